@@ -1,6 +1,7 @@
 import os
 import re
 import xml.etree.ElementTree as ET
+from collections.abc import Mapping
 from typing import Any, Optional, Union
 from xml.dom import minidom
 
@@ -562,24 +563,16 @@ class SearchWorker(QThread):
                 self.metadata_manager = MetadataManager.instance()
 
             # First check internal local metadata
-            if hasattr(self.metadata_manager, "internal_local_metadata"):
-                for (
-                    uuid,
-                    metadata,
-                ) in self.metadata_manager.internal_local_metadata.items():
-                    if (
-                        metadata
-                        and isinstance(metadata, dict)
-                        and metadata.get("publishedfileid") == pfid
-                    ):
-                        return metadata
+            uuid = self.metadata_manager.get_uuid_from_publishedfileid(pfid)
+            if uuid is not None:
+                return self.metadata_manager.internal_local_metadata[uuid]
 
             # Then check external steam metadata if available
             if hasattr(self.metadata_manager, "external_steam_metadata"):
                 steam_metadata = getattr(
                     self.metadata_manager, "external_steam_metadata", {}
                 )
-                if isinstance(steam_metadata, dict):
+                if isinstance(steam_metadata, Mapping):
                     return steam_metadata.get(pfid, {})
 
             return {}
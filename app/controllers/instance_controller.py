@@ -2,7 +2,7 @@ import os
 import shutil
 from pathlib import Path
 from traceback import format_exc
-from typing import Any, Callable, Self
+from typing import Any, Callable, Iterator, Self
 from zipfile import ZipFile
 
 import msgspec
@@ -11,6 +11,8 @@ from PySide6.QtCore import QCoreApplication, QObject
 
 from app.models.instance import Instance
 from app.utils.app_info import AppInfo
+from app.utils.zip_compress import write_files_to_zip
+from app.utils.zip_extract import extract_zip
 from app.views.dialogue import (
     show_fatal_error,
     show_warning,
@@ -139,51 +141,45 @@ class InstanceController(QObject):
         try:
             logger.info(f"Extracting instance folder from archive: {archive_path}")
             logger.info(f"Destination instance folder: {self.instance_folder_path}")
-            with ZipFile(archive_path, "r") as archive:
-                for info in archive.infolist():
-                    if info.filename == "instance.json":
-                        continue
-                    logger.debug(f"Extracting file: {info.filename}")
-                    archive.extract(info, path=self.instance_folder_path)
+            extract_zip(
+                archive_path,
+                str(self.instance_folder_path),
+                exclude={"instance.json"},
+            )
         except Exception as e:
             logger.error(f"An error occurred while extracting instance folder: {e}")
 
+    def _archive_files(self) -> Iterator[tuple[str, str]]:
+        """Yield (path, name in the archive) of every file and directory in the instance folder"""
+        for root, dirs, files in os.walk(
+            self.instance_folder_path, topdown=True, followlinks=False
+        ):
+            # Skip windows junctions (and symlinks)
+            if Path(root).absolute() != Path(root).resolve():
+                logger.debug(f"Skipping symlinked directory: {root}")
+                # Prune the search
+                dirs.clear()
+                files.clear()
+                continue
+            for name in dirs + files:
+                path = os.path.join(root, name)
+                yield path, os.path.relpath(path, self.instance_folder_path)
+
     def compress_to_archive(self, output_path: str) -> None:
         # Compress instance folder to archive.
         # Preserve folder structure.
         # Overwrite if exists.
+        # Files are compressed in parallel, except already compressed assets which are stored.
         if not output_path.endswith(".zip"):
             output_path += ".zip"
 
         try:
             logger.info(f"Compressing instance folder to archive: {output_path}")
             with ZipFile(output_path, "w") as archive:
-                for root, dirs, files in os.walk(
-                    self.instance_folder_path, topdown=True, followlinks=False
-                ):
-                    # Skip windows junctions (and symlinks)
-                    if Path(root).absolute() != Path(root).resolve():
-                        logger.debug(f"Skipping symlinked directory: {root}")
-                        # Prune the search
-                        dirs.clear()
-                        files.clear()
-                        continue
-                    for _dir in dirs:
-                        dir_path = os.path.join(root, _dir)
-                        archive.write(
-                            dir_path,
-                            os.path.relpath(dir_path, self.instance_folder_path),
-                        )
-                        logger.debug(f"Added directory to archive: {dir_path}")
-                    for file in files:
-                        file_path = os.path.join(root, file)
-                        archive.write(
-                            file_path,
-                            os.path.relpath(file_path, self.instance_folder_path),
-                        )
-                        logger.debug(f"Added file to archive: {file_path}")
+                write_files_to_zip(archive, self._archive_files())
                 archive.writestr("instance.json", self.to_bytes())
                 logger.debug(f"Added instance data to archive: {self.instance}")
+            logger.info(f"Compressed {len(archive.filelist)} files to {output_path}")
         except Exception as e:
             logger.error(f"An error occurred while compressing instance folder: {e}")
 
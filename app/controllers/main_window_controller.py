@@ -128,18 +128,11 @@ class MainWindowController(QObject):
                     if not found_locally:
                         # If not found locally, we need to find its Workshop ID
                         # First check if we have it in our Steam metadata
-                        workshop_id = None
-                        if self.metadata_manager.external_steam_metadata:
-                            for (
-                                pfid,
-                                metadata,
-                            ) in self.metadata_manager.external_steam_metadata.items():
-                                if (
-                                    metadata.get("packageId", "").lower()
-                                    == dep_id.lower()
-                                ):
-                                    workshop_id = pfid
-                                    break
+                        workshop_id = (
+                            self.metadata_manager.steamdb_packageid_to_pfid.get(
+                                dep_id.lower()
+                            )
+                        )
 
                         if workshop_id:
                             mods_to_download.append(workshop_id)
@@ -334,7 +327,5 @@ class MainWindowController(QObject):
 
     @Slot()
     def on_reset_use_this_instead_cache(self) -> None:
-        logger.warning(
-            'Resetting "Use This Instead" cache - performance may be impacted until xml is re-cached'
-        )
-        MetadataManager.instance().has_alternative_mod.cache_clear()
+        logger.info('Resetting "Use This Instead" cache')
+        MetadataManager.instance().replacement_index.invalidate()
@@ -631,6 +631,8 @@ class SettingsController(QObject):
             self.settings_dialog.sorting_alphabetical_radio.setChecked(True)
         elif self.settings.sorting_algorithm == SortMethod.TOPOLOGICAL:
             self.settings_dialog.sorting_topological_radio.setChecked(True)
+        elif self.settings.sorting_algorithm == SortMethod.ALPHABETICAL_HEAP:
+            self.settings_dialog.sorting_alphabetical_heap_radio.setChecked(True)
 
         # Use dependencies for sorting checkbox
         if self.settings.use_moddependencies_as_loadTheseBefore:
@@ -656,6 +658,9 @@ class SettingsController(QObject):
         self.settings_dialog.db_builder_update_instead_of_overwriting_checkbox.setChecked(
             self.settings.build_steam_database_update_toggle
         )
+        self.settings_dialog.db_builder_delta_update_checkbox.setChecked(
+            self.settings.build_steam_database_delta_toggle
+        )
         self.settings_dialog.db_builder_steam_api_key.setText(
             self.settings.steam_apikey
         )
@@ -801,6 +806,18 @@ class SettingsController(QObject):
         self.settings_dialog.update_databases_on_startup_checkbox.setChecked(
             self.settings.update_databases_on_startup
         )
+        self.settings_dialog.two_phase_metadata_refresh_checkbox.setChecked(
+            self.settings.two_phase_metadata_refresh
+        )
+        self.settings_dialog.indexed_steam_db_checkbox.setChecked(
+            self.settings.indexed_steam_db
+        )
+        self.settings_dialog.paint_mod_list_rows_checkbox.setChecked(
+            self.settings.paint_mod_list_rows
+        )
+        self.settings_dialog.cache_preview_thumbnails_checkbox.setChecked(
+            self.settings.cache_preview_thumbnails
+        )
         self.settings_dialog.rentry_auth_code.setText(self.settings.rentry_auth_code)
         self.settings_dialog.rentry_auth_code.setCursorPosition(0)
         self.settings_dialog.github_username.setText(self.settings.github_username)
@@ -910,6 +927,8 @@ class SettingsController(QObject):
             self.settings.sorting_algorithm = SortMethod.ALPHABETICAL
         elif self.settings_dialog.sorting_topological_radio.isChecked():
             self.settings.sorting_algorithm = SortMethod.TOPOLOGICAL
+        elif self.settings_dialog.sorting_alphabetical_heap_radio.isChecked():
+            self.settings.sorting_algorithm = SortMethod.ALPHABETICAL_HEAP
 
         # Use moddependencies as loadTheseBefore
         self.settings.use_moddependencies_as_loadTheseBefore = (
@@ -930,6 +949,9 @@ class SettingsController(QObject):
             self.settings_dialog.db_builder_query_dlc_checkbox.isChecked()
         )
         self.settings.build_steam_database_update_toggle = self.settings_dialog.db_builder_update_instead_of_overwriting_checkbox.isChecked()
+        self.settings.build_steam_database_delta_toggle = (
+            self.settings_dialog.db_builder_delta_update_checkbox.isChecked()
+        )
         self.settings.steam_apikey = (
             self.settings_dialog.db_builder_steam_api_key.text()
         )
@@ -1051,6 +1073,18 @@ class SettingsController(QObject):
         self.settings.update_databases_on_startup = (
             self.settings_dialog.update_databases_on_startup_checkbox.isChecked()
         )
+        self.settings.two_phase_metadata_refresh = (
+            self.settings_dialog.two_phase_metadata_refresh_checkbox.isChecked()
+        )
+        self.settings.indexed_steam_db = (
+            self.settings_dialog.indexed_steam_db_checkbox.isChecked()
+        )
+        self.settings.paint_mod_list_rows = (
+            self.settings_dialog.paint_mod_list_rows_checkbox.isChecked()
+        )
+        self.settings.cache_preview_thumbnails = (
+            self.settings_dialog.cache_preview_thumbnails_checkbox.isChecked()
+        )
         self.settings.rentry_auth_code = self.settings_dialog.rentry_auth_code.text()
         self.settings.github_username = self.settings_dialog.github_username.text()
         self.settings.github_token = self.settings_dialog.github_token.text()
@@ -3,7 +3,8 @@ from typing import Callable
 from loguru import logger
 
 import app.sort.dependencies as sort_deps
-from app.sort.alphabetical_sort import do_alphabetical_sort
+from app.sort.alphabetical_sort import do_alphabetical_heap_sort, do_alphabetical_sort
+from app.sort.dependency_graph_cache import DependencyGraphCache
 from app.sort.topo_sort import CircularDependencyError, do_topo_sort
 from app.utils.constants import SortMethod
 
@@ -17,12 +18,15 @@ class Sorter:
         active_package_ids: set[str],
         active_uuids: set[str],
         use_moddependencies_as_loadTheseBefore: bool = False,
+        graph_cache: DependencyGraphCache | None = None,
     ):
         self.active_package_ids = active_package_ids.copy()
         self.active_uuids = active_uuids.copy()
         self.use_moddependencies_as_loadTheseBefore = (
             use_moddependencies_as_loadTheseBefore
         )
+        # Optional dependency graphs and tier orders kept from previous sorts
+        self.graph_cache = graph_cache
 
         if isinstance(sort_method, SortMethod) or isinstance(sort_method, str):
             logger.info(f"Created sorter instance with {sort_method} sort method")
@@ -31,6 +35,8 @@ class Sorter:
                 self.sort_method = do_alphabetical_sort
             elif sort_method == SortMethod.TOPOLOGICAL:
                 self.sort_method = do_topo_sort
+            elif sort_method == SortMethod.ALPHABETICAL_HEAP:
+                self.sort_method = do_alphabetical_heap_sort
             else:
                 raise NotImplementedError(f"Sort method {sort_method} not implemented")
         elif callable(sort_method):
@@ -44,11 +50,15 @@ class Sorter:
         self,
     ) -> list[dict[str, set[str]]]:
         logger.info("Generating dependency graphs")
+        if self.graph_cache is not None and self.graph_cache.update(
+            self.active_uuids, self.use_moddependencies_as_loadTheseBefore
+        ):
+            return self.graph_cache.tier_graphs()
         dependencies_graph = sort_deps.gen_deps_graph(
-            self.active_uuids, list(self.active_package_ids)
+            self.active_uuids, self.active_package_ids
         )
         reverse_dependencies_graph = sort_deps.gen_rev_deps_graph(
-            self.active_uuids, list(self.active_package_ids)
+            self.active_uuids, self.active_package_ids
         )
 
         tier_one_graph, tier_one_mods = sort_deps.gen_tier_one_deps_graph(
@@ -63,7 +73,7 @@ class Sorter:
 
         tier_two_graph = sort_deps.gen_tier_two_deps_graph(
             self.active_uuids,
-            list(self.active_package_ids),
+            self.active_package_ids,
             tier_one_mods,
             tier_three_mods,
             use_moddependencies_as_loadTheseBefore=self.use_moddependencies_as_loadTheseBefore,
@@ -87,9 +97,22 @@ class Sorter:
         sorted_uuids = []
         try:
             for i, graph in enumerate(dependency_graphs):
+                sorted_mods = (
+                    self.graph_cache.sorted_tier(i, graph, self.sort_method)
+                    if self.graph_cache is not None
+                    else None
+                )
+                if sorted_mods is not None:
+                    logger.info(f"Tier {i + 1} unchanged since the last sort")
+                    sorted_uuids += sorted_mods
+                    continue
                 logger.info(f"Sorting tier {i + 1}")
                 sorted_mods = self.sort_method(graph, self.active_uuids)
                 logger.info(f"Tier {i + 1} sorted: {len(sorted_mods)}")
+                if self.graph_cache is not None:
+                    self.graph_cache.set_sorted_tier(
+                        i, graph, self.sort_method, sorted_mods
+                    )
                 sorted_uuids += sorted_mods
         except CircularDependencyError:
             logger.info("Circular dependency detected, abandoning sort")
@@ -26,7 +26,11 @@ from app.models.metadata.metadata_structure import (
     SteamDbSchema,
 )
 from app.utils.constants import RIMWORLD_DLC_METADATA
-from app.utils.xml import json_to_xml_write, xml_path_to_json
+from app.utils.xml import (
+    about_xml_path_to_json,
+    json_to_xml_write,
+    xml_path_to_json,
+)
 
 
 class MalformedDataException(Exception):
@@ -513,7 +517,7 @@ def _create_about_mod_from_xml(
     base_path: Path, mod_xml_path: Path, target_version: str
 ) -> tuple[bool, AboutXmlMod]:
     try:
-        mod_data = xml_path_to_json(str(mod_xml_path))
+        mod_data = about_xml_path_to_json(str(mod_xml_path))
     except Exception:
         logger.error(
             f"Unable to parse {mod_xml_path} with the exception: {traceback.format_exc()}"
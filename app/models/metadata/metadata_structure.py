@@ -557,3 +557,31 @@ class SteamDbEntry(msgspec.Struct, omit_defaults=True):
 class SteamDbSchema(msgspec.Struct):
     version: int
     database: dict[str, SteamDbEntry] = msgspec.field(default_factory=dict)
+
+
+class SteamDbFile(msgspec.Struct, gc=False):
+    """A Steam DB file as loaded by the MetadataManager.
+
+    Unlike SteamDbSchema, entries are kept as plain dicts, since they are edited and written back as is.
+
+    Attributes:
+        version (int): Timestamp the Steam DB expires relative to.
+        database (dict[str, dict[str, Any]]): Entries keyed by publishedfileid.
+    """
+
+    version: int
+    database: dict[str, dict[str, Any]] = msgspec.field(default_factory=dict)
+
+
+class ExternalRulesFile(msgspec.Struct, gc=False):
+    """A Community Rules or User Rules file as loaded by the MetadataManager.
+
+    Unlike ExternalRulesSchema, rules are kept as plain dicts, since they are edited and written back as is.
+
+    Attributes:
+        timestamp (int): When the rules were last updated.
+        rules (dict[str, dict[str, Any]] | None): Rules keyed by packageid.
+    """
+
+    timestamp: int = 0
+    rules: dict[str, dict[str, Any]] | None = msgspec.field(default_factory=dict)
@@ -91,6 +91,7 @@ class Settings(QObject):
         self.db_builder_include: str = "all_mods"
         self.build_steam_database_dlc_data: bool = True
         self.build_steam_database_update_toggle: bool = False
+        self.build_steam_database_delta_toggle: bool = False
         self.steam_apikey: str = ""
 
         # SteamCMD
@@ -139,6 +140,10 @@ class Settings(QObject):
         self.try_download_missing_mods: bool = True
         self.render_unity_rich_text: bool = True
         self.update_databases_on_startup: bool = True
+        self.two_phase_metadata_refresh: bool = True
+        self.indexed_steam_db: bool = True
+        self.paint_mod_list_rows: bool = True
+        self.cache_preview_thumbnails: bool = True
 
         self.rentry_auth_code: str = ""
 
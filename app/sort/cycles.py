@@ -0,0 +1,168 @@
+from collections import deque
+from typing import Any
+
+from app.utils.metadata_rules import RuleEdgeIndex
+
+# Number of loops reported for each group of mods depending on each other
+MAX_CYCLES_PER_COMPONENT = 5
+
+
+def strongly_connected_components(
+    dependency_graph: dict[str, set[str]],
+) -> list[list[str]]:
+    """
+    Find the groups of mods that (indirectly) depend on each other, using Tarjan's algorithm.
+
+    Runs in O(mods + rules) time, iteratively so long dependency chains can't hit the
+    recursion limit. Mods depending only on themselves are ignored, like toposort does.
+
+    :param dependency_graph: packageid -> packageids it loads after
+    :return: Every group of more than one mod, each sorted, in sorted order
+    """
+    index_of: dict[str, int] = {}
+    lowlink: dict[str, int] = {}
+    on_stack: set[str] = set()
+    stack: list[str] = []
+    components: list[list[str]] = []
+
+    for root in dependency_graph:
+        if root in index_of:
+            continue
+        # (node, iterator over its dependencies)
+        work = [(root, iter(dependency_graph.get(root, ())))]
+        index_of[root] = lowlink[root] = len(index_of)
+        stack.append(root)
+        on_stack.add(root)
+        while work:
+            node, dependencies = work[-1]
+            for dependency in dependencies:
+                if dependency not in index_of:
+                    index_of[dependency] = lowlink[dependency] = len(index_of)
+                    stack.append(dependency)
+                    on_stack.add(dependency)
+                    work.append(
+                        (dependency, iter(dependency_graph.get(dependency, ())))
+                    )
+                    break
+                if dependency in on_stack:
+                    lowlink[node] = min(lowlink[node], index_of[dependency])
+            else:
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    lowlink[parent] = min(lowlink[parent], lowlink[node])
+                if lowlink[node] == index_of[node]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        component.append(member)
+                        if member == node:
+                            break
+                    if len(component) > 1:
+                        components.append(sorted(component))
+    return sorted(components)
+
+
+def shortest_cycles(
+    dependency_graph: dict[str, set[str]],
+    component: list[str],
+    limit: int = MAX_CYCLES_PER_COMPONENT,
+) -> list[list[str]]:
+    """
+    Find up to `limit` short dependency loops within a group of mods depending on each other.
+
+    Each loop is the shortest one through one of the group's mods, found by a breadth first
+    search, so this takes O(limit × rules within the group) time instead of enumerating every
+    loop, of which there can be exponentially many.
+
+    :param dependency_graph: packageid -> packageids it loads after
+    :param component: A group of mods from strongly_connected_components
+    :param limit: The maximum number of loops to return
+    :return: Loops as lists of packageids, each one loading after the next, starting at
+        their alphabetically first mod
+    """
+    members = set(component)
+    cycles: list[list[str]] = []
+    seen: set[tuple[str, ...]] = set()
+    for start in component:
+        if len(cycles) >= limit:
+            break
+        previous: dict[str, str] = {}
+        queue = deque([start])
+        while queue and start not in previous:
+            node = queue.popleft()
+            for dependency in sorted(dependency_graph.get(node, ())):
+                if dependency in members and dependency not in previous:
+                    previous[dependency] = node
+                    if dependency == start:
+                        break
+                    queue.append(dependency)
+        if start not in previous:
+            continue
+        cycle = [start]
+        node = previous[start]
+        while node != start:
+            cycle.append(node)
+            node = previous[node]
+        cycle.reverse()
+        # Rotate the loop to its first mod, so the same loop found from another mod is skipped
+        first = cycle.index(min(cycle))
+        cycle = cycle[first:] + cycle[:first]
+        if tuple(cycle) not in seen:
+            seen.add(tuple(cycle))
+            cycles.append(cycle)
+    return cycles
+
+
+def rule_sources(
+    edges: RuleEdgeIndex, uuid: str | None, dependency_id: str
+) -> list[str]:
+    """
+    Return the rule sources that made a mod load after another mod.
+
+    :param edges: The rule edges of the compiled metadata
+    :param uuid: The uuid of the mod loading after the other one
+    :param dependency_id: The packageid of the mod it loads after
+    :return: Sorted rule sources (About.xml, Steam DB, Community Rules, User Rules)
+    """
+    if uuid is None:
+        return []
+    sources: set[str] = set()
+    # The mod's own loadAfter rules, or the other mod's loadBefore rules
+    for explicit in (True, False):
+        sources |= edges.sources_of(uuid, "loadTheseBefore", (dependency_id, explicit))
+    if not sources:
+        # Dependencies are only used as load order rules if enabled in the settings
+        sources = edges.sources_of(uuid, "dependencies", dependency_id)
+    return sorted(sources)
+
+
+def describe_cycles(
+    dependency_graph: dict[str, set[str]],
+    uuid_by_packageid: dict[str, str],
+    all_mods: dict[str, Any],
+    edges: RuleEdgeIndex,
+    limit: int = MAX_CYCLES_PER_COMPONENT,
+) -> list[str]:
+    """
+    Describe the dependency loops in a graph, and the rules causing them.
+
+    :return: One description per group of mods depending on each other
+    """
+    descriptions = []
+    for component in strongly_connected_components(dependency_graph):
+        cycles = shortest_cycles(dependency_graph, component, limit)
+        lines = [f"{len(component)} mods depend on each other: {', '.join(component)}"]
+        for cycle in cycles:
+            lines.append(" -> ".join(cycle + [cycle[0]]))
+            for packageid, dependency_id in zip(cycle, cycle[1:] + cycle[:1]):
+                uuid = uuid_by_packageid.get(packageid)
+                name = all_mods.get(uuid, {}).get("name") if uuid else None
+                sources = rule_sources(edges, uuid, dependency_id) or ["unknown"]
+                lines.append(
+                    f"    {name or packageid} ({packageid}) loads after"
+                    f" {dependency_id}: {', '.join(sources)}"
+                )
+        descriptions.append("\n".join(lines))
+    return descriptions
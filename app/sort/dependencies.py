@@ -4,7 +4,7 @@ from app.utils.metadata import MetadataManager
 
 
 def gen_deps_graph(
-    active_mods_uuids: set[str], active_mod_ids: list[str]
+    active_mods_uuids: set[str], active_mod_ids: set[str]
 ) -> dict[str, set[str]]:
     """
     Get dependencies
@@ -41,7 +41,7 @@ def gen_deps_graph(
 
 
 def gen_rev_deps_graph(
-    active_mods_uuids: set[str], active_mod_ids: list[str]
+    active_mods_uuids: set[str], active_mod_ids: set[str]
 ) -> dict[str, set[str]]:
     # Cache MetadataManager instance
     metadata_manager = MetadataManager.instance()
@@ -204,7 +204,7 @@ def get_reverse_dependencies_recursive(
 
 def gen_tier_two_deps_graph(
     active_mods_uuids: set[str],
-    active_mod_ids: list[str],
+    active_mod_ids: set[str],
     tier_one_mods: set[str],
     tier_three_mods: set[str],
     use_moddependencies_as_loadTheseBefore: bool = False,
@@ -214,7 +214,7 @@ def gen_tier_two_deps_graph(
 
     Args:
         active_mods_uuids: Set of UUIDs for active mods.
-        active_mod_ids: List of package IDs for active mods.
+        active_mod_ids: Set of package IDs for active mods.
         tier_one_mods: Set of package IDs for tier one mods.
         tier_three_mods: Set of package IDs for tier three mods.
         use_moddependencies_as_loadTheseBefore: If True, treat About.xml dependencies as loadTheseBefore rules.
@@ -0,0 +1,257 @@
+from collections.abc import Callable, Iterable
+from typing import Any
+
+from loguru import logger
+
+from app.utils.metadata import MetadataManager
+
+# Known tier one mods, see gen_tier_one_deps_graph
+KNOWN_TIER_ONE_MODS = frozenset(
+    {
+        "zetrith.prepatcher",
+        "brrainz.harmony",
+        "ludeon.rimworld",
+        "ludeon.rimworld.royalty",
+        "ludeon.rimworld.ideology",
+        "ludeon.rimworld.biotech",
+        "ludeon.rimworld.anomaly",
+        "ludeon.rimworld.odyssey",
+        "unlimitedhugs.hugslib",
+    }
+)
+# Known tier three mods, in addition to mods with loadBottom set, see gen_tier_three_deps_graph
+KNOWN_TIER_THREE_MODS = frozenset({"krkr.rocketman"})
+
+
+def _rule_ids(rules: Any, key: str) -> set[str]:
+    """Return the packageids of a mod's load order rules, which are (packageid, explicit) tuples."""
+    ids = set()
+    if rules and isinstance(rules, (set, list)):
+        for rule in rules:
+            if isinstance(rule, tuple):
+                ids.add(rule[0])
+            else:
+                logger.error(f"{key} entry is not a tuple: [{rule}]")
+    return ids
+
+
+def _reachable(starts: Iterable[str], graph: dict[str, set[str]]) -> set[str]:
+    """Return every node reachable from the start nodes, excluding the start nodes themselves unless reachable."""
+    reached: set[str] = set()
+    stack = list(starts)
+    while stack:
+        for node in graph.get(stack.pop(), ()):
+            if node not in reached:
+                reached.add(node)
+                stack.append(node)
+    return reached
+
+
+class _EdgeSet:
+    """
+    Edges of one kind of rule between the active mods, updated as mods are activated or deactivated.
+
+    A rule from an active mod to an inactive mod is remembered, and becomes an edge once the
+    other mod is activated.
+    """
+
+    def __init__(self) -> None:
+        # packageid -> packageids of every mod the rule references, active or not
+        self.targets: dict[str, set[str]] = {}
+        # packageid -> active packageids referencing it
+        self.referrers: dict[str, set[str]] = {}
+        # packageid -> active packageids it references, i.e. the graph of the active mods
+        self.graph: dict[str, set[str]] = {}
+
+    def add(self, packageid: str, targets: set[str]) -> None:
+        self.targets[packageid] = targets
+        for target in targets:
+            self.referrers.setdefault(target, set()).add(packageid)
+        self.graph[packageid] = set()
+        self.graph[packageid] = {target for target in targets if target in self.graph}
+        for referrer in self.referrers.get(packageid, ()):
+            self.graph[referrer].add(packageid)
+
+    def remove(self, packageid: str) -> None:
+        for target in self.targets.pop(packageid):
+            referrers = self.referrers[target]
+            referrers.discard(packageid)
+            if not referrers:
+                del self.referrers[target]
+        del self.graph[packageid]
+        for referrer in self.referrers.get(packageid, ()):
+            self.graph[referrer].discard(packageid)
+
+
+class DependencyGraphCache:
+    """
+    Dependency graphs of the active mods, kept between sorts.
+
+    Instead of being rebuilt from every active mod's metadata on each sort, the graphs are
+    updated for the mods activated or deactivated since the last sort. Everything is rebuilt
+    when the compiled rules change (see MetadataManager.rules_version) or when the About.xml
+    dependencies setting changes. The order of each tier is cached as well, so a tier is only
+    sorted again if its graph changed.
+
+    The graphs are the same as the ones built by the generators in app.sort.dependencies.
+    """
+
+    def __init__(self) -> None:
+        # (rules version, use_moddependencies_as_loadTheseBefore) the graphs were built for
+        self._key: tuple[int, bool] | None = None
+        self._uuid_by_packageid: dict[str, str] = {}
+        self._load_bottom: set[str] = set()
+        self._before = _EdgeSet()  # loadTheseBefore
+        self._after = _EdgeSet()  # loadTheseAfter
+        # About.xml dependencies, only if used as loadTheseBefore
+        self._about = _EdgeSet()
+        # tier index -> (graph, uuids of its mods, sort method, sorted uuids)
+        self._sorted_tiers: dict[
+            int,
+            tuple[dict[str, set[str]], dict[str, str], Callable[..., Any], list[str]],
+        ] = {}
+
+    def clear(self) -> None:
+        self._key = None
+        self._uuid_by_packageid = {}
+        self._load_bottom = set()
+        self._before = _EdgeSet()
+        self._after = _EdgeSet()
+        self._about = _EdgeSet()
+        self._sorted_tiers = {}
+
+    def update(
+        self, active_uuids: set[str], use_moddependencies_as_loadTheseBefore: bool
+    ) -> bool:
+        """
+        Bring the graphs up to date with the active mods.
+
+        :param active_uuids: The uuids of the active mods
+        :param use_moddependencies_as_loadTheseBefore: If About.xml dependencies are load order rules
+        :return: False if the graphs can't be cached because several active mods share a packageid
+        """
+        metadata_manager = MetadataManager.instance()
+        all_mods = metadata_manager.internal_local_metadata
+        uuid_by_packageid = {all_mods[uuid]["packageid"]: uuid for uuid in active_uuids}
+        if len(uuid_by_packageid) != len(active_uuids):
+            logger.info("Active mods share packageids, not caching dependency graphs")
+            self.clear()
+            return False
+        key = (metadata_manager.rules_version, use_moddependencies_as_loadTheseBefore)
+        if key != self._key:
+            logger.info(
+                "Rules changed since the last sort, rebuilding dependency graphs"
+            )
+            self.clear()
+            self._key = key
+        removed = [
+            packageid
+            for packageid, uuid in self._uuid_by_packageid.items()
+            if uuid_by_packageid.get(packageid) != uuid
+        ]
+        added = [
+            packageid
+            for packageid, uuid in uuid_by_packageid.items()
+            if self._uuid_by_packageid.get(packageid) != uuid
+        ]
+        for packageid in removed:
+            for edges in (self._before, self._after, self._about):
+                edges.remove(packageid)
+            self._load_bottom.discard(packageid)
+            del self._uuid_by_packageid[packageid]
+        for packageid in added:
+            uuid = uuid_by_packageid[packageid]
+            mod_data = all_mods[uuid]
+            self._uuid_by_packageid[packageid] = uuid
+            self._before.add(
+                packageid, _rule_ids(mod_data.get("loadTheseBefore"), "loadTheseBefore")
+            )
+            self._after.add(
+                packageid, _rule_ids(mod_data.get("loadTheseAfter"), "loadTheseAfter")
+            )
+            about_ids = set()
+            if use_moddependencies_as_loadTheseBefore:
+                about_dependencies = mod_data.get("dependencies")
+                if about_dependencies and isinstance(about_dependencies, (set, list)):
+                    for dependency in about_dependencies:
+                        if isinstance(dependency, str):
+                            about_ids.add(dependency)
+                        elif isinstance(dependency, tuple):
+                            about_ids.add(dependency[0])
+                        else:
+                            logger.error(
+                                f"About.xml dependency is not a string or tuple: [{dependency}]"
+                            )
+            self._about.add(packageid, about_ids)
+            if mod_data.get("loadBottom"):
+                self._load_bottom.add(packageid)
+        logger.info(
+            f"Updated dependency graphs of {len(uuid_by_packageid)} mods:"
+            f" {len(added)} added, {len(removed)} removed"
+        )
+        return True
+
+    def tier_graphs(self) -> list[dict[str, set[str]]]:
+        """Return the tier one, two and three dependency graphs of the active mods."""
+        dependencies_graph = self._before.graph
+        tier_one_starts = KNOWN_TIER_ONE_MODS & dependencies_graph.keys()
+        tier_one_mods = tier_one_starts | _reachable(
+            tier_one_starts, dependencies_graph
+        )
+        tier_three_starts = (
+            self._load_bottom | KNOWN_TIER_THREE_MODS
+        ) & dependencies_graph.keys()
+        tier_three_mods = tier_three_starts | _reachable(
+            tier_three_starts, self._after.graph
+        )
+        tier_one_graph = {
+            packageid: set(dependencies_graph[packageid]) for packageid in tier_one_mods
+        }
+        tier_three_graph = {
+            packageid: dependencies_graph[packageid] & tier_three_mods
+            for packageid in tier_three_mods
+        }
+        tier_two_graph = {
+            packageid: (dependencies | self._about.graph[packageid])
+            - tier_one_mods
+            - tier_three_mods
+            for packageid, dependencies in dependencies_graph.items()
+            if packageid not in tier_one_mods and packageid not in tier_three_mods
+        }
+        return [tier_one_graph, tier_two_graph, tier_three_graph]
+
+    def sorted_tier(
+        self, tier: int, graph: dict[str, set[str]], sort_method: Callable[..., Any]
+    ) -> list[str] | None:
+        """Return the cached order of a tier, if its graph and mods did not change since it was sorted."""
+        cached = self._sorted_tiers.get(tier)
+        if (
+            cached is None
+            or cached[2] is not sort_method
+            or cached[0] != graph
+            or cached[1] != self._uuids_of(graph)
+        ):
+            return None
+        return list(cached[3])
+
+    def set_sorted_tier(
+        self,
+        tier: int,
+        graph: dict[str, set[str]],
+        sort_method: Callable[..., Any],
+        sorted_uuids: list[str],
+    ) -> None:
+        """Cache the order of a tier."""
+        self._sorted_tiers[tier] = (
+            {packageid: set(dependencies) for packageid, dependencies in graph.items()},
+            self._uuids_of(graph),
+            sort_method,
+            list(sorted_uuids),
+        )
+
+    def _uuids_of(self, graph: dict[str, set[str]]) -> dict[str, str]:
+        return {
+            packageid: self._uuid_by_packageid[packageid]
+            for packageid in graph
+            if packageid in self._uuid_by_packageid
+        }
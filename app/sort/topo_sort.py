@@ -1,8 +1,8 @@
-import networkx as nx
 from loguru import logger
 from PySide6.QtCore import QCoreApplication
 from toposort import CircularDependencyError, toposort
 
+from app.sort.cycles import describe_cycles
 from app.utils.metadata import MetadataManager
 from app.views.dialogue import show_warning
 
@@ -20,7 +20,7 @@ def do_topo_sort(
     try:
         sorted_dependencies = list(toposort(dependency_graph))
     except CircularDependencyError as e:
-        find_circular_dependencies(dependency_graph)
+        find_circular_dependencies(dependency_graph, active_mods_uuids)
         # Propagate the exception after handling
         raise e
 
@@ -56,17 +56,30 @@ def do_topo_sort(
     return reordered
 
 
-def find_circular_dependencies(dependency_graph: dict[str, set[str]]) -> None:
-    graph = nx.DiGraph(dependency_graph)  # use the networkx library
-    cycles = list(nx.simple_cycles(graph))  # find all cycles in the graph
+def find_circular_dependencies(
+    dependency_graph: dict[str, set[str]], active_mods_uuids: set[str]
+) -> None:
+    """
+    Show the dependency loops preventing a sort, and the rule sources causing them.
 
-    cycle_strings = []
-    if cycles:
+    Loops are found in linear time, and only a few short loops are shown for each group of
+    mods depending on each other, as there can be exponentially many.
+    """
+    metadata_manager = MetadataManager.instance()
+    all_mods = metadata_manager.internal_local_metadata
+    uuid_by_packageid = {
+        all_mods[uuid]["packageid"]: uuid for uuid in active_mods_uuids
+    }
+    cycle_strings = describe_cycles(
+        dependency_graph,
+        uuid_by_packageid,
+        all_mods,
+        metadata_manager.rule_compiler.edges,
+    )
+    if cycle_strings:
         logger.info("Circular dependencies detected:")
-        for cycle in cycles:
-            loop = " -> ".join(cycle)
+        for loop in cycle_strings:
             logger.info(loop)
-            cycle_strings.append(loop)
     else:
         logger.info("No circular dependencies found.")
 
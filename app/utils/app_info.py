@@ -81,7 +81,13 @@ class AppInfo:
 
         self._databases_folder: Path = self._app_storage_folder / "dbs"
         self._aux_metadata_db: Path = self._databases_folder / "aux_metadata.db"
+        self._metadata_cache: Path = self._databases_folder / "metadata_cache.json"
+        self._steam_db_index_folder: Path = self._databases_folder / "steam_db_index"
+        self._use_this_instead_index: Path = (
+            self._databases_folder / "use_this_instead_index.json"
+        )
         self._saved_modlists_folder: Path = self._app_storage_folder / "modlists"
+        self._thumbnail_cache_folder: Path = self._app_storage_folder / "thumbnails"
         self._theme_storage_folder: Path = self._app_storage_folder / "themes"
         self._theme_data_folder: Path = self._application_folder / "themes"
         self._settings_file: Path = self._app_storage_folder / "settings.json"
@@ -223,3 +229,31 @@ class AppInfo:
         Get the path to the auxiliary metadata database.
         """
         return self._aux_metadata_db
+
+    @property
+    def metadata_cache(self) -> Path:
+        """
+        Get the path to the persistent mod metadata parse cache.
+        """
+        return self._metadata_cache
+
+    @property
+    def thumbnail_cache_folder(self) -> Path:
+        """
+        Get the path to the folder where thumbnails of mod preview images are cached.
+        """
+        return self._thumbnail_cache_folder
+
+    @property
+    def use_this_instead_index(self) -> Path:
+        """
+        Get the path to the compiled index of the "Use This Instead" replacements.
+        """
+        return self._use_this_instead_index
+
+    @property
+    def steam_db_index_folder(self) -> Path:
+        """
+        Get the path to the folder where compiled Steam DB indexes are stored.
+        """
+        return self._steam_db_index_folder
@@ -5,6 +5,7 @@ from typing import Any
 class SortMethod(str, Enum):
     ALPHABETICAL = "Alphabetical"
     TOPOLOGICAL = "Topological"
+    ALPHABETICAL_HEAP = "Alphabetical (priority queue)"
 
 
 DB_BUILDER_PRUNE_EXCEPTIONS = [
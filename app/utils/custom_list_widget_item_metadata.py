@@ -1,4 +1,4 @@
-from typing import Any, Optional
+from typing import Any, Callable, Optional
 
 from loguru import logger
 
@@ -36,7 +36,9 @@ class CustomListWidgetItemMetadata:
         """
         Must provide a uuid, the rest is optional.
 
-        Unless explicitly provided, invalid and mismatch are automatically set based on the uuid using metadata manager.
+        Unless explicitly provided, invalid, mismatch and alternative are automatically set based on the uuid
+        using metadata manager. They are computed when first read rather than here, so that building the items
+        of a mod list does not query the metadata of every mod up front.
 
         :param uuid: str, the uuid of the mod which corresponds to a mod's metadata
         :param errors_warnings: a string of errors and warnings
@@ -60,20 +62,62 @@ class CustomListWidgetItemMetadata:
         self.filtered = filtered
         self.hidden_by_filter = hidden_by_filter
         self.warning_toggled = warning_toggled
-        self.invalid = (
-            invalid if invalid is not None else self.get_invalid_by_uuid(uuid)
-        )
-        self.mismatch = (
-            mismatch if mismatch is not None else self.get_mismatch_by_uuid(uuid)
-        )
-        self.alternative = (
-            alternative
-            if alternative is not None
-            else self.get_alternative_by_uuid(uuid)
-        )
-        logger.debug(
-            f"Finished initializing CustomListWidgetItemMetadata for uuid: {uuid}"
-        )
+        # Flags explicitly provided or set, which are never recomputed
+        self._flags: dict[str, Any] = {}
+        # Flags computed from the mod's metadata, memoized until the metadata changes
+        self._computed_flags: dict[str, Any] = {}
+        self._computed_flags_version: Optional[int] = None
+        if invalid is not None:
+            self.invalid = invalid
+        if mismatch is not None:
+            self.mismatch = mismatch
+        if alternative is not None:
+            self.alternative = alternative
+
+    @property
+    def invalid(self) -> bool:
+        return self._get_flag("invalid", self.get_invalid_by_uuid)
+
+    @invalid.setter
+    def invalid(self, value: bool) -> None:
+        self._flags["invalid"] = value
+
+    @property
+    def mismatch(self) -> bool:
+        return self._get_flag("mismatch", self.get_mismatch_by_uuid)
+
+    @mismatch.setter
+    def mismatch(self, value: bool) -> None:
+        self._flags["mismatch"] = value
+
+    @property
+    def alternative(self) -> str | None:
+        return self._get_flag("alternative", self.get_alternative_by_uuid)
+
+    @alternative.setter
+    def alternative(self, value: str | None) -> None:
+        self._flags["alternative"] = value
+
+    def _get_flag(self, name: str, compute: Callable[[str], Any]) -> Any:
+        """
+        Get a flag, computing it from the mod's metadata if it was not explicitly provided.
+
+        Computed flags are memoized, and recomputed once the metadata manager recompiles
+        the mods' metadata (see MetadataManager.rules_version).
+
+        :param name: str, the name of the flag
+        :param compute: the function computing the flag from the uuid of the mod
+        :return: Any, the value of the flag
+        """
+        if name in self._flags:
+            return self._flags[name]
+        version = MetadataManager.instance().rules_version
+        if version != self._computed_flags_version:
+            self._computed_flags.clear()
+            self._computed_flags_version = version
+        if name not in self._computed_flags:
+            self._computed_flags[name] = compute(self.uuid)
+        return self._computed_flags[name]
 
     def get_invalid_by_uuid(self, uuid: str) -> bool:
         """
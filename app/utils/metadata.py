@@ -1,13 +1,15 @@
 import json
 import os
+import sqlite3
 import traceback
-from functools import lru_cache
+from collections.abc import Mapping, MutableMapping
 from pathlib import Path
-from re import match
+from threading import Lock
 from time import localtime, strftime, time
 from typing import Any, Iterable, Union
 from uuid import uuid4
 
+import msgspec
 from loguru import logger
 from natsort import natsorted
 from PySide6.QtCore import (
@@ -20,6 +22,7 @@ from PySide6.QtCore import (
 )
 
 from app.controllers.settings_controller import SettingsController
+from app.models.metadata.metadata_structure import ExternalRulesFile, SteamDbFile
 from app.utils.app_info import AppInfo
 from app.utils.constants import (
     DB_BUILDER_PRUNE_EXCEPTIONS,
@@ -28,14 +31,27 @@ from app.utils.constants import (
     RIMWORLD_DLC_METADATA,
 )
 from app.utils.generic import directories
+from app.utils.metadata_cache import MetadataParseCache
+from app.utils.metadata_rules import RuleCompiler
+from app.utils.replacement_index import ReplacementIndex
 from app.utils.schema import generate_rimworld_mods_list, validate_rimworld_mods_list
 from app.utils.steam.steamcmd.wrapper import SteamcmdInterface
 from app.utils.steam.steamfiles.wrapper import acf_to_dict, dict_to_acf
+from app.utils.steam.webapi.checkpoint import DynamicQueryCheckpoint
 from app.utils.steam.webapi.wrapper import (
     DynamicQuery,
     ISteamRemoteStorage_GetPublishedFileDetails,
 )
-from app.utils.xml import json_to_xml_write, xml_path_to_json
+from app.utils.steam_db_index import IndexedSteamDatabase, steam_db_packageid
+from app.utils.version_index import VersionMismatchIndex
+from app.utils.xml import (
+    ABOUT_XML_DETAIL_TAGS,
+    ABOUT_XML_SKELETON_TAGS,
+    ABOUT_XML_TAGS,
+    about_xml_path_to_json,
+    json_to_xml_write,
+    xml_path_to_json,
+)
 from app.views.dialogue import (
     show_dialogue_conditional,
     show_dialogue_file,
@@ -62,6 +78,7 @@ class MetadataManager(QObject):
     mod_created_signal = Signal(str)
     mod_deleted_signal = Signal(str)
     mod_metadata_updated_signal = Signal(str)
+    mod_details_parsed_signal = Signal(str, object)
     show_warning_signal = Signal(str, str, str, str)
 
     def __new__(cls, *args: Any, **kwargs: Any) -> "MetadataManager":
@@ -80,17 +97,35 @@ class MetadataManager(QObject):
             # Initialize our threadpool for multithreaded parsing
             self.parser_threadpool = QThreadPool.globalInstance()
 
+            # Persistent cache of parsed mod metadata, so unchanged mods skip parsing
+            self.metadata_cache = MetadataParseCache(AppInfo().metadata_cache)
+            self.metadata_cache.load()
+
+            # Compiles dependencies & load order rules, tracking where each rule came from
+            self.rule_compiler = RuleCompiler()
+            self.version_mismatch_index = VersionMismatchIndex()
+            # "Use This Instead" replacements, by the published file id of the mod they replace
+            self.replacement_index = ReplacementIndex(AppInfo().use_this_instead_index)
+            # Incremented whenever rules or mod metadata are compiled, so that
+            # anything derived from them (e.g. dependency graphs) can tell it is stale
+            self.rules_version = 0
+
             # Connect a warning signal for thread-safe prompts
             self.show_warning_signal.connect(show_warning)
+            # Details parsed in the background are applied on the main thread
+            self.mod_details_parsed_signal.connect(self.__apply_mod_details)
+            # Mods that were parsed as skeletons and still await their details
+            self.pending_detail_uuids: set[str] = set()
+            # Mods whose details were requested ahead of the background pass
+            self.requested_detail_uuids: set[str] = set()
 
             # Store parsed metadata & paths
-            self.external_steam_metadata: dict[str, Any] | None = None
+            self.external_steam_metadata: MutableMapping[str, Any] | None = None
             self.external_steam_metadata_path: str | None = None
             self.external_community_rules: dict[str, Any] | None = None
             self.external_community_rules_path: str | None = None
             self.external_no_version_warning: list[str] | None = None
             self.external_no_version_warning_path: str | None = None
-            # self.external_use_this_instead_replacements: dict[str, ModReplacement] | None = None
             self.external_user_rules: dict[str, Any] | None = None
             self.external_user_rules_path: str = str(
                 AppInfo().databases_folder / "userRules.json"
@@ -101,7 +136,12 @@ class MetadataManager(QObject):
             self.mod_metadata_file_mapper: dict[str, str] = {}
             self.mod_metadata_dir_mapper: dict[str, str] = {}
             self.packageid_to_uuids: dict[str, set[str]] = {}
-            self.steamdb_packageid_to_name: dict[str, str] = {}
+            self.publishedfileid_to_uuids: dict[str, set[str]] = {}
+            self.path_to_uuid: dict[str, str] = {}
+            # ModParser threads update the lookups while other mods are looked up
+            self.mod_index_lock = Lock()
+            self.steamdb_packageid_to_name: Mapping[str, str] = {}
+            self.steamdb_packageid_to_pfid: Mapping[str, str] = {}
             # Empty game version string unless the data is populated
             self.game_version: str = ""
             # SteamCMD .acf file data
@@ -168,7 +208,7 @@ class MetadataManager(QObject):
 
         def get_configured_steam_db(
             life: int, path: str
-        ) -> tuple[dict[str, Any] | None, str | None]:
+        ) -> tuple[MutableMapping[str, Any] | None, str | None]:
             logger.info(f"Checking for Steam DB at: {path}")
             if not validate_db_path(path, "Steam"):
                 return None, None
@@ -177,57 +217,76 @@ class MetadataManager(QObject):
             logger.info(
                 "Steam DB exists!",
             )
-            with open(path, encoding="utf-8") as f:
-                json_string = f.read()
-                logger.info("Checking metadata expiry against database...")
-                db_data = json.loads(json_string)
-                current_time = int(time())
-                db_time = int(db_data["version"])
-                elapsed = current_time - db_time
-                if (
-                    elapsed <= life
-                ):  # If the duration elapsed since db creation is less than expiry than expiry
-                    # The data is valid
-                    db_json_data = db_data[
-                        "database"
-                    ]  # TODO: additional check to verify integrity of this data's schema
-                    logger.info(
-                        "Cached Steam DB is valid! Returning data to RimSort..."
+            db_json_data: MutableMapping[str, Any] | None = None
+            if self.settings_controller.settings.indexed_steam_db:
+                # Entries are decoded lazily from an on-disk index, built on first load
+                # and whenever the Steam DB file changes
+                try:
+                    indexed_db = IndexedSteamDatabase.open_or_build(
+                        path, AppInfo().steam_db_index_folder
                     )
-                    total_entries = len(db_json_data)
-                    logger.info(
-                        f"Loaded metadata for {total_entries} Steam Workshop mods from Steam DB"
+                    db_json_data = indexed_db
+                    db_time = indexed_db.version
+                    self.steamdb_packageid_to_name = indexed_db.name_by_packageid
+                    self.steamdb_packageid_to_pfid = indexed_db.pfid_by_packageid
+                except (
+                    OSError,
+                    sqlite3.Error,
+                    msgspec.DecodeError,
+                    ValueError,
+                    KeyError,
+                    TypeError,
+                ) as e:
+                    logger.warning(
+                        f"Unable to index Steam DB, loading it in full instead: {e}"
                     )
-                else:  # If the cached db data is expired but NOT missing
-                    # Fallback to the expired metadata
-                    if life != 0:  # Disable Notification if value is 0
-                        self.show_warning_signal.emit(
-                            self.tr("Steam DB metadata expired"),
-                            self.tr("Steam DB is expired! Consider updating!\n"),
-                            self.tr(
-                                "Steam DB last updated: {last_updated}\n\n"
-                                + "Falling back to cached, but EXPIRED Steam Database..."
-                            ).format(
-                                last_updated=strftime(
-                                    "%Y-%m-%d %H:%M:%S",
-                                    localtime(db_data["version"] - life),
-                                )
-                            ),
-                            "",
-                        )
-                    db_json_data = db_data[
-                        "database"
-                    ]  # TODO: additional check to verify integrity of this data's schema
-                    total_entries = len(db_json_data)
-                    logger.info(
-                        f"Loaded metadata for {total_entries} Steam Workshop mods from Steam DB"
+            if db_json_data is None:
+                with open(path, "rb") as f:
+                    db_data = msgspec.json.decode(
+                        f.read(), type=SteamDbFile, strict=False
                     )
-                self.steamdb_packageid_to_name = {
-                    metadata["packageid"]: metadata["name"]
-                    for metadata in db_data.get("database", {}).values()
-                    if metadata.get("packageid") and metadata.get("name")
-                }
-                return db_json_data, path
+                db_json_data = db_data.database
+                db_time = db_data.version
+                packageid_to_name: dict[str, str] = {}
+                packageid_to_pfid: dict[str, str] = {}
+                for pfid, metadata in db_json_data.items():
+                    packageid = steam_db_packageid(metadata)
+                    if packageid:
+                        packageid_to_pfid.setdefault(packageid, pfid)
+                        if metadata.get("name"):
+                            packageid_to_name[packageid] = metadata["name"]
+                self.steamdb_packageid_to_name = packageid_to_name
+                self.steamdb_packageid_to_pfid = packageid_to_pfid
+            logger.info("Checking metadata expiry against database...")
+            current_time = int(time())
+            elapsed = current_time - db_time
+            if (
+                elapsed <= life
+            ):  # If the duration elapsed since db creation is less than expiry than expiry
+                # The data is valid
+                logger.info("Cached Steam DB is valid! Returning data to RimSort...")
+            else:  # If the cached db data is expired but NOT missing
+                # Fallback to the expired metadata
+                if life != 0:  # Disable Notification if value is 0
+                    self.show_warning_signal.emit(
+                        self.tr("Steam DB metadata expired"),
+                        self.tr("Steam DB is expired! Consider updating!\n"),
+                        self.tr(
+                            "Steam DB last updated: {last_updated}\n\n"
+                            + "Falling back to cached, but EXPIRED Steam Database..."
+                        ).format(
+                            last_updated=strftime(
+                                "%Y-%m-%d %H:%M:%S",
+                                localtime(db_time - life),
+                            )
+                        ),
+                        "",
+                    )
+            total_entries = len(db_json_data)
+            logger.info(
+                f"Loaded metadata for {total_entries} Steam Workshop mods from Steam DB"
+            )
+            return db_json_data, path
 
         def get_configured_community_rules_db(
             path: str,
@@ -241,12 +300,13 @@ class MetadataManager(QObject):
             logger.info(
                 "Community Rules DB exists!",
             )
-            with open(path, encoding="utf-8") as f:
-                json_string = f.read()
+            with open(path, "rb") as f:
                 logger.info("Reading info from communityRules.json")
-                rule_data = json.loads(json_string)
-                community_rules_json_data = rule_data["rules"]
-                total_entries = len(community_rules_json_data)
+                rule_data = msgspec.json.decode(
+                    f.read(), type=ExternalRulesFile, strict=False
+                )
+                community_rules_json_data = rule_data.rules
+                total_entries = len(community_rules_json_data or {})
                 logger.info(
                     f"Loaded {total_entries} additional sorting rules from Community Rules"
                 )
@@ -270,6 +330,13 @@ class MetadataManager(QObject):
 
         # Load external metadata
 
+        # Release the previous Steam DB index, the parsers that used it are done
+        if isinstance(self.external_steam_metadata, IndexedSteamDatabase):
+            self.external_steam_metadata.close()
+        self.external_steam_metadata = None
+        self.steamdb_packageid_to_name = {}
+        self.steamdb_packageid_to_pfid = {}
+
         # External Steam metadata
         if (
             self.settings_controller.settings.external_steam_metadata_source
@@ -347,9 +414,10 @@ class MetadataManager(QObject):
         # External User Rules metadata
         if os.path.exists(self.external_user_rules_path):
             logger.info("Loading userRules.json")
-            with open(self.external_user_rules_path, encoding="utf-8") as f:
-                json_string = f.read()
-                self.external_user_rules = json.loads(json_string)["rules"]
+            with open(self.external_user_rules_path, "rb") as f:
+                self.external_user_rules = msgspec.json.decode(
+                    f.read(), type=ExternalRulesFile, strict=False
+                ).rules
             total_entries = 0
             if self.external_user_rules is not None:
                 total_entries = len(self.external_user_rules)
@@ -411,6 +479,11 @@ class MetadataManager(QObject):
                 '"No Version Warning" override disabled by user. Please choose a metadata source in settings.'
             )
 
+        # "Use This Instead" replacements, re-indexed if the Replacements folder changed
+        use_this_instead_folder = self.get_use_this_instead_folder()
+        if use_this_instead_folder is not None:
+            self.replacement_index.load(use_this_instead_folder)
+
     def __refresh_internal_metadata(self, is_initial: bool = False) -> None:
         def batch_by_data_source(
             data_source: str, mod_directories: list[str]
@@ -466,13 +539,8 @@ class MetadataManager(QObject):
                         )
                         continue
 
-                    deleted_mod_packageid = deleted_mod.get("packageid")
                     self.internal_local_metadata.pop(uuid)
-
-                    if deleted_mod_packageid and self.packageid_to_uuids.get(
-                        deleted_mod_packageid
-                    ):
-                        self.packageid_to_uuids[deleted_mod_packageid].remove(uuid)
+                    self.unindex_mod(uuid, deleted_mod)
 
         # Get & set Rimworld version string
         game_folder = self.settings_controller.settings.instances[
@@ -584,6 +652,7 @@ class MetadataManager(QObject):
             self.process_batch(
                 batch=local_batch,
                 data_source="local",
+                skeleton=self.settings_controller.settings.two_phase_metadata_refresh,
             )
         else:
             logger.debug(
@@ -607,6 +676,7 @@ class MetadataManager(QObject):
             self.process_batch(
                 batch=workshop_batch,
                 data_source="workshop",
+                skeleton=self.settings_controller.settings.two_phase_metadata_refresh,
             )
         else:
             logger.debug(
@@ -636,6 +706,8 @@ class MetadataManager(QObject):
                 for uuid, metadata in self.internal_local_metadata.items()
             },
         }
+        # Persist parsed metadata, pruning directories that no longer exist
+        self.metadata_cache.save(keep=self.mod_metadata_dir_mapper.keys())
 
     def __update_from_settings(self) -> None:
         self.community_rules_repo = (
@@ -661,542 +733,55 @@ class MetadataManager(QObject):
         """
         Iterate through each expansion or mod and add new key-values describing the
         dependencies, incompatibilities, and load order rules compiled from metadata.
-        """
-        # Compile metadata for all mods if uuids is None
-        uuids = uuids or list(self.internal_local_metadata.keys())
-        logger.info(f"Started compiling metadata for {len(uuids)} mods")
-
-        # Add dependencies to installed mods based on dependencies listed in About.xml TODO manifest.xml
-        logger.info("Started compiling metadata from About.xml")
-        # Go through each mod and add dependencies
-        dependencies = None
-        for uuid in uuids:
-            logger.debug(
-                f"UUID: {uuid} packageid: "
-                + self.internal_local_metadata[uuid].get("packageid")
-            )
-            # moddependencies are not equal to mod load order rules
-            if self.internal_local_metadata[uuid].get("moddependencies"):
-                if isinstance(
-                    self.internal_local_metadata[uuid]["moddependencies"], dict
-                ):
-                    dependencies = self.internal_local_metadata[uuid][
-                        "moddependencies"
-                    ].get("li")
-                elif isinstance(
-                    self.internal_local_metadata[uuid]["moddependencies"], list
-                ):
-                    # Loop through the list and try to find dictionary. If we find one, use it.
-                    for potential_dependencies in self.internal_local_metadata[uuid][
-                        "moddependencies"
-                    ]:
-                        if (
-                            potential_dependencies
-                            and isinstance(potential_dependencies, dict)
-                            and potential_dependencies.get("li")
-                        ):
-                            dependencies = potential_dependencies["li"]
-                if dependencies:
-                    logger.debug(
-                        f"Current mod requires these mods to work: {dependencies}"
-                    )
-                    add_dependency_to_mod(
-                        self.internal_local_metadata[uuid],
-                        dependencies,
-                        self.internal_local_metadata,
-                    )
 
-            if self.internal_local_metadata[uuid].get("moddependenciesbyversion"):
-                major, minor = self.game_version.split(".")[
-                    :2
-                ]  # Split the version and take the first two parts
-                version_regex = rf"v{major}\.{minor}"  # Construct the regex to match both major and minor versions
-                for version, dependencies_by_ver in self.internal_local_metadata[uuid][
-                    "moddependenciesbyversion"
-                ].items():
-                    if match(version_regex, version):
-                        if (
-                            dependencies_by_ver
-                            and isinstance(dependencies_by_ver, dict)
-                            and dependencies_by_ver.get("li")
-                        ):
-                            logger.debug(
-                                f"Current mod requires these mods by version to work: {dependencies_by_ver['li']}"
-                            )
-                            add_dependency_to_mod(
-                                self.internal_local_metadata[uuid],
-                                dependencies_by_ver["li"],
-                                self.internal_local_metadata,
-                            )
-                        else:
-                            logger.warning(
-                                f"About.xml syntax error. Unable to read <moddependenciesbyversion> tag from XML for version [{version}]: {self.internal_local_metadata[uuid]['metadata_file_path']}"
-                            )
-                            logger.debug(dependencies_by_ver)
-            if self.internal_local_metadata[uuid].get(
-                "incompatiblewith"
-            ) and isinstance(
-                self.internal_local_metadata[uuid].get("incompatiblewith"), dict
-            ):
-                incompatibilities = self.internal_local_metadata[uuid][
-                    "incompatiblewith"
-                ].get("li")
-                if incompatibilities:
-                    logger.debug(
-                        f"Current mod is incompatible with these mods: {incompatibilities}"
-                    )
-                    add_incompatibility_to_mod(
-                        self.internal_local_metadata[uuid],
-                        incompatibilities,
-                        self.internal_local_metadata,
-                    )
-
-            if self.internal_local_metadata[uuid].get("incompatiblewithbyversion"):
-                major, minor = self.game_version.split(".")[
-                    :2
-                ]  # Split the version and take the first two parts
-                version_regex = rf"v{major}\.{minor}"  # Construct the regex to match both major and minor versions
-                for version, incompatibilities_by_ver in self.internal_local_metadata[
-                    uuid
-                ]["incompatiblewithbyversion"].items():
-                    if match(version_regex, version):
-                        if (
-                            incompatibilities_by_ver
-                            and isinstance(incompatibilities_by_ver, dict)
-                            and incompatibilities_by_ver.get("li")
-                        ):
-                            logger.debug(
-                                f"Current mod is incompatible by version with these mods: {incompatibilities_by_ver['li']}"
-                            )
-                            add_incompatibility_to_mod(
-                                self.internal_local_metadata[uuid],
-                                incompatibilities_by_ver["li"],
-                                self.internal_local_metadata,
-                            )
-                        else:
-                            logger.warning(
-                                f"About.xml syntax error. Unable to read <incompatiblewithbyversion> tag from XML for version [{version}]: {self.internal_local_metadata[uuid]['metadata_file_path']}"
-                            )
-                            logger.debug(incompatibilities_by_ver)
-            # Current mod should be loaded AFTER these mods. These mods can be thought
-            # of as "load these before". These are not necessarily dependencies in the sense
-            # that they "depend" on them. But, if they exist in the same mod list, they
-            # should be loaded before.
-            if self.internal_local_metadata[uuid].get("loadafter"):
-                try:
-                    load_these_before = self.internal_local_metadata[uuid][
-                        "loadafter"
-                    ].get("li")
-                    if load_these_before:
-                        logger.debug(
-                            f"Current mod should load after these mods: {load_these_before}"
-                        )
-                        add_load_rule_to_mod(
-                            self.internal_local_metadata[uuid],
-                            load_these_before,
-                            "loadTheseBefore",
-                            "loadTheseAfter",
-                            self.internal_local_metadata,
-                            self.packageid_to_uuids,
-                        )
-                except Exception as e:
-                    mod_metadata_path = self.internal_local_metadata[uuid][
-                        "metadata_file_path"
-                    ]
-                    logger.warning(
-                        f"About.xml syntax error. Unable to read <loadafter> tag from XML: {mod_metadata_path}"
-                    )
-                    logger.debug(e)
-
-            if self.internal_local_metadata[uuid].get("forceloadafter"):
-                try:
-                    force_load_these_before = self.internal_local_metadata[uuid][
-                        "forceloadafter"
-                    ].get("li")
-                    if force_load_these_before:
-                        logger.debug(
-                            f"Current mod should force load after these mods: {force_load_these_before}"
-                        )
-                        add_load_rule_to_mod(
-                            self.internal_local_metadata[uuid],
-                            force_load_these_before,
-                            "loadTheseBefore",
-                            "loadTheseAfter",
-                            self.internal_local_metadata,
-                            self.packageid_to_uuids,
-                        )
-                except Exception as e:
-                    mod_metadata_path = self.internal_local_metadata[uuid][
-                        "mod_metadata_path"
-                    ]
-                    logger.warning(
-                        f"About.xml syntax error. Unable to read <forceloadafter> tag from XML: {mod_metadata_path}"
-                    )
-                    logger.debug(e)
-
-            if self.internal_local_metadata[uuid].get("loadafterbyversion"):
-                major, minor = self.game_version.split(".")[:2]
-                version_regex = rf"v{major}\.{minor}"
-                for version, load_these_before_by_ver in self.internal_local_metadata[
-                    uuid
-                ]["loadafterbyversion"].items():
-                    if match(version_regex, version):
-                        try:
-                            if (
-                                load_these_before_by_ver
-                                and isinstance(load_these_before_by_ver, dict)
-                                and load_these_before_by_ver.get("li")
-                            ):
-                                logger.debug(
-                                    f"Current mod should load before these mods for {version}: {load_these_before_by_ver['li']}"
-                                )
-                                add_load_rule_to_mod(
-                                    self.internal_local_metadata[uuid],
-                                    load_these_before_by_ver["li"],
-                                    "loadTheseBefore",
-                                    "loadTheseAfter",
-                                    self.internal_local_metadata,
-                                    self.packageid_to_uuids,
-                                )
-                            else:
-                                logger.warning(
-                                    f"About.xml syntax error. Unable to read <loadafterbyversion> tag from XML for version [{version}]: {self.internal_local_metadata[uuid]['metadata_file_path']}"
-                                )
-                                logger.debug(load_these_before_by_ver)
-                        except Exception as e:
-                            mod_metadata_path = self.internal_local_metadata[uuid].get(
-                                "metadata_file_path"
-                            )
-                            logger.warning(
-                                f"Error processing <loadafterbyversion> tag for {version} from XML: {mod_metadata_path}"
-                            )
-                            logger.debug(e)
-
-            # Current mod should be loaded BEFORE these mods
-            # The current mod is a dependency for all these mods
-            if self.internal_local_metadata[uuid].get("loadbefore"):
-                try:
-                    load_these_after = self.internal_local_metadata[uuid][
-                        "loadbefore"
-                    ].get("li")
-                    if load_these_after:
-                        logger.debug(
-                            f"Current mod should load before these mods: {load_these_after}"
-                        )
-                        add_load_rule_to_mod(
-                            self.internal_local_metadata[uuid],
-                            load_these_after,
-                            "loadTheseAfter",
-                            "loadTheseBefore",
-                            self.internal_local_metadata,
-                            self.packageid_to_uuids,
-                        )
-                except Exception as e:
-                    mod_metadata_path = self.internal_local_metadata[uuid][
-                        "metadata_file_path"
-                    ]
-                    logger.warning(
-                        f"About.xml syntax error. Unable to read <loadbefore> tag from XML: {mod_metadata_path}"
-                    )
-                    logger.debug(e)
-
-            if self.internal_local_metadata[uuid].get("forceloadbefore"):
-                try:
-                    force_load_these_after = self.internal_local_metadata[uuid][
-                        "forceloadbefore"
-                    ].get("li")
-                    if force_load_these_after:
-                        logger.debug(
-                            f"Current mod should force load before these mods: {force_load_these_after}"
-                        )
-                        add_load_rule_to_mod(
-                            self.internal_local_metadata[uuid],
-                            force_load_these_after,
-                            "loadTheseAfter",
-                            "loadTheseBefore",
-                            self.internal_local_metadata,
-                            self.packageid_to_uuids,
-                        )
-                except Exception as e:
-                    mod_metadata_path = self.internal_local_metadata[uuid][
-                        "metadata_file_path"
-                    ]
-                    logger.warning(
-                        f"About.xml syntax error. Unable to read <forceloadbefore> tag from XML: {mod_metadata_path}"
-                    )
-                    logger.debug(e)
-
-            if self.internal_local_metadata[uuid].get("loadbeforebyversion"):
-                major, minor = self.game_version.split(".")[:2]
-                version_regex = rf"v{major}\.{minor}"
-                for version, load_these_after_by_ver in self.internal_local_metadata[
-                    uuid
-                ]["loadbeforebyversion"].items():
-                    if match(version_regex, version):
-                        try:
-                            if (
-                                load_these_after_by_ver
-                                and isinstance(load_these_after_by_ver, dict)
-                                and load_these_after_by_ver.get("li")
-                            ):
-                                logger.debug(
-                                    f"Current mod should load after these mods for {version}: {load_these_after_by_ver['li']}"
-                                )
-                                add_load_rule_to_mod(
-                                    self.internal_local_metadata[uuid],
-                                    load_these_after_by_ver["li"],
-                                    "loadTheseAfter",
-                                    "loadTheseBefore",
-                                    self.internal_local_metadata,
-                                    self.packageid_to_uuids,
-                                )
-                            else:
-                                logger.warning(
-                                    f"About.xml syntax error. Unable to read <loadbeforebyversion> tag from XML for version [{version}]: {self.internal_local_metadata[uuid]['metadata_file_path']}"
-                                )
-                                logger.debug(load_these_after_by_ver)
-                        except Exception as e:
-                            mod_metadata_path = self.internal_local_metadata[uuid].get(
-                                "metadata_file_path"
-                            )
-                            logger.warning(
-                                f"Error processing <loadbeforebyversion> tag for {version} from XML: {mod_metadata_path}"
-                            )
-                            logger.debug(e)
-
-        logger.info("Finished adding dependencies through About.xml information")
-        log_deps_order_info(self.internal_local_metadata)
-
-        # Steam references dependencies based on PublishedFileID, not package ID
-        if self.external_steam_metadata:
-            logger.info("Started compiling metadata from configured SteamDB")
-            tracking_dict: dict[str, set[str]] = {}
-            steam_id_to_package_id: dict[str, str] = {}
-            for publishedfileid, mod_data in self.external_steam_metadata.items():
-                db_packageid = mod_data.get("packageid")
-                # If our DB has a packageid for this
-                if db_packageid:
-                    db_packageid = db_packageid.lower()  # Normalize packageid
-                    steam_id_to_package_id[publishedfileid] = db_packageid
-                    self.steamdb_packageid_to_name[db_packageid] = mod_data.get("name")
-                    potential_uuids = self.packageid_to_uuids.get(db_packageid)
-                    if potential_uuids:  # Potential uuids is a set
-                        for uuid in potential_uuids:
-                            if (
-                                uuid
-                                and self.internal_local_metadata[uuid].get(
-                                    "publishedfileid"
-                                )
-                                == publishedfileid
-                            ):
-                                dependencies = mod_data.get("dependencies")
-                                if dependencies:
-                                    tracking_dict.setdefault(uuid, set()).update(
-                                        dependencies.keys()
-                                    )
-            logger.debug(
-                f"Tracking {len(steam_id_to_package_id)} SteamDB packageids for lookup"
-            )
-            logger.debug(
-                f"Tracking Steam dependency data for {len(tracking_dict)} installed mods"
-            )
-            # For each mod that exists in self.internal_local_metadata -> dependencies (in Steam ID form)
-            for (
-                installed_mod_uuid,
-                set_of_dependency_publishedfileids,
-            ) in tracking_dict.items():
-                for dependency_steam_id in set_of_dependency_publishedfileids:
-                    # Dependencies are added as package_ids. We should be able to
-                    # resolve the package_id from the Steam ID for any mod, unless
-                    # the metadata actually references a Steam ID that itself does not
-                    # wire to a package_id defined in an installed & valid mod.
-                    if dependency_steam_id in steam_id_to_package_id:
-                        add_dependency_to_mod_from_steamdb(
-                            self.internal_local_metadata[installed_mod_uuid],
-                            steam_id_to_package_id[dependency_steam_id],
-                            self.internal_local_metadata,
-                        )
-                    else:
-                        # This should only happen with RimPy Mod Manager Database, since it does not contain
-                        # keyed information for Core + DLCs in it's ["database"] - this is only referenced by
-                        # RPMMDB with the ["database"][pfid]["children"] values.
-                        logger.debug(
-                            f"Unable to lookup Steam AppID/PublishedFileID in Steam metadata: {dependency_steam_id}"
-                        )
-            logger.info("Finished adding dependencies from SteamDB")
-            log_deps_order_info(self.internal_local_metadata)
-        else:
+        If uuids is supplied and does not cover every mod, compilation is incremental:
+        only the given mods (which may have been created, updated or deleted) and the mods
+        whose rules reference them are recompiled.
+        """
+        full = not uuids or set(uuids).issuperset(self.internal_local_metadata)
+        if full:
+            uuids = list(self.internal_local_metadata.keys())
+            self.rule_compiler.reset()
+        logger.info(
+            f"Started compiling metadata for {len(uuids)} mods"
+            + ("" if full else " (incremental)")
+        )
+        if not self.external_steam_metadata:
             logger.info("No Steam database supplied from external metadata. skipping.")
-        # Add load order to installed mods based on dependencies from community rules
-        if self.external_community_rules:
-            logger.info("Started compiling metadata from configured Community Rules")
-            for package_id in self.external_community_rules:
-                # Note: requiring the package be in self.internal_local_metadata should be fine, as
-                # if the mod doesn't exist self.internal_local_metadata, then either mod_data or dependency_id
-                # will be None, and then we don't insert a dependency
-                if package_id.lower() in self.packageid_to_uuids:
-                    potential_uuids = self.packageid_to_uuids.get(
-                        package_id.lower(), set()
-                    )
-                    load_these_after = self.external_community_rules[package_id].get(
-                        "loadBefore"
-                    )
-                    if load_these_after:
-                        logger.debug(
-                            f"Current mod should load before these mods: {load_these_after}"
-                        )
-                        # In Alphabetical, load_these_after is at least an empty dict
-                        # Cannot call add_load_rule_to_mod outside of this for loop,
-                        # as that expects a list
-                        for load_this_after in load_these_after:
-                            for uuid in potential_uuids:
-                                add_load_rule_to_mod(
-                                    self.internal_local_metadata[
-                                        uuid
-                                    ],  # Already checked above
-                                    load_this_after,  # Lower() done in call
-                                    "loadTheseAfter",
-                                    "loadTheseBefore",
-                                    self.internal_local_metadata,
-                                    self.packageid_to_uuids,
-                                )
-                    load_these_before = self.external_community_rules[package_id].get(
-                        "loadAfter"
-                    )
-                    if load_these_before:
-                        logger.debug(
-                            f"Current mod should load after these mods: {load_these_before}"
-                        )
-                        # In Alphabetical, load_these_before is at least an empty dict
-                        for load_this_before in load_these_before:
-                            for uuid in potential_uuids:
-                                add_load_rule_to_mod(
-                                    self.internal_local_metadata[
-                                        uuid
-                                    ],  # Already checked above
-                                    load_this_before,  # lower() done in call
-                                    "loadTheseBefore",
-                                    "loadTheseAfter",
-                                    self.internal_local_metadata,
-                                    self.packageid_to_uuids,
-                                )
-                    incompatibilities = self.external_community_rules[package_id].get(
-                        "incompatibleWith"
-                    )
-                    if incompatibilities:
-                        logger.debug(
-                            f"Current mod is incompatible with these mods: {incompatibilities}"
-                        )
-                        for incompatibilities in incompatibilities:
-                            for uuid in potential_uuids:
-                                add_incompatibility_to_mod(
-                                    self.internal_local_metadata[uuid],
-                                    incompatibilities,
-                                    self.internal_local_metadata,
-                                )
-                    load_this_bottom = self.external_community_rules[package_id].get(
-                        "loadBottom"
-                    )
-                    if load_this_bottom:
-                        logger.debug(
-                            'Current mod should load at the bottom of a mods list, and will be considered a "tier 3" mod'
-                        )
-                        for uuid in potential_uuids:
-                            self.internal_local_metadata[uuid]["loadBottom"] = True
-            logger.info("Finished adding dependencies from Community Rules")
-            log_deps_order_info(self.internal_local_metadata)
-        else:
+        if not self.external_community_rules:
             logger.info(
                 "No Community Rules database supplied from external metadata. skipping."
             )
-        # Add load order rules to installed mods based on rules from user rules
-        if self.external_user_rules:
-            logger.info("Started compiling metadata from User Rules")
-            for package_id in self.external_user_rules:
-                # Note: requiring the package be in self.internal_local_metadata should be fine, as
-                # if the mod doesn't exist self.internal_local_metadata, then either mod_data or dependency_id
-                # will be None, and then we don't insert a dependency
-                if package_id.lower() in self.packageid_to_uuids:
-                    potential_uuids = self.packageid_to_uuids.get(
-                        package_id.lower(), set()
-                    )
-                    load_these_after = self.external_user_rules[package_id].get(
-                        "loadBefore"
-                    )
-                    if load_these_after:
-                        logger.debug(
-                            f"Current mod should load before these mods: {load_these_after}"
-                        )
-                        # In Alphabetical, load_these_after is at least an empty dict
-                        # Cannot call add_load_rule_to_mod outside of this for loop,
-                        # as that expects a list
-                        for load_this_after in load_these_after:
-                            for uuid in potential_uuids:
-                                add_load_rule_to_mod(
-                                    self.internal_local_metadata[
-                                        uuid
-                                    ],  # Already checked above
-                                    load_this_after,  # lower() done in call
-                                    "loadTheseAfter",
-                                    "loadTheseBefore",
-                                    self.internal_local_metadata,
-                                    self.packageid_to_uuids,
-                                )
-
-                    load_these_before = self.external_user_rules[package_id].get(
-                        "loadAfter"
-                    )
-                    if load_these_before:
-                        logger.debug(
-                            f"Current mod should load after these mods: {load_these_before}"
-                        )
-                        # In Alphabetical, load_these_before is at least an empty dict
-                        for load_this_before in load_these_before:
-                            for uuid in potential_uuids:
-                                add_load_rule_to_mod(
-                                    self.internal_local_metadata[
-                                        uuid
-                                    ],  # Already checked above
-                                    load_this_before,  # lower() done in call
-                                    "loadTheseBefore",
-                                    "loadTheseAfter",
-                                    self.internal_local_metadata,
-                                    self.packageid_to_uuids,
-                                )
-                    incompatibilities = self.external_user_rules[package_id].get(
-                        "incompatibleWith"
-                    )
-                    if incompatibilities:
-                        logger.debug(
-                            f"Current mod is incompatible with these mods: {incompatibilities}"
-                        )
-                        for incompatibilities in incompatibilities:
-                            for uuid in potential_uuids:
-                                add_incompatibility_to_mod(
-                                    self.internal_local_metadata[uuid],
-                                    incompatibilities,
-                                    self.internal_local_metadata,
-                                )
-                    load_this_bottom = self.external_user_rules[package_id].get(
-                        "loadBottom"
-                    )
-                    if load_this_bottom:
-                        logger.debug(
-                            'Current mod should load at the bottom of a mods list, and will be considered a "tier 3" mod'
-                        )
-                        for uuid in potential_uuids:
-                            self.internal_local_metadata[uuid]["loadBottom"] = True
-            logger.info("Finished adding dependencies from User Rules")
-            log_deps_order_info(self.internal_local_metadata)
-        else:
+        if not self.external_user_rules:
             logger.info(
                 "No User Rules database supplied from external metadata. skipping."
             )
-
-        # logger.info("Flagging obsoleted mods from the Use This Instead database")
-        # if self.settings_controller.settings.external_use_this_instead_metadata_source != "None":
-
-        logger.info("Finished compiling internal metadata with external metadata")
+        compiled = self.rule_compiler.compile(
+            uuids,
+            all_mods=self.internal_local_metadata,
+            packageid_to_uuids=self.packageid_to_uuids,
+            game_version=self.game_version,
+            steam_db=self.external_steam_metadata,
+            community_rules=self.external_community_rules,
+            user_rules=self.external_user_rules,
+        )
+        if full:
+            if isinstance(self.steamdb_packageid_to_name, dict):
+                self.steamdb_packageid_to_name.update(
+                    self.rule_compiler.steam_package_id_to_name
+                )
+            log_deps_order_info(self.internal_local_metadata)
+            self.version_mismatch_index.rebuild(
+                self.internal_local_metadata,
+                self.game_version,
+                self.external_no_version_warning,
+            )
+        else:
+            self.version_mismatch_index.update(uuids, self.internal_local_metadata)
+        self.rules_version += 1
+        logger.info(
+            f"Finished compiling internal metadata with external metadata ({len(compiled)} mods compiled)"
+        )
 
     def is_version_mismatch(self, uuid: str) -> bool:
         """
@@ -1204,86 +789,35 @@ class MetadataManager(QObject):
         Return True if the version does not match.
         Return False if the version matches.
         If there is an error, log it and return True.
-        """
-        # Initialize result to True, if an error occurs, it will be changed to False
-        result = True
-
-        # Get mod data
-        mod_data = self.internal_local_metadata.get(uuid, {})
 
-        # check if mod_data exists and packageid is included in the external "No Version Warning" list
-        if (
-            mod_data
-            and self.external_no_version_warning
-            and mod_data["packageid"] in self.external_no_version_warning
-        ):
-            logger.info(
-                f'mod with id "{mod_data["packageid"]}" was found on the "No Version Warning" list. Skipping version mismatch check!'
+        Answered from the version mismatch index, which is built when metadata is compiled.
+        """
+        if self.version_mismatch_index.game_version != self.game_version:
+            self.version_mismatch_index.rebuild(
+                self.internal_local_metadata,
+                self.game_version,
+                self.external_no_version_warning,
             )
-            return False
-        elif (  # Check if game_version exists and mod_data exists and mod_data contains 'supportedversions' with 'li' key
-            self.game_version
-            and mod_data
-            and mod_data.get("supportedversions", {}).get("li")
-        ):
-            # Get supported versions
-            supported_versions = self.internal_local_metadata[uuid][
-                "supportedversions"
-            ]["li"]
-
-            # Check if supported versions is a string or a list
-            if isinstance(supported_versions, str):
-                # If game_version starts with supported_versions, result is False
-                if self.game_version.startswith(supported_versions):
-                    result = False
-            elif isinstance(supported_versions, list):
-                # If any version from supported_versions starts with game_version, result is False
-                result = not any(
-                    [
-                        ver
-                        for ver in supported_versions
-                        if self.game_version.startswith(ver)
-                    ]
-                )
-            else:
-                # If supported_versions is not a string or a list, log error and return True
-                logger.error(
-                    f"supportedversions value not str or list: {supported_versions}"
-                )
-                result = True
-
-        # Return result
-        return result
+        return self.version_mismatch_index.is_mismatch(
+            uuid, self.internal_local_metadata
+        )
 
-    @lru_cache
-    def has_alternative_mod(self, uuid: str) -> ModReplacement | None:
+    def get_use_this_instead_folder(self) -> Path | None:
         """
-        If the use has configured a "Use This Instead" database, this function checks if a given mod has
-        a recommended alternative.
+        Return the configured "Use This Instead" Replacements folder, a directory of xml files
+        each named for the published file id of the mod it replaces.
 
-        If the user does not, it always returns false
+        :return: The folder, or None if no "Use This Instead" database is configured
         """
-
-        if (
-            self.settings_controller.settings.external_use_this_instead_metadata_source
-            == "None"
-        ):
-            return None
-
-        path: Path
-
-        if (
+        source = (
             self.settings_controller.settings.external_use_this_instead_metadata_source
-            == "Configured file path"
-        ):
-            path = Path(
+        )
+        if source == "Configured file path":
+            return Path(
                 self.settings_controller.settings.external_use_this_instead_folder_path
             )
-        elif (
-            self.settings_controller.settings.external_use_this_instead_metadata_source
-            == "Configured git repository"
-        ):
-            path = (
+        elif source == "Configured git repository":
+            return (
                 AppInfo().databases_folder
                 / Path(
                     os.path.split(
@@ -1292,44 +826,168 @@ class MetadataManager(QObject):
                 )
                 / "Replacements"
             )
-        else:
+        return None
+
+    def has_alternative_mod(self, uuid: str) -> ModReplacement | None:
+        """
+        If the use has configured a "Use This Instead" database, this function checks if a given mod has
+        a recommended alternative.
+
+        If the user does not, it always returns false
+
+        Answered from the replacement index, which is loaded when external metadata is refreshed.
+        """
+        path = self.get_use_this_instead_folder()
+        if path is None:
             return None
 
-        # At this point, path points to a directory of xml files, each named for a mod.
         mod_data = self.internal_local_metadata.get(uuid, False)
         if not mod_data or "publishedfileid" not in mod_data:
             return None
 
-        check_path = path / Path(mod_data["publishedfileid"] + ".xml")
-        if not check_path.exists():
-            return None
-        replacement_data = xml_path_to_json(str(check_path))["ModReplacement"]
-
-        # check if replacement supports  the game version
-        major, minor = self.game_version.split(".")[:2]
-        version_regex = rf"{major}.{minor}"
-        if version_regex not in replacement_data["ReplacementVersions"]:
+        replacement = self.replacement_index.get(path, mod_data["publishedfileid"])
+        # check if replacement supports the game version
+        if replacement is None or not replacement.supports(self.game_version):
             return None
 
         return ModReplacement(
-            name=replacement_data["ReplacementName"],
-            author=replacement_data["ReplacementAuthor"],
-            pfid=replacement_data["ReplacementSteamId"],
+            name=replacement.name,
+            author=replacement.author,
+            pfid=replacement.pfid,
         )
 
+    def get_steamdb_stamp(self) -> str:
+        """
+        Return a string identifying the currently loaded Steam DB, or an empty string if none is loaded.
+
+        Used to invalidate cached metadata that was derived from a different Steam DB.
+        """
+        if not self.external_steam_metadata or not self.external_steam_metadata_path:
+            return ""
+        try:
+            mtime = os.path.getmtime(self.external_steam_metadata_path)
+        except OSError:
+            mtime = 0
+        return f"{self.external_steam_metadata_path}:{mtime}"
+
+    def apply_acf_metadata(self, mod_metadata: ModMetadata, data_source: str) -> None:
+        """
+        Supplement a mod's metadata with Steam client / SteamCMD .acf timestamps.
+
+        This is kept separate from parsing, since .acf data changes independently of the mod's files.
+        """
+        publishedfileid = mod_metadata.get("publishedfileid")
+        if not publishedfileid:
+            return
+        # Get our metadata based on data source
+        workshop_acf_data = (
+            self.workshop_acf_data
+            if data_source == "workshop"
+            else self.steamcmd_acf_data
+        )
+        workshop_item_details = workshop_acf_data.get("AppWorkshop", {}).get(
+            "WorkshopItemDetails", {}
+        )
+        workshop_items_installed = workshop_acf_data.get("AppWorkshop", {}).get(
+            "WorkshopItemsInstalled", {}
+        )
+        # Edit our metadata, append values
+        if (
+            workshop_item_details.get(publishedfileid, {}).get("timetouched")
+            and workshop_item_details.get(publishedfileid, {}).get("timetouched") != 0
+        ):
+            # The last time SteamCMD/Steam client touched a mod according to its entry
+            mod_metadata["internal_time_touched"] = int(
+                workshop_item_details[publishedfileid]["timetouched"]
+            )
+        if workshop_item_details.get(publishedfileid, {}).get("timeupdated"):
+            # The last time SteamCMD/Steam client updated a mod according to its entry
+            mod_metadata["internal_time_updated"] = int(
+                workshop_item_details[publishedfileid]["timeupdated"]
+            )
+        if workshop_items_installed.get(publishedfileid, {}).get("timeupdated"):
+            # The last time SteamCMD/Steam client updated a mod according to its entry
+            mod_metadata["internal_time_updated"] = int(
+                workshop_items_installed[publishedfileid]["timeupdated"]
+            )
+
+    def index_mod(self, uuid: str, mod_metadata: ModMetadata) -> None:
+        """
+        Track a mod in the packageid, publishedfileid and path lookups.
+
+        :param uuid: The uuid of the mod
+        :param mod_metadata: The metadata of the mod, as stored in internal_local_metadata
+        """
+        packageid = mod_metadata.get("packageid")
+        publishedfileid = mod_metadata.get("publishedfileid")
+        path = mod_metadata.get("path")
+        with self.mod_index_lock:
+            if packageid:
+                self.packageid_to_uuids.setdefault(packageid, set()).add(uuid)
+            if publishedfileid:
+                self.publishedfileid_to_uuids.setdefault(publishedfileid, set()).add(
+                    uuid
+                )
+            if path:
+                self.path_to_uuid[path] = uuid
+
+    def unindex_mod(self, uuid: str, mod_metadata: ModMetadata) -> None:
+        """
+        Stop tracking a mod in the lookups, e.g. before it is removed or re-parsed.
+
+        :param uuid: The uuid of the mod
+        :param mod_metadata: The metadata the mod was indexed with
+        """
+        path = mod_metadata.get("path")
+        with self.mod_index_lock:
+            for lookup, key in (
+                (self.packageid_to_uuids, mod_metadata.get("packageid")),
+                (self.publishedfileid_to_uuids, mod_metadata.get("publishedfileid")),
+            ):
+                if not isinstance(key, str) or key not in lookup:
+                    continue
+                lookup[key].discard(uuid)
+                if not lookup[key]:
+                    del lookup[key]
+            if path and self.path_to_uuid.get(path) == uuid:
+                del self.path_to_uuid[path]
+
     def process_batch(
         self,
         batch: dict[str, str],  # Batch is a mapper of mod directory <-> UUID to parse
         data_source: str,
+        skeleton: bool = False,
     ) -> None:
+        steamdb_stamp = self.get_steamdb_stamp()
+        cached = 0
         for directory, uuid in batch.items():
+            # Hydrate unchanged mods straight from the metadata cache
+            mod_metadata = self.metadata_cache.get(directory, steamdb_stamp)
+            # Skeletons are only complete enough for another skeleton pass
+            if mod_metadata is not None and (
+                skeleton or not mod_metadata.get("skeleton")
+            ):
+                if "uuid" in mod_metadata:
+                    mod_metadata["uuid"] = uuid
+                self.apply_acf_metadata(mod_metadata, data_source)
+                previous_metadata = self.internal_local_metadata.get(uuid)
+                if previous_metadata is not None:
+                    self.unindex_mod(uuid, previous_metadata)
+                self.internal_local_metadata[uuid] = mod_metadata
+                self.index_mod(uuid, mod_metadata)
+                cached += 1
+                continue
             self.process_update(
                 batch=True,
                 exists=uuid in self.internal_local_metadata.keys(),
                 data_source=data_source,
                 mod_directory=directory,
                 uuid=uuid,
+                skeleton=skeleton,
             )
+        logger.info(
+            f"[{data_source}] Loaded {cached} mods from metadata cache, parsing {len(batch) - cached}"
+        )
 
     def process_creation(self, data_source: str, mod_directory: str, uuid: str) -> None:
         logger.debug(
@@ -1355,10 +1013,10 @@ class MetadataManager(QObject):
             )
             return
 
-        deleted_mod_packageid = deleted_mod.get("packageid")
         self.internal_local_metadata.pop(uuid, None)
-        if deleted_mod_packageid and self.packageid_to_uuids.get(deleted_mod_packageid):
-            self.packageid_to_uuids[deleted_mod_packageid].remove(uuid)
+        self.unindex_mod(uuid, deleted_mod)
+        # Drop rules the deleted mod contributed, and rules other mods had towards it
+        self.compile_metadata(uuids=[uuid])
         self.mod_deleted_signal.emit(uuid)
 
     def process_update(
@@ -1368,6 +1026,7 @@ class MetadataManager(QObject):
         data_source: str,
         mod_directory: str,
         uuid: str,
+        skeleton: bool = False,
     ) -> None:
         # logger.warning(exists)
         parser = ModParser(
@@ -1375,6 +1034,7 @@ class MetadataManager(QObject):
             data_source=data_source,
             metadata_manager=self,
             uuid=uuid,
+            skeleton=skeleton,
         )
         self.parser_threadpool.start(parser)
         # Wait for pool to complete if this is a single update
@@ -1382,9 +1042,10 @@ class MetadataManager(QObject):
             logger.debug("Waiting for metadata update to complete...")
             self.parser_threadpool.waitForDone()
             self.parser_threadpool.clear()
+            # Only the updated mod and the mods whose rules reference it are recompiled
+            self.compile_metadata(uuids=[uuid])
         # Send signal to UI to update mod list if the mod we are updating exists
         if exists and not batch:
-            self.compile_metadata(uuids=[uuid])
             self.mod_metadata_updated_signal.emit(uuid)
 
     def refresh_acf_metadata(
@@ -1442,6 +1103,112 @@ class MetadataManager(QObject):
         self.__refresh_internal_metadata(is_initial=is_initial)
         self.__refresh_external_metadata()
         self.compile_metadata(uuids=list(self.internal_local_metadata.keys()))
+        # Fill in anything the skeleton pass skipped, without blocking the UI
+        self.load_mod_details()
+
+    def load_mod_details(self) -> None:
+        """
+        Start parsing the details of every mod that was parsed as a skeleton in the background.
+
+        Skeleton mods only contain what is needed to populate and sort the mod lists. The rest
+        of their About.xml, e.g. the description, and scenario data are applied once parsed.
+        """
+        self.pending_detail_uuids = {
+            uuid
+            for uuid, metadata in self.internal_local_metadata.items()
+            if metadata.get("skeleton")
+        }
+        if not self.pending_detail_uuids:
+            return
+        logger.info(
+            f"Loading details for {len(self.pending_detail_uuids)} mods in the background"
+        )
+        for uuid in self.pending_detail_uuids:
+            metadata = self.internal_local_metadata[uuid]
+            self.parser_threadpool.start(
+                ModParser(
+                    data_source=metadata["data_source"],
+                    mod_directory=metadata["path"],
+                    metadata_manager=self,
+                    uuid=uuid,
+                    details_only=True,
+                    about_file_path=(
+                        ""
+                        if metadata.get("scenario")
+                        else metadata.get("metadata_file_path", "")
+                    ),
+                )
+            )
+
+    def request_mod_details(self, uuid: str) -> None:
+        """
+        Parse the details of a skeleton mod ahead of the rest of the background pass, e.g.
+        when the mod is being displayed. mod_metadata_updated_signal is emitted for the mod
+        once they are applied.
+
+        :param uuid: The uuid of the mod
+        """
+        metadata = self.internal_local_metadata.get(uuid)
+        if (
+            not metadata
+            or not metadata.get("skeleton")
+            or uuid in self.requested_detail_uuids
+        ):
+            return
+        logger.debug(f"Loading details ahead for {metadata.get('path')}")
+        self.requested_detail_uuids.add(uuid)
+        # Queued before the mods of the background pass that have not started yet
+        self.parser_threadpool.start(
+            ModParser(
+                data_source=metadata["data_source"],
+                mod_directory=metadata["path"],
+                metadata_manager=self,
+                uuid=uuid,
+                details_only=True,
+                about_file_path=(
+                    ""
+                    if metadata.get("scenario")
+                    else metadata.get("metadata_file_path", "")
+                ),
+            ),
+            1,
+        )
+
+    def __apply_mod_details(self, uuid: str, details: ModMetadata) -> None:
+        was_pending = uuid in self.pending_detail_uuids
+        self.pending_detail_uuids.discard(uuid)
+        self.requested_detail_uuids.discard(uuid)
+        mod_metadata = self.internal_local_metadata.get(uuid)
+        # Ignore stale details, e.g. if the mod was removed or re-parsed in the meantime
+        if (
+            details
+            and mod_metadata
+            and mod_metadata.get("skeleton")
+            and mod_metadata.get("path") == details.get("path")
+        ):
+            mod_metadata.pop("skeleton")
+            if mod_metadata.get("scenario"):
+                # Scenario skeletons are placeholders, replace them entirely
+                previous_packageid = mod_metadata.get("packageid")
+                self.unindex_mod(uuid, mod_metadata)
+                mod_metadata.update(details)
+                self.index_mod(uuid, mod_metadata)
+                if mod_metadata.get("packageid") != previous_packageid:
+                    self.compile_metadata(uuids=[uuid])
+                else:
+                    self.version_mismatch_index.update(
+                        [uuid], self.internal_local_metadata
+                    )
+                    # The scenario's name, used when sorting, may have changed
+                    self.rules_version += 1
+            else:
+                for key, value in details.items():
+                    mod_metadata.setdefault(key, value)
+                self.index_mod(uuid, mod_metadata)
+            self.mod_metadata_updated_signal.emit(uuid)
+        if was_pending and not self.pending_detail_uuids:
+            # Persist the details, so the next start does not need a skeleton pass
+            self.metadata_cache.save(keep=self.mod_metadata_dir_mapper.keys())
 
     def steamcmd_purge_mods(self, publishedfileids: set[str]) -> None:
         """
@@ -1507,11 +1274,38 @@ class MetadataManager(QObject):
 
     def get_mod_name_from_package_id(self, package_id: str) -> str:
         """Get a mod's name from its package ID"""
-        for mod_data in self.internal_local_metadata.values():
-            if mod_data.get("packageid") == package_id:
+        with self.mod_index_lock:
+            uuids = tuple(self.packageid_to_uuids.get(package_id, ()))
+        for uuid in uuids:
+            mod_data = self.internal_local_metadata.get(uuid)
+            if mod_data is not None:
                 return mod_data.get("name", package_id)
         return package_id
 
+    def get_uuid_from_publishedfileid(self, publishedfileid: str) -> str | None:
+        """
+        Get the uuid of a local mod from its PublishedFileID.
+
+        :param publishedfileid: The PublishedFileID of the mod
+        :return: The uuid of a mod with the PublishedFileID, or None if no local mod has it
+        """
+        with self.mod_index_lock:
+            uuids = tuple(self.publishedfileid_to_uuids.get(publishedfileid, ()))
+        for uuid in uuids:
+            if uuid in self.internal_local_metadata:
+                return uuid
+        return None
+
+    def get_uuid_from_path(self, path: str) -> str | None:
+        """
+        Get the uuid of a local mod from its directory.
+
+        :param path: The path of the mod's directory, as stored in its metadata
+        :return: The uuid of the mod, or None if no local mod is in the directory
+        """
+        uuid = self.path_to_uuid.get(path)
+        return uuid if uuid in self.internal_local_metadata else None
+
     def get_missing_dependencies(
         self, active_mods_uuids: set[str]
     ) -> dict[str, set[str]]:
@@ -1553,12 +1347,27 @@ class ModParser(QRunnable):
         mod_directory: str,
         metadata_manager: MetadataManager,
         uuid: str = "",
+        skeleton: bool = False,
+        details_only: bool = False,
+        about_file_path: str = "",
     ):
         super(ModParser, self).__init__()
         self.data_source = data_source
         self.mod_directory = mod_directory
         self.metadata_manager = metadata_manager
         self.uuid = uuid
+        # A skeleton parse skips everything the mod lists do not need (About.xml tags other
+        # than ABOUT_XML_SKELETON_TAGS, scenario .rsc parsing), to populate the lists sooner
+        self.skeleton = skeleton
+        # Hand the result to the MetadataManager as the details of a skeleton
+        self.details_only = details_only
+        # The About.xml of an About.xml skeleton, whose details are only the remaining tags.
+        # Scenario skeletons are placeholders, so their details are a full parse.
+        self.about_file_path = about_file_path
+        # Paths the parse result was derived from, and whether it depends on the Steam DB.
+        # Both are used to validate the metadata cache entry written for this mod.
+        self.stamp_paths: list[str] = []
+        self.steamdb_sensitive = False
 
         # Set autoDelete to True
         self.setAutoDelete(True)
@@ -1599,6 +1408,7 @@ class ModParser(QRunnable):
             ):
                 about_folder_name = temp_file.name
                 invalid_about_folder_path_found = False
+                self.stamp_paths.append(temp_file.path)
                 break
             # Look for a case-insensitive "About.xml" file
         if not invalid_about_folder_path_found:
@@ -1609,6 +1419,7 @@ class ModParser(QRunnable):
                 ):
                     about_file_name = temp_file.name
                     invalid_about_file_path_found = False
+                    self.stamp_paths.append(temp_file.path)
                     break
         # Look for .rsc scenario files to load metadata from if we didn't find About.xml
         if invalid_about_file_path_found:
@@ -1616,15 +1427,11 @@ class ModParser(QRunnable):
                 if temp_file.name.lower().endswith(".rsc") and not temp_file.is_dir():
                     scenario_rsc_file = temp_file.name
                     scenario_rsc_found = True
+                    self.stamp_paths.append(temp_file.path)
                     break
-        # If a mod's folder name is a valid PublishedFileId in SteamDB
-        if (
-            self.metadata_manager.external_steam_metadata
-            and directory_name in self.metadata_manager.external_steam_metadata.keys()
-        ):
-            pfid = directory_name
-        # Look for a case-insensitive "PublishedFileId.txt" file if we didn't find a pfid
-        elif not pfid and not invalid_about_folder_path_found:
+        # Look for a case-insensitive "PublishedFileId.txt" file
+        file_pfid = None
+        if not invalid_about_folder_path_found:
             pfid_file_name = "PublishedFileId.txt"
             for temp_file in os.scandir(str((directory_path / about_folder_name))):
                 if (
@@ -1635,13 +1442,25 @@ class ModParser(QRunnable):
                     pfid_path = str(
                         (directory_path / about_folder_name / pfid_file_name)
                     )
+                    self.stamp_paths.append(pfid_path)
                     try:
                         with open(pfid_path, encoding="utf-8-sig") as pfid_file:
-                            pfid = pfid_file.read()
-                            pfid = pfid.strip()
+                            file_pfid = pfid_file.read()
+                            file_pfid = file_pfid.strip()
                     except Exception:
                         logger.error(f"Failed to read pfid from {pfid_path}")
                     break
+        # If a mod's folder name is a valid PublishedFileId in SteamDB, prefer it
+        if (
+            self.metadata_manager.external_steam_metadata
+            and directory_name in self.metadata_manager.external_steam_metadata.keys()
+        ):
+            pfid = directory_name
+        else:
+            pfid = file_pfid
+        # The folder name could resolve to a different pfid with another Steam DB loaded
+        if directory_name.isdigit() and file_pfid != directory_name:
+            self.steamdb_sensitive = True
         # If we were able to find an About.xml, populate mod data...
         if not invalid_about_file_path_found:
             mod_data_path = str((directory_path / about_folder_name / about_file_name))
@@ -1649,7 +1468,10 @@ class ModParser(QRunnable):
             mod_data = {}
             try:
                 # Try to parse .xml
-                mod_data = xml_path_to_json(mod_data_path)
+                mod_data = about_xml_path_to_json(
+                    mod_data_path,
+                    ABOUT_XML_SKELETON_TAGS if self.skeleton else ABOUT_XML_TAGS,
+                )
             except Exception:
                 # If there was an issue parsing the .xml, track and exit
                 logger.error(
@@ -1664,6 +1486,11 @@ class ModParser(QRunnable):
                     mod_metadata = mod_data["modmetadata"]
                     # Case-insensitive metadata keys
                     mod_metadata = {k.lower(): v for k, v in mod_metadata.items()}
+                    # Missing <name> or <packageid> may be filled in from the Steam DB
+                    if pfid and not (
+                        mod_metadata.get("name") and mod_metadata.get("packageid")
+                    ):
+                        self.steamdb_sensitive = True
                     if (  # If we don't have a <name>
                         not mod_metadata.get("name")
                         and self.metadata_manager.external_steam_metadata  # ... try to find it in Steam DB
@@ -1786,6 +1613,10 @@ class ModParser(QRunnable):
                         )
                     # If a mod contains C# assemblies, we want to tag the mod
                     assemblies_path = str(directory_path / "Assemblies")
+                    self.stamp_paths.append(assemblies_path)
+                    if self.skeleton:
+                        # Details are loaded later, see MetadataManager.load_mod_details
+                        mod_metadata["skeleton"] = True
                     # Check if the 'Assemblies' directory exists and is a directory
                     if os.path.exists(assemblies_path) and os.path.isdir(
                         assemblies_path
@@ -1812,6 +1643,8 @@ class ModParser(QRunnable):
                         ]
                         for subfolder_path in subfolder_paths:
                             assemblies_path = str(Path(subfolder_path) / "Assemblies")
+                            self.stamp_paths.append(subfolder_path)
+                            self.stamp_paths.append(assemblies_path)
                             # Check if the 'Assemblies' directory exists in the subfolder
                             if os.path.exists(assemblies_path):
                                 # Check if there are any .dll files in this 'Assemblies' directory
@@ -1834,49 +1667,6 @@ class ModParser(QRunnable):
                         os.path.getmtime(mod_data_path)
                     )
                     mod_metadata["metadata_file_path"] = mod_data_path
-                    # Grab our mod's publishedfileid
-                    publishedfileid = mod_metadata.get("publishedfileid")
-                    if publishedfileid:
-                        # Get our metadata based on data source
-                        workshop_acf_data = (
-                            self.metadata_manager.workshop_acf_data
-                            if data_source == "workshop"
-                            else self.metadata_manager.steamcmd_acf_data
-                        )
-                        workshop_item_details = workshop_acf_data.get(
-                            "AppWorkshop", {}
-                        ).get("WorkshopItemDetails", {})
-                        workshop_items_installed = workshop_acf_data.get(
-                            "AppWorkshop", {}
-                        ).get("WorkshopItemsInstalled", {})
-                        # Edit our metadata, append values
-                        if (
-                            workshop_item_details.get(publishedfileid, {}).get(
-                                "timetouched"
-                            )
-                            and workshop_item_details.get(publishedfileid, {}).get(
-                                "timetouched"
-                            )
-                            != 0
-                        ):
-                            # The last time SteamCMD/Steam client touched a mod according to its entry
-                            mod_metadata["internal_time_touched"] = int(
-                                workshop_item_details[publishedfileid]["timetouched"]
-                            )
-                        if publishedfileid and workshop_item_details.get(
-                            publishedfileid, {}
-                        ).get("timeupdated"):
-                            # The last time SteamCMD/Steam client updated a mod according to its entry
-                            mod_metadata["internal_time_updated"] = int(
-                                workshop_item_details[publishedfileid]["timeupdated"]
-                            )
-                        if publishedfileid and workshop_items_installed.get(
-                            publishedfileid, {}
-                        ).get("timeupdated"):
-                            # The last time SteamCMD/Steam client updated a mod according to its entry
-                            mod_metadata["internal_time_updated"] = int(
-                                workshop_items_installed[publishedfileid]["timeupdated"]
-                            )
                     # Assign our metadata to the UUID
                     metadata[uuid] = mod_metadata
                 else:
@@ -1884,6 +1674,24 @@ class ModParser(QRunnable):
                         f"Key <modmetadata> does not exist in this data: {mod_data}"
                     )
                     data_malformed = True
+        # ...or, if we only need a skeleton, defer parsing the (potentially large) scenario .rsc...
+        elif invalid_about_file_path_found and scenario_rsc_found and self.skeleton:
+            scenario_data_path = str((directory_path / scenario_rsc_file))
+            metadata[uuid] = {
+                "name": Path(scenario_rsc_file).stem,
+                "packageid": "scenario.rsc",
+                "scenario": True,
+                "skeleton": True,
+                "data_source": data_source,
+                "folder": directory_name,
+                "path": mod_directory,
+                # This is overwritten if acf data is parsed for Steam/SteamCMD mods
+                "internal_time_touched": int(os.path.getmtime(mod_directory)),
+                "metadata_file_path": scenario_data_path,
+                "uuid": uuid,
+            }
+            if pfid:
+                metadata[uuid]["publishedfileid"] = pfid
         # ...or, if we didn't find an About.xml, but we have a RimWorld scenario .rsc to parse...
         elif invalid_about_file_path_found and scenario_rsc_found:
             scenario_data_path = str((directory_path / scenario_rsc_file))
@@ -1997,95 +1805,71 @@ class ModParser(QRunnable):
                 local_mod_metadata["steamcmd"] = True
         return metadata
 
+    def __parse_mod_details(self) -> dict[str, Any]:
+        """
+        Parse the About.xml tags a skeleton parse skipped, normalized like a full parse.
+        """
+        logger.debug(
+            f"Parsing details of [{self.data_source}] mod: {self.about_file_path}"
+        )
+        mod_data = about_xml_path_to_json(self.about_file_path, ABOUT_XML_DETAIL_TAGS)
+        mod_data = {k.lower(): v for k, v in mod_data.items()}
+        return {
+            ("authors" if key.lower() == "author" else key.lower()): value
+            for key, value in (mod_data.get("modmetadata") or {}).items()
+        }
+
     def run(self) -> None:
         try:
+            if self.details_only and self.about_file_path:
+                details = self.__parse_mod_details()
+                # Complete the cached skeleton, so the next start does not need a details pass
+                self.metadata_manager.metadata_cache.complete_skeleton(
+                    self.mod_directory, details
+                )
+                self.metadata_manager.mod_details_parsed_signal.emit(
+                    self.uuid, {**details, "path": self.mod_directory}
+                )
+                return
             mod_metadata = self.__parse_mod_metadata(
                 self.data_source, self.mod_directory, self.metadata_manager, self.uuid
             )
-            packageid = mod_metadata[self.uuid].get("packageid")
-            self.metadata_manager.internal_local_metadata.update(mod_metadata)
-            # Track packageid -> uuid relationships for future uses
-            self.metadata_manager.packageid_to_uuids.setdefault(packageid, set()).add(
+            # Cache the parse result before supplementing it with .acf data.
+            # Skeletons are cached too, their details pass completes them.
+            self.metadata_manager.metadata_cache.put(
+                mod_directory=self.mod_directory,
+                metadata=mod_metadata[self.uuid],
+                stamp_paths=self.stamp_paths,
+                steamdb_sensitive=self.steamdb_sensitive,
+                steamdb_stamp=self.metadata_manager.get_steamdb_stamp(),
+            )
+            self.metadata_manager.apply_acf_metadata(
+                mod_metadata[self.uuid], self.data_source
+            )
+            if self.details_only:
+                self.metadata_manager.mod_details_parsed_signal.emit(
+                    self.uuid, mod_metadata[self.uuid]
+                )
+                return
+            # Track packageid/publishedfileid/path -> uuid relationships for future uses
+            previous_metadata = self.metadata_manager.internal_local_metadata.get(
                 self.uuid
             )
+            if previous_metadata is not None:
+                self.metadata_manager.unindex_mod(self.uuid, previous_metadata)
+            self.metadata_manager.internal_local_metadata.update(mod_metadata)
+            self.metadata_manager.index_mod(self.uuid, mod_metadata[self.uuid])
         except Exception as e:
             error_message = f"{type(e).__name__}: {str(e)}\n{traceback.format_exc()}"
             logger.error(f"ERROR: Unable to initialize ModParser {error_message}")
+            if self.details_only:
+                # Let the MetadataManager know these details will not arrive
+                self.metadata_manager.mod_details_parsed_signal.emit(self.uuid, {})
 
 
 # Mod helper functions
 
 
-def add_dependency_to_mod(
-    mod_data: dict[str, Any],
-    dependency_or_dependency_ids: Any,
-    all_mods: dict[str, Any],
-) -> None:
-    """
-    Dependency data is collected regardless of whether or not that dependency
-    is in `all_mods`. This makes sense as dependencies exist outside of the realm
-    of the mods the user currently has installed. Dependencies are one-way, so
-    if A depends on B, B does not necessarily depend on A.
-    """
-    if mod_data:
-        # Create a new key with empty set as value by default
-        mod_data.setdefault("dependencies", set())
-
-        # If the value is a single dict (for moddependencies)
-        if isinstance(dependency_or_dependency_ids, dict):
-            if (
-                dependency_or_dependency_ids.get("packageId")
-                and not isinstance(dependency_or_dependency_ids["packageId"], list)
-                and not isinstance(dependency_or_dependency_ids["packageId"], dict)
-            ):
-                # if dependency_id in all_mods:
-                # ^ dependencies are required regardless of whether they are in all_mods
-                mod_data["dependencies"].add(
-                    dependency_or_dependency_ids["packageId"].lower()
-                )
-            else:
-                logger.error(
-                    f"Dependency dict does not contain packageid or correct format: [{dependency_or_dependency_ids}]"
-                )
-        # If the value is a LIST of dicts
-        elif isinstance(dependency_or_dependency_ids, list):
-            if isinstance(dependency_or_dependency_ids[0], dict):
-                for dependency in dependency_or_dependency_ids:
-                    if dependency.get("packageId"):
-                        # Below works with `MayRequire` dependencies
-                        dependency_id = dependency["packageId"].lower()
-                        # if dependency_id in all_mods:
-                        # ^ dependencies are required regardless of whether they are in all_mods
-                        mod_data["dependencies"].add(dependency_id)
-                    else:
-                        logger.error(
-                            f"Dependency dict does not contain packageId: [{dependency_or_dependency_ids}]"
-                        )
-            else:
-                logger.error(
-                    f"List of dependencies does not contain dicts: [{dependency_or_dependency_ids}]"
-                )
-        else:
-            logger.error(
-                f"Dependencies is not a single dict or a list of dicts: [{dependency_or_dependency_ids}]"
-            )
-
-
-def add_dependency_to_mod_from_steamdb(
-    mod_data: dict[str, Any], dependency_id: Any, all_mods: dict[str, Any]
-) -> None:
-    mod_name = mod_data.get("name")
-    # Create a new key with empty set as value by default
-    mod_data.setdefault("dependencies", set())
-
-    # If the value is a single str (for steamDB)
-    if isinstance(dependency_id, str):
-        mod_data["dependencies"].add(dependency_id)
-    else:
-        logger.error(f"Dependencies is not a single str: [{dependency_id}]")
-    logger.debug(f"Added dependency to [{mod_name}] from SteamDB: [{dependency_id}]")
-
-
 def get_num_dependencies(all_mods: dict[str, Any], key_name: str) -> int:
     """Debug func for getting total number of dependencies"""
     counter = 0
@@ -2095,110 +1879,6 @@ def get_num_dependencies(all_mods: dict[str, Any], key_name: str) -> int:
     return counter
 
 
-def add_incompatibility_to_mod(
-    mod_data: dict[str, Any],
-    dependency_or_dependency_ids: Any,
-    all_mods: dict[str, Any],
-) -> None:
-    """
-    Incompatibility data is collected only if that incompatibility is in `all_mods`.
-    There's no need to surface incompatibilities if they aren't even downloaded.
-    """
-    logger.debug(
-        f"Adding incompatibilities for packages [{dependency_or_dependency_ids}] to mod data: {mod_data} (and reverse direction too)"
-    )
-    if mod_data:
-        # Create a new key with empty set as value by default
-        mod_data.setdefault("incompatibilities", set())
-
-        all_package_ids = set(all_mods[uuid]["packageid"] for uuid in all_mods)
-
-        # If the value is a single string...
-        if isinstance(dependency_or_dependency_ids, str):
-            dependency_id = dependency_or_dependency_ids.lower()
-            if dependency_id in all_package_ids:
-                mod_data["incompatibilities"].add(dependency_id)
-
-        # If the value is a LIST of strings
-        elif isinstance(dependency_or_dependency_ids, list):
-            if isinstance(dependency_or_dependency_ids[0], str):
-                for dependency in dependency_or_dependency_ids:
-                    if dependency:  # Sometimes, this can be None or an empty string if XML syntax error/extra elements
-                        dependency_id = dependency.lower()
-                        if dependency_id in all_package_ids:
-                            mod_data["incompatibilities"].add(dependency_id)
-            else:
-                logger.error(
-                    f"List of incompatibilities does not contain strings: [{dependency_or_dependency_ids}]"
-                )
-        else:
-            logger.error(
-                f"Incompatibilities is not a single string or a list of strings: [{dependency_or_dependency_ids}]"
-            )
-
-
-def add_load_rule_to_mod(
-    mod_data: dict[str, Any],
-    dependency_or_dependency_ids: Any,
-    explicit_key: str,
-    indirect_key: str,
-    all_mods: dict[str, Any],
-    packageid_to_uuids: dict[str, Any],
-) -> None:
-    """
-    Load order data is collected only if the mod referenced is in `all_mods`, as
-    mods that are not installed do not need to be ordered.
-
-    Rules that do not exist in all_mods are not added.
-
-    :param mod_data: mod data dict to add dependencies to
-    :param dependency_or_dependency_ids: either string or list of strings (or sometimes None)
-    :param explicit_key: indicates if the rule is added because it was explicitly defined
-    somewhere, e.g. About.xml, or if it was inferred, e.g. If A loads after B,
-    B should load before A
-    :param indirect_key:
-    :param all_mods: dict of all mods to verify keys against
-    :param packageid_to_uuids: a helper dict to reduce work
-    """
-    if not mod_data:
-        return
-
-    # Pre-processing: Normalize dependency_or_dependency_ids to a list of strings
-    dependencies = []
-    if isinstance(dependency_or_dependency_ids, str):
-        dependencies.append(dependency_or_dependency_ids.lower())
-    elif isinstance(dependency_or_dependency_ids, dict):
-        if "#text" in dependency_or_dependency_ids:
-            dependencies.append(dependency_or_dependency_ids["#text"].lower())
-        else:
-            logger.error(
-                f"Load rule with MayRequire does not contain expected #text key: {dependency_or_dependency_ids}"
-            )
-    elif isinstance(dependency_or_dependency_ids, list):
-        for dep in dependency_or_dependency_ids:
-            if isinstance(dep, str):
-                dependencies.append(dep.lower())
-            elif isinstance(dep, dict) and "#text" in dep:
-                dependencies.append(dep["#text"].lower())
-            else:
-                logger.error(f"Load rule is not an expected str or dict: {dep}")
-    else:
-        logger.error(
-            f"Load order rules is not a single string/dict/list of strings/dicts: [{dependency_or_dependency_ids}]"
-        )
-        return
-
-    mod_data.setdefault(explicit_key, set())
-    for dep in dependencies:
-        if dep in packageid_to_uuids:
-            mod_data[explicit_key].add((dep, True))
-            potential_dep_uuids = packageid_to_uuids[dep]
-            for dep_uuid in potential_dep_uuids:
-                all_mods[dep_uuid].setdefault(indirect_key, set()).add(
-                    (mod_data["packageid"], False)
-                )
-
-
 def get_mods_from_list(
     mod_list: Union[str, list[str]],
 ) -> tuple[list[str], list[str], dict[str, Any], list[str]]:
@@ -2218,18 +1898,24 @@ def get_mods_from_list(
 
     active_mods_uuids: list[str] = []
     inactive_mods_uuids: list[str] = []
-    duplicate_mods: dict[str, Any] = {}
-    duplicates_processed = []
+    duplicates_processed: set[str] = set()
     missing_mods: list[str] = []
-    populated_mods = []
+    populated_mods: set[str] = set()
     to_populate = []
     logger.debug("Started generating active and inactive mods")
-    # Calculate duplicate mods (SCHEMA: {str packageid: list[str duplicate uuids]})
+    # Index mods by packageid, in the order of all_mods (SCHEMA: {str packageid: list[str uuids]})
+    uuids_by_packageid: dict[str, list[str]] = {}
     for mod_uuid, mod_data in all_mods.items():
-        # Using setdefault() to initialize the dictionary and then assigning the value
-        duplicate_mods.setdefault(mod_data["packageid"], []).append(mod_uuid)
-    # Filter out non-duplicate mods
-    duplicate_mods = {k: v for k, v in duplicate_mods.items() if len(v) > 1}
+        uuids_by_packageid.setdefault(mod_data["packageid"], []).append(mod_uuid)
+    # Calculate duplicate mods (SCHEMA: {str packageid: list[str duplicate uuids]})
+    duplicate_mods: dict[str, Any] = {
+        k: v for k, v in uuids_by_packageid.items() if len(v) > 1
+    }
+    # Lazily computed (SCHEMA: {str packageid: {str source: str uuid}}), with the
+    # duplicate to use from each data source, i.e. the first by natural path order
+    duplicate_buckets: dict[str, dict[str, str]] = {}
+    # Only needed to merge the matches of packageids with and without _steam
+    uuid_positions: dict[str, int] = {}
     # Calculate mod lists
     if isinstance(mod_list, str):
         # Handle the mod list not existing
@@ -2277,62 +1963,64 @@ def get_mods_from_list(
             # ... otherwise, we use standard data source priority if suffix not used
             else ["expansion", "local", "workshop"]
         )
-        # Loop through all mods
-        for uuid, metadata in all_mods.items():
-            metadata_package_id = metadata["packageid"]
-            if (
-                metadata_package_id
-                in [  # If we have a match with or without _steam present
-                    package_id_normalized,
-                    package_id_normalized_stripped,
-                ]
-            ):
-                # Add non-duplicates to active mods
-                if target_id not in duplicate_mods.keys():
-                    populated_mods.append(target_id)
-                    active_mods_uuids.append(uuid)
-                else:  # Otherwise, duplicate needs calculated
-                    if (
-                        target_id in duplicates_processed
-                    ):  # Skip duplicates that have already been processed
-                        continue
-                    logger.info(
-                        f"Found duplicate mod present in active mods list: {target_id}"
-                    )
-                    # Loop through sorted paths and determine which duplicate to used based on priority
-                    for source in sources_order:
-                        logger.debug(f"Checking for duplicate with source: {source}")
-                        # Sort duplicate mod paths by source priority
-                        paths_to_uuid = {}
-                        for duplicate_uuid in duplicate_mods[target_id]:
-                            if source in all_mods[duplicate_uuid]["data_source"]:
-                                paths_to_uuid[all_mods[duplicate_uuid]["path"]] = (
-                                    duplicate_uuid
-                                )
-                        # Sort duplicate mod paths from current source priority using natsort
-                        source_paths_sorted = natsorted(paths_to_uuid.keys())
-                        if source_paths_sorted:  # If we have paths returned
-                            # If we are here, we've found our calculated duplicate, log and use this mod
-                            calculated_duplicate_uuid = paths_to_uuid[
-                                source_paths_sorted[0]
-                            ]
-                            logger.debug(
-                                f"Using duplicate {source} mod for {target_id}: {all_mods[calculated_duplicate_uuid]['path']}"
-                            )
-                            populated_mods.append(target_id)
-                            duplicates_processed.append(target_id)
-                            active_mods_uuids.append(calculated_duplicate_uuid)
-                            break
-                        else:  # Skip this source priority if no paths
-                            logger.debug(f"No paths returned for {source}")
-                            continue
+        # Find the mods matching the packageid, with or without _steam present
+        matching_uuids = uuids_by_packageid.get(package_id_normalized, [])
+        if package_id_normalized_stripped != package_id_normalized:
+            stripped_uuids = uuids_by_packageid.get(package_id_normalized_stripped, [])
+            if matching_uuids and stripped_uuids:
+                if not uuid_positions:
+                    uuid_positions = {uuid: i for i, uuid in enumerate(all_mods)}
+                matching_uuids = sorted(
+                    matching_uuids + stripped_uuids, key=uuid_positions.__getitem__
+                )
+            else:
+                matching_uuids = matching_uuids or stripped_uuids
+        if not matching_uuids:
+            continue
+        # Add non-duplicates to active mods
+        if target_id not in duplicate_mods:
+            populated_mods.add(target_id)
+            active_mods_uuids.extend(matching_uuids)
+            continue
+        # Otherwise, duplicate needs calculated, unless it has already been processed
+        if target_id in duplicates_processed:
+            continue
+        logger.info(f"Found duplicate mod present in active mods list: {target_id}")
+        buckets = duplicate_buckets.get(target_id)
+        if buckets is None:
+            buckets = duplicate_buckets[target_id] = {}
+            # Sort duplicate mod paths using natsort, and keep the first per source
+            paths_to_uuid = {
+                all_mods[duplicate_uuid]["path"]: duplicate_uuid
+                for duplicate_uuid in duplicate_mods[target_id]
+            }
+            for path in natsorted(paths_to_uuid.keys()):
+                duplicate_uuid = paths_to_uuid[path]
+                for source in ("expansion", "local", "workshop"):
+                    if source in all_mods[duplicate_uuid]["data_source"]:
+                        buckets.setdefault(source, duplicate_uuid)
+        # Determine which duplicate to use based on source priority
+        for source in sources_order:
+            calculated_duplicate_uuid = buckets.get(source)
+            if calculated_duplicate_uuid is None:  # Skip this source if no paths
+                logger.debug(f"No paths returned for {source}")
+                continue
+            # If we are here, we've found our calculated duplicate, log and use this mod
+            logger.debug(
+                f"Using duplicate {source} mod for {target_id}: {all_mods[calculated_duplicate_uuid]['path']}"
+            )
+            populated_mods.add(target_id)
+            duplicates_processed.add(target_id)
+            active_mods_uuids.append(calculated_duplicate_uuid)
+            break
     # Calculate missing mods from the difference
-    missing_mods = list(set(to_populate) - set(populated_mods))
+    missing_mods = list(set(to_populate) - populated_mods)
     logger.debug(f"Generated active mods dict with {len(active_mods_uuids)} mods")
     # Get the inactive mods by subtracting active mods from workshop + expansions
     logger.info("Generating inactive mod list")
+    active_mods_uuids_set = set(active_mods_uuids)
     inactive_mods_uuids = [
-        uuid for uuid in all_mods.keys() if uuid not in active_mods_uuids
+        uuid for uuid in all_mods.keys() if uuid not in active_mods_uuids_set
     ]
     logger.info(f"# active mods: {len(active_mods_uuids)}")
     logger.info(f"# inactive mods: {len(inactive_mods_uuids)}")
@@ -2373,8 +2061,10 @@ class SteamDatabaseBuilder(QThread):
         get_appid_deps: bool = False,
         update: bool = False,
         mods: dict[str, Any] = {},
+        delta: bool = False,
     ):
         QThread.__init__(self)
+        self.delta = delta
         self.apikey = apikey
         self.appid = appid
         self.database_expiry = database_expiry
@@ -2394,16 +2084,26 @@ class SteamDatabaseBuilder(QThread):
                 "Received valid Steam WebAPI key from settings"
             )
             # Since the key is valid, we try to launch a live query
+            if self.delta and self.mode in ("no_local", "all_mods"):
+                existing_database = self._load_output_database()
+                if existing_database is not None:
+                    self._delta_update(existing_database)
+                    return
+                self.db_builder_message_output_signal.emit(
+                    "\nNo existing database to update, building the whole database"
+                )
             if self.mode == "no_local":
                 self.db_builder_message_output_signal.emit(
                     f'\nInitializing "DynamicQuery" with configured Steam API key for AppID: {self.appid}\n\n'
                 )
+                checkpoint = self._load_checkpoint()
                 # Create query
                 dynamic_query = DynamicQuery(
                     apikey=self.apikey,
                     appid=self.appid,
                     life=self.database_expiry,
                     get_appid_deps=self.get_appid_deps,
+                    checkpoint=checkpoint,
                 )
                 # Connect messaging signal
                 dynamic_query.dq_messaging_signal.connect(
@@ -2420,13 +2120,18 @@ class SteamDatabaseBuilder(QThread):
                     )
                     return  # Exit operation
 
-                database = self._init_empty_db_from_publishedfileids(
-                    dynamic_query.publishedfileids
-                )
+                if checkpoint is not None and checkpoint.database is not None:
+                    database = checkpoint.database
+                else:
+                    database = self._init_empty_db_from_publishedfileids(
+                        dynamic_query.publishedfileids
+                    )
                 dynamic_query.create_steam_db(
                     database=database, publishedfileids=dynamic_query.publishedfileids
                 )
                 self._output_database(dynamic_query.database)
+                if checkpoint is not None:
+                    checkpoint.remove()
                 self.db_builder_message_output_signal.emit(
                     "SteamDatabasebuilder: Completed!"
                 )
@@ -2449,17 +2154,32 @@ class SteamDatabaseBuilder(QThread):
                                 publishedfileids.append(
                                     publishedfileid
                                 )  # Add it to our list
+                        checkpoint = self._load_checkpoint()
+                        if checkpoint is not None:
+                            if (
+                                checkpoint.database is not None
+                                and checkpoint.query_files["publishedfileids"]
+                                == publishedfileids
+                            ):
+                                database = checkpoint.database
+                            else:
+                                # The previous run was for other mods
+                                checkpoint.clear()
+                                checkpoint.complete_query_files(publishedfileids)
                         dynamic_query = DynamicQuery(
                             apikey=self.apikey,
                             appid=self.appid,
                             life=self.database_expiry,
                             get_appid_deps=self.get_appid_deps,
+                            checkpoint=checkpoint,
                         )
                         dynamic_query.dq_messaging_signal.connect(
                             self.db_builder_message_output_signal.emit
                         )
                         dynamic_query.create_steam_db(database, publishedfileids)
                         self._output_database(dynamic_query.database)
+                        if checkpoint is not None:
+                            checkpoint.remove()
                         self.db_builder_message_output_signal.emit(
                             "SteamDatabasebuilder: Completed!"
                         )
@@ -2496,6 +2216,114 @@ class SteamDatabaseBuilder(QThread):
                 f"SteamDatabaseBuilder ({self.mode}): Exiting..."
             )
 
+    def _load_output_database(self) -> dict[str, Any] | None:
+        """Load the database at the output path, if there is one to update."""
+        if not self.output_database_path or not os.path.exists(
+            self.output_database_path
+        ):
+            return None
+        try:
+            with open(self.output_database_path, encoding="utf-8") as f:
+                database = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Unable to read database to update: {e}")
+            return None
+        if not isinstance(database.get("version"), int) or not isinstance(
+            database.get("database"), dict
+        ):
+            return None
+        if not isinstance(database.get("built"), int):
+            # Databases built before build times were recorded
+            logger.info("Database to update has no build time, it will be rebuilt")
+            return None
+        return database
+
+    def _delta_update(self, database: dict[str, Any]) -> None:
+        """
+        Update an existing database with the mods updated since it was built.
+
+        Only mods updated on the workshop since then, and local mods missing from the
+        database, are queried. Their details and AppID dependencies are merged into the
+        database, the rest of it is kept as is. Mods removed from the workshop since are
+        only noticed by a full build.
+
+        :param database: The database to update, as built by a previous run
+        """
+        built_at = database["built"]
+        dynamic_query = DynamicQuery(
+            apikey=self.apikey,
+            appid=self.appid,
+            life=self.database_expiry,
+            get_appid_deps=self.get_appid_deps,
+        )
+        dynamic_query.dq_messaging_signal.connect(
+            self.db_builder_message_output_signal.emit
+        )
+        updated = dynamic_query.pfids_updated_since(built_at)
+        if updated is None:
+            return
+        updated_publishedfileids = set(updated)
+        database["built"] = dynamic_query.started
+        if self.mode == "all_mods":
+            local_database = self._init_db_from_local_metadata()
+            publishedfileids = [
+                publishedfileid
+                for publishedfileid, metadata in local_database["database"].items()
+                if not metadata.get("appid")
+                and (
+                    publishedfileid in updated_publishedfileids
+                    or publishedfileid not in database["database"]
+                )
+            ]
+            recursively_update_dict(
+                database,
+                local_database,
+                prune_exceptions=DB_BUILDER_PRUNE_EXCEPTIONS,
+                recurse_exceptions=DB_BUILDER_RECURSE_EXCEPTIONS,
+            )
+        else:
+            publishedfileids = list(updated)
+            for publishedfileid in publishedfileids:
+                database["database"].setdefault(
+                    publishedfileid,
+                    {
+                        "url": f"https://steamcommunity.com/sharedfiles/filedetails/?id={publishedfileid}"
+                    },
+                )
+        self.db_builder_message_output_signal.emit(
+            f"\nQuerying {len(publishedfileids)} mods updated since the database was built"
+        )
+        if publishedfileids:
+            dynamic_query.create_steam_db(database, publishedfileids)
+        else:
+            database["version"] = dynamic_query.expiry
+            dynamic_query.database.update(database)
+        self._output_database(dynamic_query.database)
+        self.db_builder_message_output_signal.emit("SteamDatabasebuilder: Completed!")
+
+    def _load_checkpoint(self) -> DynamicQueryCheckpoint | None:
+        """
+        Load the progress of a previous, interrupted build of the same database.
+
+        Progress is saved next to the output database while building, and removed once the
+        database is written.
+
+        :return: The checkpoint to resume from and save progress to, None if there is no output path
+        """
+        if not self.output_database_path:
+            return None
+        checkpoint = DynamicQueryCheckpoint(
+            DynamicQueryCheckpoint.path_for(self.output_database_path),
+            appid=self.appid,
+            mode=self.mode,
+            max_age=self.database_expiry,
+        )
+        if checkpoint.load():
+            self.db_builder_message_output_signal.emit(
+                f"\nResuming from the checkpoint of a previous run:\n{checkpoint.path}\n"
+            )
+        return checkpoint
+
     def _init_db_from_local_metadata(self) -> dict[str, Any]:
         db_from_local_metadata = {
             "version": 0,
@@ -2653,7 +2481,7 @@ class SteamDatabaseBuilder(QThread):
 
 
 def check_if_pfids_blacklisted(
-    publishedfileids: list[str], steamdb: dict[str, Any]
+    publishedfileids: list[str], steamdb: Mapping[str, Any]
 ) -> list[str]:
     # None-check for steamdb
     if not steamdb:
@@ -0,0 +1,211 @@
+import os
+from pathlib import Path
+from threading import Lock
+from typing import Any, Iterable
+
+import msgspec
+from loguru import logger
+
+# Bump this whenever the shape of the parsed metadata changes, so stale caches are discarded
+METADATA_CACHE_VERSION = 2
+
+# Stamp used for paths that did not exist when the mod was parsed
+MISSING_PATH_STAMP = (-1, -1)
+
+
+class MetadataCacheEntry(msgspec.Struct, array_like=True, gc=False):
+    """A parsed mod, along with the file stamps it was parsed from.
+
+    Attributes:
+        stamps (dict[str, tuple[int, int]]): path -> (mtime_ns, size) for every path the parser looked at.
+        steamdb_sensitive (bool): Whether the parse result could change depending on the Steam DB.
+        steamdb_stamp (str): Identity of the Steam DB that was loaded when the mod was parsed.
+        metadata (msgspec.Raw): The encoded mod metadata. Decoded lazily on cache hits.
+    """
+
+    stamps: dict[str, tuple[int, int]]
+    steamdb_sensitive: bool
+    steamdb_stamp: str
+    metadata: msgspec.Raw
+
+
+class MetadataCacheSchema(msgspec.Struct):
+    version: int
+    entries: dict[str, MetadataCacheEntry] = msgspec.field(default_factory=dict)
+
+
+def path_stamp(path: str) -> tuple[int, int]:
+    """
+    Return a cheap change stamp for a path.
+
+    :param path: Path to stat.
+    :return: A tuple of (mtime_ns, size), or MISSING_PATH_STAMP if the path does not exist.
+    """
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return MISSING_PATH_STAMP
+    return stat.st_mtime_ns, stat.st_size
+
+
+class MetadataParseCache:
+    """
+    Persistent cache of parsed About.xml (and scenario .rsc) metadata, keyed by mod directory.
+
+    An entry is only considered valid while every path the parser looked at still has
+    the same mtime and size. Entries whose parse result depends on the Steam DB are
+    additionally tied to the Steam DB that was loaded at parse time.
+
+    Entries are added from parser threads, so all access to the in-memory entries is locked.
+    """
+
+    def __init__(self, path: Path | str) -> None:
+        self.path = Path(path)
+        self._entries: dict[str, MetadataCacheEntry] = {}
+        self._lock = Lock()
+        self._decoder = msgspec.json.Decoder(MetadataCacheSchema)
+        self._encoder = msgspec.json.Encoder()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def load(self) -> None:
+        """Load the cache from disk. A missing, outdated or corrupt cache is treated as empty."""
+        entries: dict[str, MetadataCacheEntry] = {}
+        if self.path.exists():
+            try:
+                with open(self.path, "rb") as f:
+                    cache = self._decoder.decode(f.read())
+                if cache.version == METADATA_CACHE_VERSION:
+                    entries = cache.entries
+                else:
+                    logger.info(
+                        f"Discarding metadata cache with outdated version {cache.version}"
+                    )
+            except (OSError, msgspec.DecodeError) as e:
+                logger.warning(f"Unable to read metadata cache at {self.path}: {e}")
+        with self._lock:
+            self._entries = entries
+        logger.info(f"Loaded {len(entries)} entries from metadata cache")
+
+    def save(self, keep: Iterable[str] | None = None) -> None:
+        """
+        Write the cache to disk.
+
+        :param keep: If supplied, only entries for these mod directories are written.
+        Used to prune mods that no longer exist.
+        """
+        with self._lock:
+            if keep is not None:
+                keep_set = set(keep)
+                self._entries = {
+                    path: entry
+                    for path, entry in self._entries.items()
+                    if path in keep_set
+                }
+            cache = MetadataCacheSchema(
+                version=METADATA_CACHE_VERSION, entries=self._entries
+            )
+            data = self._encoder.encode(cache)
+        try:
+            tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+            with open(tmp_path, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logger.error(f"Unable to write metadata cache to {self.path}: {e}")
+            return
+        logger.debug(f"Wrote {len(cache.entries)} entries to metadata cache")
+
+    def get(self, mod_directory: str, steamdb_stamp: str) -> dict[str, Any] | None:
+        """
+        Return cached metadata for a mod directory if nothing it was parsed from has changed.
+
+        :param mod_directory: The mod directory.
+        :param steamdb_stamp: Identity of the currently loaded Steam DB.
+        :return: A fresh copy of the cached metadata, or None on a cache miss.
+        """
+        with self._lock:
+            entry = self._entries.get(mod_directory)
+        if entry is None:
+            return None
+        if entry.steamdb_sensitive and entry.steamdb_stamp != steamdb_stamp:
+            return None
+        for path, stamp in entry.stamps.items():
+            if path_stamp(path) != tuple(stamp):
+                return None
+        try:
+            return msgspec.json.decode(entry.metadata)
+        except msgspec.DecodeError:
+            return None
+
+    def put(
+        self,
+        mod_directory: str,
+        metadata: dict[str, Any],
+        stamp_paths: Iterable[str],
+        steamdb_sensitive: bool,
+        steamdb_stamp: str,
+    ) -> None:
+        """
+        Add or replace the cached metadata for a mod directory.
+
+        The metadata is encoded immediately, so later in-place changes to the dict are not cached.
+
+        :param mod_directory: The mod directory.
+        :param metadata: The parsed mod metadata.
+        :param stamp_paths: Every path the parse result was derived from.
+        :param steamdb_sensitive: Whether the parse result depends on the Steam DB.
+        :param steamdb_stamp: Identity of the currently loaded Steam DB.
+        """
+        try:
+            raw = msgspec.Raw(self._encoder.encode(metadata))
+        except (TypeError, msgspec.EncodeError) as e:
+            logger.debug(f"Not caching metadata for {mod_directory}: {e}")
+            return
+        entry = MetadataCacheEntry(
+            stamps={path: path_stamp(path) for path in {mod_directory, *stamp_paths}},
+            steamdb_sensitive=steamdb_sensitive,
+            steamdb_stamp=steamdb_stamp,
+            metadata=raw,
+        )
+        with self._lock:
+            self._entries[mod_directory] = entry
+
+    def complete_skeleton(self, mod_directory: str, details: dict[str, Any]) -> None:
+        """
+        Merge the details of a mod parsed as a skeleton into its cached metadata.
+
+        The entry keeps its stamps, since the details are parsed from the same paths.
+        Nothing is changed if the entry is not a skeleton, or is replaced in the meantime.
+
+        :param mod_directory: The mod directory.
+        :param details: The details parsed for the skeleton.
+        """
+        with self._lock:
+            entry = self._entries.get(mod_directory)
+        if entry is None:
+            return
+        try:
+            metadata = msgspec.json.decode(entry.metadata)
+        except msgspec.DecodeError:
+            return
+        if not isinstance(metadata, dict) or not metadata.pop("skeleton", False):
+            return
+        for key, value in details.items():
+            metadata.setdefault(key, value)
+        try:
+            raw = msgspec.Raw(self._encoder.encode(metadata))
+        except (TypeError, msgspec.EncodeError) as e:
+            logger.debug(f"Not caching details for {mod_directory}: {e}")
+            return
+        with self._lock:
+            if self._entries.get(mod_directory) is entry:
+                self._entries[mod_directory] = msgspec.structs.replace(
+                    entry, metadata=raw
+                )
+
+    def discard(self, mod_directory: str) -> None:
+        """Remove the cached metadata for a mod directory, if any."""
+        with self._lock:
+            self._entries.pop(mod_directory, None)
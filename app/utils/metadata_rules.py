@@ -0,0 +1,599 @@
+from collections.abc import Mapping
+from re import match
+from typing import Any, Callable, Iterable
+
+from loguru import logger
+
+from app.utils.steam_db_index import IndexedSteamDatabase, steam_db_packageid
+
+# Rule sources an edge can be contributed by
+RULE_SOURCE_ABOUT_XML = "About.xml"
+RULE_SOURCE_STEAM_DB = "Steam DB"
+RULE_SOURCE_COMMUNITY_RULES = "Community Rules"
+RULE_SOURCE_USER_RULES = "User Rules"
+
+# (target uuid, metadata key, value)
+RuleEdge = tuple[str, str, Any]
+
+
+def normalize_dependency_ids(dependency_or_dependency_ids: Any) -> list[str]:
+    """
+    Normalize About.xml <modDependencies> data (a single dict, or a list of dicts)
+    to a list of lowercase packageids.
+
+    Dependency data is collected regardless of whether or not that dependency
+    is installed. This makes sense as dependencies exist outside of the realm
+    of the mods the user currently has installed.
+    """
+    dependency_ids: list[str] = []
+    # If the value is a single dict (for moddependencies)
+    if isinstance(dependency_or_dependency_ids, dict):
+        if (
+            dependency_or_dependency_ids.get("packageId")
+            and not isinstance(dependency_or_dependency_ids["packageId"], list)
+            and not isinstance(dependency_or_dependency_ids["packageId"], dict)
+        ):
+            dependency_ids.append(dependency_or_dependency_ids["packageId"].lower())
+        else:
+            logger.error(
+                f"Dependency dict does not contain packageid or correct format: [{dependency_or_dependency_ids}]"
+            )
+    # If the value is a LIST of dicts
+    elif isinstance(dependency_or_dependency_ids, list):
+        if dependency_or_dependency_ids and isinstance(
+            dependency_or_dependency_ids[0], dict
+        ):
+            for dependency in dependency_or_dependency_ids:
+                if dependency.get("packageId"):
+                    # Below works with `MayRequire` dependencies
+                    dependency_ids.append(dependency["packageId"].lower())
+                else:
+                    logger.error(
+                        f"Dependency dict does not contain packageId: [{dependency_or_dependency_ids}]"
+                    )
+        else:
+            logger.error(
+                f"List of dependencies does not contain dicts: [{dependency_or_dependency_ids}]"
+            )
+    else:
+        logger.error(
+            f"Dependencies is not a single dict or a list of dicts: [{dependency_or_dependency_ids}]"
+        )
+    return dependency_ids
+
+
+def normalize_incompatibility_ids(dependency_or_dependency_ids: Any) -> list[str]:
+    """
+    Normalize incompatibility data (a single string, or a list of strings) to a
+    list of lowercase packageids.
+    """
+    # If the value is a single string...
+    if isinstance(dependency_or_dependency_ids, str):
+        return [dependency_or_dependency_ids.lower()]
+    # If the value is a LIST of strings
+    if isinstance(dependency_or_dependency_ids, list):
+        if dependency_or_dependency_ids and isinstance(
+            dependency_or_dependency_ids[0], str
+        ):
+            # Sometimes, entries can be None or an empty string if XML syntax error/extra elements
+            return [
+                dependency.lower()
+                for dependency in dependency_or_dependency_ids
+                if dependency
+            ]
+        logger.error(
+            f"List of incompatibilities does not contain strings: [{dependency_or_dependency_ids}]"
+        )
+        return []
+    logger.error(
+        f"Incompatibilities is not a single string or a list of strings: [{dependency_or_dependency_ids}]"
+    )
+    return []
+
+
+def normalize_load_rule_ids(dependency_or_dependency_ids: Any) -> list[str]:
+    """
+    Normalize load order rule data to a list of lowercase packageids.
+
+    :param dependency_or_dependency_ids: either a string, a dict with `MayRequire`
+    (#text) data, or a list of those
+    """
+    dependencies: list[str] = []
+    if isinstance(dependency_or_dependency_ids, str):
+        dependencies.append(dependency_or_dependency_ids.lower())
+    elif isinstance(dependency_or_dependency_ids, dict):
+        if "#text" in dependency_or_dependency_ids:
+            dependencies.append(dependency_or_dependency_ids["#text"].lower())
+        else:
+            logger.error(
+                f"Load rule with MayRequire does not contain expected #text key: {dependency_or_dependency_ids}"
+            )
+    elif isinstance(dependency_or_dependency_ids, list):
+        for dep in dependency_or_dependency_ids:
+            if isinstance(dep, str):
+                dependencies.append(dep.lower())
+            elif isinstance(dep, dict) and "#text" in dep:
+                dependencies.append(dep["#text"].lower())
+            else:
+                logger.error(f"Load rule is not an expected str or dict: {dep}")
+    else:
+        logger.error(
+            f"Load order rules is not a single string/dict/list of strings/dicts: [{dependency_or_dependency_ids}]"
+        )
+    return dependencies
+
+
+def index_steam_db(
+    steam_db: Mapping[str, Any],
+) -> tuple[Mapping[str, str], Mapping[str, str]]:
+    """
+    Build lookups for a Steam DB.
+
+    An IndexedSteamDatabase already has these lookups on disk, so they are used as is
+    instead of decoding every entry.
+
+    :param steam_db: The ["database"] of a Steam DB, keyed by publishedfileid
+    :return: A tuple of (publishedfileid -> packageid, packageid -> name). Packageids are lowercase.
+    """
+    if isinstance(steam_db, IndexedSteamDatabase):
+        return steam_db.packageid_by_pfid, steam_db.name_by_packageid
+    steam_id_to_package_id: dict[str, str] = {}
+    package_id_to_name: dict[str, str] = {}
+    for publishedfileid, mod_data in steam_db.items():
+        db_packageid = steam_db_packageid(mod_data)
+        # If our DB has a packageid for this
+        if db_packageid:
+            steam_id_to_package_id[publishedfileid] = db_packageid
+            package_id_to_name[db_packageid] = mod_data.get("name")
+    return steam_id_to_package_id, package_id_to_name
+
+
+class RuleEdgeIndex:
+    """
+    Tracks which mod, and which rule source, contributed every compiled rule edge.
+
+    A mod "contributes" an edge if the edge was derived from rules belonging to it:
+    its About.xml, its Steam DB entry, or the community/user rules keyed by its packageid.
+    Edges can land on other mods (e.g. A loads after B adds (A, False) to B's loadTheseAfter),
+    and the same edge can be contributed by several mods and sources, so edges are reference
+    counted and only removed from the metadata once nothing contributes them anymore.
+
+    Every packageid a contributor's rules reference is also tracked, so the contributors
+    that need recompiling when a packageid is installed, changed or removed can be found
+    without scanning every mod.
+    """
+
+    def __init__(self) -> None:
+        # contributor uuid -> {(target uuid, key, value, source)}
+        self.contributions: dict[str, set[tuple[str, str, Any, str]]] = {}
+        # edge -> {(contributor uuid, source)}
+        self.edge_sources: dict[RuleEdge, set[tuple[str, str]]] = {}
+        # referenced packageid -> contributor uuids
+        self.dependents: dict[str, set[str]] = {}
+        # contributor uuid -> referenced packageids
+        self.references: dict[str, set[str]] = {}
+        # contributor uuid -> packageid it had when it was compiled
+        self.compiled_packageids: dict[str, str] = {}
+
+    def clear(self) -> None:
+        self.contributions.clear()
+        self.edge_sources.clear()
+        self.dependents.clear()
+        self.references.clear()
+        self.compiled_packageids.clear()
+
+    def add_reference(self, contributor: str, packageid: str) -> None:
+        """Record that the rules of a contributor reference a packageid."""
+        self.dependents.setdefault(packageid, set()).add(contributor)
+        self.references.setdefault(contributor, set()).add(packageid)
+
+    def add(
+        self,
+        contributor: str,
+        target: str,
+        key: str,
+        value: Any,
+        source: str,
+        all_mods: dict[str, Any],
+    ) -> None:
+        """Add an edge to the target mod's metadata, recording who contributed it."""
+        self.edge_sources.setdefault((target, key, value), set()).add(
+            (contributor, source)
+        )
+        self.contributions.setdefault(contributor, set()).add(
+            (target, key, value, source)
+        )
+        mod_data = all_mods.get(target)
+        if mod_data is None:
+            return
+        if key == "loadBottom":
+            mod_data["loadBottom"] = True
+        else:
+            mod_data.setdefault(key, set()).add(value)
+
+    def remove_contributor(self, contributor: str, all_mods: dict[str, Any]) -> None:
+        """Remove every edge, and every reference, contributed by a mod."""
+        for target, key, value, source in self.contributions.pop(contributor, ()):
+            edge = (target, key, value)
+            sources = self.edge_sources.get(edge)
+            if sources is None:
+                continue
+            sources.discard((contributor, source))
+            if sources:
+                # Still contributed by another mod or rule source
+                continue
+            del self.edge_sources[edge]
+            mod_data = all_mods.get(target)
+            if mod_data is None:
+                continue
+            if key == "loadBottom":
+                mod_data.pop("loadBottom", None)
+            elif isinstance(mod_data.get(key), set):
+                mod_data[key].discard(value)
+        for packageid in self.references.pop(contributor, ()):
+            dependents = self.dependents.get(packageid)
+            if dependents is not None:
+                dependents.discard(contributor)
+                if not dependents:
+                    del self.dependents[packageid]
+        self.compiled_packageids.pop(contributor, None)
+
+    def dependents_of(self, packageid: str) -> set[str]:
+        """Return the contributors whose rules reference a packageid."""
+        return self.dependents.get(packageid, set())
+
+    def sources_of(self, target: str, key: str, value: Any) -> set[str]:
+        """Return the rule sources that contributed an edge."""
+        return {source for _, source in self.edge_sources.get((target, key, value), ())}
+
+
+class RuleCompiler:
+    """
+    Compiles dependencies, incompatibilities and load order rules from About.xml,
+    the Steam DB, community rules and user rules into mod metadata.
+
+    Compilation is incremental: compiling a set of changed mods only recompiles those
+    mods and the mods whose rules reference them, using the reverse index kept by
+    RuleEdgeIndex. A one-mod update therefore costs O(degree) instead of O(all mods × rules).
+    """
+
+    def __init__(self) -> None:
+        self.edges = RuleEdgeIndex()
+        self.steam_id_to_package_id: Mapping[str, str] = {}
+        self.steam_package_id_to_name: Mapping[str, str] = {}
+        self._steam_db: Mapping[str, Any] | None = None
+        # rules source -> (rules dict, lowercase packageid -> rules keys)
+        self._rules_lookup: dict[str, tuple[dict[str, Any], dict[str, list[str]]]] = {}
+
+    def reset(self) -> None:
+        """Forget everything compiled so far. Used before recompiling all mods."""
+        self.edges.clear()
+        self._steam_db = None
+        self._rules_lookup.clear()
+
+    def compile(
+        self,
+        uuids: Iterable[str],
+        all_mods: dict[str, Any],
+        packageid_to_uuids: dict[str, set[str]],
+        game_version: str,
+        steam_db: Mapping[str, Any] | None = None,
+        community_rules: dict[str, Any] | None = None,
+        user_rules: dict[str, Any] | None = None,
+    ) -> set[str]:
+        """
+        (Re)compile rules for changed mods and every mod whose rules reference them.
+
+        Changed mods may have been added, replaced or removed from `all_mods`.
+
+        :param uuids: uuids of the mods that changed
+        :param all_mods: all mod metadata, keyed by uuid
+        :param packageid_to_uuids: installed packageid -> uuids
+        :param game_version: the game version, used for *byversion tags
+        :param steam_db: the Steam DB, keyed by publishedfileid
+        :param community_rules: community rules, keyed by packageid
+        :param user_rules: user rules, keyed by packageid
+        :return: the uuids that were recompiled
+        """
+        if steam_db is not self._steam_db:
+            self._steam_db = steam_db
+            self.steam_id_to_package_id, self.steam_package_id_to_name = (
+                index_steam_db(steam_db) if steam_db else ({}, {})
+            )
+        rules_by_source = {
+            RULE_SOURCE_COMMUNITY_RULES: (
+                community_rules,
+                self._get_rules_lookup(RULE_SOURCE_COMMUNITY_RULES, community_rules),
+            ),
+            RULE_SOURCE_USER_RULES: (
+                user_rules,
+                self._get_rules_lookup(RULE_SOURCE_USER_RULES, user_rules),
+            ),
+        }
+
+        affected = set(uuids)
+        for uuid in list(affected):
+            packageids = {
+                self.edges.compiled_packageids.get(uuid),
+                all_mods.get(uuid, {}).get("packageid"),
+            }
+            for packageid in packageids:
+                if packageid:
+                    affected.update(self.edges.dependents_of(packageid))
+
+        for uuid in affected:
+            self.edges.remove_contributor(uuid, all_mods)
+        for uuid in affected:
+            if uuid in all_mods:
+                self._compile_mod(
+                    uuid,
+                    all_mods,
+                    packageid_to_uuids,
+                    game_version,
+                    steam_db,
+                    rules_by_source,
+                )
+        return affected
+
+    def _get_rules_lookup(
+        self, source: str, rules: dict[str, Any] | None
+    ) -> dict[str, list[str]]:
+        if not rules:
+            self._rules_lookup.pop(source, None)
+            return {}
+        cached = self._rules_lookup.get(source)
+        if cached is not None and cached[0] is rules:
+            return cached[1]
+        lookup: dict[str, list[str]] = {}
+        for package_id in rules:
+            lookup.setdefault(package_id.lower(), []).append(package_id)
+        self._rules_lookup[source] = (rules, lookup)
+        return lookup
+
+    def _compile_mod(
+        self,
+        uuid: str,
+        all_mods: dict[str, Any],
+        packageid_to_uuids: dict[str, set[str]],
+        game_version: str,
+        steam_db: Mapping[str, Any] | None,
+        rules_by_source: dict[str, tuple[dict[str, Any] | None, dict[str, list[str]]]],
+    ) -> None:
+        mod_data = all_mods[uuid]
+        packageid = mod_data.get("packageid")
+        logger.debug(f"UUID: {uuid} packageid: {packageid}")
+        if packageid:
+            self.edges.compiled_packageids[uuid] = packageid
+
+        def add_dependencies(dependency_ids: Iterable[str], source: str) -> None:
+            for dependency_id in dependency_ids:
+                self.edges.add(
+                    uuid, uuid, "dependencies", dependency_id, source, all_mods
+                )
+
+        def add_incompatibilities(incompatible_ids: Iterable[str], source: str) -> None:
+            # There's no need to surface incompatibilities if they aren't even downloaded
+            for incompatible_id in incompatible_ids:
+                self.edges.add_reference(uuid, incompatible_id)
+                if packageid_to_uuids.get(incompatible_id):
+                    self.edges.add(
+                        uuid,
+                        uuid,
+                        "incompatibilities",
+                        incompatible_id,
+                        source,
+                        all_mods,
+                    )
+
+        def add_load_rules(
+            rule_ids: Iterable[str], explicit_key: str, indirect_key: str, source: str
+        ) -> None:
+            # Load order data is collected only if the mod referenced is installed, as
+            # mods that are not installed do not need to be ordered
+            for rule_id in rule_ids:
+                self.edges.add_reference(uuid, rule_id)
+                rule_uuids = packageid_to_uuids.get(rule_id)
+                if not rule_uuids:
+                    continue
+                self.edges.add(
+                    uuid, uuid, explicit_key, (rule_id, True), source, all_mods
+                )
+                for rule_uuid in rule_uuids:
+                    self.edges.add(
+                        uuid,
+                        rule_uuid,
+                        indirect_key,
+                        (packageid, False),
+                        source,
+                        all_mods,
+                    )
+
+        # About.xml
+        self._compile_about_xml(
+            mod_data,
+            game_version,
+            add_dependencies,
+            add_incompatibilities,
+            add_load_rules,
+        )
+
+        # Steam references dependencies based on PublishedFileID, not package ID
+        publishedfileid = mod_data.get("publishedfileid")
+        if steam_db and publishedfileid and packageid:
+            steam_data = steam_db.get(publishedfileid)
+            if (
+                steam_data
+                and steam_db_packageid(steam_data) == packageid
+                and steam_data.get("dependencies")
+            ):
+                for dependency_steam_id in steam_data["dependencies"]:
+                    # We should be able to resolve the package_id from the Steam ID for any mod,
+                    # unless the metadata references a Steam ID that does not wire to a package_id
+                    dependency_id = self.steam_id_to_package_id.get(dependency_steam_id)
+                    if dependency_id:
+                        add_dependencies([dependency_id], RULE_SOURCE_STEAM_DB)
+                    else:
+                        # This should only happen with RimPy Mod Manager Database, since it does not contain
+                        # keyed information for Core + DLCs in it's ["database"]
+                        logger.debug(
+                            f"Unable to lookup Steam AppID/PublishedFileID in Steam metadata: {dependency_steam_id}"
+                        )
+
+        # Community rules & user rules
+        if not packageid:
+            return
+        for source, (rules, lookup) in rules_by_source.items():
+            if not rules:
+                continue
+            for package_id in lookup.get(packageid, ()):
+                rule = rules[package_id]
+                # In Alphabetical, these are at least an empty dict keyed by packageid
+                for load_this_after in rule.get("loadBefore") or ():
+                    add_load_rules(
+                        normalize_load_rule_ids(load_this_after),
+                        "loadTheseAfter",
+                        "loadTheseBefore",
+                        source,
+                    )
+                for load_this_before in rule.get("loadAfter") or ():
+                    add_load_rules(
+                        normalize_load_rule_ids(load_this_before),
+                        "loadTheseBefore",
+                        "loadTheseAfter",
+                        source,
+                    )
+                for incompatibility in rule.get("incompatibleWith") or ():
+                    add_incompatibilities(
+                        normalize_incompatibility_ids(incompatibility), source
+                    )
+                if rule.get("loadBottom"):
+                    logger.debug(
+                        'Current mod should load at the bottom of a mods list, and will be considered a "tier 3" mod'
+                    )
+                    self.edges.add(uuid, uuid, "loadBottom", True, source, all_mods)
+
+    @staticmethod
+    def _compile_about_xml(
+        mod_data: dict[str, Any],
+        game_version: str,
+        add_dependencies: Callable[[Iterable[str], str], None],
+        add_incompatibilities: Callable[[Iterable[str], str], None],
+        add_load_rules: Callable[[Iterable[str], str, str, str], None],
+    ) -> None:
+        metadata_file_path = mod_data.get("metadata_file_path")
+
+        def matching_versions(tag: str) -> list[tuple[str, Any]]:
+            # Return the entries of a *byversion tag matching the game's major.minor version
+            tag_data = mod_data.get(tag)
+            if not tag_data or not isinstance(tag_data, dict):
+                return []
+            try:
+                major, minor = game_version.split(".")[:2]
+            except ValueError:
+                logger.warning(
+                    f"Unable to read <{tag}> tag without a valid game version: {metadata_file_path}"
+                )
+                return []
+            version_regex = rf"v{major}\.{minor}"
+            return [
+                (version, data)
+                for version, data in tag_data.items()
+                if match(version_regex, version)
+            ]
+
+        def li(data: Any) -> Any:
+            if data and isinstance(data, dict):
+                return data.get("li")
+            return None
+
+        # moddependencies are not equal to mod load order rules
+        moddependencies = mod_data.get("moddependencies")
+        dependencies = None
+        if isinstance(moddependencies, dict):
+            dependencies = moddependencies.get("li")
+        elif isinstance(moddependencies, list):
+            # Loop through the list and try to find dictionary. If we find one, use it.
+            for potential_dependencies in moddependencies:
+                if li(potential_dependencies):
+                    dependencies = potential_dependencies["li"]
+        if dependencies:
+            logger.debug(f"Current mod requires these mods to work: {dependencies}")
+            add_dependencies(
+                normalize_dependency_ids(dependencies), RULE_SOURCE_ABOUT_XML
+            )
+        for version, dependencies_by_ver in matching_versions(
+            "moddependenciesbyversion"
+        ):
+            if li(dependencies_by_ver):
+                add_dependencies(
+                    normalize_dependency_ids(dependencies_by_ver["li"]),
+                    RULE_SOURCE_ABOUT_XML,
+                )
+            else:
+                logger.warning(
+                    f"About.xml syntax error. Unable to read <moddependenciesbyversion> tag from XML for version [{version}]: {metadata_file_path}"
+                )
+
+        incompatibilities = li(mod_data.get("incompatiblewith"))
+        if incompatibilities:
+            logger.debug(
+                f"Current mod is incompatible with these mods: {incompatibilities}"
+            )
+            add_incompatibilities(
+                normalize_incompatibility_ids(incompatibilities), RULE_SOURCE_ABOUT_XML
+            )
+        for version, incompatibilities_by_ver in matching_versions(
+            "incompatiblewithbyversion"
+        ):
+            if li(incompatibilities_by_ver):
+                add_incompatibilities(
+                    normalize_incompatibility_ids(incompatibilities_by_ver["li"]),
+                    RULE_SOURCE_ABOUT_XML,
+                )
+            else:
+                logger.warning(
+                    f"About.xml syntax error. Unable to read <incompatiblewithbyversion> tag from XML for version [{version}]: {metadata_file_path}"
+                )
+
+        # Current mod should be loaded AFTER these mods ("load these before"), or
+        # BEFORE these mods ("load these after"). These are not necessarily dependencies,
+        # but if they exist in the same mod list, they should be ordered.
+        for tag, explicit_key, indirect_key in (
+            ("loadafter", "loadTheseBefore", "loadTheseAfter"),
+            ("forceloadafter", "loadTheseBefore", "loadTheseAfter"),
+            ("loadbefore", "loadTheseAfter", "loadTheseBefore"),
+            ("forceloadbefore", "loadTheseAfter", "loadTheseBefore"),
+        ):
+            if not mod_data.get(tag):
+                continue
+            try:
+                rules = mod_data[tag].get("li")
+                if rules:
+                    logger.debug(f"Current mod has <{tag}> rules: {rules}")
+                    add_load_rules(
+                        normalize_load_rule_ids(rules),
+                        explicit_key,
+                        indirect_key,
+                        RULE_SOURCE_ABOUT_XML,
+                    )
+            except Exception as e:
+                logger.warning(
+                    f"About.xml syntax error. Unable to read <{tag}> tag from XML: {metadata_file_path}"
+                )
+                logger.debug(e)
+        for tag, explicit_key, indirect_key in (
+            ("loadafterbyversion", "loadTheseBefore", "loadTheseAfter"),
+            ("loadbeforebyversion", "loadTheseAfter", "loadTheseBefore"),
+        ):
+            for version, rules_by_ver in matching_versions(tag):
+                if li(rules_by_ver):
+                    add_load_rules(
+                        normalize_load_rule_ids(rules_by_ver["li"]),
+                        explicit_key,
+                        indirect_key,
+                        RULE_SOURCE_ABOUT_XML,
+                    )
+                else:
+                    logger.warning(
+                        f"About.xml syntax error. Unable to read <{tag}> tag from XML for version [{version}]: {metadata_file_path}"
+                    )
@@ -0,0 +1,111 @@
+from collections.abc import Iterable, Mapping
+from typing import Any
+
+# Fields the mod list search bar can search in
+SEARCH_FIELDS = ("name", "packageid", "authors", "publishedfileid", "version")
+
+# Separates versions; the search bar is a single line, so patterns can't match across two
+_VERSION_SEPARATOR = "\n"
+
+
+def search_text(metadata: Mapping[str, Any], field: str) -> str | None:
+    """
+    Return the lowercased text a search in a field is matched against.
+
+    :param metadata: The mod's metadata
+    :param field: One of SEARCH_FIELDS
+    :return: The text to search, or None if the mod has no value for the field
+    """
+    if field == "version":
+        versions = (metadata.get("supportedversions") or {}).get("li", [])
+        if isinstance(versions, str):
+            versions = [versions]
+        if not versions:
+            return None
+        return _VERSION_SEPARATOR.join(str(version).lower() for version in versions)
+    value = metadata.get(field)
+    return str(value).lower() if value else None
+
+
+class ModSearchIndex:
+    """
+    Lowercased search texts of mods, so searching does not re-read and lowercase metadata on every keystroke.
+
+    Mods are indexed the first time they are searched and re-indexed when their metadata
+    is replaced; in-place metadata changes must be signalled with `discard`. The results of
+    the last search are kept, so typing more characters only rescans the previous matches.
+    """
+
+    def __init__(self) -> None:
+        # uuid -> the metadata the mod was indexed from
+        self._sources: dict[str, Mapping[str, Any]] = {}
+        # field -> uuid -> search text, for mods that have a value for the field
+        self._texts: dict[str, dict[str, str]] = {field: {} for field in SEARCH_FIELDS}
+        # (field, lowercased pattern, uuids with a text, matching uuids) of the last search
+        self._last_search: tuple[str, str, frozenset[str], set[str]] | None = None
+
+    def __len__(self) -> int:
+        return len(self._sources)
+
+    def add(self, uuid: str, metadata: Mapping[str, Any]) -> None:
+        """(Re)index a mod."""
+        self._sources[uuid] = metadata
+        for field, texts in self._texts.items():
+            text = search_text(metadata, field)
+            if text is None:
+                texts.pop(uuid, None)
+            else:
+                texts[uuid] = text
+        self._last_search = None
+
+    def discard(self, uuid: str) -> None:
+        """Remove a mod from the index, e.g. after it was deleted or its metadata changed."""
+        if self._sources.pop(uuid, None) is None:
+            return
+        for texts in self._texts.values():
+            texts.pop(uuid, None)
+        self._last_search = None
+
+    def sync(self, uuids: Iterable[str], all_mods: Mapping[str, Any]) -> None:
+        """Index the given mods if they are new, or if their metadata was replaced."""
+        sources = self._sources
+        for uuid in uuids:
+            metadata = all_mods.get(uuid)
+            if metadata is not None and sources.get(uuid) is not metadata:
+                self.add(uuid, metadata)
+
+    def filtered_out(self, field: str, pattern: str, uuids: Iterable[str]) -> set[str]:
+        """
+        Return the mods a search pattern filters out.
+
+        A mod is filtered out if it has a value for the field that does not contain the pattern
+        (case-insensitive). Mods without a value are never filtered out, except for "version",
+        where mods without supported versions never match.
+
+        :param field: One of SEARCH_FIELDS
+        :param pattern: The search pattern
+        :param uuids: The mods to search, which must have been synced
+        :return: The uuids filtered out by the pattern
+        """
+        if not pattern:
+            return set()
+        uuid_set = set(uuids)
+        texts = self._texts[field]
+        pattern = pattern.lower()
+        with_text = frozenset(texts.keys() & uuid_set)
+        last_search = self._last_search
+        if (
+            last_search is not None
+            and last_search[0] == field
+            and pattern.startswith(last_search[1])
+            and last_search[2] >= with_text
+        ):
+            # A longer pattern can only match a subset of what the shorter one matched
+            candidates: Iterable[str] = last_search[3] & with_text
+        else:
+            candidates = with_text
+        matches = {uuid for uuid in candidates if pattern in texts[uuid]}
+        self._last_search = (field, pattern, with_text, matches)
+        if field == "version":
+            return uuid_set - matches
+        return set(with_text - matches)
@@ -1,4 +1,5 @@
 import os
+from collections.abc import Mapping
 from typing import Union
 
 from loguru import logger
@@ -34,9 +35,9 @@ def get_mod_name_from_pfid(pfid: Union[str, int, None]) -> str:
     metadata_manager = MetadataManager.instance()
 
     # Check internal metadata
-    for mod_data in metadata_manager.internal_local_metadata.values():
-        if mod_data.get("publishedfileid") == pfid_str:
-            return mod_data.get("name", pfid_str)
+    uuid = metadata_manager.get_uuid_from_publishedfileid(pfid_str)
+    if uuid is not None:
+        return metadata_manager.internal_local_metadata[uuid].get("name", pfid_str)
 
     # Check external Steam metadata
     if metadata_manager.external_steam_metadata:
@@ -74,24 +75,17 @@ def get_mod_path_from_pfid(pfid: Union[str, int, None]) -> str:
 
     try:
         # Check internal local metadata
-        if hasattr(metadata_manager, "internal_local_metadata"):
-            for metadata in metadata_manager.internal_local_metadata.values():
-                if (
-                    metadata
-                    and isinstance(metadata, dict)
-                    and metadata.get("publishedfileid") == pfid_str
-                ):
-                    logger.debug(
-                        f"Found match in internal metadata for PFID {pfid_str}"
-                    )
-                    path = metadata.get("path")
-                    if path:
-                        return path
+        uuid = metadata_manager.get_uuid_from_publishedfileid(pfid_str)
+        if uuid is not None:
+            logger.debug(f"Found match in internal metadata for PFID {pfid_str}")
+            path = metadata_manager.internal_local_metadata[uuid].get("path")
+            if path:
+                return path
 
         # Check external steam metadata if available
         if hasattr(metadata_manager, "external_steam_metadata"):
             steam_metadata = getattr(metadata_manager, "external_steam_metadata", {})
-            if isinstance(steam_metadata, dict):
+            if isinstance(steam_metadata, Mapping):
                 match = steam_metadata.get(pfid_str, {})
                 if match and "path" in match:
                     logger.debug(
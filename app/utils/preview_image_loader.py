@@ -0,0 +1,328 @@
+import hashlib
+import os
+from collections import OrderedDict
+from collections.abc import Iterable
+from pathlib import Path
+
+from loguru import logger
+from PySide6.QtCore import QObject, QRunnable, QSize, Qt, QThreadPool, Signal
+from PySide6.QtGui import QImage, QImageReader, QPixmap
+
+# Preview images larger than this are downscaled to fit, before they are cached and displayed
+THUMBNAIL_SIZE = 1024
+# Memory used by the thumbnails kept in memory, least recently used thumbnails are dropped
+THUMBNAIL_CACHE_BYTES = 64 * 1024 * 1024
+# Thumbnails kept on disk, the oldest are deleted
+THUMBNAIL_DISK_CACHE_FILES = 500
+# Bump this whenever the way thumbnails are made changes, so stale thumbnails are not used
+THUMBNAIL_CACHE_VERSION = 1
+
+
+def find_about_folder(mod_path: str) -> str | None:
+    """
+    Find a mod's About folder, matching its name case-insensitively.
+
+    :param mod_path: The mod's folder
+    :return: The path to the About folder, or None if the mod has none
+    """
+    try:
+        with os.scandir(mod_path) as entries:
+            return next(
+                (
+                    entry.path
+                    for entry in entries
+                    if entry.name.lower() == "about" and entry.is_dir()
+                ),
+                None,
+            )
+    except OSError:
+        return None
+
+
+def find_preview_image(mod_path: str) -> str | None:
+    """
+    Find a mod's About/Preview.png, matching the folder and file names case-insensitively.
+
+    :param mod_path: The mod's folder
+    :return: The path to the preview image, or None if the mod has none
+    """
+    about_path = find_about_folder(mod_path)
+    if about_path is None:
+        return None
+    try:
+        with os.scandir(about_path) as entries:
+            return next(
+                (
+                    entry.path
+                    for entry in entries
+                    if entry.name.lower() == "preview.png" and entry.is_file()
+                ),
+                None,
+            )
+    except OSError:
+        return None
+
+
+def file_stamp(path: str) -> tuple[int, int] | None:
+    """
+    Return (mtime_ns, size) of a file or folder, or None if it can't be read.
+
+    :param path: The file or folder
+    """
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def thumbnail_cache_path(image_path: str, cache_folder: Path) -> Path:
+    """
+    Return the path of the cached thumbnail of an image.
+
+    The file name is derived from the image's path and its (mtime_ns, size), so a changed
+    image maps to a new thumbnail, and a thumbnail never has to be validated against it.
+
+    :param image_path: The full size image
+    :param cache_folder: Folder that holds cached thumbnails
+    :return: Path to the thumbnail, which may not exist
+    """
+    stat = os.stat(image_path)
+    key = f"{os.path.abspath(image_path)}:{stat.st_mtime_ns}:{stat.st_size}:{THUMBNAIL_SIZE}:{THUMBNAIL_CACHE_VERSION}"
+    return cache_folder / hashlib.sha1(key.encode("utf-8")).hexdigest()[:20]
+
+
+def load_thumbnail(image_path: str, cache_folder: Path | None = None) -> QImage:
+    """
+    Read an image, downscaled to fit in THUMBNAIL_SIZE. Safe to call from any thread.
+
+    Downscaled images are cached in `cache_folder` if given, and read from it when the
+    image is unchanged.
+
+    :param image_path: The image to read
+    :param cache_folder: Folder that holds cached thumbnails, None to not cache them
+    :return: The thumbnail, a null image if the image could not be read
+    """
+    cache_path = None
+    if cache_folder is not None:
+        try:
+            cache_path = thumbnail_cache_path(image_path, cache_folder)
+        except OSError:
+            return QImage()
+        if cache_path.exists():
+            image = QImage(str(cache_path))
+            if not image.isNull():
+                try:
+                    # Recently used thumbnails are the last to be pruned
+                    os.utime(cache_path)
+                except OSError:
+                    pass
+                return image
+
+    reader = QImageReader(image_path)
+    reader.setAutoTransform(True)
+    size = reader.size()
+    downscaled = size.isValid() and (
+        size.width() > THUMBNAIL_SIZE or size.height() > THUMBNAIL_SIZE
+    )
+    if downscaled:
+        reader.setScaledSize(
+            size.scaled(
+                QSize(THUMBNAIL_SIZE, THUMBNAIL_SIZE),
+                Qt.AspectRatioMode.KeepAspectRatio,
+            )
+        )
+    image = reader.read()
+    if image.isNull():
+        logger.warning(f"Unable to read image {image_path}: {reader.errorString()}")
+        return image
+
+    # Small images are read quickly enough as they are
+    if cache_path is not None and downscaled:
+        try:
+            cache_folder_path = cache_path.parent
+            cache_folder_path.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_path.with_suffix(".tmp")
+            # Keep transparency, which jpg does not support
+            image_format = "PNG" if image.hasAlphaChannel() else "JPG"
+            if image.save(str(tmp_path), image_format, 90):  # type: ignore[call-overload]
+                os.replace(tmp_path, cache_path)
+            else:
+                tmp_path.unlink(missing_ok=True)
+        except OSError as e:
+            logger.warning(f"Unable to cache thumbnail of {image_path}: {e}")
+    return image
+
+
+def prune_thumbnail_cache(
+    cache_folder: Path, keep: int = THUMBNAIL_DISK_CACHE_FILES
+) -> None:
+    """
+    Delete the oldest thumbnails, so at most `keep` thumbnails are kept.
+
+    :param cache_folder: Folder that holds cached thumbnails
+    :param keep: The number of thumbnails to keep
+    """
+    try:
+        with os.scandir(cache_folder) as entries:
+            thumbnails = [
+                (entry.stat().st_mtime_ns, entry.path)
+                for entry in entries
+                if entry.is_file()
+            ]
+        thumbnails.sort()
+        for _, path in thumbnails[: max(0, len(thumbnails) - keep)]:
+            os.remove(path)
+    except OSError as e:
+        logger.debug(f"Unable to prune thumbnail cache {cache_folder}: {e}")
+
+
+class _PreviewImageTask(QRunnable):
+    """Finds and reads the preview image of a mod on a thread of the loader's pool."""
+
+    def __init__(
+        self, loader: "PreviewImageLoader", mod_path: str, cache_folder: Path | None
+    ) -> None:
+        super().__init__()
+        self.loader = loader
+        self.mod_path = mod_path
+        self.cache_folder = cache_folder
+
+    def run(self) -> None:
+        # The file whose changes make the thumbnail stale: the image, or where it would be
+        stamp_path = self.mod_path
+        try:
+            image_path = find_preview_image(self.mod_path)
+            if image_path is not None:
+                stamp_path = image_path
+                image = load_thumbnail(image_path, self.cache_folder)
+            else:
+                stamp_path = find_about_folder(self.mod_path) or self.mod_path
+                image = QImage()
+        except Exception as e:
+            logger.warning(f"Unable to load preview image of {self.mod_path}: {e}")
+            image = QImage()
+        # Queued to the loader's thread
+        self.loader._thumbnail_read.emit(
+            self.mod_path, image, (stamp_path, file_stamp(stamp_path))
+        )
+
+
+class PreviewImageLoader(QObject):
+    """
+    Loads the preview images of mods on a background thread pool, keeping recently used
+    thumbnails in memory.
+
+    `request` returns a cached thumbnail immediately, or starts loading it and emits
+    `preview_loaded` once it is read. Cached thumbnails are reloaded once the preview
+    image (or the folder it would be in, for mods without one) changes. Previews requested earlier that have not started
+    loading yet are cancelled by the next request, so quickly moving through a mod list
+    only loads the mods it stops on (and their neighbours, if prefetched).
+    Must be used from the GUI thread.
+
+    :param cache_folder: Folder to cache thumbnails of large images in, None to not cache them on disk
+    """
+
+    # Mod folder, thumbnail of its preview image (null if it has none)
+    preview_loaded = Signal(str, QPixmap)
+    # Mod folder, thumbnail, (path, stamp) of the file it was read from
+    _thumbnail_read = Signal(str, QImage, object)
+
+    def __init__(
+        self, cache_folder: Path | None = None, parent: QObject | None = None
+    ) -> None:
+        super().__init__(parent)
+        # Mod folder -> thumbnail, and (path, stamp) of the file it was read from
+        self._cache: OrderedDict[
+            str, tuple[QPixmap, tuple[str, tuple[int, int] | None]]
+        ] = OrderedDict()
+        self._cache_bytes = 0
+        # Mod folder -> task, for previews being loaded
+        self._pending: dict[str, _PreviewImageTask] = {}
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(2)
+        self._thumbnail_read.connect(self._on_thumbnail_read)
+        # Cache folders pruned so far, each is pruned once when first used
+        self._pruned: set[Path] = set()
+        self._cache_folder: Path | None = None
+        self.cache_folder = cache_folder
+
+    @property
+    def cache_folder(self) -> Path | None:
+        """Folder to cache thumbnails of large images in, None to not cache them on disk."""
+        return self._cache_folder
+
+    @cache_folder.setter
+    def cache_folder(self, cache_folder: Path | None) -> None:
+        self._cache_folder = cache_folder
+        if cache_folder is not None and cache_folder not in self._pruned:
+            self._pruned.add(cache_folder)
+            self._pool.start(lambda: prune_thumbnail_cache(cache_folder))
+
+    def request(self, mod_path: str, prefetch: Iterable[str] = ()) -> QPixmap | None:
+        """
+        Get the preview image of a mod, and prefetch the previews of other mods.
+
+        :param mod_path: The mod's folder
+        :param prefetch: Folders of mods whose previews are likely requested next
+        :return: The thumbnail if it is cached (null if the mod has no preview), otherwise None
+            and `preview_loaded` is emitted once it is loaded
+        """
+        prefetch_paths = [path for path in prefetch if path != mod_path]
+        wanted = {mod_path, *prefetch_paths}
+        # Cancel stale requests that have not started yet
+        for path, task in list(self._pending.items()):
+            if path not in wanted and self._pool.tryTake(task):
+                del self._pending[path]
+
+        pixmap = self._get_cached(mod_path)
+        if pixmap is not None:
+            self._cache.move_to_end(mod_path)
+        else:
+            self._start(mod_path, priority=1)
+        for path in prefetch_paths:
+            if self._get_cached(path) is None:
+                self._start(path, priority=0)
+        return pixmap
+
+    def _get_cached(self, mod_path: str) -> QPixmap | None:
+        entry = self._cache.get(mod_path)
+        if entry is None:
+            return None
+        pixmap, (stamp_path, stamp) = entry
+        if file_stamp(stamp_path) != stamp:
+            # The mod was updated since
+            del self._cache[mod_path]
+            self._cache_bytes -= self._pixmap_bytes(pixmap)
+            return None
+        return pixmap
+
+    def _start(self, mod_path: str, priority: int) -> None:
+        if mod_path in self._pending:
+            return
+        task = _PreviewImageTask(self, mod_path, self.cache_folder)
+        # Tasks stay in _pending until their result is received, after run() returns
+        task.setAutoDelete(False)
+        self._pending[mod_path] = task
+        self._pool.start(task, priority)
+
+    def _on_thumbnail_read(
+        self,
+        mod_path: str,
+        image: QImage,
+        stamp: tuple[str, tuple[int, int] | None],
+    ) -> None:
+        self._pending.pop(mod_path, None)
+        pixmap = QPixmap.fromImage(image)
+        if mod_path in self._cache:
+            self._cache_bytes -= self._pixmap_bytes(self._cache.pop(mod_path)[0])
+        self._cache[mod_path] = (pixmap, stamp)
+        self._cache_bytes += self._pixmap_bytes(pixmap)
+        while self._cache_bytes > THUMBNAIL_CACHE_BYTES and len(self._cache) > 1:
+            _, (evicted, _) = self._cache.popitem(last=False)
+            self._cache_bytes -= self._pixmap_bytes(evicted)
+        self.preview_loaded.emit(mod_path, pixmap)
+
+    @staticmethod
+    def _pixmap_bytes(pixmap: QPixmap) -> int:
+        return pixmap.width() * pixmap.height() * 4
@@ -0,0 +1,219 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any
+
+import msgspec
+from loguru import logger
+
+from app.utils.xml import xml_path_to_json
+
+# Bump this whenever the layout of the index changes, so stale indexes are rebuilt
+REPLACEMENT_INDEX_VERSION = 1
+
+
+class ReplacementEntry(msgspec.Struct, array_like=True, gc=False):
+    """A recommended replacement for a mod, as listed in a "Use This Instead" Replacements folder.
+
+    Attributes:
+        name (str): Name of the replacement mod.
+        author (str): Author of the replacement mod.
+        pfid (str): Published file id of the replacement mod.
+        versions (str): Game versions the replacement supports, e.g. "1.4,1.5".
+    """
+
+    name: str
+    author: str
+    pfid: str
+    versions: str
+
+    def supports(self, game_version: str) -> bool:
+        """Return whether the replacement supports a game version, compared by major.minor."""
+        major_minor = game_version.split(".")[:2]
+        if len(major_minor) < 2:
+            return False
+        return ".".join(major_minor) in self.versions
+
+
+class ReplacementIndexSchema(msgspec.Struct):
+    version: int
+    folder: str
+    stamp: tuple[int, int, int]
+    entries: dict[str, ReplacementEntry] = msgspec.field(default_factory=dict)
+
+
+def replacements_stamp(folder: Path | str) -> tuple[int, int, int]:
+    """
+    Return a cheap change stamp for a Replacements folder.
+
+    Updating the repository rewrites the files it changes, so their mtimes change as well.
+
+    :param folder: The Replacements folder
+    :return: A tuple of (number of files, latest mtime_ns, total size), or (-1, -1, -1) if the folder can't be read
+    """
+    count = 0
+    latest = 0
+    size = 0
+    try:
+        with os.scandir(folder) as entries:
+            for entry in entries:
+                if not entry.name.endswith(".xml") or not entry.is_file():
+                    continue
+                stat = entry.stat()
+                count += 1
+                latest = max(latest, stat.st_mtime_ns)
+                size += stat.st_size
+    except OSError:
+        return -1, -1, -1
+    return count, latest, size
+
+
+def parse_replacement(path: str) -> ReplacementEntry | None:
+    """
+    Parse a replacement file, named for the published file id of the mod it replaces.
+
+    :param path: Path to the replacement XML file
+    :return: The replacement, or None if the file could not be parsed
+    """
+    try:
+        data: dict[str, Any] = xml_path_to_json(path)["ModReplacement"]
+        versions = data["ReplacementVersions"]
+        if not isinstance(versions, str):
+            versions = ",".join(map(str, versions or ()))
+        return ReplacementEntry(
+            name=str(data["ReplacementName"] or ""),
+            author=str(data["ReplacementAuthor"] or ""),
+            pfid=str(data["ReplacementSteamId"] or ""),
+            versions=versions or "",
+        )
+    except (KeyError, TypeError) as e:
+        logger.warning(f"Unable to parse replacement at {path}: {e}")
+        return None
+
+
+class ReplacementIndex:
+    """
+    Index of a "Use This Instead" Replacements folder: published file id -> replacement.
+
+    The folder is parsed in bulk on a pool of worker threads, and the result is written to
+    disk, so it is only parsed again once its files change. Looking up a mod is a dict lookup.
+    """
+
+    def __init__(self, path: Path | str, max_workers: int | None = None) -> None:
+        """
+        :param path: Path of the on-disk index
+        :param max_workers: The number of parser threads, by default one per CPU (at most 8)
+        """
+        self.path = Path(path)
+        self.max_workers = max_workers or min(8, os.cpu_count() or 1)
+        # The folder the entries were loaded from and its stamp, None until loaded
+        self.folder: str | None = None
+        self.stamp: tuple[int, int, int] = (-1, -1, -1)
+        # Whether the folder was checked for changes since the last invalidation
+        self._checked = False
+        self._entries: dict[str, ReplacementEntry] = {}
+        self._decoder = msgspec.json.Decoder(ReplacementIndexSchema)
+        self._encoder = msgspec.json.Encoder()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, folder: Path | str, publishedfileid: str) -> ReplacementEntry | None:
+        """
+        Return the replacement of a mod, loading the index of the folder if it isn't loaded.
+
+        :param folder: The Replacements folder
+        :param publishedfileid: Published file id of the mod
+        :return: The replacement, or None if the mod has none
+        """
+        if not self._checked or self.folder != str(folder):
+            self.load(folder)
+        return self._entries.get(publishedfileid)
+
+    def invalidate(self) -> None:
+        """Check the folder for changes on the next lookup."""
+        self._checked = False
+
+    def load(self, folder: Path | str) -> None:
+        """
+        Load the index of a Replacements folder, from disk if the folder is unchanged since the
+        index was built, or by parsing the folder otherwise.
+
+        :param folder: The Replacements folder
+        """
+        folder = str(folder)
+        stamp = replacements_stamp(folder)
+        self._checked = True
+        if folder == self.folder and stamp == self.stamp:
+            return
+        self.folder = folder
+        self.stamp = stamp
+        if stamp[0] <= 0:
+            logger.info(f'No "Use This Instead" replacements found at: {folder}')
+            self._entries = {}
+            return
+        if self._load_from_disk(folder, stamp):
+            logger.info(
+                f'Loaded {len(self._entries)} "Use This Instead" replacements from index'
+            )
+            return
+        self._entries = self._build(folder)
+        logger.info(
+            f'Indexed {len(self._entries)} "Use This Instead" replacements from {folder}'
+        )
+        self._save(folder, stamp)
+
+    def _build(self, folder: str) -> dict[str, ReplacementEntry]:
+        with os.scandir(folder) as entries:
+            paths = [
+                entry.path
+                for entry in entries
+                if entry.name.endswith(".xml") and entry.is_file()
+            ]
+        with ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="ReplacementIndex"
+        ) as executor:
+            replacements = executor.map(parse_replacement, paths)
+            return {
+                os.path.basename(path)[: -len(".xml")]: replacement
+                for path, replacement in zip(paths, replacements)
+                if replacement is not None
+            }
+
+    def _load_from_disk(self, folder: str, stamp: tuple[int, int, int]) -> bool:
+        if not self.path.exists():
+            return False
+        try:
+            with open(self.path, "rb") as f:
+                index = self._decoder.decode(f.read())
+        except (OSError, msgspec.DecodeError) as e:
+            logger.warning(
+                f'Unable to read "Use This Instead" index at {self.path}: {e}'
+            )
+            return False
+        if (
+            index.version != REPLACEMENT_INDEX_VERSION
+            or index.folder != folder
+            or tuple(index.stamp) != stamp
+        ):
+            return False
+        self._entries = index.entries
+        return True
+
+    def _save(self, folder: str, stamp: tuple[int, int, int]) -> None:
+        index = ReplacementIndexSchema(
+            version=REPLACEMENT_INDEX_VERSION,
+            folder=folder,
+            stamp=stamp,
+            entries=self._entries,
+        )
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+            with open(tmp_path, "wb") as f:
+                f.write(self._encoder.encode(index))
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logger.error(
+                f'Unable to write "Use This Instead" index to {self.path}: {e}'
+            )
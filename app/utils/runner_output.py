@@ -0,0 +1,209 @@
+import codecs
+import threading
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from queue import Queue
+from re import compile
+from typing import TextIO
+
+from loguru import logger
+
+ANSI_ESCAPE = compile(r"\x1B\[[0-?]*[ -/]*[@-~]")
+STEAMCMD_DOWNLOADING = compile(r"Downloading item (\d+)...")
+STEAMCMD_SUCCESS = compile(r"Success. Downloaded item (\d+)")
+STEAMCMD_OVERWRITE = (
+    "] Downloading update (",
+    "] Installing update",
+    "] Extracting package",
+)
+TODDS_PROGRESS = compile(r"Progress: (\d+)/(\d+)")
+QUERY_PROGRESS = compile(
+    r"IPublishedFileService/(QueryFiles|GetDetails) (page|chunk) \[(\d+)\/(\d+)\]"
+)
+
+# Runner logs kept on disk, older logs are deleted
+RUNNER_LOGS_KEPT = 10
+
+
+@dataclass
+class RunnerOutputLine:
+    """A line of runner output, and the progress it reports."""
+
+    text: str
+    # Replace the previous line instead of adding a new one
+    overwrite: bool = False
+    # (value, maximum) to set the progress bar to
+    progress: tuple[int, int] | None = None
+    # Number of items finished, to add to the progress bar
+    progress_step: int = 0
+    # The progress bar style to switch to
+    progress_state: str | None = None
+    # The item SteamCMD started downloading
+    steamcmd_pfid: str | None = None
+    # The items SteamCMD finished downloading
+    steamcmd_downloaded: list[str] = field(default_factory=list)
+
+
+def parse_line(line: str, program: str = "") -> RunnerOutputLine:
+    """
+    Parse a line of output, from SteamCMD, todds, the DB builder or anything else.
+
+    :param line: The line of output, without ANSI escape sequences
+    :param program: The program currently running, if any
+    :return: The line to display, and the progress it reports
+    """
+    output = RunnerOutputLine(line)
+    if "steamcmd" in program:
+        match = STEAMCMD_DOWNLOADING.search(line)
+        if match:
+            output.steamcmd_pfid = match.group(1)
+        if any(pattern in line for pattern in STEAMCMD_OVERWRITE):
+            output.overwrite = True
+        # Format specific lines for better readability
+        if "workshop_download_item" in line:
+            output.text = line.replace(
+                "workshop_download_item", "\n\nworkshop_download_item"
+            )
+        elif ") quit" in line:
+            output.text = line.replace(") quit", ")\n\nquit")
+        output.steamcmd_downloaded = STEAMCMD_SUCCESS.findall(line)
+        if not output.steamcmd_downloaded:
+            if "ERROR! Download item " in line:
+                output.progress_state = "warn"
+                output.progress_step = 1
+            elif "ERROR! Not logged on." in line:
+                output.progress_state = "critical"
+                output.progress_step = 1
+    elif "todds" in program:
+        match = TODDS_PROGRESS.search(line)
+        if match:
+            output.progress = (int(match.group(1)), int(match.group(2)))
+            output.overwrite = True
+    # Query progress applies to any process
+    match = QUERY_PROGRESS.search(line)
+    if match:
+        output.progress = (int(match.group(3)), int(match.group(4)))
+        output.overwrite = True
+    if output.overwrite:
+        output.text = output.text.strip()
+    return output
+
+
+def open_runner_log(log_folder: Path, keep: int = RUNNER_LOGS_KEPT) -> TextIO | None:
+    """
+    Create a new runner log, deleting the oldest ones so at most `keep` logs are kept.
+
+    :param log_folder: The folder runner logs are kept in
+    :param keep: The number of logs to keep, including the new one
+    :return: The new log, or None if it could not be created
+    """
+    try:
+        log_folder.mkdir(parents=True, exist_ok=True)
+        old_logs = sorted(log_folder.glob("runner_*.log"))
+        for old_log in old_logs[: max(0, len(old_logs) - keep + 1)]:
+            old_log.unlink(missing_ok=True)
+        log_path = log_folder / f"runner_{datetime.now():%Y%m%d_%H%M%S_%f}.log"
+        return open(log_path, "w", encoding="utf-8")
+    except OSError as e:
+        logger.warning(f"Unable to create runner log in {log_folder}: {e}")
+        return None
+
+
+class RunnerOutputPipeline:
+    """
+    Decodes and parses runner output on a worker thread, for the GUI thread to display in batches.
+
+    Output is fed as it is received, tagged with the program currently running. The worker
+    splits it into lines, parses them, and writes them to a new runner log. The GUI thread
+    collects parsed lines with `drain`, as often as it wants to refresh the display.
+
+    The worker and the log are only created once there is output.
+
+    :param log_folder: The folder to create the runner log in, None to not keep a log
+    """
+
+    def __init__(self, log_folder: Path | None = None) -> None:
+        self.log_folder = log_folder
+        self.log: TextIO | None = None
+        self._closed = False
+        self._queue: Queue[tuple[bytes | str, str] | None] = Queue()
+        self._lines: deque[RunnerOutputLine] = deque()
+        self._decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        self._thread: threading.Thread | None = None
+
+    def feed(self, data: bytes | str, program: str = "") -> None:
+        """
+        Queue output to be parsed.
+
+        :param data: Raw process output, or a message to display
+        :param program: The program currently running, if any
+        """
+        if self._closed:
+            return
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._run, name="RunnerOutputPipeline", daemon=True
+            )
+            self._thread.start()
+        self._queue.put((data, program))
+
+    def drain(self) -> list[RunnerOutputLine]:
+        """Return the lines parsed since the last drain."""
+        lines = []
+        while self._lines:
+            lines.append(self._lines.popleft())
+        return lines
+
+    def pending(self) -> bool:
+        """Return whether there is output left to parse or drain."""
+        return self._queue.unfinished_tasks > 0 or bool(self._lines)
+
+    def wait(self) -> None:
+        """Block until all output fed so far is parsed."""
+        self._queue.join()
+
+    def close(self) -> None:
+        """Stop the worker once all output is parsed, and close the log."""
+        self._closed = True
+        if self._thread is not None:
+            self._queue.put(None)
+            self._thread.join()
+            self._thread = None
+        if self.log is not None:
+            self.log.close()
+            self.log = None
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            try:
+                if item is None:
+                    return
+                self._parse(*item)
+            except Exception as e:
+                logger.error(f"Error parsing runner output: {e}")
+            finally:
+                self._queue.task_done()
+
+    def _parse(self, data: bytes | str, program: str) -> None:
+        if isinstance(data, bytes):
+            text = self._decoder.decode(data)
+            if not text:
+                # Only part of a multi-byte character
+                return
+        else:
+            text = data
+        text = ANSI_ESCAPE.sub("", text)
+        if self.log is None and self.log_folder is not None:
+            self.log = open_runner_log(self.log_folder)
+            # Don't retry if the log could not be created
+            self.log_folder = None
+        if self.log is not None:
+            self.log.write(text if text.endswith("\n") else f"{text}\n")
+            self.log.flush()
+        if text.endswith("\n"):
+            text = text[:-1]
+        for line in text.splitlines() or [""]:
+            self._lines.append(parse_line(line, program))
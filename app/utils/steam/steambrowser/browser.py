@@ -733,11 +733,10 @@ class SteamBrowser(QWidget):
 
     def _is_mod_installed(self, publishedfileid: str) -> bool:
         """Check if a mod is installed by looking through local and workshop folders"""
-        # check all mods in internal metadata
-        for metadata in self.metadata_manager.internal_local_metadata.values():
-            if metadata.get("publishedfileid") == publishedfileid:
-                return True
-        return False
+        return (
+            self.metadata_manager.get_uuid_from_publishedfileid(publishedfileid)
+            is not None
+        )
 
     def _get_installed_mods_list(self) -> list[str]:
         """Get list of installed mod IDs"""
@@ -0,0 +1,185 @@
+import json
+import os
+from pathlib import Path
+from time import monotonic, time
+from typing import Any
+
+from loguru import logger
+
+CHECKPOINT_VERSION = 1
+
+
+class DynamicQueryCheckpoint:
+    """
+    Progress of a Steam database build, saved to disk so an interrupted build can be resumed.
+
+    A build is a QueryFiles cursor walk (for builds without local metadata), followed by a
+    series of IPublishedFileService/GetDetails steps, and optionally ISteamUGC/GetAppDependencies.
+    The checkpoint records:
+        - the cursor walk's position, and the PublishedFileIds found so far
+        - the missing children returned by every completed GetDetails step, so the steps
+          can be replayed without querying them again
+        - when each PublishedFileId of the current GetDetails step was queried, and the
+          missing children found so far in that step
+        - the AppID dependencies of every PublishedFileId queried so far
+        - the database being built
+
+    Progress older than `max_age` seconds is stale, and is queried again on resume.
+
+    :param path: The checkpoint file
+    :param appid: The AppID of the database being built
+    :param mode: The builder mode, a checkpoint is only resumed by a build with the same mode
+    :param max_age: Seconds before progress is stale, 0 to never go stale
+    :param save_interval: The minimum number of seconds between two saves
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        appid: int,
+        mode: str,
+        max_age: int = 0,
+        save_interval: float = 60.0,
+    ) -> None:
+        self.path = Path(path)
+        self.appid = appid
+        self.mode = mode
+        self.max_age = max_age
+        self.save_interval = save_interval
+        self._last_save = monotonic()
+        self.query_files: dict[str, Any] = {}
+        self.details_steps: list[dict[str, Any]] = []
+        self.step_queried: dict[str, float] = {}
+        self.step_missing_children: list[str] = []
+        self.appid_dependencies: dict[str, list[int]] = {}
+        self.database: dict[str, Any] | None = None
+        self.clear()
+
+    @staticmethod
+    def path_for(output_database_path: str) -> Path:
+        """Return the checkpoint file of a database being built."""
+        output_path = Path(output_database_path)
+        return output_path.with_name(f"{output_path.name}.checkpoint")
+
+    def clear(self) -> None:
+        """Forget all progress."""
+        self.query_files = {
+            "complete": False,
+            "completed_at": 0.0,
+            "next_cursor": "*",
+            "pagenum": 1,
+            "pages": 1,
+            "total": 0,
+            "publishedfileids": [],
+        }
+        # {"missing_children": [...], "completed_at": epoch} for every completed step
+        self.details_steps = []
+        self.step_queried = {}
+        self.step_missing_children = []
+        self.appid_dependencies = {}
+        self.database = None
+
+    def is_stale(self, timestamp: float) -> bool:
+        """Return whether progress made at a time (epoch) is stale."""
+        return self.max_age > 0 and time() - timestamp > self.max_age
+
+    def load(self) -> bool:
+        """
+        Load the progress of a previous build with the same AppID and mode, dropping stale progress.
+
+        :return: True if there is progress to resume
+        """
+        self.clear()
+        if not self.path.exists():
+            return False
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                checkpoint = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Unable to read DB builder checkpoint {self.path}: {e}")
+            return False
+        if (
+            checkpoint.get("version") != CHECKPOINT_VERSION
+            or checkpoint.get("appid") != self.appid
+            or checkpoint.get("mode") != self.mode
+        ):
+            logger.info(f"Ignoring DB builder checkpoint of another build: {self.path}")
+            return False
+        self.query_files = checkpoint["query_files"]
+        if self.query_files["complete"] and self.is_stale(
+            self.query_files["completed_at"]
+        ):
+            # Every later step depends on the PublishedFileIds found by the cursor walk
+            logger.info("DB builder checkpoint is stale, starting over")
+            self.clear()
+            return False
+        self.details_steps = checkpoint["details_steps"]
+        self.step_queried = checkpoint["step_queried"]
+        self.step_missing_children = checkpoint["step_missing_children"]
+        for step, details_step in enumerate(self.details_steps):
+            if self.is_stale(details_step["completed_at"]):
+                # Later steps depend on the results of this one
+                del self.details_steps[step:]
+                self.step_queried = {}
+                self.step_missing_children = []
+                break
+        self.step_queried = {
+            publishedfileid: queried_at
+            for publishedfileid, queried_at in self.step_queried.items()
+            if not self.is_stale(queried_at)
+        }
+        self.appid_dependencies = checkpoint["appid_dependencies"]
+        self.database = checkpoint["database"]
+        return True
+
+    def save(self, force: bool = False) -> None:
+        """
+        Save the progress, unless it was saved less than `save_interval` seconds ago.
+
+        The file is replaced atomically, so an interrupted save keeps the previous checkpoint.
+
+        :param force: Save even if the progress was saved recently
+        """
+        if not force and monotonic() - self._last_save < self.save_interval:
+            return
+        checkpoint = {
+            "version": CHECKPOINT_VERSION,
+            "appid": self.appid,
+            "mode": self.mode,
+            "query_files": self.query_files,
+            "details_steps": self.details_steps,
+            "step_queried": self.step_queried,
+            "step_missing_children": self.step_missing_children,
+            "appid_dependencies": self.appid_dependencies,
+            "database": self.database,
+        }
+        temp_path = self.path.with_name(f"{self.path.name}.tmp")
+        try:
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump(checkpoint, f)
+            os.replace(temp_path, self.path)
+        except OSError as e:
+            logger.warning(f"Unable to save DB builder checkpoint {self.path}: {e}")
+            return
+        self._last_save = monotonic()
+        logger.debug(f"Saved DB builder checkpoint {self.path}")
+
+    def remove(self) -> None:
+        """Delete the checkpoint, once the build is complete."""
+        self.path.unlink(missing_ok=True)
+
+    def complete_query_files(self, publishedfileids: list[str]) -> None:
+        """Record the PublishedFileIds to build the database for."""
+        self.query_files["publishedfileids"] = list(publishedfileids)
+        self.query_files["complete"] = True
+        self.query_files["completed_at"] = time()
+        self.save(force=True)
+
+    def complete_details_step(self, missing_children: list[str]) -> None:
+        """Record a completed IPublishedFileService/GetDetails step, and its missing children."""
+        self.details_steps.append(
+            {"missing_children": list(missing_children), "completed_at": time()}
+        )
+        self.step_queried = {}
+        self.step_missing_children = []
+        self.save(force=True)
@@ -0,0 +1,167 @@
+import threading
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from time import monotonic, sleep
+from typing import Any
+
+import requests
+from loguru import logger
+from requests.adapters import HTTPAdapter
+from steam.utils.web import make_requests_session
+from steam.webapi import webapi_request
+
+STEAM_WEBAPI_URL = "https://api.steampowered.com"
+
+
+class WebAPIRequestPool:
+    """
+    Makes Steam WebAPI requests from a pool of worker threads.
+
+    Every worker keeps its own keep-alive session, as requests sessions are not thread safe.
+    Workers and their sessions are reused by every request until the pool is closed.
+    Requests are rate limited across all workers, and retried with exponential backoff if
+    they fail with a connection error, a timeout, HTTP 429 or a server error.
+
+    :param apikey: Steam API key, sent with every request
+    :param max_workers: The maximum number of requests in flight
+    :param requests_per_second: The maximum rate requests are started at, across all workers
+    :param retries: The number of times a failed request is retried
+    :param backoff: Seconds to wait before the first retry, doubled on each following retry
+    :param base_url: The WebAPI host, e.g. a local server replaying recorded responses in tests
+    """
+
+    def __init__(
+        self,
+        apikey: str,
+        max_workers: int = 4,
+        requests_per_second: float = 10.0,
+        retries: int = 3,
+        backoff: float = 1.0,
+        base_url: str = STEAM_WEBAPI_URL,
+    ) -> None:
+        self.apikey = apikey
+        self.max_workers = max(1, max_workers)
+        self.retries = retries
+        self.backoff = backoff
+        self.base_url = base_url.rstrip("/")
+        self._interval = 1 / requests_per_second if requests_per_second > 0 else 0.0
+        self._rate_lock = threading.Lock()
+        self._next_request = 0.0
+        self._local = threading.local()
+        self._sessions: list[requests.Session] = []
+        self._sessions_lock = threading.Lock()
+        self._executor: ThreadPoolExecutor | None = None
+
+    def __enter__(self) -> "WebAPIRequestPool":
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Stop the workers, and close their sessions."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+        with self._sessions_lock:
+            for session in self._sessions:
+                session.close()
+            self._sessions.clear()
+        self._local = threading.local()
+
+    def _session(self) -> requests.Session:
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = make_requests_session()
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=1)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            self._local.session = session
+            with self._sessions_lock:
+                self._sessions.append(session)
+        return session
+
+    def _wait_for_rate_limit(self) -> None:
+        with self._rate_lock:
+            now = monotonic()
+            start = max(now, self._next_request)
+            self._next_request = start + self._interval
+        if start > now:
+            sleep(start - now)
+
+    def request(self, method_path: str, params: dict[str, Any]) -> Any:
+        """
+        Make a WebAPI request, retrying it if it fails with a transient error.
+
+        :param method_path: The interface and method, e.g. "IPublishedFileService.GetDetails"
+        :param params: The method's parameters, without the API key
+        :return: The decoded json response
+        """
+        interface, method = method_path.split(".")
+        url = f"{self.base_url}/{interface}/{method}/v1/"
+        attempt = 0
+        while True:
+            self._wait_for_rate_limit()
+            delay = self.backoff * 2**attempt
+            try:
+                # The key is sent last, so it can be cut from error messages containing the url
+                return webapi_request(
+                    url=url,
+                    method="GET",
+                    session=self._session(),
+                    params={**params, "key": self.apikey},
+                )
+            except requests.HTTPError as e:
+                status = e.response.status_code if e.response is not None else None
+                if status != 429 and (status is None or status < 500):
+                    raise
+                if attempt >= self.retries:
+                    raise
+                retry_after = (
+                    e.response.headers.get("Retry-After")
+                    if e.response is not None
+                    else None
+                )
+                if retry_after and retry_after.isdigit():
+                    delay = max(delay, float(retry_after))
+                logger.warning(
+                    f"{method_path} returned HTTP {status}, retrying in {delay:.1f}s"
+                )
+            except (requests.ConnectionError, requests.Timeout) as e:
+                if attempt >= self.retries:
+                    raise
+                logger.warning(
+                    f"{method_path} failed with {e.__class__.__name__}, retrying in {delay:.1f}s"
+                )
+            attempt += 1
+            sleep(delay)
+
+    def map(
+        self, method_path: str, params_list: Iterable[dict[str, Any]]
+    ) -> Iterator[Any]:
+        """
+        Make several requests concurrently, yielding their responses in the order of the params.
+
+        A request failing after every retry yields its exception instead of a response, so the
+        other responses can still be used.
+
+        :param method_path: The interface and method, e.g. "IPublishedFileService.GetDetails"
+        :param params_list: The parameters of each request
+        :return: An iterator of decoded json responses or exceptions
+        """
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="WebAPIRequestPool"
+            )
+        futures: list[Future[Any]] = [
+            self._executor.submit(self.request, method_path, params)
+            for params in params_list
+        ]
+        try:
+            for future in futures:
+                exception = future.exception()
+                yield exception if exception is not None else future.result()
+        finally:
+            # Don't keep requesting if the caller stops early
+            for future in futures:
+                future.cancel()
@@ -3,7 +3,7 @@ import traceback
 from logging import WARNING, getLogger
 from math import ceil
 from multiprocessing import Pool, cpu_count
-from time import time
+from time import localtime, strftime, time
 from typing import TYPE_CHECKING, Any, Dict
 
 import requests
@@ -15,6 +15,8 @@ from app.utils.app_info import AppInfo
 from app.utils.constants import RIMWORLD_DLC_METADATA
 from app.utils.generic import chunks
 from app.utils.steam.steamworks.wrapper import SteamworksAppDependenciesQuery
+from app.utils.steam.webapi.checkpoint import DynamicQueryCheckpoint
+from app.utils.steam.webapi.request_pool import STEAM_WEBAPI_URL, WebAPIRequestPool
 from app.views.dialogue import show_dialogue_input, show_warning
 
 # Prevent circular dependencies for type checking
@@ -32,6 +34,10 @@ BASE_URL = "https://steamcommunity.com"
 BASE_URL_STEAMFILES = "https://steamcommunity.com/sharedfiles/filedetails/?id="
 BASE_URL_WORKSHOP = "https://steamcommunity.com/workshop/filedetails/?id="
 
+# Maximum PublishedFileIds per ISteamUGC/GetAppDependencies process task when checkpointing,
+# so progress is saved every few minutes
+APPID_DEPS_CHECKPOINT_CHUNK = 500
+
 
 class CollectionImport:
     """
@@ -158,6 +164,9 @@ class DynamicQuery(QObject):
     :param life: The lifespan of the Query in terms of the seconds added to the time of
     database generation. This adds an 'expiry' to the data being cached.
     :param get_appid_deps: This toggle determines whether or not to query DLC dependency data
+    :param max_workers: The maximum number of concurrent WebAPI requests
+    :param base_url: The WebAPI host to query
+    :param checkpoint: Progress of a previous query to resume, and to save progress to
     """
 
     dq_messaging_signal = Signal(str)
@@ -168,6 +177,9 @@ class DynamicQuery(QObject):
         appid: int,
         get_appid_deps: bool = False,
         life: int = 0,
+        max_workers: int = 4,
+        base_url: str = STEAM_WEBAPI_URL,
+        checkpoint: DynamicQueryCheckpoint | None = None,
     ) -> None:
         QObject.__init__(self)
 
@@ -175,6 +187,8 @@ class DynamicQuery(QObject):
         self.api = None
         self.apikey = apikey
         self.appid = appid
+        # When the query started, recorded in the database as when it was built
+        self.started = int(time())
         self.expiry = self.__expires(life)
         self.get_appid_deps = get_appid_deps
         self.next_cursor = "*"
@@ -183,6 +197,12 @@ class DynamicQuery(QObject):
         self.publishedfileids: list[str] = []
         self.total = 0
         self.database: dict[str, Any] = {}
+        self.request_pool = WebAPIRequestPool(
+            apikey, max_workers=max_workers, base_url=base_url
+        )
+        self.checkpoint = checkpoint
+        # Number of IPublishedFileService/GetDetails steps started, see DynamicQueryCheckpoint
+        self.details_step = 0
 
     def __expires(self, life: int) -> int:
         """Returns current epoch + life
@@ -237,22 +257,34 @@ class DynamicQuery(QObject):
         """
 
         self.__initialize_webapi()
+        if not self.api:
+            logger.warning(
+                f"Dynamic Query failed to initialize WebAPI query! Critical failure. Aborting steam_db creation. publishedfileids: {publishedfileids}"
+            )
+            return
 
+        try:
+            self.__create_steam_db(database, publishedfileids)
+        finally:
+            self.request_pool.close()
+
+    def __create_steam_db(
+        self, database: Dict[str, Any], publishedfileids: list[str]
+    ) -> None:
         query = database
         query["version"] = self.expiry
+        # Delta updates look for mods updated since then. A resumed build keeps the time
+        # its first run started, since that is when its first mods were queried.
+        query.setdefault("built", self.started)
         query["database"] = database["database"]
+        if self.checkpoint is not None:
+            self.checkpoint.database = query
         querying = True
         while querying:  # Begin initial query
-            result = self.IPublishedFileService_GetDetails(query, publishedfileids)
-
-            if result is None:
-                logger.warning(
-                    f"Dynamic Query failed to initialize WebAPI query! Critical failure. Aborting steam_db creation. query: {query} publishedfileids: {publishedfileids}"
-                )
-                return
-
             # Returns WHAT we can get remotely, FROM what we have locally
-            query, missing_children = result
+            query, missing_children = self.IPublishedFileService_GetDetails(
+                query, publishedfileids
+            )
 
             if (
                 missing_children and len(missing_children) > 0
@@ -274,15 +306,9 @@ class DynamicQuery(QObject):
                 #
                 # It is the only way to paint the full picture without already
                 # possessing the mod's metadata for the initial query.
-                result = self.IPublishedFileService_GetDetails(query, missing_children)
-
-                if result is None:
-                    logger.warning(
-                        f"Dynamic Query failed to initialize WebAPI query! Critical failure. Aborting steam_db creation. Query: {query} Missing Children: {missing_children}"
-                    )
-                    return
-
-                query, missing_children = result
+                query, missing_children = self.IPublishedFileService_GetDetails(
+                    query, missing_children
+                )
                 self.dq_messaging_signal.emit(
                     "\nLaunching addiitonal full query to complete dependency information for the missing children"
                 )
@@ -319,25 +345,73 @@ class DynamicQuery(QObject):
         self.__initialize_webapi()
 
         if self.api:
-            query = True
-            while query:
-                if self.pagenum > self.pages:
-                    query = False
-                    break
-                self.next_cursor = self.IPublishedFileService_QueryFiles(
-                    self.next_cursor
-                )
+            checkpoint = self.checkpoint
+            if checkpoint is not None:
+                progress = checkpoint.query_files
+                self.publishedfileids = list(progress["publishedfileids"])
+                if progress["complete"]:
+                    self.dq_messaging_signal.emit(
+                        f"Resuming: found {len(self.publishedfileids)} PublishedFileIds in a previous run"
+                    )
+                    return
+                self.next_cursor = progress["next_cursor"]
+                self.pagenum = progress["pagenum"]
+                self.pages = progress["pages"]
+                self.total = progress["total"]
+            # Each page's cursor comes from the previous page, so pages are queried one at a
+            # time, over the request pool's keep-alive session
+            try:
+                query = True
+                while query:
+                    if self.pagenum > self.pages:
+                        query = False
+                        break
+                    self.next_cursor = self.IPublishedFileService_QueryFiles(
+                        self.next_cursor
+                    )
+                    if checkpoint is not None:
+                        checkpoint.query_files.update(
+                            publishedfileids=self.publishedfileids,
+                            next_cursor=self.next_cursor,
+                            pagenum=self.pagenum,
+                            pages=self.pages,
+                            total=self.total,
+                        )
+                        checkpoint.save(force=True)
+            finally:
+                self.request_pool.close()
+            if checkpoint is not None:
+                checkpoint.complete_query_files(self.publishedfileids)
         else:
             self.dq_messaging_signal.emit("AppIDQuery: WebAPI failed to initialize!")
 
+    def pfids_updated_since(self, timestamp: int) -> list[str] | None:
+        """
+        Collect the PublishedFileIds of every workshop mod for the AppID updated since a time.
+
+        :param timestamp: The epoch to find updates since
+        :return: The updated PublishedFileIds, or None if the WebAPI failed to initialize
+        """
+        self.__initialize_webapi()
+        if not self.api:
+            self.dq_messaging_signal.emit("AppIDQuery: WebAPI failed to initialize!")
+            return None
+        try:
+            return self.IPublishedFileService_QueryUpdatedFiles(timestamp)
+        finally:
+            self.request_pool.close()
+
     def IPublishedFileService_GetDetails(
         self, json_to_update: dict[Any, Any], publishedfileids: list[str]
-    ) -> tuple[dict[Any, Any], list[str]] | None:
+    ) -> tuple[dict[Any, Any], list[str]]:
         """
 
         Given a list of PublishedFileIds, return a dict of json data queried
         from Steam WebAPI, containing data to be parsed during db update.
 
+        Chunks of PublishedFileIds are queried concurrently through the request pool,
+        and merged in order, so the result is the same as querying them one at a time.
+
         https://steamapi.xpaw.me/#IPublishedFileService/GetDetails
         https://steamwebapi.azurewebsites.net (Ctrl + F search: "IPublishedFileService/GetDetails")
 
@@ -346,48 +420,73 @@ class DynamicQuery(QObject):
         :param publishedfileids: a list of PublishedFileIds to query Steam Workshop mod metadata for
         :return: Tuple containing the updated json data from PublishedFileIds query, as well as
         a list of any missing children's PublishedFileIds to consider for additional queries
-            OR None, None -  which indicates a critical failure in an ongoing Dynamic Query
         """
         chunks_processed = 0
         total = len(publishedfileids)
         self.dq_messaging_signal.emit(
             f"\nSteam WebAPI: IPublishedFileService/GetDetails initializing for {total} mods\n\n"
         )
+        missing_children: list[str] = []
+        result = json_to_update
+        checkpoint = self.checkpoint
+        step = self.details_step
+        self.details_step += 1
+        if checkpoint is not None:
+            if step < len(checkpoint.details_steps):
+                self.dq_messaging_signal.emit(
+                    f"Resuming: IPublishedFileService/GetDetails completed for {total} mods in a previous run"
+                )
+                return result, list(checkpoint.details_steps[step]["missing_children"])
+            # Only query the PublishedFileIds that are missing or stale
+            queried = checkpoint.step_queried
+            chunks_processed = sum(1 for pfid in publishedfileids if pfid in queried)
+            if chunks_processed:
+                self.dq_messaging_signal.emit(
+                    f"Resuming: {chunks_processed} mods were queried in a previous run"
+                )
+                publishedfileids = [
+                    pfid for pfid in publishedfileids if pfid not in queried
+                ]
+            missing_children = checkpoint.step_missing_children
         self.dq_messaging_signal.emit(
-            f"IPublishedFileService/GetDetails chunk [0/{total}]"
+            f"IPublishedFileService/GetDetails chunk [{chunks_processed}/{total}]"
         )
-        if not self.api:  # If we don't have API initialized
-            return None  # Exit query
-        missing_children = []
-        result = json_to_update
         # Uncomment to see the all pfids to be queried
         # logger.debug(f"PublishedFileIds being queried: {publishedfileids}")
-        for chunk in chunks(
-            _list=publishedfileids, limit=213
-        ):  # Chunk limit appears to be 213 PublishedFileIds at a time - this appears to be a WebAPI limitation
+        publishedfileid_chunks = list(
+            chunks(_list=publishedfileids, limit=213)
+        )  # Chunk limit appears to be 213 PublishedFileIds at a time - this appears to be a WebAPI limitation
+        responses = self.request_pool.map(
+            "IPublishedFileService.GetDetails",
+            (
+                {
+                    "publishedfileids": chunk,
+                    "includetags": False,
+                    "includeadditionalpreviews": False,
+                    "includechildren": True,
+                    "includekvtags": True,
+                    "includevotes": False,
+                    "short_description": False,
+                    "includeforsaledata": False,
+                    "includemetadata": True,
+                    "return_playtime_stats": 0,
+                    "appid": self.appid,
+                    "strip_description_bbcode": False,
+                    "includereactions": False,
+                    "admin_query": False,
+                }
+                for chunk in publishedfileid_chunks
+            ),
+        )
+        for chunk, response in zip(publishedfileid_chunks, responses):
             chunk_total = len(chunk)
             chunks_processed += chunk_total
             # Uncomment to see the pfids from each chunk
             # logger.debug(f"{chunk_total} PublishedFileIds in chunk: {chunk}")
             try:
-                response = self.api.call(
-                    method_path="IPublishedFileService.GetDetails",
-                    key=self.apikey,
-                    publishedfileids=chunk,
-                    includetags=False,
-                    includeadditionalpreviews=False,
-                    includechildren=True,
-                    includekvtags=True,
-                    includevotes=False,
-                    short_description=False,
-                    includeforsaledata=False,
-                    includemetadata=True,
-                    return_playtime_stats=0,
-                    appid=self.appid,
-                    strip_description_bbcode=False,
-                    includereactions=False,
-                    admin_query=False,
-                )
+                if isinstance(response, Exception):
+                    # The request failed after every retry
+                    raise response
                 for metadata in response["response"]["publishedfiledetails"]:
                     publishedfileid = metadata[
                         "publishedfileid"
@@ -476,6 +575,11 @@ class DynamicQuery(QObject):
                                             f"Could not find pfid {child_pfid} in database. Adding child to missing_children"
                                         )
                                         missing_children.append(child_pfid)
+                if checkpoint is not None:
+                    queried_at = time()
+                    for publishedfileid in chunk:
+                        checkpoint.step_queried[publishedfileid] = queried_at
+                    checkpoint.save()
             except Exception as e:
                 stacktrace = traceback.format_exc()
                 if (
@@ -502,6 +606,8 @@ class DynamicQuery(QObject):
                 "unpublished"
             ):  # If there is somehow an unpublished mod in missing_children, remove it
                 missing_children.remove(missing_child)
+        if checkpoint is not None:
+            checkpoint.complete_details_step(missing_children)
         return result, missing_children
 
     def IPublishedFileService_QueryFiles(self, cursor: str) -> str:
@@ -528,43 +634,44 @@ class DynamicQuery(QObject):
                 "Tried to query files while API was not properly initialized."
             )  # Exit query
 
-        result = self.api.call(
-            method_path="IPublishedFileService.QueryFiles",
-            key=self.apikey,
-            query_type=1,
-            page=1,
-            cursor=cursor,
-            numperpage=50000,
-            creator_appid=self.appid,
-            appid=self.appid,
-            requiredtags=None,
-            excludedtags=None,
-            match_all_tags=False,
-            required_flags=None,
-            omitted_flags=None,
-            search_text="",
-            filetype=0,
-            child_publishedfileid=None,
-            days=None,
-            include_recent_votes_only=False,
-            required_kv_tags=None,
-            taggroups=None,
-            date_range_created=None,
-            date_range_updated=None,
-            excluded_content_descriptors=None,
-            totalonly=False,
-            ids_only=True,
-            return_vote_data=False,
-            return_tags=False,
-            return_kv_tags=False,
-            return_previews=False,
-            return_children=True,
-            return_short_description=False,
-            return_for_sale_data=False,
-            return_playtime_stats=False,
-            return_details=False,
-            strip_description_bbcode=False,
-            admin_query=False,
+        result = self.request_pool.request(
+            "IPublishedFileService.QueryFiles",
+            dict(
+                query_type=1,
+                page=1,
+                cursor=cursor,
+                numperpage=50000,
+                creator_appid=self.appid,
+                appid=self.appid,
+                requiredtags=None,
+                excludedtags=None,
+                match_all_tags=False,
+                required_flags=None,
+                omitted_flags=None,
+                search_text="",
+                filetype=0,
+                child_publishedfileid=None,
+                days=None,
+                include_recent_votes_only=False,
+                required_kv_tags=None,
+                taggroups=None,
+                date_range_created=None,
+                date_range_updated=None,
+                excluded_content_descriptors=None,
+                totalonly=False,
+                ids_only=True,
+                return_vote_data=False,
+                return_tags=False,
+                return_kv_tags=False,
+                return_previews=False,
+                return_children=True,
+                return_short_description=False,
+                return_for_sale_data=False,
+                return_playtime_stats=False,
+                return_details=False,
+                strip_description_bbcode=False,
+                admin_query=False,
+            ),
         )
         # Print total mods found we need to iter through paginations to get info for
         if (
@@ -592,6 +699,69 @@ class DynamicQuery(QObject):
         self.pagenum += 1
         return result["response"]["next_cursor"]
 
+    def IPublishedFileService_QueryUpdatedFiles(self, timestamp: int) -> list[str]:
+        """
+        Return the PublishedFileIds of the workshop mods updated since a time.
+
+        Mods are queried ranked by last updated date, so only the pages of mods updated
+        since the time are queried, and only their update times are used. For a routine
+        refresh this is a few pages, instead of the whole workshop catalogue.
+
+        https://steamapi.xpaw.me/#IPublishedFileService/QueryFiles
+
+        :param timestamp: The epoch to find updates since
+        :return: The PublishedFileIds of the mods updated at or after the time, newest first
+        """
+        self.dq_messaging_signal.emit(
+            f"\nSteam WebAPI: IPublishedFileService/QueryFiles looking for mods updated since {strftime('%Y-%m-%d %H:%M:%S', localtime(timestamp))}\n"
+        )
+        updated: list[str] = []
+        cursor = "*"
+        while True:
+            result = self.request_pool.request(
+                "IPublishedFileService.QueryFiles",
+                dict(
+                    query_type=21,  # k_PublishedFileQueryType_RankedByLastUpdatedDate
+                    cursor=cursor,
+                    numperpage=100,
+                    creator_appid=self.appid,
+                    appid=self.appid,
+                    ids_only=False,
+                    return_vote_data=False,
+                    return_tags=False,
+                    return_kv_tags=False,
+                    return_previews=False,
+                    return_children=False,
+                    return_short_description=True,
+                    return_for_sale_data=False,
+                    return_playtime_stats=False,
+                    strip_description_bbcode=True,
+                ),
+            )
+            publishedfiledetails = result["response"].get("publishedfiledetails") or []
+            for metadata in publishedfiledetails:
+                if "time_updated" not in metadata:
+                    # e.g. unpublished or removed items, which say nothing about the
+                    # update times of the mods ranked after them
+                    continue
+                if int(metadata["time_updated"]) < timestamp:
+                    # Every following mod was updated earlier
+                    self.dq_messaging_signal.emit(
+                        f"Found {len(updated)} mods updated since the last build"
+                    )
+                    return updated
+                updated.append(metadata["publishedfileid"])
+            next_cursor = result["response"].get("next_cursor")
+            if not publishedfiledetails or not next_cursor or next_cursor == cursor:
+                self.dq_messaging_signal.emit(
+                    f"Found {len(updated)} mods updated since the last build"
+                )
+                return updated
+            cursor = next_cursor
+            self.dq_messaging_signal.emit(
+                f"IPublishedFileService/QueryFiles found {len(updated)} updated mods so far"
+            )
+
     def ISteamUGC_GetAppDependencies(
         self, publishedfileids: list[str], query: Dict[str, Any]
     ) -> None:
@@ -609,32 +779,57 @@ class DynamicQuery(QObject):
         self.dq_messaging_signal.emit(
             f"\nSteamworks API: ISteamUGC/GetAppDependencies initializing for {len(publishedfileids)} mods\n\nThis may take a while. Please wait..."
         )
-        # Maximum processes
-        num_processes = cpu_count()
-        # Create a pool of worker processes
-        with Pool(processes=num_processes) as pool:
-            # Create instances of SteamworksAppDependenciesQuery for each chunk
-            queries = [
-                SteamworksAppDependenciesQuery(
-                    pfid_or_pfids=[eval(str_pfid) for str_pfid in chunk],
-                    interval=1,
-                    _libs=str((AppInfo().application_folder / "libs")),
+        pfids_appid_deps: dict[int, list[int]] = {}
+        checkpoint = self.checkpoint
+        if checkpoint is not None:
+            # Only query the PublishedFileIds not queried in a previous run
+            pfids_appid_deps.update(
+                (int(pfid), appids)
+                for pfid, appids in checkpoint.appid_dependencies.items()
+            )
+            pending = [
+                pfid
+                for pfid in publishedfileids
+                if pfid not in checkpoint.appid_dependencies
+            ]
+            if len(pending) < len(publishedfileids):
+                self.dq_messaging_signal.emit(
+                    f"Resuming: {len(publishedfileids) - len(pending)} mods were queried in a previous run"
                 )
-                for chunk in list(
-                    chunks(
-                        _list=publishedfileids,
-                        limit=ceil(len(publishedfileids) / num_processes),
+            publishedfileids = pending
+        if publishedfileids:
+            # Maximum processes
+            num_processes = cpu_count()
+            chunk_limit = ceil(len(publishedfileids) / num_processes)
+            if checkpoint is not None:
+                chunk_limit = min(chunk_limit, APPID_DEPS_CHECKPOINT_CHUNK)
+            pfid_chunks = list(chunks(_list=publishedfileids, limit=chunk_limit))
+            # Create a pool of worker processes
+            with Pool(processes=num_processes) as pool:
+                # Create instances of SteamworksAppDependenciesQuery for each chunk
+                queries = [
+                    SteamworksAppDependenciesQuery(
+                        pfid_or_pfids=[eval(str_pfid) for str_pfid in chunk],
+                        interval=1,
+                        _libs=str((AppInfo().application_folder / "libs")),
                     )
-                )
-            ]
-            # Map the execution of the queries to the pool of processes
-            results = pool.map(SteamworksAppDependenciesQuery.run, queries)
-        # Merge the results from all processes into a single dictionary
+                    for chunk in pfid_chunks
+                ]
+                # Map the execution of the queries to the pool of processes, merging the
+                # results from all processes into a single dictionary as they complete
+                for chunk, result in zip(
+                    pfid_chunks, pool.imap(SteamworksAppDependenciesQuery.run, queries)
+                ):
+                    if result is None:
+                        continue
+                    pfids_appid_deps.update(result)
+                    if checkpoint is not None:
+                        for pfid in chunk:
+                            checkpoint.appid_dependencies[pfid] = result.get(
+                                int(pfid), []
+                            )
+                        checkpoint.save()
         self.dq_messaging_signal.emit("Processes completed!\nCollecting results")
-        pfids_appid_deps: dict[int, list[int]] = {}
-        for result in results:
-            if result is not None:
-                pfids_appid_deps.update(result)
         self.dq_messaging_signal.emit(f"\nTotal: {len(pfids_appid_deps.keys())}")
         # Uncomment to see the total metadata returned from all Processes
         # logger.debug(pfids_appid_deps)
@@ -0,0 +1,339 @@
+import hashlib
+import os
+import sqlite3
+from collections.abc import ItemsView, Iterator, Mapping, MutableMapping, ValuesView
+from pathlib import Path
+from threading import Lock
+from typing import Any
+
+import msgspec
+from loguru import logger
+
+from app.models.metadata.metadata_structure import SteamDbFile
+
+# Bump this whenever the layout of the index changes, so stale indexes are rebuilt
+STEAM_DB_INDEX_VERSION = 2
+
+_SCHEMA = """
+CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE entries (
+    pfid TEXT PRIMARY KEY,
+    packageid TEXT,
+    name TEXT,
+    data BLOB NOT NULL
+) WITHOUT ROWID;
+CREATE INDEX entries_packageid ON entries (packageid);
+"""
+
+
+def steam_db_index_path(source_path: str, index_folder: Path | str) -> Path:
+    """
+    Return the path of the index for the current contents of a Steam DB file.
+
+    The file name is derived from the source path and its (mtime_ns, size), so any
+    change to the source (e.g. a new "version" after an update, or a blacklist edit)
+    maps to a new index, and an index never has to be validated against its source.
+
+    :param source_path: Path to the steamDB.json
+    :param index_folder: Folder that holds Steam DB indexes
+    :return: Path to the index for this source
+    """
+    stat = os.stat(source_path)
+    key = f"{os.path.abspath(source_path)}:{stat.st_mtime_ns}:{stat.st_size}:{STEAM_DB_INDEX_VERSION}"
+    digest = hashlib.sha1(key.encode("utf-8")).hexdigest()[:16]
+    return Path(index_folder) / f"steamDB.{digest}.sqlite"
+
+
+def steam_db_packageid(entry: Mapping[str, Any]) -> str | None:
+    """
+    Return the lowercase packageid of a Steam DB entry.
+
+    Entries store it as "packageId" (see SteamDbEntry), older databases as "packageid".
+
+    :param entry: An entry of a Steam DB's ["database"]
+    :return: The packageid, or None if the entry has none
+    """
+    packageid = entry.get("packageId") or entry.get("packageid")
+    return packageid.lower() if isinstance(packageid, str) and packageid else None
+
+
+class _IndexLookup(Mapping[str, str]):
+    """Read-only mapping answered by a single-column query against the index."""
+
+    def __init__(
+        self, db: "IndexedSteamDatabase", column: str, key_column: str
+    ) -> None:
+        self._db = db
+        self._column = column
+        self._key_column = key_column
+        self._len: int | None = None
+
+    def __getitem__(self, key: str) -> str:
+        row = self._db._query_one(
+            f"SELECT {self._column} FROM entries WHERE {self._key_column} = ? "
+            f"AND {self._column} IS NOT NULL LIMIT 1",
+            (self._normalize(key),),
+        )
+        if row is None:
+            raise KeyError(key)
+        return row[0]
+
+    def __iter__(self) -> Iterator[str]:
+        rows = self._db._iter_query(
+            f"SELECT DISTINCT {self._key_column} FROM entries "
+            f"WHERE {self._key_column} IS NOT NULL AND {self._column} IS NOT NULL"
+        )
+        return (row[0] for row in rows)
+
+    def __len__(self) -> int:
+        if self._len is None:
+            row = self._db._query_one(
+                f"SELECT COUNT(DISTINCT {self._key_column}) FROM entries "
+                f"WHERE {self._key_column} IS NOT NULL AND {self._column} IS NOT NULL"
+            )
+            self._len = row[0] if row else 0
+        return self._len
+
+    def _normalize(self, key: str) -> str:
+        # Packageids are stored lowercase, publishedfileids as-is
+        return key.lower() if self._key_column == "packageid" else key
+
+
+class _EntriesItemsView(ItemsView[str, dict[str, Any]]):
+    _mapping: "IndexedSteamDatabase"
+
+    def __iter__(self) -> Iterator[tuple[str, dict[str, Any]]]:
+        return self._mapping._iter_items()
+
+
+class _EntriesValuesView(ValuesView[dict[str, Any]]):
+    _mapping: "IndexedSteamDatabase"
+
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        return (entry for _, entry in self._mapping._iter_items())
+
+
+class IndexedSteamDatabase(MutableMapping[str, dict[str, Any]]):
+    """
+    Dict-like view of a Steam DB's ["database"], backed by an on-disk SQLite index.
+
+    Only the publishedfileid/packageid/name columns are indexed; entries are stored
+    as encoded JSON and only decoded when looked up, so opening a large Steam DB does
+    not require parsing or holding every entry in memory.
+
+    Entries that were looked up or assigned are kept in memory, so mutating a returned
+    entry behaves like mutating a plain dict. Entries yielded by items() / values() that
+    were not looked up are decoded for the iteration only, so they are read-only; mutate
+    entries through db[pfid]. Changes are never written to the index; callers persist
+    them by writing the Steam DB file, which invalidates the index. The packageid and
+    name lookups only reflect the index.
+
+    Lookups may come from parser threads, so access to the connection is locked.
+    """
+
+    def __init__(self, index_path: Path | str) -> None:
+        self.path = Path(index_path).resolve()
+        self._connection = sqlite3.connect(
+            f"{self.path.as_uri()}?mode=ro", uri=True, check_same_thread=False
+        )
+        self._lock = Lock()
+        self._decoder = msgspec.json.Decoder(dict[str, Any])
+        # Entries that were looked up or assigned
+        self._entries: dict[str, dict[str, Any]] = {}
+        # Assigned keys that are not in the index / index keys that were deleted
+        self._added: set[str] = set()
+        self._deleted: set[str] = set()
+
+        meta = dict(self._query_all("SELECT key, value FROM meta"))
+        if int(meta.get("index_version", -1)) != STEAM_DB_INDEX_VERSION:
+            raise ValueError(f"Unsupported Steam DB index version: {meta}")
+        self.version: int = int(meta["version"])
+        self._indexed_len: int = int(meta["entries"])
+
+        self.packageid_by_pfid: Mapping[str, str] = _IndexLookup(
+            self, "packageid", "pfid"
+        )
+        self.name_by_packageid: Mapping[str, str] = _IndexLookup(
+            self, "name", "packageid"
+        )
+        self.pfid_by_packageid: Mapping[str, str] = _IndexLookup(
+            self, "pfid", "packageid"
+        )
+
+    @classmethod
+    def open_or_build(
+        cls, source_path: str, index_folder: Path | str
+    ) -> "IndexedSteamDatabase":
+        """
+        Open the index for a Steam DB file, building it first if it does not exist yet.
+
+        :param source_path: Path to the steamDB.json
+        :param index_folder: Folder that holds Steam DB indexes
+        :return: The opened index
+        """
+        index_path = steam_db_index_path(source_path, index_folder)
+        if index_path.exists():
+            try:
+                return cls(index_path)
+            except (sqlite3.Error, ValueError, KeyError) as e:
+                logger.warning(
+                    f"Discarding unreadable Steam DB index {index_path}: {e}"
+                )
+        cls.build(source_path, index_path)
+        return cls(index_path)
+
+    @staticmethod
+    def build(source_path: str, index_path: Path | str) -> None:
+        """
+        Compile a Steam DB file into an index, replacing stale indexes for other sources.
+
+        :param source_path: Path to the steamDB.json
+        :param index_path: Path to write the index to
+        """
+        index_path = Path(index_path)
+        logger.info(f"Building Steam DB index for {source_path} at {index_path}")
+        with open(source_path, "rb") as f:
+            db_data = msgspec.json.decode(f.read(), type=SteamDbFile, strict=False)
+        database = db_data.database
+        encoder = msgspec.json.Encoder()
+
+        def rows() -> Iterator[tuple[str, str | None, str | None, bytes]]:
+            for pfid, entry in database.items():
+                yield (
+                    pfid,
+                    steam_db_packageid(entry),
+                    entry.get("name") or None,
+                    encoder.encode(entry),
+                )
+
+        index_path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = index_path.with_name(index_path.name + ".tmp")
+        temp_path.unlink(missing_ok=True)
+        connection = sqlite3.connect(temp_path)
+        try:
+            with connection:
+                connection.executescript(_SCHEMA)
+                connection.executemany(
+                    "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?)", rows()
+                )
+                connection.executemany(
+                    "INSERT INTO meta VALUES (?, ?)",
+                    [
+                        ("index_version", str(STEAM_DB_INDEX_VERSION)),
+                        ("version", str(db_data.version)),
+                        ("entries", str(len(database))),
+                        ("source", os.path.abspath(source_path)),
+                    ],
+                )
+        finally:
+            connection.close()
+        os.replace(temp_path, index_path)
+        logger.info(f"Indexed {len(database)} Steam DB entries")
+
+        # Indexes of older versions of this (or another) Steam DB are no longer needed.
+        # They may still be open elsewhere (e.g. on Windows), in which case they are
+        # removed on a later build.
+        for stale in index_path.parent.glob("steamDB.*.sqlite"):
+            if stale != index_path:
+                try:
+                    stale.unlink()
+                except OSError:
+                    pass
+
+    def _query_one(self, sql: str, parameters: tuple[Any, ...] = ()) -> Any:
+        with self._lock:
+            return self._connection.execute(sql, parameters).fetchone()
+
+    def _query_all(self, sql: str, parameters: tuple[Any, ...] = ()) -> list[Any]:
+        with self._lock:
+            return self._connection.execute(sql, parameters).fetchall()
+
+    def _iter_query(self, sql: str, batch_size: int = 1000) -> Iterator[Any]:
+        """Stream the rows of a query in batches, so large results are never held in memory."""
+        with self._lock:
+            cursor = self._connection.execute(sql)
+        while True:
+            with self._lock:
+                rows = cursor.fetchmany(batch_size)
+            if not rows:
+                return
+            yield from rows
+
+    def _in_index(self, key: str) -> bool:
+        return (
+            self._query_one("SELECT 1 FROM entries WHERE pfid = ?", (key,)) is not None
+        )
+
+    def __getitem__(self, key: str) -> dict[str, Any]:
+        entry = self._entries.get(key)
+        if entry is not None:
+            return entry
+        if key in self._deleted or not isinstance(key, str):
+            raise KeyError(key)
+        row = self._query_one("SELECT data FROM entries WHERE pfid = ?", (key,))
+        if row is None:
+            raise KeyError(key)
+        entry = self._decoder.decode(row[0])
+        with self._lock:
+            return self._entries.setdefault(key, entry)
+
+    def __contains__(self, key: object) -> bool:
+        if key in self._entries:
+            return True
+        if not isinstance(key, str) or key in self._deleted:
+            return False
+        return self._in_index(key)
+
+    def __setitem__(self, key: str, value: dict[str, Any]) -> None:
+        if key not in self:
+            if key in self._deleted:
+                self._deleted.discard(key)
+            else:
+                self._added.add(key)
+        with self._lock:
+            self._entries[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        if key not in self:
+            raise KeyError(key)
+        with self._lock:
+            self._entries.pop(key, None)
+        if key in self._added:
+            self._added.discard(key)
+        else:
+            self._deleted.add(key)
+
+    def __iter__(self) -> Iterator[str]:
+        for (pfid,) in self._iter_query("SELECT pfid FROM entries ORDER BY pfid"):
+            if pfid not in self._deleted:
+                yield pfid
+        yield from list(self._added)
+
+    def __len__(self) -> int:
+        return self._indexed_len - len(self._deleted) + len(self._added)
+
+    def items(self) -> ItemsView[str, dict[str, Any]]:
+        return _EntriesItemsView(self)
+
+    def values(self) -> ValuesView[dict[str, Any]]:
+        return _EntriesValuesView(self)
+
+    def _iter_items(self) -> Iterator[tuple[str, dict[str, Any]]]:
+        """
+        Iterate over all entries without keeping the ones that weren't looked up in memory.
+
+        Those entries are decoded for the iteration only, changes to them are lost.
+        """
+        for pfid, data in self._iter_query(
+            "SELECT pfid, data FROM entries ORDER BY pfid"
+        ):
+            if pfid in self._deleted:
+                continue
+            entry = self._entries.get(pfid)
+            yield pfid, entry if entry is not None else self._decoder.decode(data)
+        for pfid in list(self._added):
+            yield pfid, self._entries[pfid]
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
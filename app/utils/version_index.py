@@ -0,0 +1,97 @@
+from collections.abc import Iterable
+from typing import Any
+
+from loguru import logger
+
+
+class VersionMismatchIndex:
+    """
+    Precomputed version mismatch status of every mod, for the current game version.
+
+    Evaluated once per mod when metadata is compiled, so checking a mod is a dict lookup.
+    The index is rebuilt when the game version or the "No Version Warning" list changes,
+    and only the changed mods are re-evaluated on incremental compiles.
+    """
+
+    def __init__(self) -> None:
+        self.game_version: str = ""
+        self.no_version_warning: frozenset[str] = frozenset()
+        # uuid -> whether the mod's supported versions do not match the game version
+        self._mismatches: dict[str, bool] = {}
+
+    def rebuild(
+        self,
+        all_mods: dict[str, Any],
+        game_version: str,
+        no_version_warning: Iterable[str] | None,
+    ) -> None:
+        """
+        Evaluate every mod against a game version.
+
+        :param all_mods: all mod metadata, keyed by uuid
+        :param game_version: the game version, as read from Version.txt
+        :param no_version_warning: packageids that never have a version mismatch
+        """
+        self.game_version = game_version
+        self.no_version_warning = frozenset(no_version_warning or ())
+        self._mismatches.clear()
+        self.update(all_mods.keys(), all_mods)
+
+    def update(self, uuids: Iterable[str], all_mods: dict[str, Any]) -> None:
+        """
+        Re-evaluate mods whose metadata changed. Mods no longer in `all_mods` are dropped.
+
+        :param uuids: uuids of the mods that changed
+        :param all_mods: all mod metadata, keyed by uuid
+        """
+        for uuid in uuids:
+            mod_data = all_mods.get(uuid)
+            if mod_data is None:
+                self._mismatches.pop(uuid, None)
+            else:
+                self._mismatches[uuid] = self._evaluate(mod_data)
+
+    def is_mismatch(self, uuid: str, all_mods: dict[str, Any]) -> bool:
+        """
+        Return the version mismatch status of a mod, evaluating it if it isn't indexed yet.
+
+        Mods that are unknown are reported as a mismatch.
+        """
+        mismatch = self._mismatches.get(uuid)
+        if mismatch is None:
+            mod_data = all_mods.get(uuid)
+            if not mod_data:
+                return True
+            mismatch = self._mismatches[uuid] = self._evaluate(mod_data)
+        return mismatch
+
+    def _evaluate(self, mod_data: dict[str, Any]) -> bool:
+        """
+        Check version for everything except Core.
+        Return True if the version does not match.
+        Return False if the version matches.
+        If there is an error, log it and return True.
+        """
+        # check if packageid is included in the external "No Version Warning" list
+        if mod_data and mod_data.get("packageid") in self.no_version_warning:
+            logger.debug(
+                f'mod with id "{mod_data["packageid"]}" was found on the "No Version Warning" list. Skipping version mismatch check!'
+            )
+            return False
+        if not self.game_version or not mod_data:
+            return True
+        supported_versions = (mod_data.get("supportedversions") or {}).get("li")
+        if not supported_versions:
+            return True
+        if isinstance(supported_versions, str):
+            # If game_version starts with supported_versions, there is no mismatch
+            return not self.game_version.startswith(supported_versions)
+        if isinstance(supported_versions, list):
+            # If game_version starts with any of supported_versions, there is no mismatch
+            return not any(
+                isinstance(version, str) and self.game_version.startswith(version)
+                for version in supported_versions
+            )
+        # If supported_versions is not a string or a list, log error and return True
+        logger.error(f"supportedversions value not str or list: {supported_versions}")
+        return True
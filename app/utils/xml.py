@@ -1,9 +1,62 @@
 import os
+import threading
+from collections.abc import Set
 from typing import Any
 
 import xmltodict
 from bs4 import BeautifulSoup
 from loguru import logger
+from lxml import etree
+
+# Top-level About.xml tags consumed by ModParser and the metadata factory (lowercase)
+ABOUT_XML_TAGS = frozenset(
+    {
+        "packageid",
+        "name",
+        "author",
+        "authors",
+        "description",
+        "descriptionsbyversion",
+        "supportedversions",
+        "targetversion",
+        "url",
+        "modversion",
+        "modiconpath",
+        "steamappid",
+        "moddependencies",
+        "moddependenciesbyversion",
+        "loadafter",
+        "loadafterbyversion",
+        "loadbefore",
+        "loadbeforebyversion",
+        "forceloadafter",
+        "forceloadbefore",
+        "incompatiblewith",
+        "incompatiblewithbyversion",
+    }
+)
+
+# The About.xml tags needed to populate and sort the mod lists (lowercase), read by the
+# skeleton pass of a two-phase metadata refresh. The other tags are the mod's details.
+ABOUT_XML_SKELETON_TAGS = frozenset(
+    {
+        "packageid",
+        "name",
+        "supportedversions",
+        "targetversion",
+        "moddependencies",
+        "moddependenciesbyversion",
+        "loadafter",
+        "loadafterbyversion",
+        "loadbefore",
+        "loadbeforebyversion",
+        "forceloadafter",
+        "forceloadbefore",
+        "incompatiblewith",
+        "incompatiblewithbyversion",
+    }
+)
+ABOUT_XML_DETAIL_TAGS = ABOUT_XML_TAGS - ABOUT_XML_SKELETON_TAGS
 
 
 def xml_path_to_json(path: str) -> dict[str, Any]:
@@ -45,6 +98,95 @@ def xml_path_to_json(path: str) -> dict[str, Any]:
         return data
 
 
+# libxml2 parsers are not thread-safe, ModParser threads each get their own
+_about_xml_parsers = threading.local()
+
+
+def _get_about_xml_parser() -> etree.XMLParser:
+    parser = getattr(_about_xml_parsers, "parser", None)
+    if parser is None:
+        parser = _about_xml_parsers.parser = etree.XMLParser(
+            recover=True,
+            remove_comments=True,
+            remove_pis=True,
+            resolve_entities=False,
+            no_network=True,
+            huge_tree=True,
+        )
+    return parser
+
+
+def _element_to_json(element: Any) -> Any:
+    """
+    Convert an lxml element to the same structure xmltodict would produce for it:
+    attributes as "@name", text as "#text" (or a plain string), repeated children as lists
+    and empty elements as None.
+    """
+    attributes = element.attrib
+    if not attributes and not len(element):
+        text = element.text
+        return (text.strip() or None) if text else None
+    data: dict[str, Any] = {f"@{key}": value for key, value in attributes.items()}
+    text_parts = [element.text] if element.text else []
+    for child in element:
+        if child.tail:
+            text_parts.append(child.tail)
+        if isinstance(child.tag, str):
+            _add_child(data, child.tag, _element_to_json(child))
+    text = "".join(text_parts).strip()
+    if not data:
+        return text or None
+    if text:
+        data["#text"] = text
+    return data
+
+
+def _add_child(data: dict[str, Any], key: str, value: Any) -> None:
+    if key not in data:
+        data[key] = value
+    elif isinstance(data[key], list):
+        data[key].append(value)
+    else:
+        data[key] = [data[key], value]
+
+
+def about_xml_path_to_json(
+    path: str, tags: Set[str] = ABOUT_XML_TAGS
+) -> dict[str, Any]:
+    """
+    Return the contents of a mod's About.xml as JSON, in the same structure as
+    xml_path_to_json, but only for the given top-level tags.
+
+    The file is parsed once by a recovering libxml2 parser, which tolerates common
+    malformations (unescaped ampersands, unknown entities, unclosed or mismatched tags,
+    junk after the root element, ...) directly instead of re-parsing the whole file.
+    Only the needed subtrees are converted to dicts.
+    If the file does not exist or has no root element, return an empty dict.
+
+    :param path: Path to the About.xml file.
+    :param tags: The top-level tags to return (lowercase), ABOUT_XML_TAGS by default.
+    :return: JSON dict of the About.xml contents.
+    """
+    if not os.path.exists(path):
+        logger.error(f"XML file does not exist at: {path}")
+        return {}
+    try:
+        root = etree.parse(path, _get_about_xml_parser()).getroot()
+    except (OSError, etree.XMLSyntaxError) as e:
+        # XMLSyntaxError is only raised if the parser was unable to recover anything at all
+        logger.debug(f"Error parsing XML file with lxml: {e}")
+        root = None
+    if root is None:
+        logger.error(f"Error parsing XML file: {path}")
+        return {}
+    data: dict[str, Any] = {}
+    for element in root:
+        tag = element.tag
+        if isinstance(tag, str) and tag.lower() in tags:
+            _add_child(data, tag, _element_to_json(element))
+    return {root.tag: data or None}
+
+
 def json_to_xml_write(
     data: dict[str, Any], path: str, raise_errs: bool = False
 ) -> None:
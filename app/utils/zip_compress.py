@@ -0,0 +1,172 @@
+import os
+import sys
+import zlib
+from collections import deque
+from collections.abc import Iterable
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any
+from zipfile import ZIP_DEFLATED, ZIP_STORED, ZipFile, ZipInfo
+
+# Extensions of files that are already compressed, and are stored as they are
+STORED_EXTENSIONS = frozenset(
+    {
+        ".7z",
+        ".bz2",
+        ".dds",
+        ".gz",
+        ".jpeg",
+        ".jpg",
+        ".mp3",
+        ".ogg",
+        ".png",
+        ".rar",
+        ".webp",
+        ".xz",
+        ".zip",
+    }
+)
+# Files larger than this are streamed into the archive by the writer, instead of being
+# compressed in memory by a worker
+LARGE_FILE_SIZE = 8 * 1024 * 1024
+# The maximum number of bytes compressed by workers but not yet written to the archive
+MAX_BYTES_IN_FLIGHT = 64 * 1024 * 1024
+READ_BLOCK_SIZE = 1024 * 1024
+# Python versions whose ZipFile write path _write_deflated mirrors, and is tested on.
+# Members are compressed by ZipFile itself on any other version
+PRECOMPRESS_PYTHON_VERSIONS = frozenset({(3, 11), (3, 12), (3, 13)})
+
+
+def _deflate_file(path: str, compresslevel: int) -> tuple[int, int, bytes]:
+    """Compress a file to a raw deflate stream, returning its CRC, size and compressed data."""
+    compressor = zlib.compressobj(compresslevel, zlib.DEFLATED, -zlib.MAX_WBITS)
+    crc = 0
+    size = 0
+    chunks = []
+    with open(path, "rb") as f:
+        while block := f.read(READ_BLOCK_SIZE):
+            crc = zlib.crc32(block, crc)
+            size += len(block)
+            chunks.append(compressor.compress(block))
+    chunks.append(compressor.flush())
+    return crc, size, b"".join(chunks)
+
+
+def _can_write_deflated(archive: ZipFile) -> bool:
+    """Return whether members compressed ahead of time can be written to the archive."""
+    return (
+        sys.version_info[:2] in PRECOMPRESS_PYTHON_VERSIONS and type(archive) is ZipFile
+    )
+
+
+def _write_deflated(
+    archive: ZipFile, zinfo: ZipInfo, crc: int, size: int, data: bytes
+) -> None:
+    """
+    Write a member compressed ahead of time to the archive.
+
+    ZipFile can only compress members itself, one at a time. This mirrors what
+    ZipFile.open(zinfo, "w") does, with the CRC and sizes known up front so the local header
+    is written once, and the data written as is.
+    """
+    zinfo.compress_type = ZIP_DEFLATED
+    zinfo.CRC = crc
+    zinfo.file_size = size
+    zinfo.compress_size = len(data)
+    zinfo.flag_bits = 0
+    # The private write state of the archive, kept up to date as ZipFile itself does
+    zip_file: Any = archive
+    with zip_file._lock:
+        if zip_file._writing:
+            raise ValueError(
+                "Can't write to ZIP archive while an open writing handle exists."
+            )
+        if zip_file._seekable:
+            zip_file.fp.seek(zip_file.start_dir)
+        zinfo.header_offset = zip_file.fp.tell()
+        zip_file._writecheck(zinfo)
+        zip_file._didModify = True
+        zip_file.fp.write(zinfo.FileHeader())
+        zip_file.fp.write(data)
+        zip_file.start_dir = zip_file.fp.tell()
+        zip_file.filelist.append(zinfo)
+        zip_file.NameToInfo[zinfo.filename] = zinfo
+
+
+def write_files_to_zip(
+    archive: ZipFile,
+    files: Iterable[tuple[str, str]],
+    max_workers: int | None = None,
+    compresslevel: int = 6,
+) -> None:
+    """
+    Write files and directories to a zip archive, compressing them on a pool of worker threads.
+
+    Already compressed files (textures, audio, archives) are stored without recompressing
+    them. Small files are compressed in memory by the workers, while the calling thread writes
+    finished members to the archive, and streams large files to it. Compressed data waiting
+    to be written is bounded by MAX_BYTES_IN_FLIGHT, so memory use does not grow with the
+    size of the files.
+
+    :param archive: The archive to write to, opened in "w" or "a" mode
+    :param files: (path, name in the archive) of each file or directory to write
+    :param max_workers: The number of worker threads, by default one per CPU (at most 8)
+    :param compresslevel: The deflate compression level
+    """
+    if max_workers is None:
+        max_workers = min(8, os.cpu_count() or 1)
+
+    # Otherwise every member is compressed on the calling thread, as ZipFile.write does
+    precompress = _can_write_deflated(archive)
+    pending: deque[tuple[ZipInfo, str, int, Future[tuple[int, int, bytes]]]] = deque()
+    bytes_in_flight = 0
+
+    def write_next() -> None:
+        nonlocal bytes_in_flight
+        zinfo, path, stat_size, future = pending.popleft()
+        bytes_in_flight -= stat_size
+        crc, size, data = future.result()
+        if len(data) >= size:
+            # Not worth compressing
+            archive.write(path, zinfo.filename, compress_type=ZIP_STORED)
+        else:
+            _write_deflated(archive, zinfo, crc, size, data)
+
+    with ThreadPoolExecutor(
+        max_workers=max_workers, thread_name_prefix="ZipCompress"
+    ) as executor:
+        try:
+            for path, arcname in files:
+                if os.path.isdir(path):
+                    archive.write(path, arcname)
+                    continue
+                if os.path.splitext(path)[1].lower() in STORED_EXTENSIONS:
+                    archive.write(path, arcname, compress_type=ZIP_STORED)
+                    continue
+                zinfo = ZipInfo.from_file(path, arcname)
+                if zinfo.file_size > LARGE_FILE_SIZE or not precompress:
+                    archive.write(
+                        path,
+                        arcname,
+                        compress_type=ZIP_DEFLATED,
+                        compresslevel=compresslevel,
+                    )
+                    continue
+                while pending and (
+                    bytes_in_flight + zinfo.file_size > MAX_BYTES_IN_FLIGHT
+                    or pending[0][3].done()
+                ):
+                    write_next()
+                pending.append(
+                    (
+                        zinfo,
+                        path,
+                        zinfo.file_size,
+                        executor.submit(_deflate_file, path, compresslevel),
+                    )
+                )
+                bytes_in_flight += zinfo.file_size
+            while pending:
+                write_next()
+        finally:
+            for _, _, _, future in pending:
+                future.cancel()
@@ -0,0 +1,168 @@
+import os
+import threading
+from collections.abc import Callable, Collection
+from concurrent.futures import ThreadPoolExecutor, wait
+from zipfile import ZipFile, ZipInfo
+
+from loguru import logger
+
+# Size of the blocks members are copied in, cancellation is checked between blocks
+COPY_BLOCK_SIZE = 64 * 1024
+# Small members are extracted in batches of about this many bytes, to limit the overhead of
+# scheduling thousands of tiny files on the worker pool
+BATCH_SIZE = 8 * 1024 * 1024
+BATCH_MAX_MEMBERS = 256
+
+
+def _member_path(target_path: str, filename: str) -> str | None:
+    """Return where a member is extracted to, or None if its path leaves the target."""
+    dst = os.path.normpath(os.path.join(target_path, filename))
+    try:
+        if os.path.commonpath([target_path, dst]) != target_path:
+            return None
+    except ValueError:
+        # On a different drive
+        return None
+    return dst
+
+
+def _batch_members(
+    members: list[tuple[ZipInfo, str]],
+) -> list[list[tuple[ZipInfo, str]]]:
+    """Group members into batches of similar size, largest first so workers finish together."""
+    batches: list[list[tuple[ZipInfo, str]]] = []
+    batch: list[tuple[ZipInfo, str]] = []
+    batch_size = 0
+    for member in sorted(members, key=lambda member: member[0].file_size, reverse=True):
+        if batch and (
+            batch_size + member[0].file_size > BATCH_SIZE
+            or len(batch) >= BATCH_MAX_MEMBERS
+        ):
+            batches.append(batch)
+            batch = []
+            batch_size = 0
+        batch.append(member)
+        batch_size += member[0].file_size
+    if batch:
+        batches.append(batch)
+    return batches
+
+
+def extract_zip(
+    zip_path: str,
+    target_path: str,
+    overwrite: bool = True,
+    max_workers: int | None = None,
+    progress_callback: Callable[[int], None] | None = None,
+    should_abort: Callable[[], bool] | None = None,
+    exclude: Collection[str] = (),
+) -> bool:
+    """
+    Extract a zip archive using a pool of worker threads.
+
+    The directory tree is created once up front, then members are decompressed and written
+    by the workers, each reading the archive through its own ZipFile handle. Decompression
+    and file writes release the GIL, so large archives are extracted on several cores.
+
+    Members whose path would leave the target directory are skipped.
+
+    :param zip_path: The archive to extract
+    :param target_path: The directory to extract to
+    :param overwrite: Overwrite existing files, otherwise skip them
+    :param max_workers: The number of worker threads, by default one per CPU (at most 8)
+    :param progress_callback: Called with the percentage of bytes extracted, only when it changes
+    :param should_abort: Polled while extracting, extraction stops as soon as it returns True
+    :param exclude: Names of members not to extract
+    :return: False if extraction was aborted, True otherwise
+    """
+    target_path = os.path.abspath(target_path)
+    if max_workers is None:
+        max_workers = min(8, os.cpu_count() or 1)
+    abort = should_abort or (lambda: False)
+
+    with ZipFile(zip_path) as zipobj:
+        infolist = zipobj.infolist()
+
+    # Plan the extraction: every directory to create, and every file to write
+    directories = {target_path}
+    members: list[tuple[ZipInfo, str]] = []
+    for zip_info in infolist:
+        if zip_info.filename in exclude:
+            continue
+        dst = _member_path(target_path, zip_info.filename)
+        if dst is None:
+            logger.warning(
+                f"Skipping zip member outside target path: {zip_info.filename}"
+            )
+            continue
+        if zip_info.is_dir():
+            directories.add(dst)
+            continue
+        directories.add(os.path.dirname(dst))
+        if not overwrite and os.path.exists(dst):
+            continue
+        members.append((zip_info, dst))
+    for directory in sorted(directories):
+        os.makedirs(directory, exist_ok=True)
+
+    total_bytes = sum(zip_info.file_size for zip_info, _ in members)
+    extracted_bytes = 0
+    last_percent = -1
+    progress_lock = threading.Lock()
+
+    def report(size: int) -> None:
+        nonlocal extracted_bytes, last_percent
+        with progress_lock:
+            extracted_bytes += size
+            percent = int(extracted_bytes / total_bytes * 100) if total_bytes else 100
+            if percent == last_percent:
+                return
+            last_percent = percent
+        if progress_callback is not None:
+            progress_callback(percent)
+
+    local = threading.local()
+    handles: list[ZipFile] = []
+    handles_lock = threading.Lock()
+
+    def extract_batch(batch: list[tuple[ZipInfo, str]]) -> bool:
+        handle = getattr(local, "zipobj", None)
+        if handle is None:
+            handle = local.zipobj = ZipFile(zip_path)
+            with handles_lock:
+                handles.append(handle)
+        for zip_info, dst in batch:
+            if abort():
+                return False
+            with handle.open(zip_info) as src, open(dst, "wb") as out_file:
+                while True:
+                    block = src.read(COPY_BLOCK_SIZE)
+                    if not block:
+                        break
+                    out_file.write(block)
+                    if abort():
+                        break
+            if abort():
+                # Don't leave a partially written member behind
+                os.remove(dst)
+                return False
+            report(zip_info.file_size)
+        return True
+
+    try:
+        with ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="ZipExtract"
+        ) as executor:
+            futures = [
+                executor.submit(extract_batch, batch)
+                for batch in _batch_members(members)
+            ]
+            wait(futures)
+            # Raise the first error, if any
+            completed = all([future.result() for future in futures])
+    finally:
+        for handle in handles:
+            handle.close()
+    if completed and not members:
+        report(0)
+    return completed and not abort()
@@ -714,23 +714,24 @@ class AcfLogReader(QDialog):
                 internal_time_touched_str = "Unknown"
                 try:
                     metadata_manager = MetadataManager.instance()
-                    for metadata in metadata_manager.internal_local_metadata.values():
-                        if metadata.get("publishedfileid") == pfid:
-                            internal_time_touched = metadata.get(
+                    uuid = metadata_manager.get_uuid_from_publishedfileid(pfid)
+                    if uuid is not None:
+                        internal_time_touched = (
+                            metadata_manager.internal_local_metadata[uuid].get(
                                 "internal_time_touched"
                             )
-                            if internal_time_touched:
-                                dt_touched = datetime.fromtimestamp(
-                                    int(internal_time_touched)
-                                )
-                                internal_time_touched_str = dt_touched.strftime(
-                                    "%Y-%m-%d %H:%M:%S"
-                                )
-                                rel_time = self.get_relative_time(internal_time_touched)
-                                internal_time_touched_str = (
-                                    f"{internal_time_touched_str} | {rel_time}"
-                                )
-                            break
+                        )
+                        if internal_time_touched:
+                            dt_touched = datetime.fromtimestamp(
+                                int(internal_time_touched)
+                            )
+                            internal_time_touched_str = dt_touched.strftime(
+                                "%Y-%m-%d %H:%M:%S"
+                            )
+                            rel_time = self.get_relative_time(internal_time_touched)
+                            internal_time_touched_str = (
+                                f"{internal_time_touched_str} | {rel_time}"
+                            )
                 except Exception as e:
                     logger.error(
                         f"Error getting internal_time_touched for PFID {pfid}: {str(e)}"
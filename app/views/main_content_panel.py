@@ -2,7 +2,6 @@ import json
 import os
 import platform
 import re
-import shutil
 import subprocess
 import sys
 import tempfile
@@ -49,6 +48,7 @@ import app.utils.metadata as metadata
 import app.views.dialogue as dialogue
 from app.controllers.sort_controller import Sorter
 from app.models.animations import LoadingAnimation
+from app.sort.dependency_graph_cache import DependencyGraphCache
 from app.utils.app_info import AppInfo
 from app.utils.event_bus import EventBus
 from app.utils.generic import (
@@ -76,6 +76,7 @@ from app.utils.steam.webapi.wrapper import (
 from app.utils.system_info import SystemInfo
 from app.utils.todds.wrapper import ToddsInterface
 from app.utils.xml import json_to_xml_write
+from app.utils.zip_extract import extract_zip
 from app.views.mod_info_panel import ModInfo
 from app.views.mods_panel import ModListWidget, ModsPanel, ModsPanelSortKey
 from app.windows.missing_dependencies_dialog import MissingDependenciesDialog
@@ -230,6 +231,8 @@ class MainContent(QObject):
 
             # Initialize MetadataManager
             self.metadata_manager = metadata.MetadataManager.instance()
+            # Dependency graphs kept between sorts
+            self.sort_graph_cache = DependencyGraphCache()
 
             # BASE LAYOUT
             self.main_layout = QHBoxLayout()
@@ -277,6 +280,9 @@ class MainContent(QObject):
             self.metadata_manager.mod_metadata_updated_signal.connect(
                 self.mods_panel.on_mod_metadata_updated  # Connect MetadataManager to ModPanel for mod metadata updates
             )
+            self.metadata_manager.mod_metadata_updated_signal.connect(
+                self.mod_info_panel.on_mod_metadata_updated
+            )
             self.mods_panel.active_mods_list.key_press_signal.connect(
                 self.__handle_active_mod_key_press
             )
@@ -295,6 +301,12 @@ class MainContent(QObject):
             self.mods_panel.inactive_mods_list.item_added_signal.connect(
                 self.mods_panel.active_mods_list.handle_other_list_row_added
             )
+            self.mods_panel.active_mods_list.items_added_signal.connect(
+                self.mods_panel.inactive_mods_list.handle_other_list_rows_added
+            )
+            self.mods_panel.inactive_mods_list.items_added_signal.connect(
+                self.mods_panel.active_mods_list.handle_other_list_rows_added
+            )
             self.mods_panel.active_mods_list.edit_rules_signal.connect(
                 self._do_open_rule_editor
             )
@@ -596,9 +608,20 @@ class MainContent(QObject):
 
         :param uuid: uuid of mod
         """
+        # Load the previews of the mods next to it ahead, for moving through the list
+        prefetch_uuids: list[str] = []
+        for mod_list in (
+            self.mods_panel.active_mods_list,
+            self.mods_panel.inactive_mods_list,
+        ):
+            if uuid in mod_list.uuids:
+                index = mod_list.uuids.index(uuid)
+                prefetch_uuids = mod_list.uuids[max(0, index - 1) : index + 2]
+                break
         self.mod_info_panel.display_mod_info(
             uuid=uuid,
             render_unity_rt=self.settings_controller.settings.render_unity_rich_text,
+            prefetch_uuids=prefetch_uuids,
         )
 
     def __repopulate_lists(self, is_initial: bool = False) -> None:
@@ -1381,6 +1404,7 @@ class MainContent(QObject):
                 active_package_ids=active_package_ids,
                 active_uuids=active_mods,
                 use_moddependencies_as_loadTheseBefore=self.settings_controller.settings.use_moddependencies_as_loadTheseBefore,
+                graph_cache=self.sort_graph_cache,
             )
         except NotImplementedError as e:
             dialogue.show_warning(
@@ -1577,11 +1601,9 @@ class MainContent(QObject):
 
         if rentry_import.publishedfileids:
             # Get set of publishedfileids already present locally
-            existing_publishedfileids = {
-                mod_data.get("publishedfileid")
-                for mod_data in self.metadata_manager.internal_local_metadata.values()
-                if mod_data.get("publishedfileid") is not None
-            }
+            existing_publishedfileids = (
+                self.metadata_manager.publishedfileid_to_uuids.keys()
+            )
             # Filter out publishedfileids that already exist locally
             filtered_publishedfileids = list(
                 {
@@ -2861,6 +2883,7 @@ class MainContent(QObject):
                     output_database_path=output_path,
                     get_appid_deps=self.settings_controller.settings.build_steam_database_dlc_data,
                     update=self.settings_controller.settings.build_steam_database_update_toggle,
+                    delta=self.settings_controller.settings.build_steam_database_delta_toggle,
                 )
             # "Yes": Produce accurate, possibly semi-incomplete DB without QueryFiles via API
             # CAN produce a complete DB! Only includes metadata parsed from mods you have downloaded.
@@ -2875,6 +2898,7 @@ class MainContent(QObject):
                     get_appid_deps=self.settings_controller.settings.build_steam_database_dlc_data,
                     mods=self.metadata_manager.internal_local_metadata,
                     update=self.settings_controller.settings.build_steam_database_update_toggle,
+                    delta=self.settings_controller.settings.build_steam_database_delta_toggle,
                 )
             # Create query runner
             self.query_runner = RunnerPanel()
@@ -2936,7 +2960,7 @@ class MainContent(QObject):
                             time.time()
                             + self.settings_controller.settings.database_expiry
                         ),
-                        "database": self.metadata_manager.external_steam_metadata,
+                        "database": dict(self.metadata_manager.external_steam_metadata),
                     },
                     output,
                     indent=4,
@@ -3450,30 +3474,21 @@ class ZipExtractThread(QThread):
     def run(self) -> None:
         start = time.perf_counter()
 
-        with ZipFile(self.zip_path) as zipobj:
-            file_list = zipobj.infolist()
-            total_files = len(file_list)
-            update_interval = max(1, total_files // 100)
-
-            for i, zip_info in enumerate(file_list):
-                if self._should_abort:
-                    self.finished.emit(False, "Operation aborted")
-                    return
-                filename = zip_info.filename
-                dst = os.path.join(self.target_path, filename)
-                os.makedirs(os.path.dirname(dst), exist_ok=True)
-
-                if zip_info.is_dir():
-                    os.makedirs(dst, exist_ok=True)
-                else:
-                    if os.path.exists(dst) and not self.overwrite_all:
-                        continue
-
-                    with zipobj.open(zip_info) as src, open(dst, "wb") as out_file:
-                        shutil.copyfileobj(src, out_file)
-
-                if i % update_interval == 0 or i == total_files - 1:
-                    self.progress.emit(int((i + 1) / total_files * 100))
+        try:
+            completed = extract_zip(
+                self.zip_path,
+                self.target_path,
+                overwrite=self.overwrite_all,
+                progress_callback=self.progress.emit,
+                should_abort=lambda: self._should_abort,
+            )
+        except (NotImplementedError, OSError, zipfile.BadZipFile) as e:
+            logger.error(f"Failed to extract {self.zip_path}: {e}")
+            self.finished.emit(False, str(e))
+            return
+        if not completed:
+            self.finished.emit(False, "Operation aborted")
+            return
 
         end = time.perf_counter()
         elapsed = end - start
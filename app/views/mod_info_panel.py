@@ -1,5 +1,4 @@
-import os
-from pathlib import Path
+from collections.abc import Iterable
 from re import match
 
 from loguru import logger
@@ -10,6 +9,7 @@ from PySide6.QtWidgets import QFrame, QHBoxLayout, QLabel, QSizePolicy, QVBoxLay
 from app.models.image_label import ImageLabel
 from app.utils.app_info import AppInfo
 from app.utils.metadata import MetadataManager
+from app.utils.preview_image_loader import PreviewImageLoader
 from app.views.description_widget import DescriptionWidget
 
 
@@ -72,6 +72,15 @@ class ModInfo:
             QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding
         )
         self.preview_picture.setMinimumSize(1, 1)
+        # Preview images are read and downscaled in the background
+        self.preview_loader = PreviewImageLoader()
+        self.preview_loader.preview_loaded.connect(self.on_preview_loaded)
+        # The folder of the mod whose preview is displayed or being loaded
+        self.preview_mod_path: str | None = None
+        # The mod being displayed, refreshed when its metadata is updated
+        self.displayed_uuid: str | None = None
+        self.render_unity_rt = False
+        self.prefetch_uuids: tuple[str, ...] = ()
         self.preview_picture.setPixmap(
             QPixmap(self.rimsort_image_a_path).scaled(
                 self.preview_picture.size(), Qt.AspectRatioMode.KeepAspectRatio
@@ -201,14 +210,23 @@ class ModInfo:
     def tr(text: str) -> str:
         return QCoreApplication.translate("ModInfo", text)
 
-    def display_mod_info(self, uuid: str, render_unity_rt: bool) -> None:
+    def display_mod_info(
+        self, uuid: str, render_unity_rt: bool, prefetch_uuids: Iterable[str] = ()
+    ) -> None:
         """
         This slot receives a the complete mod data json for
         the mod that was just clicked on. It will set the relevant
         information on the info panel.
 
         :param mod_info: complete json info for the mod
+        :param prefetch_uuids: mods likely displayed next, whose preview images are loaded ahead
         """
+        self.displayed_uuid = uuid
+        self.render_unity_rt = render_unity_rt
+        self.prefetch_uuids = tuple(prefetch_uuids)
+        # Mods may still be waiting for their details to be parsed in the background, show
+        # what is known until on_mod_metadata_updated displays them
+        self.metadata_manager.request_mod_details(uuid)
         mod_info = self.metadata_manager.internal_local_metadata.get(uuid, {})
         # Style summary values based on validity
         if mod_info and mod_info.get("invalid"):
@@ -338,79 +356,56 @@ class ModInfo:
         # It is OK for the description value to be None (was not provided)
         # It is OK for the description key to not be in mod_info
         if mod_info.get("scenario"):
-            pixmap = QPixmap(self.scenario_image_path)
-            self.preview_picture.setPixmap(
-                pixmap.scaled(
-                    self.preview_picture.size(), Qt.AspectRatioMode.KeepAspectRatio
-                )
-            )
+            self.preview_mod_path = None
+            self.preview_picture.setPixmap(QPixmap(self.scenario_image_path))
         else:
-            # Get Preview.png
-            workshop_folder_path = mod_info.get("path", "")
-            logger.debug(
-                f"Retrieved mod path to parse preview image: {workshop_folder_path}"
-            )
-            if os.path.exists(workshop_folder_path):
-                about_folder_name = "About"
-                about_folder_target_path = str(
-                    (Path(workshop_folder_path) / about_folder_name)
-                )
-                if os.path.exists(about_folder_target_path):
-                    # Look for a case-insensitive About folder
-                    invalid_folder_path_found = True
-                    for temp_file in os.scandir(workshop_folder_path):
-                        if (
-                            temp_file.name.lower() == about_folder_name.lower()
-                            and temp_file.is_dir()
-                        ):
-                            about_folder_name = temp_file.name
-                            invalid_folder_path_found = False
-                            break
-                    # Look for a case-insensitive "Preview.png" file
-                    invalid_file_path_found = True
-                    preview_file_name = "Preview.png"
-                    for temp_file in os.scandir(
-                        str((Path(workshop_folder_path) / about_folder_name))
-                    ):
-                        if (
-                            temp_file.name.lower() == preview_file_name.lower()
-                            and temp_file.is_file()
-                        ):
-                            preview_file_name = temp_file.name
-                            invalid_file_path_found = False
-                            break
-                    # If there was an issue getting the expected path, track and exit
-                    if invalid_folder_path_found or invalid_file_path_found:
-                        logger.debug("No preview image found for the mod")
-                        pixmap = QPixmap(self.missing_image_path)
-                        self.preview_picture.setPixmap(
-                            pixmap.scaled(
-                                self.preview_picture.size(),
-                                Qt.AspectRatioMode.KeepAspectRatio,
-                            )
-                        )
-                    else:
-                        logger.debug("Preview image found")
-                        image_path = str(
-                            (
-                                Path(workshop_folder_path)
-                                / about_folder_name
-                                / preview_file_name
-                            )
-                        )
-                        pixmap = QPixmap(image_path)
-                        self.preview_picture.setPixmap(
-                            pixmap.scaled(
-                                self.preview_picture.size(),
-                                Qt.AspectRatioMode.KeepAspectRatio,
-                            )
-                        )
-                else:
-                    pixmap = QPixmap(self.missing_image_path)
-                    self.preview_picture.setPixmap(
-                        pixmap.scaled(
-                            self.preview_picture.size(),
-                            Qt.AspectRatioMode.KeepAspectRatio,
-                        )
-                    )
+            self.show_preview(mod_info.get("path", ""), self.prefetch_uuids)
         logger.debug("Finished displaying mod info")
+
+    def on_mod_metadata_updated(self, uuid: str) -> None:
+        """
+        Refresh the panel if the updated mod is being displayed, e.g. once its details are parsed.
+
+        :param uuid: The uuid of the updated mod
+        """
+        if uuid == self.displayed_uuid:
+            self.display_mod_info(uuid, self.render_unity_rt, self.prefetch_uuids)
+
+    def show_preview(self, mod_path: str, prefetch_uuids: Iterable[str] = ()) -> None:
+        """
+        Display a mod's preview image. Images that are not cached yet are loaded in the
+        background, and displayed by on_preview_loaded.
+
+        :param mod_path: the mod's folder
+        :param prefetch_uuids: mods whose preview images are loaded ahead
+        """
+        self.preview_mod_path = mod_path
+        self.preview_loader.cache_folder = (
+            AppInfo().thumbnail_cache_folder
+            if self.metadata_manager.settings_controller.settings.cache_preview_thumbnails
+            else None
+        )
+        prefetch_paths = []
+        for prefetch_uuid in prefetch_uuids:
+            prefetch_info = self.metadata_manager.internal_local_metadata.get(
+                prefetch_uuid, {}
+            )
+            if prefetch_info.get("path") and not prefetch_info.get("scenario"):
+                prefetch_paths.append(prefetch_info["path"])
+        pixmap = self.preview_loader.request(mod_path, prefetch_paths)
+        if pixmap is not None:
+            self.set_preview_pixmap(pixmap)
+        else:
+            # Don't leave the previous mod's preview up while this one loads
+            self.preview_picture.clear()
+
+    def on_preview_loaded(self, mod_path: str, pixmap: QPixmap) -> None:
+        # Previews of mods that are no longer displayed were only prefetched
+        if mod_path == self.preview_mod_path:
+            self.set_preview_pixmap(pixmap)
+
+    def set_preview_pixmap(self, pixmap: QPixmap) -> None:
+        if pixmap.isNull():
+            logger.debug("No preview image found for the mod")
+            pixmap = QPixmap(self.missing_image_path)
+        self.preview_picture.setPixmap(pixmap)
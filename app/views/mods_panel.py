@@ -5,23 +5,39 @@ from functools import partial
 from pathlib import Path
 from shutil import copy2, copytree
 from traceback import format_exc
-from typing import cast
+from typing import AbstractSet, cast
 
 from loguru import logger
-from PySide6.QtCore import QEvent, QModelIndex, QObject, QRectF, QSize, Qt, Signal
+from PySide6.QtCore import (
+    QAbstractItemModel,
+    QEvent,
+    QModelIndex,
+    QObject,
+    QPersistentModelIndex,
+    QRect,
+    QRectF,
+    QSize,
+    Qt,
+    Signal,
+)
 from PySide6.QtGui import (
     QAction,
     QCursor,
     QDropEvent,
     QFocusEvent,
     QFontMetrics,
+    QHelpEvent,
     QIcon,
     QKeyEvent,
     QKeySequence,
+    QMouseEvent,
+    QPainter,
+    QPalette,
     QResizeEvent,
 )
 from PySide6.QtWidgets import (
     QAbstractItemView,
+    QApplication,
     QComboBox,
     QFrame,
     QHBoxLayout,
@@ -31,7 +47,11 @@ from PySide6.QtWidgets import (
     QMenu,
     QMessageBox,
     QPushButton,
+    QStyle,
+    QStyledItemDelegate,
+    QStyleOptionViewItem,
     QToolButton,
+    QToolTip,
     QVBoxLayout,
     QWidget,
 )
@@ -55,6 +75,7 @@ from app.utils.generic import (
     sanitize_filename,
 )
 from app.utils.metadata import MetadataManager, ModMetadata
+from app.utils.mod_search_index import ModSearchIndex
 from app.views.deletion_menu import ModDeletionMenu
 from app.views.dialogue import (
     show_dialogue_conditional,
@@ -114,6 +135,74 @@ def sort_uuids(uuids: list[str], key: ModsPanelSortKey) -> list[str]:
     return sorted(uuids, key=key_function)
 
 
+def mod_tool_tip_text(uuid: str) -> str:
+    """
+    Compose the tooltip of a mod list row.
+
+    :param uuid: str, the uuid of the mod
+    :return: string containing the tool_tip_text
+    """
+    metadata = MetadataManager.instance().internal_local_metadata.get(uuid, {})
+
+    name_line = f"Mod: {metadata.get('name', 'Not specified')}\n"
+
+    authors_tag = metadata.get("authors")
+    authors_text = (
+        ", ".join(authors_tag.get("li", ["Not specified"]))
+        if isinstance(authors_tag, dict)
+        else authors_tag or "Not specified"
+    )
+    author_line = f"Authors: {authors_text}\n"
+
+    package_id = metadata.get("packageid", "Not specified")
+    package_id_line = f"PackageID: {package_id}\n"
+
+    mod_version = metadata.get("modversion", "Not specified")
+    modversion_line = f"Mod Version: {mod_version}\n"
+
+    supported_versions_tag = metadata.get("supportedversions", {})
+    supported_versions_list = supported_versions_tag.get("li")
+    supported_versions_text = (
+        ", ".join(supported_versions_list)
+        if isinstance(supported_versions_list, list)
+        else supported_versions_list or "Not specified"
+    )
+    supported_versions_line = f"Supported Versions: {supported_versions_text}\n"
+
+    path = metadata.get("path", "Not specified")
+    path_line = f"Path: {path}"
+
+    return "".join(
+        [
+            name_line,
+            author_line,
+            package_id_line,
+            modversion_line,
+            supported_versions_line,
+            path_line,
+        ]
+    )
+
+
+def mod_source_icon(uuid: str) -> QIcon | None:
+    """
+    Return the icon of a mod's source type (expansion, workshop, or local mod).
+
+    :param uuid: str, the uuid of the mod
+    :return: QIcon of the mod's source type, None if it has no known source type
+    """
+    metadata = MetadataManager.instance().internal_local_metadata[uuid]
+    data_source = metadata.get("data_source")
+    if data_source == "expansion":
+        return ModListIcons.ludeon_icon()
+    elif data_source == "local":
+        return ModListIcons.local_icon()
+    elif data_source == "workshop":
+        return ModListIcons.steam_icon()
+    logger.error(f"No type found for mod with package id {metadata.get('packageid')}")
+    return None
+
+
 class ModListItemInner(QWidget):
     """
     Subclass for QWidget. Used to store data for a single
@@ -358,73 +447,16 @@ class ModListItemInner(QWidget):
 
         :return: string containing the tool_tip_text
         """
-        metadata = self.metadata_manager.internal_local_metadata.get(self.uuid, {})
-
-        name_line = f"Mod: {metadata.get('name', 'Not specified')}\n"
+        return mod_tool_tip_text(self.uuid)
 
-        authors_tag = metadata.get("authors")
-        authors_text = (
-            ", ".join(authors_tag.get("li", ["Not specified"]))
-            if isinstance(authors_tag, dict)
-            else authors_tag or "Not specified"
-        )
-        author_line = f"Authors: {authors_text}\n"
-
-        package_id = metadata.get("packageid", "Not specified")
-        package_id_line = f"PackageID: {package_id}\n"
-
-        mod_version = metadata.get("modversion", "Not specified")
-        modversion_line = f"Mod Version: {mod_version}\n"
-
-        supported_versions_tag = metadata.get("supportedversions", {})
-        supported_versions_list = supported_versions_tag.get("li")
-        supported_versions_text = (
-            ", ".join(supported_versions_list)
-            if isinstance(supported_versions_list, list)
-            else supported_versions_list or "Not specified"
-        )
-        supported_versions_line = f"Supported Versions: {supported_versions_text}\n"
-
-        path = metadata.get("path", "Not specified")
-        path_line = f"Path: {path}"
-
-        return "".join(
-            [
-                name_line,
-                author_line,
-                package_id_line,
-                modversion_line,
-                supported_versions_line,
-                path_line,
-            ]
-        )
-
-    def get_icon(self) -> QIcon:  # type: ignore
+    def get_icon(self) -> QIcon:
         """
         Check custom tags added to mod metadata upon initialization, and return the corresponding
         QIcon for the mod's source type (expansion, workshop, or local mod?)
 
         :return: QIcon object set to the path of the corresponding icon image
         """
-        if (
-            self.metadata_manager.internal_local_metadata[self.uuid].get("data_source")
-            == "expansion"
-        ):
-            return ModListIcons.ludeon_icon()
-        elif (
-            self.metadata_manager.internal_local_metadata[self.uuid].get("data_source")
-            == "local"
-        ):
-            return ModListIcons.local_icon()
-        elif (
-            self.metadata_manager.internal_local_metadata[self.uuid].get("data_source")
-            == "workshop"
-        ):
-            return ModListIcons.steam_icon()
-        else:
-            logger.error(
-                f"No type found for ModListItemInner with package id {self.metadata_manager.internal_local_metadata[self.uuid].get('packageid')}"
-            )
+        return mod_source_icon(self.uuid)  # type: ignore
 
     def resizeEvent(self, event: QResizeEvent) -> None:
         """
@@ -564,6 +596,239 @@ class ModListIcons:
         return cls._error_icon
 
 
+class ModListItemDelegate(QStyledItemDelegate):
+    """
+    Paints the rows of a ModListWidget directly, instead of giving every row a
+    ModListItemInner widget.
+
+    Rows show the same icons, label colors and tooltips as ModListItemInner, and clicking
+    a row's warning or error icon toggles its warnings. Nothing is kept per row, so memory
+    use does not grow with the size of the list.
+    """
+
+    ICON_SIZE = 20
+
+    def __init__(self, mod_list: "ModListWidget") -> None:
+        super().__init__(mod_list)
+        self.mod_list = mod_list
+        self.metadata_manager = MetadataManager.instance()
+        # Hidden labels styled by the theme, the label colors are read from them
+        self._label_styles: dict[str, QLabel] = {}
+        for object_name in (
+            "ListItemLabel",
+            "ListItemLabelFiltered",
+            "ListItemLabelInvalid",
+        ):
+            label = QLabel(mod_list)
+            label.setObjectName(object_name)
+            label.hide()
+            self._label_styles[object_name] = label
+
+    def _icons(self, uuid: str) -> list[tuple[QIcon, str]]:
+        """Return the icons shown before a mod's name, with their tooltips."""
+        metadata = self.metadata_manager.internal_local_metadata.get(uuid)
+        if metadata is None:
+            return []
+        data_source = metadata.get("data_source")
+        icons = []
+        is_git = (
+            data_source == "local"
+            and metadata.get("git_repo")
+            and not metadata.get("steamcmd")
+        )
+        is_steamcmd = data_source == "local" and metadata.get("steamcmd")
+        if is_git:
+            icons.append(
+                (
+                    ModListIcons.git_icon(),
+                    self.tr("Local mod that contains a git repository"),
+                )
+            )
+        if is_steamcmd:
+            icons.append(
+                (
+                    ModListIcons.steamcmd_icon(),
+                    self.tr("Local mod that can be used with SteamCMD"),
+                )
+            )
+        if not is_git and not is_steamcmd:
+            source_icon = mod_source_icon(uuid)
+            if source_icon is not None:
+                if data_source == "expansion":
+                    tool_tip = self.tr("Official RimWorld content by Ludeon Studios")
+                elif data_source == "workshop":
+                    tool_tip = self.tr("Subscribed via Steam")
+                else:
+                    tool_tip = self.tr("Installed locally")
+                icons.append((source_icon, tool_tip))
+        if self.mod_list.settings_controller.settings.mod_type_filter_toggle:
+            if metadata.get("csharp") is not None:
+                icons.append(
+                    (
+                        ModListIcons.csharp_icon(),
+                        self.tr("Contains custom C# assemblies (custom code)"),
+                    )
+                )
+            else:
+                icons.append(
+                    (
+                        ModListIcons.xml_icon(),
+                        self.tr("Contains custom content (textures / XML)"),
+                    )
+                )
+        return icons
+
+    def _layout(
+        self,
+        rect: QRect,
+        font_metrics: QFontMetrics,
+        data: CustomListWidgetItemMetadata,
+    ) -> tuple[list[tuple[QRect, QIcon, str]], QRect, str, int]:
+        """
+        Lay out a row like ModListItemInner: the icons, the elided name, then the warning
+        and error icons.
+
+        :return: the rect, icon and tooltip of every icon, the rect of the name, the name,
+            and the number of warning and error icons at the end of the icons
+        """
+        size = self.ICON_SIZE
+        top = rect.top() + (rect.height() - size) // 2
+        icons = self._icons(data["uuid"])
+        trailing = []
+        if data["warnings"]:
+            trailing.append((ModListIcons.warning_icon(), data["warnings"]))
+        if data["errors"]:
+            trailing.append((ModListIcons.error_icon(), data["errors"]))
+
+        name = self.metadata_manager.internal_local_metadata.get(data["uuid"], {}).get(
+            "name"
+        )
+        if not isinstance(name, str):
+            name = "name error in mod about.xml"
+        available_width = max(0, rect.width() - (len(icons) + len(trailing)) * size)
+        name = font_metrics.elidedText(
+            name, Qt.TextElideMode.ElideRight, available_width
+        )
+        name_width = min(font_metrics.horizontalAdvance(name), available_width)
+
+        x = rect.left()
+        icon_rects = []
+        for icon, tool_tip in icons:
+            icon_rects.append((QRect(x, top, size, size), icon, tool_tip))
+            x += size
+        name_rect = QRect(x, rect.top(), name_width, rect.height())
+        x += name_width
+        for icon, tool_tip in trailing:
+            icon_rects.append((QRect(x, top, size, size), icon, tool_tip))
+            x += size
+        return icon_rects, name_rect, name, len(trailing)
+
+    def paint(
+        self,
+        painter: QPainter,
+        option: QStyleOptionViewItem,
+        index: QModelIndex | QPersistentModelIndex,
+    ) -> None:
+        opt = QStyleOptionViewItem(option)
+        self.initStyleOption(opt, index)
+        # Draw the row's background (selection, hover) as the theme styles it
+        opt.text = ""  # type: ignore[attr-defined]
+        opt.icon = QIcon()  # type: ignore[attr-defined]
+        widget = opt.widget  # type: ignore[attr-defined]
+        style = widget.style() if widget is not None else QApplication.style()
+        style.drawControl(QStyle.ControlElement.CE_ItemViewItem, opt, painter, widget)
+
+        data = index.data(Qt.ItemDataRole.UserRole)
+        if data is None:
+            return
+        rect: QRect = option.rect  # type: ignore[attr-defined]
+        font_metrics: QFontMetrics = option.fontMetrics  # type: ignore[attr-defined]
+        icon_rects, name_rect, name, _ = self._layout(rect, font_metrics, data)
+        for icon_rect, icon, _ in icon_rects:
+            icon.paint(painter, icon_rect)
+        if data["filtered"]:
+            label = self._label_styles["ListItemLabelFiltered"]
+        elif data["errors_warnings"] or data["errors"] or data["warnings"]:
+            label = self._label_styles["ListItemLabelInvalid"]
+        else:
+            label = self._label_styles["ListItemLabel"]
+        label.ensurePolished()
+        painter.save()
+        painter.setFont(option.font)  # type: ignore[attr-defined]
+        painter.setPen(label.palette().color(QPalette.ColorRole.WindowText))
+        painter.drawText(
+            name_rect,
+            int(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter),
+            name,
+        )
+        painter.restore()
+
+    def sizeHint(
+        self,
+        option: QStyleOptionViewItem,
+        index: QModelIndex | QPersistentModelIndex,
+    ) -> QSize:
+        rect: QRect = option.rect  # type: ignore[attr-defined]
+        font_metrics: QFontMetrics = option.fontMetrics  # type: ignore[attr-defined]
+        return QSize(rect.width(), max(self.ICON_SIZE, font_metrics.height()))
+
+    def helpEvent(
+        self,
+        event: QHelpEvent,
+        view: QAbstractItemView,
+        option: QStyleOptionViewItem,
+        index: QModelIndex | QPersistentModelIndex,
+    ) -> bool:
+        data = index.data(Qt.ItemDataRole.UserRole) if index.isValid() else None
+        if event.type() != QEvent.Type.ToolTip or data is None:
+            return super().helpEvent(event, view, option, index)
+        rect: QRect = option.rect  # type: ignore[attr-defined]
+        font_metrics: QFontMetrics = option.fontMetrics  # type: ignore[attr-defined]
+        icon_rects, _, _, _ = self._layout(rect, font_metrics, data)
+        # Show the tooltip of the icon under the cursor, or the mod's tooltip
+        tool_tip = next(
+            (
+                icon_tool_tip
+                for icon_rect, _, icon_tool_tip in icon_rects
+                if icon_rect.contains(event.pos())
+            ),
+            "",
+        )
+        QToolTip.showText(
+            event.globalPos(), tool_tip or mod_tool_tip_text(data["uuid"]), view
+        )
+        return True
+
+    def editorEvent(
+        self,
+        event: QEvent,
+        model: QAbstractItemModel,
+        option: QStyleOptionViewItem,
+        index: QModelIndex | QPersistentModelIndex,
+    ) -> bool:
+        # Clicking the warning or error icon toggles the mod's warnings
+        if (
+            isinstance(event, QMouseEvent)
+            and event.type() == QEvent.Type.MouseButtonRelease
+            and event.button() == Qt.MouseButton.LeftButton
+        ):
+            data = index.data(Qt.ItemDataRole.UserRole)
+            if data is not None and (data["warnings"] or data["errors"]):
+                rect: QRect = option.rect  # type: ignore[attr-defined]
+                font_metrics: QFontMetrics = option.fontMetrics  # type: ignore[attr-defined]
+                icon_rects, _, _, trailing = self._layout(rect, font_metrics, data)
+                if any(
+                    icon_rect.contains(event.position().toPoint())
+                    for icon_rect, _, _ in icon_rects[len(icon_rects) - trailing :]
+                ):
+                    packageid = self.metadata_manager.internal_local_metadata[
+                        data["uuid"]
+                    ]["packageid"]
+                    self.mod_list.toggle_warning(packageid, data["uuid"])
+                    return True
+        return super().editorEvent(event, model, option, index)
+
+
 class ModListWidget(QListWidget):
     """
     Subclass for QListWidget. Used to store lists for
@@ -573,6 +838,7 @@ class ModListWidget(QListWidget):
 
     edit_rules_signal = Signal(bool, str, str)
     item_added_signal = Signal(str)
+    items_added_signal = Signal(list)
     key_press_signal = Signal(str)
     list_update_signal = Signal(str)
     mod_info_signal = Signal(str)
@@ -623,6 +889,12 @@ class ModListWidget(QListWidget):
         self.horizontalScrollBar().setEnabled(False)
         self.horizontalScrollBar().setVisible(False)
 
+        # Paint rows with a delegate instead of creating a widget for every row
+        self.painted_rows = self.settings_controller.settings.paint_mod_list_rows
+        if self.painted_rows:
+            self.setItemDelegate(ModListItemDelegate(self))
+            # Painted rows all have the same height
+            self.setUniformItemSizes(True)
         # Optimizes performance
         # self.setUniformItemSizes(True)
 
@@ -640,12 +912,17 @@ class ModListWidget(QListWidget):
         )
 
         # Lazy load ModListItemInner
-        self.verticalScrollBar().valueChanged.connect(self.check_widgets_visible)
+        if not self.painted_rows:
+            self.verticalScrollBar().valueChanged.connect(self.check_widgets_visible)
 
         # This set is used to keep track of mods that have been loaded
         # into widgets. Used for an optimization strategy for `handle_rows_inserted`
         self.uuids: list[str] = []
         self.ignore_warning_list: list[str] = []
+        # uuid -> the mod's (error, warning) summary entries from the last errors / warnings pass
+        self._errors_warnings: dict[str, tuple[str | None, str | None]] = {}
+        # First and last row rearranged by a drop within this list since the last pass
+        self._moved_rows: tuple[int, int] | None = None
 
         self.deletion_sub_menu = ModDeletionMenu(
             self._get_selected_metadata,
@@ -688,11 +965,20 @@ class ModListWidget(QListWidget):
                 item.data(Qt.ItemDataRole.UserRole)["uuid"]
                 for item in self.selectedItems()
             ]
-            # Insert the UUIDs at the respective new indexes
-            for idx, uuid in zip(new_indexes, uuids):
-                if uuid in self.uuids:  # Remove the uuid if it exists in the list
-                    self.uuids.remove(uuid)
-                # Reinsert uuid at it's new index
+            if source_widget == self and new_indexes:
+                # Only the rows between the old and new positions changed order
+                old_indexes = [
+                    self.uuids.index(uuid) for uuid in uuids if uuid in self.uuids
+                ]
+                self._moved_rows = (
+                    min(old_indexes + new_indexes),
+                    max(old_indexes + new_indexes),
+                )
+            # Remove the UUIDs if they exist in the list, then reinsert them at
+            # their new indexes, lowest first so that every index is final
+            dropped = set(uuids)
+            self.uuids[:] = [uuid for uuid in self.uuids if uuid not in dropped]
+            for idx, uuid in sorted(zip(new_indexes, uuids)):
                 self.uuids.insert(idx, uuid)
         # Update list signal
         logger.debug(
@@ -1557,21 +1843,6 @@ class ModListWidget(QListWidget):
             mod_list_items.append(item)
         return mod_list_items
 
-    def get_all_loaded_mod_list_items(self) -> list[ModListItemInner]:
-        """
-        This gets all modlist items as ModListItemInner.
-        Mods that have not been loaded or lazy loaded will not be returned.
-
-        :return: List of all modlist items as ModListItemInner
-        """
-        mod_list_items = []
-        for index in range(self.count()):
-            item = self.item(index)
-            widget = self.itemWidget(item)
-            if isinstance(widget, ModListItemInner):
-                mod_list_items.append(widget)
-        return mod_list_items
-
     def get_all_loaded_and_toggled_mod_list_items(self) -> list[CustomListWidgetItem]:
         """
         This returns all modlist items that have their warnings toggled.
@@ -1592,6 +1863,9 @@ class ModListWidget(QListWidget):
         return rect.top() < self.viewport().height() and rect.bottom() > 0
 
     def create_widget_for_item(self, item: CustomListWidgetItem) -> None:
+        if self.painted_rows:
+            # Rows are painted by ModListItemDelegate
+            return
         data = item.data(Qt.ItemDataRole.UserRole)
         if data is None:
             logger.debug("Attempted to create widget for item with None data")
@@ -1623,6 +1897,8 @@ class ModListWidget(QListWidget):
 
     def check_widgets_visible(self) -> None:
         # This function checks the visibility of each item and creates a widget if the item is visible and not already setup.
+        if self.painted_rows:
+            return
         for idx in range(self.count()):
             item = self.item(idx)
             # Check for visible item without a widget set
@@ -1633,6 +1909,11 @@ class ModListWidget(QListWidget):
         """
         This slot is called when an item's data changes
         """
+        if self.painted_rows:
+            # The item data is updated in place, so the view isn't always notified.
+            # Updates are coalesced into a single repaint of the visible rows.
+            self.viewport().update()
+            return
         widget = self.itemWidget(item)
         if widget is not None and isinstance(widget, ModListItemInner):
             widget.repolish(item)
@@ -1646,6 +1927,14 @@ class ModListWidget(QListWidget):
         if uuid in self.uuids:
             self.uuids.remove(uuid)
 
+    def handle_other_list_rows_added(self, uuids: list[str]) -> None:
+        """
+        When the other list is recreated, the uuids it now contains are removed from this list.
+        """
+        added = set(uuids)
+        if not added.isdisjoint(self.uuids):
+            self.uuids = [uuid for uuid in self.uuids if uuid not in added]
+
     def handle_rows_inserted(self, parent: QModelIndex, first: int, last: int) -> None:
         """
         This slot is called when rows are inserted.
@@ -1665,17 +1954,14 @@ class ModListWidget(QListWidget):
         of this method, `self.count()` is already 103; there are 3 "empty"
         list items that do not have widgets assigned to them.
 
-        However, inserting the initial `n` mods with `recreate_mod_list` has
-        an inefficiency: it is only able to insert one at a time. This means
-        this method is called `n` times for the first `n` mods.
-        One optimization here (saving about 1 second with a 200 mod list) is
-        to not emit the list update signal until the number of widgets is
-        equal to the number of items. If widgets < items, that means
-        widgets are still being added. Only when widgets == items does it mean
-        we are done with adding the initial set of mods. We can do this
-        by keeping track of the number of widgets currently loaded in the list
-        through a set of UUIDs which we can compare to the number of items
-        directly, as this set will equate to the items in the list.
+        `recreate_mod_list` inserts all of its items in a single model reset
+        instead, and updates `self.uuids` and emits the signals itself, so this
+        method is not called for the initial `n` mods.
+        The list update signal is still only emitted once the number of
+        UUIDs is equal to the number of items. If UUIDs < items, that means
+        items are still being added. We can do this by keeping track of the
+        UUIDs currently loaded in the list, which we can compare to the number
+        of items directly, as this list will equate to the items in the list.
 
         :param parent: parent to get rows under (not used)
         :param first: index of first item inserted
@@ -1772,6 +2058,12 @@ class ModListWidget(QListWidget):
         item_index = self.uuids.index(uuid)
         item = self.item(item_index)
         logger.debug(f"Rebuilding widget for item {uuid} at index {item_index}")
+        if self.painted_rows:
+            # Repaint the row with the mod's new metadata
+            self.viewport().update(self.visualItemRect(item))
+            if self.currentItem() == item:
+                self.mod_info_signal.emit(uuid)
+            return
         # Destroy the item's previous widget immediately. Recreate if the item is visible.
         widget = self.itemWidget(item)
         if widget:
@@ -1788,217 +2080,269 @@ class ModListWidget(QListWidget):
         Whenever the respective mod list has items added to it, or has
         items removed from it, or has items rearranged around within it,
         calculate the internal list errors / warnings for the mod list
-        """
-        logger.info(f"Recalculating {self.list_type} list errors / warnings")
 
+        If the only change since the last pass is a contiguous range of rows being
+        rearranged (see dropEvent), only the mods in that range are re-evaluated:
+        mods outside of it keep their order relative to every other mod.
+        """
+        moved_rows, self._moved_rows = self._moved_rows, None
         internal_local_metadata = self.metadata_manager.internal_local_metadata
 
+        uuid_to_row = {uuid: row for row, uuid in enumerate(self.uuids)}
         packageid_to_uuid = {
             internal_local_metadata[uuid]["packageid"]: uuid for uuid in self.uuids
         }
-        package_ids_set = set(packageid_to_uuid.keys())
-
-        package_id_to_errors: dict[str, dict[str, None | set[str] | bool]] = {
-            uuid: {
-                "missing_dependencies": set() if self.list_type == "Active" else None,
-                "conflicting_incompatibilities": (
-                    set() if self.list_type == "Active" else None
-                ),
-                "load_before_violations": set() if self.list_type == "Active" else None,
-                "load_after_violations": set() if self.list_type == "Active" else None,
-                "version_mismatch": True,
-                "use_this_instead": set()
-                if self.settings_controller.settings.external_use_this_instead_metadata_source
-                != "None"
-                else None,
-            }
-            for uuid in self.uuids
+        packageid_to_row = {
+            packageid: uuid_to_row[uuid]
+            for packageid, uuid in packageid_to_uuid.items()
         }
 
+        if moved_rows is not None and self._errors_warnings.keys() == (
+            uuid_to_row.keys()
+        ):
+            rows = range(moved_rows[0], min(moved_rows[1] + 1, len(self.uuids)))
+            logger.info(
+                f"Recalculating {self.list_type} list errors / warnings for rows {moved_rows[0]}-{moved_rows[1]}"
+            )
+        else:
+            self._errors_warnings = {}
+            rows = range(len(self.uuids))
+            logger.info(f"Recalculating {self.list_type} list errors / warnings")
+
+        ignore_warnings = set(self.ignore_warning_list)
+        for row in rows:
+            uuid = self.uuids[row]
+            summary = self._calculate_mod_errors_warnings(
+                row, uuid, packageid_to_uuid, packageid_to_row, ignore_warnings
+            )
+            if summary is None:
+                self._errors_warnings.pop(uuid, None)
+            else:
+                self._errors_warnings[uuid] = summary
+
         num_warnings = 0
-        total_warning_text = ""
+        total_warning_text: list[str] = []
         num_errors = 0
-        total_error_text = ""
+        total_error_text: list[str] = []
+        for uuid in self.uuids:
+            error_text, warning_text = self._errors_warnings.get(uuid, (None, None))
+            if error_text is not None:
+                num_errors += 1
+                total_error_text.append(error_text)
+            if warning_text is not None:
+                num_warnings += 1
+                total_warning_text.append(warning_text)
+        logger.info(f"Finished recalculating {self.list_type} list errors and warnings")
+        return (
+            "".join(total_error_text),
+            "".join(total_warning_text),
+            num_errors,
+            num_warnings,
+        )
 
-        for uuid, mod_errors in package_id_to_errors.items():
-            current_mod_index = self.uuids.index(uuid)
-            current_item = self.item(current_mod_index)
-            if current_item is None:
-                continue
-            current_item_data = current_item.data(Qt.ItemDataRole.UserRole)
-            current_item_data["mismatch"] = False
-            current_item_data["errors"] = ""
-            current_item_data["warnings"] = ""
-            mod_data = internal_local_metadata[uuid]
-            # Check mod supportedversions against currently loaded version of game
-            mod_errors["version_mismatch"] = self.metadata_manager.is_version_mismatch(
-                uuid
-            )
-            # Set an item's validity dynamically based on the version mismatch value
-            if (
-                mod_data["packageid"] not in self.ignore_warning_list
-                and not current_item_data["warning_toggled"]
-            ):
-                current_item_data["mismatch"] = mod_errors["version_mismatch"]
-            else:
-                # If a mod has been moved for eg. inactive -> active. We keep ignoring the warnings.
-                # This makes sure to add the mod to the ignore list of the new modlist.
-                # TODO: Check if toggle_warning method can add a mod to the ignore list
-                # of both ModListWidgets (Active and Inactive) at the same time. Then we can remove some of this confusing code...
-                if not current_item_data["warning_toggled"]:
-                    if mod_data["packageid"] in self.ignore_warning_list:
-                        self.ignore_warning_list.remove(mod_data["packageid"])
-                elif mod_data["packageid"] not in self.ignore_warning_list:
-                    self.ignore_warning_list.append(mod_data.get("packageid"))
-            # Check for "Active" mod list specific errors and warnings
-            if (
-                self.list_type == "Active"
-                and mod_data.get("packageid")
-                and mod_data["packageid"] not in self.ignore_warning_list
-            ):
-                # Check dependencies (and replacements for dependencies)
-                # Note: dependency replacements are NOT assumed to be subject
-                # to the same load order rules as the orignal mods!
-                mod_errors["missing_dependencies"] = {
-                    dep
-                    for dep in mod_data.get("dependencies", [])
-                    if dep not in package_ids_set
-                    and not self._has_replacement(
-                        mod_data["packageid"], dep, package_ids_set
-                    )
-                }
+    def _calculate_mod_errors_warnings(
+        self,
+        current_mod_index: int,
+        uuid: str,
+        packageid_to_uuid: dict[str, str],
+        packageid_to_row: dict[str, int],
+        ignore_warnings: set[str],
+    ) -> tuple[str | None, str | None] | None:
+        """
+        Calculate the errors / warnings of a single mod and update its item data.
+
+        :param current_mod_index: row of the mod in the list
+        :param uuid: uuid of the mod
+        :param packageid_to_uuid: packageid -> uuid of every mod in the list
+        :param packageid_to_row: packageid -> row of every mod in the list
+        :param ignore_warnings: packageids whose warnings are ignored, kept in sync with ignore_warning_list
+        :return: The mod's entry in the error and warning summaries (None if it has no
+            errors / warnings), or None if the mod has no item
+        """
+        current_item = self.item(current_mod_index)
+        if current_item is None:
+            return None
+        internal_local_metadata = self.metadata_manager.internal_local_metadata
+        mod_errors: dict[str, None | set[str] | bool] = {
+            "missing_dependencies": set() if self.list_type == "Active" else None,
+            "conflicting_incompatibilities": (
+                set() if self.list_type == "Active" else None
+            ),
+            "load_before_violations": set() if self.list_type == "Active" else None,
+            "load_after_violations": set() if self.list_type == "Active" else None,
+            "version_mismatch": True,
+            "use_this_instead": set()
+            if self.settings_controller.settings.external_use_this_instead_metadata_source
+            != "None"
+            else None,
+        }
+        current_item_data = current_item.data(Qt.ItemDataRole.UserRole)
+        current_item_data["mismatch"] = False
+        current_item_data["errors"] = ""
+        current_item_data["warnings"] = ""
+        mod_data = internal_local_metadata[uuid]
+        # Check mod supportedversions against currently loaded version of game
+        mod_errors["version_mismatch"] = self.metadata_manager.is_version_mismatch(uuid)
+        # Set an item's validity dynamically based on the version mismatch value
+        if (
+            mod_data["packageid"] not in ignore_warnings
+            and not current_item_data["warning_toggled"]
+        ):
+            current_item_data["mismatch"] = mod_errors["version_mismatch"]
+        else:
+            # If a mod has been moved for eg. inactive -> active. We keep ignoring the warnings.
+            # This makes sure to add the mod to the ignore list of the new modlist.
+            # TODO: Check if toggle_warning method can add a mod to the ignore list
+            # of both ModListWidgets (Active and Inactive) at the same time. Then we can remove some of this confusing code...
+            if not current_item_data["warning_toggled"]:
+                if mod_data["packageid"] in ignore_warnings:
+                    self.ignore_warning_list.remove(mod_data["packageid"])
+                    ignore_warnings.discard(mod_data["packageid"])
+            elif mod_data["packageid"] not in ignore_warnings:
+                self.ignore_warning_list.append(mod_data.get("packageid"))
+                ignore_warnings.add(mod_data["packageid"])
+        # Check for "Active" mod list specific errors and warnings
+        if (
+            self.list_type == "Active"
+            and mod_data.get("packageid")
+            and mod_data["packageid"] not in ignore_warnings
+        ):
+            # Check dependencies (and replacements for dependencies)
+            # Note: dependency replacements are NOT assumed to be subject
+            # to the same load order rules as the orignal mods!
+            mod_errors["missing_dependencies"] = {
+                dep
+                for dep in mod_data.get("dependencies", [])
+                if dep not in packageid_to_uuid
+                and not self._has_replacement(
+                    mod_data["packageid"], dep, packageid_to_uuid.keys()
+                )
+            }
 
-                # Check incompatibilities
-                mod_errors["conflicting_incompatibilities"] = {
-                    incomp
-                    for incomp in mod_data.get("incompatibilities", [])
-                    if incomp in package_ids_set
-                }
+            # Check incompatibilities
+            mod_errors["conflicting_incompatibilities"] = {
+                incomp
+                for incomp in mod_data.get("incompatibilities", [])
+                if incomp in packageid_to_uuid
+            }
 
-                # Check loadTheseBefore
-                for load_this_before in mod_data.get("loadTheseBefore", []):
-                    if (
-                        load_this_before[1]
-                        and load_this_before[0] in packageid_to_uuid
-                        and current_mod_index
-                        <= self.uuids.index(packageid_to_uuid[load_this_before[0]])
-                    ):
-                        assert isinstance(mod_errors["load_before_violations"], set)
-                        mod_errors["load_before_violations"].add(load_this_before[0])
+            # Check loadTheseBefore
+            for load_this_before in mod_data.get("loadTheseBefore", []):
+                if (
+                    load_this_before[1]
+                    and load_this_before[0] in packageid_to_row
+                    and current_mod_index <= packageid_to_row[load_this_before[0]]
+                ):
+                    assert isinstance(mod_errors["load_before_violations"], set)
+                    mod_errors["load_before_violations"].add(load_this_before[0])
 
-                # Check loadTheseAfter
-                for load_this_after in mod_data.get("loadTheseAfter", []):
-                    if (
-                        load_this_after[1]
-                        and load_this_after[0] in packageid_to_uuid
-                        and current_mod_index
-                        >= self.uuids.index(packageid_to_uuid[load_this_after[0]])
-                    ):
-                        assert isinstance(mod_errors["load_after_violations"], set)
-                        mod_errors["load_after_violations"].add(load_this_after[0])
-            # Calculate any needed string for errors
-            tool_tip_text = ""
-            for error_type, tooltip_header in [
-                ("missing_dependencies", self.tr("\nMissing Dependencies:")),
-                ("conflicting_incompatibilities", self.tr("\nIncompatibilities:")),
-            ]:
-                if mod_errors[error_type]:
-                    tool_tip_text += tooltip_header
-                    errors = mod_errors[error_type]
-                    assert isinstance(errors, set)
-                    for key in errors:
-                        name = internal_local_metadata.get(
-                            packageid_to_uuid.get(key, ""), {}
-                        ).get(
-                            "name",
-                            self.metadata_manager.steamdb_packageid_to_name.get(
-                                key, key
-                            ),
-                        )
-                        tool_tip_text += f"\n  * {name}"
-            # If missing dependency and/or incompatibility, add tooltip to errors
-            current_item_data["errors"] = tool_tip_text
-            # Calculate any needed string for warnings
-            for error_type, tooltip_header in [
-                ("load_before_violations", self.tr("\nShould be Loaded After:")),
-                ("load_after_violations", self.tr("\nShould be Loaded Before:")),
-            ]:
-                if mod_errors[error_type]:
-                    tool_tip_text += tooltip_header
-                    errors = mod_errors[error_type]
-                    assert isinstance(errors, set)
-                    for key in errors:
-                        name = internal_local_metadata.get(
-                            packageid_to_uuid.get(key, ""), {}
-                        ).get(
-                            "name",
-                            self.metadata_manager.steamdb_packageid_to_name.get(
-                                key, key
-                            ),
-                        )
-                        tool_tip_text += f"\n  * {name}"
-            # Handle version mismatch behavior
-            if (
-                mod_errors["version_mismatch"]
-                and mod_data["packageid"] not in self.ignore_warning_list
-            ):
-                # Add tool tip to indicate mod and game version mismatch
-                tool_tip_text += "\nMod and Game Version Mismatch"
-            # Handle "use this instead" behavior
-            if (
-                current_item_data["alternative"]
-                and mod_data["packageid"] not in self.ignore_warning_list
-            ):
-                tool_tip_text += f"\nAn alternative updated mod is recommended:\n{current_item_data['alternative']}"
-            # Add to error summary if any missing dependencies or incompatibilities
-            if self.list_type == "Active" and any(
+            # Check loadTheseAfter
+            for load_this_after in mod_data.get("loadTheseAfter", []):
+                if (
+                    load_this_after[1]
+                    and load_this_after[0] in packageid_to_row
+                    and current_mod_index >= packageid_to_row[load_this_after[0]]
+                ):
+                    assert isinstance(mod_errors["load_after_violations"], set)
+                    mod_errors["load_after_violations"].add(load_this_after[0])
+        # Calculate any needed string for errors
+        tool_tip_text = ""
+        for error_type, tooltip_header in [
+            ("missing_dependencies", self.tr("\nMissing Dependencies:")),
+            ("conflicting_incompatibilities", self.tr("\nIncompatibilities:")),
+        ]:
+            if mod_errors[error_type]:
+                tool_tip_text += tooltip_header
+                errors = mod_errors[error_type]
+                assert isinstance(errors, set)
+                for key in errors:
+                    name = internal_local_metadata.get(
+                        packageid_to_uuid.get(key, ""), {}
+                    ).get(
+                        "name",
+                        self.metadata_manager.steamdb_packageid_to_name.get(key, key),
+                    )
+                    tool_tip_text += f"\n  * {name}"
+        # If missing dependency and/or incompatibility, add tooltip to errors
+        current_item_data["errors"] = tool_tip_text
+        # Calculate any needed string for warnings
+        for error_type, tooltip_header in [
+            ("load_before_violations", self.tr("\nShould be Loaded After:")),
+            ("load_after_violations", self.tr("\nShould be Loaded Before:")),
+        ]:
+            if mod_errors[error_type]:
+                tool_tip_text += tooltip_header
+                errors = mod_errors[error_type]
+                assert isinstance(errors, set)
+                for key in errors:
+                    name = internal_local_metadata.get(
+                        packageid_to_uuid.get(key, ""), {}
+                    ).get(
+                        "name",
+                        self.metadata_manager.steamdb_packageid_to_name.get(key, key),
+                    )
+                    tool_tip_text += f"\n  * {name}"
+        # Handle version mismatch behavior
+        if (
+            mod_errors["version_mismatch"]
+            and mod_data["packageid"] not in ignore_warnings
+        ):
+            # Add tool tip to indicate mod and game version mismatch
+            tool_tip_text += "\nMod and Game Version Mismatch"
+        # Handle "use this instead" behavior
+        if (
+            current_item_data["alternative"]
+            and mod_data["packageid"] not in ignore_warnings
+        ):
+            tool_tip_text += f"\nAn alternative updated mod is recommended:\n{current_item_data['alternative']}"
+        # Add to error summary if any missing dependencies or incompatibilities
+        error_text = None
+        if self.list_type == "Active" and any(
+            [
+                mod_errors[key]
+                for key in [
+                    "missing_dependencies",
+                    "conflicting_incompatibilities",
+                ]
+            ]
+        ):
+            error_text = f"\n\n{mod_data['name']}"
+            error_text += "\n" + "=" * len(mod_data["name"])
+            error_text += tool_tip_text
+
+        # Add to warning summary if any loadBefore or loadAfter violations, or version mismatch
+        # Version mismatch is determined earlier without checking if the mod is in ignore_warning_list
+        # so we have to check it again here in order to not display a faulty, empty version warning
+        warning_text = None
+        if (
+            self.list_type == "Active"
+            and mod_data["packageid"] not in ignore_warnings
+            and any(
                 [
                     mod_errors[key]
                     for key in [
-                        "missing_dependencies",
-                        "conflicting_incompatibilities",
+                        "load_before_violations",
+                        "load_after_violations",
+                        "version_mismatch",
+                        "use_this_instead",
                     ]
                 ]
-            ):
-                num_errors += 1
-                total_error_text += f"\n\n{mod_data['name']}"
-                total_error_text += "\n" + "=" * len(mod_data["name"])
-                total_error_text += tool_tip_text
-
-            # Add to warning summary if any loadBefore or loadAfter violations, or version mismatch
-            # Version mismatch is determined earlier without checking if the mod is in ignore_warning_list
-            # so we have to check it again here in order to not display a faulty, empty version warning
-            if (
-                self.list_type == "Active"
-                and mod_data["packageid"] not in self.ignore_warning_list
-                and any(
-                    [
-                        mod_errors[key]
-                        for key in [
-                            "load_before_violations",
-                            "load_after_violations",
-                            "version_mismatch",
-                            "use_this_instead",
-                        ]
-                    ]
-                )
-            ):
-                num_warnings += 1
-                total_warning_text += f"\n\n{mod_data['name']}"
-                total_warning_text += "\n============================="
-                total_warning_text += tool_tip_text
-            # Add tooltip to item data and set the data back to the item
-            current_item_data["errors_warnings"] = tool_tip_text.strip()
-            current_item_data["warnings"] = tool_tip_text[
-                len(current_item_data["errors"]) :
-            ].strip()
-            current_item_data["errors"] = current_item_data["errors"].strip()
-            current_item.setData(Qt.ItemDataRole.UserRole, current_item_data)
-        logger.info(f"Finished recalculating {self.list_type} list errors and warnings")
-        return total_error_text, total_warning_text, num_errors, num_warnings
+            )
+        ):
+            warning_text = f"\n\n{mod_data['name']}"
+            warning_text += "\n============================="
+            warning_text += tool_tip_text
+        # Add tooltip to item data and set the data back to the item
+        current_item_data["errors_warnings"] = tool_tip_text.strip()
+        current_item_data["warnings"] = tool_tip_text[
+            len(current_item_data["errors"]) :
+        ].strip()
+        current_item_data["errors"] = current_item_data["errors"].strip()
+        current_item.setData(Qt.ItemDataRole.UserRole, current_item_data)
+        return error_text, warning_text
 
     def _has_replacement(
-        self, package_id: str, dep: str, package_ids_set: set[str]
+        self, package_id: str, dep: str, package_ids_set: AbstractSet[str]
     ) -> bool:
         # Get a list of mods that can replace this mod
         replacements = KNOWN_MOD_REPLACEMENTS.get(dep, set())
@@ -2039,27 +2383,52 @@ class ModListWidget(QListWidget):
 
     def recreate_mod_list(self, list_type: str, uuids: list[str]) -> None:
         """
-        Clear all mod items and add new ones from a dict.
+        Clear all mod items and add new ones from a list of uuids.
 
-        :param mods: dict of mod data
+        The items and their metadata are all built up front, and inserted in a
+        single model reset instead of one row at a time. This avoids a
+        rowsInserted signal, a queued `handle_rows_inserted` call and an
+        itemChanged signal for every mod, and lays the list out once.
+
+        :param list_type: The type of mod list ("Active", "Inactive")
+        :param uuids: The uuids of the mods, in order
         """
         logger.info(f"Internally recreating {list_type} mod list")
         # Disable updates
         self.setUpdatesEnabled(False)
-        # Clear list
-        self.clear()
-        self.uuids = list()
-        if uuids:  # Insert data...
-            for uuid_key in uuids:
-                list_item = CustomListWidgetItem(self)
-                data = CustomListWidgetItemMetadata(uuid=uuid_key)
-                list_item.setData(Qt.ItemDataRole.UserRole, data)
+        items = []
+        for uuid_key in uuids:
+            list_item = CustomListWidgetItem()
+            data = CustomListWidgetItemMetadata(uuid=uuid_key)
+            # The item isn't in the list yet, there is no widget to update
+            list_item.setData(Qt.ItemDataRole.UserRole, data, avoid_emit=True)
+            items.append(list_item)
+        # Replace all items as a single reset of the model. Row signals are
+        # blocked while the list is cleared (which resets the model itself) and
+        # the items are added, then the reset tells the view to lay out all the
+        # rows at once.
+        model = self.model()
+        model.blockSignals(True)
+        try:
+            self.clear()
+            for list_item in items:
                 self.addItem(list_item)
-        else:  # ...unless we don't have mods, at which point reenable updates and exit
-            self.setUpdatesEnabled(True)
-            return
+        finally:
+            model.blockSignals(False)
+            model.beginResetModel()
+            model.endResetModel()
+        self.uuids = list(uuids)
+        # Emit the aggregated signals handle_rows_inserted / handle_rows_removed
+        # would emit per row
+        if uuids:
+            self.items_added_signal.emit(list(uuids))
+        logger.debug(
+            f"Emitting {self.list_type} list update signal after recreating list [{self.count()}]"
+        )
+        self.list_update_signal.emit(str(self.count()))
         # Enable updates and repaint
         self.setUpdatesEnabled(True)
+        self.check_widgets_visible()
         self.repaint()
 
     def toggle_warning(self, packageid: str, uuid: str) -> None:
@@ -2124,6 +2493,7 @@ class ModsPanel(QWidget):
         logger.debug("Initializing ModsPanel")
         self.metadata_manager = MetadataManager.instance()
         self.settings_controller = settings_controller
+        self.search_index = ModSearchIndex()
 
         # Base layout horizontal, sub-layouts vertical
         self.panel = QHBoxLayout()
@@ -2584,6 +2954,7 @@ class ModsPanel(QWidget):
         )
 
     def on_mod_deleted(self, uuid: str) -> None:
+        self.search_index.discard(uuid)
         if uuid in self.active_mods_list.uuids:
             index = self.active_mods_list.uuids.index(uuid)
             self.active_mods_list.takeItem(index)
@@ -2596,6 +2967,7 @@ class ModsPanel(QWidget):
             self.update_count(list_type="Inactive")
 
     def on_mod_metadata_updated(self, uuid: str) -> None:
+        self.search_index.discard(uuid)
         if uuid in self.active_mods_list.uuids:
             self.active_mods_list.rebuild_item_widget_from_uuid(uuid=uuid)
         elif uuid in self.inactive_mods_list.uuids:
@@ -2718,82 +3090,90 @@ class ModsPanel(QWidget):
             search_filter = "publishedfileid"
         elif _filter.currentText() == self.tr("Version"):
             search_filter = "version"
-        # Filter the list using any search and filter state
-        for uuid in uuids:
-            item = (
-                self.active_mods_list.item(uuids.index(uuid))
-                if list_type == "Active"
-                else self.inactive_mods_list.item(uuids.index(uuid))
+        if pattern != "":
+            filters_active = True
+        mod_list = (
+            self.active_mods_list if list_type == "Active" else self.inactive_mods_list
+        )
+        type_filter_index = (
+            self.active_data_source_filter_type_index
+            if list_type == "Active"
+            else self.inactive_data_source_filter_type_index
+        )
+        hide_invalid = (
+            self.settings_controller.settings.hide_invalid_mods_when_filtering_toggle
+        )
+        internal_local_metadata = self.metadata_manager.internal_local_metadata
+        # Match the pattern against the prebuilt search texts, instead of every item's metadata
+        pattern_filtered: set[str] = set()
+        if pattern and search_filter is not None:
+            self.search_index.sync(uuids, internal_local_metadata)
+            pattern_filtered = self.search_index.filtered_out(
+                search_filter, pattern, uuids
             )
-            if item is None:
-                continue
-            item_data = item.data(Qt.ItemDataRole.UserRole)
-            metadata = self.metadata_manager.internal_local_metadata[uuid]
-            if pattern != "":
-                filters_active = True
-            # Hide invalid items if enabled in settings
-            if self.settings_controller.settings.hide_invalid_mods_when_filtering_toggle:
-                invalid = item_data["invalid"]
-                # TODO: I dont think filtered should be set at all for invalid items... I misunderstood what it represents
-                if invalid and filters_active:
-                    item_data["filtered"] = True
-                    item.setHidden(True)
+        # Filter the list using any search and filter state. Only items whose state
+        # changes are touched, and the list is repainted once at the end.
+        mod_list.setUpdatesEnabled(False)
+        try:
+            for row, uuid in enumerate(uuids):
+                item = mod_list.item(row)
+                if item is None:
                     continue
-                elif invalid and not filters_active:
-                    item_data["filtered"] = False
-                    item.setHidden(False)
-            # Check if the item is filtered
-            item_filtered = item_data["filtered"]
-            # Check if the item should be filtered or not based on search filter
-            if search_filter == "version" and pattern:
-                versions = metadata.get("supportedversions", {}).get("li", [])
-                if isinstance(versions, str):
-                    versions = [versions]
-                if not versions or not any(
-                    pattern.lower() in v.lower() for v in versions
-                ):
+                item_data = item.data(Qt.ItemDataRole.UserRole)
+                metadata = internal_local_metadata[uuid]
+                was_filtered = item_data["filtered"]
+                # Hide invalid items if enabled in settings
+                if hide_invalid:
+                    invalid = item_data["invalid"]
+                    # TODO: I dont think filtered should be set at all for invalid items... I misunderstood what it represents
+                    if invalid and filters_active:
+                        item_data["filtered"] = True
+                        if not item.isHidden():
+                            item.setHidden(True)
+                        if not was_filtered:
+                            item.setData(Qt.ItemDataRole.UserRole, item_data)
+                        continue
+                    elif invalid and not filters_active:
+                        item_data["filtered"] = False
+                        if item.isHidden():
+                            item.setHidden(False)
+                # Check if the item is filtered
+                item_filtered = item_data["filtered"]
+                # Check if the item should be filtered or not based on search filter
+                if search_filter == "version" and pattern:
+                    if uuid in pattern_filtered:
+                        item_filtered = True
+                elif uuid in pattern_filtered:
+                    item_filtered = True
+                elif source_filter == "all":  # or data source
+                    item_filtered = False
+                elif source_filter == "git_repo":
+                    item_filtered = not metadata.get("git_repo")
+                elif source_filter == "steamcmd":
+                    item_filtered = not metadata.get("steamcmd")
+                elif source_filter != metadata.get("data_source"):
                     item_filtered = True
-            elif (
-                pattern
-                and metadata.get(search_filter)
-                and pattern.lower() not in str(metadata.get(search_filter)).lower()
-            ):
-                item_filtered = True
-            elif source_filter == "all":  # or data source
-                item_filtered = False
-            elif source_filter == "git_repo":
-                item_filtered = not metadata.get("git_repo")
-            elif source_filter == "steamcmd":
-                item_filtered = not metadata.get("steamcmd")
-            elif source_filter != metadata.get("data_source"):
-                item_filtered = True
-
-            type_filter_index = (
-                self.active_data_source_filter_type_index
-                if list_type == "Active"
-                else self.inactive_data_source_filter_type_index
-            )
 
-            if type_filter_index == 1 and not metadata.get("csharp"):
-                item_filtered = True
-            elif type_filter_index == 2 and metadata.get("csharp"):
-                item_filtered = True
+                if type_filter_index == 1 and not metadata.get("csharp"):
+                    item_filtered = True
+                elif type_filter_index == 2 and metadata.get("csharp"):
+                    item_filtered = True
 
-            # Check if the item should be filtered or hidden based on filter state
-            if filter_state:
-                item.setHidden(item_filtered)
-                if item_filtered:
-                    item_data["hidden_by_filter"] = True
+                # Check if the item should be filtered or hidden based on filter state
+                if filter_state:
+                    if item.isHidden() != item_filtered:
+                        item.setHidden(item_filtered)
+                    item_data["hidden_by_filter"] = item_filtered
                     item_filtered = False
-                else:
-                    item_data["hidden_by_filter"] = False
-            else:
-                if item_filtered and item.isHidden():
+                elif item_filtered and item.isHidden():
                     item.setHidden(False)
                     item_data["hidden_by_filter"] = False
-            # Update item data
-            item_data["filtered"] = item_filtered
-            item.setData(Qt.ItemDataRole.UserRole, item_data)
+                # Update item data, repolishing its widget only if the filtered state changed
+                item_data["filtered"] = item_filtered
+                if item_filtered != was_filtered:
+                    item.setData(Qt.ItemDataRole.UserRole, item_data)
+        finally:
+            mod_list.setUpdatesEnabled(True)
         self.mod_list_updated(
             str(len(uuids)),
             list_type,
@@ -478,6 +478,17 @@ class SettingsDialog(QDialog):
         self.sorting_topological_radio = QRadioButton(self.tr("Topologically"))
         sort_group_box_layout.addWidget(self.sorting_topological_radio)
 
+        self.sorting_alphabetical_heap_radio = QRadioButton(
+            self.tr("Alphabetically, dependencies first (fast)")
+        )
+        self.sorting_alphabetical_heap_radio.setToolTip(
+            self.tr(
+                "Loads each mod as early as its dependencies allow, picking mods alphabetically. "
+                "Much faster than sorting alphabetically on large mod lists."
+            )
+        )
+        sort_group_box_layout.addWidget(self.sorting_alphabetical_heap_radio)
+
         # Use dependencies for sorting checkbox
         self.use_moddependencies_as_loadTheseBefore = QCheckBox(
             self.tr("Use dependency rules for sorting.")
@@ -573,6 +584,17 @@ class SettingsDialog(QDialog):
         )
         group_layout.addWidget(self.db_builder_update_instead_of_overwriting_checkbox)
 
+        self.db_builder_delta_update_checkbox = QCheckBox(
+            self.tr("Only query mods updated since the database was built")
+        )
+        self.db_builder_delta_update_checkbox.setToolTip(
+            self.tr(
+                "Refresh an existing database by querying only the mods updated on the Steam Workshop since it was built,\n"
+                "and merging them into it. Builds the whole database if there is none yet."
+            )
+        )
+        group_layout.addWidget(self.db_builder_delta_update_checkbox)
+
         # Text fields
         group_box = QGroupBox()
         tab_layout.addWidget(group_box)
@@ -1206,6 +1228,50 @@ class SettingsDialog(QDialog):
         )
         group_layout.addWidget(self.update_databases_on_startup_checkbox)
 
+        self.two_phase_metadata_refresh_checkbox = QCheckBox(
+            self.tr("Load mod details in the background")
+        )
+        self.two_phase_metadata_refresh_checkbox.setToolTip(
+            self.tr(
+                "Enable this option to populate the mod lists as soon as the basic metadata of every mod is read. "
+                "Descriptions, authors and scenario details are loaded afterwards in the background."
+            )
+        )
+        group_layout.addWidget(self.two_phase_metadata_refresh_checkbox)
+
+        self.indexed_steam_db_checkbox = QCheckBox(
+            self.tr("Index the Steam DB on disk")
+        )
+        self.indexed_steam_db_checkbox.setToolTip(
+            self.tr(
+                "Enable this option to compile the Steam DB into an on-disk index the first time it is loaded, or after it changes. "
+                "Mod entries are then read from the index as needed instead of loading the entire database into memory on every refresh."
+            )
+        )
+        group_layout.addWidget(self.indexed_steam_db_checkbox)
+
+        self.paint_mod_list_rows_checkbox = QCheckBox(
+            self.tr("Paint mod list rows directly")
+        )
+        self.paint_mod_list_rows_checkbox.setToolTip(
+            self.tr(
+                "Enable this option to draw the rows of the mod lists directly instead of creating a widget for each row. "
+                "Scrolling through large mod lists is smoother and uses less memory. Requires a restart."
+            )
+        )
+        group_layout.addWidget(self.paint_mod_list_rows_checkbox)
+
+        self.cache_preview_thumbnails_checkbox = QCheckBox(
+            self.tr("Cache preview image thumbnails on disk")
+        )
+        self.cache_preview_thumbnails_checkbox.setToolTip(
+            self.tr(
+                "Enable this option to keep downscaled copies of large mod preview images on disk. "
+                "Previews of mods that were viewed before are then shown faster."
+            )
+        )
+        group_layout.addWidget(self.cache_preview_thumbnails_checkbox)
+
         run_args_group = QGroupBox()
         tab_layout.addWidget(run_args_group)
 
@@ -151,9 +151,8 @@ class MissingDependenciesDialog(QDialog):
         for mod_id, deps in missing_deps.items():
             mod_name = self.metadata_manager.get_mod_name_from_package_id(mod_id)
             for dep_id in deps:
-                exists_locally = any(
-                    mod_data.get("packageid") == dep_id
-                    for mod_data in self.metadata_manager.internal_local_metadata.values()
+                exists_locally = bool(
+                    self.metadata_manager.packageid_to_uuids.get(dep_id)
                 )
                 target_dict = local_deps if exists_locally else download_deps
                 if dep_id not in target_dict:
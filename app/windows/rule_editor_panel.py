@@ -153,15 +153,9 @@ class RuleEditor(QWidget):
         self.user_rules_hidden: bool = False
         # Can be used to get proper names for mods found in list
         # items that are not locally available
-        self.steam_workshop_metadata_packageids_to_name = {}
-        external_steam_metadata = self.metadata_manager.external_steam_metadata
-        if external_steam_metadata and len(external_steam_metadata.keys()) > 0:
-            for metadata in external_steam_metadata.values():
-                package_id = metadata.get("packageId") or metadata.get("packageid")
-                if package_id:
-                    self.steam_workshop_metadata_packageids_to_name[package_id] = (
-                        metadata["name"]
-                    )
+        self.steam_workshop_metadata_packageids_to_name = (
+            self.metadata_manager.steamdb_packageid_to_name
+        )
 
         # MOD LABEL
         self.mod_label = QLabel(self.tr("No mod currently being edited"))
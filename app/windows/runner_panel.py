@@ -1,11 +1,12 @@
 import os
+import shutil
+from collections.abc import Mapping
 from platform import system
-from re import compile, findall, search
 from typing import Any, Optional, Sequence
 
 import psutil
 from loguru import logger
-from PySide6.QtCore import QProcess, Qt, Signal
+from PySide6.QtCore import QProcess, Qt, QTimer, Signal
 from PySide6.QtGui import QCloseEvent, QFont, QIcon, QKeyEvent, QTextCursor
 from PySide6.QtWidgets import (
     QHBoxLayout,
@@ -18,6 +19,7 @@ from PySide6.QtWidgets import (
 )
 
 from app.utils.app_info import AppInfo
+from app.utils.runner_output import RunnerOutputPipeline
 from app.utils.steam.webapi.wrapper import (
     ISteamRemoteStorage_GetPublishedFileDetails,
 )
@@ -27,11 +29,19 @@ from app.views.dialogue import (
     show_dialogue_file,
 )
 
+# Lines of output kept in the panel, the full output is kept in the runner log
+MAX_SCROLLBACK_LINES = 10000
+# Milliseconds between two refreshes of the output
+OUTPUT_FLUSH_INTERVAL = 50
+
 
 class RunnerPanel(QWidget):
     """
     A generic, read-only panel that can be used to display output from something.
     It also has a built-in QProcess functionality.
+
+    Output is parsed on a worker thread, and displayed in batches at most every
+    OUTPUT_FLUSH_INTERVAL milliseconds, so chatty processes don't flood the GUI thread.
     """
 
     closing_signal = Signal()
@@ -41,7 +51,7 @@ class RunnerPanel(QWidget):
         self,
         todds_dry_run_support: bool = False,
         steamcmd_download_tracking: Optional[list[str]] = None,
-        steam_db: Optional[dict[str, Any]] = None,
+        steam_db: Optional[Mapping[str, Any]] = None,
     ):
         """
         Initialize the RunnerPanel widget.
@@ -55,7 +65,6 @@ class RunnerPanel(QWidget):
         logger.debug("Initializing RunnerPanel")
 
         # Initialize instance variables
-        self.ansi_escape = compile(r"\x1B\[[0-?]*[ -/]*[@-~]")
         self.system = system()
         self.installEventFilter(self)
         self.previous_line = ""
@@ -71,6 +80,13 @@ class RunnerPanel(QWidget):
         self.process_last_args: Sequence[str] = []
         self.steamcmd_current_pfid: Optional[str] = None
 
+        # Output pipeline, flushed to the display by a timer
+        self.output = RunnerOutputPipeline(AppInfo().user_log_folder / "runner")
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(OUTPUT_FLUSH_INTERVAL)
+        self._flush_timer.timeout.connect(self._flush_output)
+
         # Set up UI components
         self._setup_text_display()
         self._setup_buttons()
@@ -89,6 +105,8 @@ class RunnerPanel(QWidget):
         self.text.verticalScrollBar().setValue(self.text.verticalScrollBar().maximum())
         self.text.setReadOnly(True)
         self.text.setObjectName("RunnerPanelText")
+        # Oldest lines are dropped past this
+        self.text.setMaximumBlockCount(MAX_SCROLLBACK_LINES)
 
         # Set font based on platform
         font_mapping = {
@@ -184,6 +202,8 @@ class RunnerPanel(QWidget):
     def closeEvent(self, event: QCloseEvent) -> None:
         self.closing_signal.emit()
         self._do_kill_process()
+        self._flush_timer.stop()
+        self.output.close()
         event.accept()
         self.destroy()
 
@@ -269,10 +289,15 @@ class RunnerPanel(QWidget):
 
             logger.info(f"Saving output to: {file_path}")
 
-            # Save the text content to the file
+            # Save the full output from the log if there is one, the display only keeps the
+            # latest lines
             try:
-                with open(file_path, "w", encoding="utf-8") as outfile:
-                    outfile.write(self.text.toPlainText())
+                if self.output.log is not None:
+                    self.output.wait()
+                    shutil.copyfile(self.output.log.name, file_path)
+                else:
+                    with open(file_path, "w", encoding="utf-8") as outfile:
+                        outfile.write(self.text.toPlainText())
                 logger.info("Output successfully saved")
             except IOError as e:
                 logger.error(f"Error writing to file: {e}")
@@ -335,135 +360,76 @@ class RunnerPanel(QWidget):
 
     def handle_output(self) -> None:
         data = self.process.readAll()
-        stdout = self.ansi_escape.sub("", bytes(data.data()).decode("utf8"))
-        self.message(stdout)
+        self.output.feed(bytes(data.data()), self._running_program())
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
 
     def message(self, line: str) -> None:
         """
-        Process and display a message in the output panel.
+        Queue a message to be displayed in the output panel.
 
-        This method handles special formatting and progress tracking for different
-        types of processes (steamcmd, todds, query).
+        Messages go through the same pipeline as process output, which handles special
+        formatting and progress tracking for different types of processes (steamcmd, todds,
+        query).
 
         Args:
             line: The text line to process and display
         """
-        # Default behavior is to append the line
-        overwrite = False
-
-        # Log the message with appropriate context
-        if self.process and self.process.state() == QProcess.ProcessState.Running:
-            program_name = self.process.program().split("/")[-1]
-            logger.debug(f"[{program_name}]\n{line}")
+        program = self._running_program()
+        if program:
+            logger.debug(f"[{program.split('/')[-1]}]\n{line}")
         else:
             logger.debug(f"{line}")
+        self.output.feed(line, program)
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
 
-        # Process specific handlers
-        if self._is_process_running("steamcmd"):
-            overwrite = self._handle_steamcmd_output(line)
-        elif self._is_process_running("todds"):
-            overwrite = self._handle_todds_output(line)
-
-        # Handle query progress output (applies to any process)
-        query_overwrite = self._handle_query_output(line)
-        overwrite = overwrite or query_overwrite
-
-        # Display the line (either by overwriting the last line or appending)
-        if overwrite:
-            self._overwrite_last_line(line.strip())
-        else:
-            self.text.appendPlainText(line)
-
-        # Store the line for potential future reference
-        self.previous_line = line
+    def _running_program(self) -> str:
+        """Return the program currently running, or an empty string."""
+        if not self.process or self.process.state() != QProcess.ProcessState.Running:
+            return ""
+        return self.process.program()
 
     def _is_process_running(self, program_name: str) -> bool:
         """Check if a specific process is currently running."""
-        if not self.process:
-            return False
-        if self.process.state() != QProcess.ProcessState.Running:
-            return False
-        return program_name in self.process.program()
-
-    def _handle_steamcmd_output(self, line: str) -> bool:
-        """
-        Process steamcmd-specific output.
-
-        Returns:
-            bool: True if the line should overwrite the previous line
-        """
-        overwrite = False
-
-        # Track current download item
-        if "Downloading item " in line:
-            match = search(r"Downloading item (\d+)...", line)
-            if match:
-                self.steamcmd_current_pfid = match.group(1)
-
-        # Determine if this line should overwrite the previous one
-        if any(
-            pattern in line
-            for pattern in [
-                "] Downloading update (",
-                "] Installing update",
-                "] Extracting package",
-            ]
-        ):
-            overwrite = True
-
-        # Format specific lines for better readability
-        if "workshop_download_item" in line:
-            line = line.replace("workshop_download_item", "\n\nworkshop_download_item")
-        elif ") quit" in line:
-            line = line.replace(") quit", ")\n\nquit")
-
-        # Handle download success and errors
-        success_matches = findall(r"Success. Downloaded item (\d+)", line)
-        if success_matches:
-            for success_pfid in success_matches:
-                if success_pfid in self.steamcmd_download_tracking:
-                    self.steamcmd_download_tracking.remove(success_pfid)
-                    self.progress_bar.setValue(self.progress_bar.value() + 1)
-        elif "ERROR! Download item " in line:
-            self.change_progress_bar_color("warn")
-            self.progress_bar.setValue(self.progress_bar.value() + 1)
-        elif "ERROR! Not logged on." in line:
-            self.change_progress_bar_color("critical")
-            self.progress_bar.setValue(self.progress_bar.value() + 1)
-
-        return overwrite
-
-    def _handle_todds_output(self, line: str) -> bool:
-        """
-        Process todds-specific output.
-
-        Returns:
-            bool: True if the line should overwrite the previous line
-        """
-        match = search(r"Progress: (\d+)/(\d+)", line)
-        if match:
-            self.progress_bar.setRange(0, int(match.group(2)))
-            self.progress_bar.setValue(int(match.group(1)))
-            return True
-        return False
-
-    def _handle_query_output(self, line: str) -> bool:
-        """
-        Process query-specific output.
-
-        Returns:
-            bool: True if the line should overwrite the previous line
-        """
-        match = search(
-            r"IPublishedFileService/(QueryFiles|GetDetails) (page|chunk) \[(\d+)\/(\d+)\]",
-            line,
-        )
-        if match:
-            operation, pagination, start, end = match.groups()
-            self.progress_bar.setRange(0, int(end))
-            self.progress_bar.setValue(int(start))
-            return True
-        return False
+        return program_name in self._running_program()
+
+    def _flush_output(self) -> None:
+        """Display the output parsed since the last flush, in a single update."""
+        lines: list[str] = []
+        overwrite_last: Optional[str] = None
+        progress_maximum: Optional[int] = None
+        progress_value = self.progress_bar.value()
+        for output in self.output.drain():
+            if output.steamcmd_pfid is not None:
+                self.steamcmd_current_pfid = output.steamcmd_pfid
+            for pfid in output.steamcmd_downloaded:
+                if pfid in self.steamcmd_download_tracking:
+                    self.steamcmd_download_tracking.remove(pfid)
+                    progress_value += 1
+            if output.progress_state is not None:
+                self.change_progress_bar_color(output.progress_state)
+            progress_value += output.progress_step
+            if output.progress is not None:
+                progress_value, progress_maximum = output.progress
+            # Display the line (either by overwriting the last line or appending)
+            if not output.overwrite:
+                lines.append(output.text)
+            elif lines:
+                lines[-1] = output.text
+            else:
+                overwrite_last = output.text
+            self.previous_line = output.text
+        if progress_maximum is not None:
+            self.progress_bar.setRange(0, progress_maximum)
+        if progress_value != self.progress_bar.value():
+            self.progress_bar.setValue(progress_value)
+        if overwrite_last is not None:
+            self._overwrite_last_line(overwrite_last)
+        if lines:
+            self.text.appendPlainText("\n".join(lines))
+        if self.output.pending() and not self._flush_timer.isActive():
+            self._flush_timer.start()
 
     def _overwrite_last_line(self, text: str) -> None:
         """Replace the last line in the text display with the given text."""
@@ -480,6 +446,10 @@ class RunnerPanel(QWidget):
         """
         Handle process completion, including success/failure reporting and cleanup.
         """
+        # Display all output, and update download tracking, before reporting completion
+        self.output.wait()
+        self._flush_output()
+
         # Skip detailed output in dry run mode
         if not self.todds_dry_run_support:
             # Show completion status
@@ -0,0 +1,98 @@
+import argparse
+import random
+import sys
+import timeit
+from typing import Any, Callable
+from unittest.mock import MagicMock, patch
+
+from loguru import logger
+
+from app.sort.alphabetical_sort import do_alphabetical_heap_sort, do_alphabetical_sort
+from app.utils.metadata import MetadataManager
+
+
+def generate_mods(
+    count: int, rules: int, chain: int
+) -> tuple[dict[str, Any], dict[str, set[str]]]:
+    """generate metadata and an acyclic dependency graph, ending with a chain of mods each depending on the next"""
+    package_ids = [f"author{i % 100}.mod{i}" for i in range(count)]
+    mods = {
+        f"uuid-{i}": {"packageid": package_id, "name": f"Mod {random.random()}"}
+        for i, package_id in enumerate(package_ids)
+    }
+    dependency_graph: dict[str, set[str]] = {}
+    for i, package_id in enumerate(package_ids):
+        # Depend on mods earlier in the list, so the graph has no loops
+        dependency_graph[package_id] = (
+            set(random.sample(package_ids[:i], min(i, random.randrange(rules + 1))))
+            if i < count - chain
+            else set()
+        )
+    for i in range(count - chain, count - 1):
+        dependency_graph[package_ids[i]].add(package_ids[i + 1])
+    return mods, dependency_graph
+
+
+def time_sort(
+    sort: Callable[[dict[str, set[str]], set[str]], list[str]],
+    dependency_graph: dict[str, set[str]],
+    active_uuids: set[str],
+    repeat: int,
+) -> str:
+    try:
+        seconds = min(
+            timeit.repeat(
+                lambda: sort(dependency_graph, active_uuids),
+                number=1,
+                repeat=repeat,
+            )
+        )
+    except RecursionError:
+        return "RecursionError"
+    return f"{seconds * 1000:.1f} ms"
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(
+        description="Time the alphabetical dependency sorts"
+    )
+    arg_parser.add_argument("--mods", type=int, default=1000, help="number of mods")
+    arg_parser.add_argument(
+        "--rules", type=int, default=3, help="maximum dependencies per mod"
+    )
+    arg_parser.add_argument(
+        "--chain",
+        type=int,
+        default=0,
+        help="length of a chain of mods depending on each other",
+    )
+    arg_parser.add_argument(
+        "--repeat", type=int, default=3, help="number of timed passes"
+    )
+    args = arg_parser.parse_args()
+
+    logger.remove()
+    logger.add(sys.stderr, level="WARNING")
+
+    random.seed(0)
+    mods, dependency_graph = generate_mods(args.mods, args.rules, args.chain)
+    active_uuids = set(mods)
+
+    metadata_manager = MagicMock()
+    metadata_manager.internal_local_metadata = mods
+    with patch.object(MetadataManager, "instance", return_value=metadata_manager):
+        print(
+            f"{args.mods} mods, up to {args.rules} dependencies each,"
+            f" chain of {args.chain}"
+        )
+        for name, sort in (
+            ("do_alphabetical_sort", do_alphabetical_sort),
+            ("do_alphabetical_heap_sort", do_alphabetical_heap_sort),
+        ):
+            print(
+                f"{name}: {time_sort(sort, dependency_graph, active_uuids, args.repeat)}"
+            )
+
+
+if __name__ == "__main__":
+    main()
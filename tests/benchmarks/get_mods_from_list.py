@@ -0,0 +1,87 @@
+import argparse
+import random
+import sys
+import timeit
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+from loguru import logger
+
+from app.utils.metadata import MetadataManager, get_mods_from_list
+
+
+def generate_mods(
+    installed: int, duplicates: float
+) -> tuple[dict[str, Any], list[str]]:
+    """generate metadata for installed mods, some of them installed from several sources"""
+    package_ids = [f"author{i % 100}.mod{i}" for i in range(installed)]
+    mods = {}
+    for i in range(installed):
+        package_id = (
+            random.choice(package_ids)
+            if random.random() < duplicates
+            else package_ids[i]
+        )
+        data_source = random.choice(["local", "workshop"])
+        mods[f"uuid-{i}"] = {
+            "packageid": package_id,
+            "path": f"/mods/{data_source}/{i}",
+            "data_source": data_source,
+        }
+    return mods, package_ids
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(
+        description="Time populating the mod lists from a list of active package ids"
+    )
+    arg_parser.add_argument(
+        "--installed", type=int, default=5000, help="number of installed mods"
+    )
+    arg_parser.add_argument(
+        "--active", type=int, default=1000, help="number of active package ids"
+    )
+    arg_parser.add_argument(
+        "--duplicates",
+        type=float,
+        default=0.05,
+        help="fraction of installed mods that duplicate another mod's package id",
+    )
+    arg_parser.add_argument(
+        "--repeat", type=int, default=5, help="number of timed passes"
+    )
+    args = arg_parser.parse_args()
+
+    logger.remove()
+    logger.add(sys.stderr, level="WARNING")
+
+    random.seed(0)
+    mods, package_ids = generate_mods(args.installed, args.duplicates)
+    active = random.sample(package_ids, min(args.active, len(package_ids)))
+    # Some mod lists refer to the Steam copy of a mod
+    active = [
+        f"{package_id}_steam" if random.random() < 0.1 else package_id
+        for package_id in active
+    ]
+
+    metadata_manager = MagicMock()
+    metadata_manager.internal_local_metadata = mods
+    with patch.object(MetadataManager, "instance", return_value=metadata_manager):
+        active_uuids, inactive_uuids, duplicate_mods, missing_mods = get_mods_from_list(
+            list(active)
+        )
+        seconds = min(
+            timeit.repeat(
+                lambda: get_mods_from_list(list(active)), number=1, repeat=args.repeat
+            )
+        )
+    print(
+        f"{args.installed} installed / {len(active)} active mods:"
+        f" {len(active_uuids)} active, {len(inactive_uuids)} inactive,"
+        f" {len(duplicate_mods)} duplicated, {len(missing_mods)} missing"
+    )
+    print(f"get_mods_from_list: {seconds * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+from typing import Callable
+from zipfile import ZIP_DEFLATED, ZIP_STORED, ZipFile
+
+from loguru import logger
+
+from app.utils.zip_compress import write_files_to_zip
+
+
+def generate_instance(folder: str, files: int, size: int) -> list[tuple[str, str]]:
+    """generate a folder of mod-like files, mostly xml with some textures, returning (path, name in the archive) of each"""
+    archive_files = []
+    for i in range(files):
+        sub_folder = os.path.join(folder, f"Mod{i % 20}", f"Folder{i % 50}")
+        os.makedirs(sub_folder, exist_ok=True)
+        if i % 10 == 0:
+            path = os.path.join(sub_folder, f"Texture{i}.dds")
+            with open(path, "wb") as f:
+                f.write(random.randbytes(size * 4))
+        else:
+            path = os.path.join(sub_folder, f"Def{i}.xml")
+            with open(path, "w") as f:
+                f.write((f"<Defs><ThingDef>{i}</ThingDef></Defs>\n" * size)[:size])
+        archive_files.append((path, os.path.relpath(path, folder)))
+    return archive_files
+
+
+def write_serial(compression: int) -> Callable[[ZipFile, list[tuple[str, str]]], None]:
+    """the previous compression, one ZipFile.write per file"""
+
+    def write(archive: ZipFile, archive_files: list[tuple[str, str]]) -> None:
+        for path, arcname in archive_files:
+            archive.write(path, arcname, compress_type=compression)
+
+    return write
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(
+        description="Time instance archive compression on a synthetic instance folder"
+    )
+    arg_parser.add_argument("--files", type=int, default=5000, help="number of files")
+    arg_parser.add_argument(
+        "--size", type=int, default=16384, help="size of each xml file in bytes"
+    )
+    arg_parser.add_argument(
+        "--workers", type=int, default=None, help="worker threads of write_files_to_zip"
+    )
+    args = arg_parser.parse_args()
+
+    logger.remove()
+    logger.add(sys.stderr, level="WARNING")
+
+    random.seed(0)
+    with tempfile.TemporaryDirectory() as work_dir:
+        archive_files = generate_instance(
+            os.path.join(work_dir, "instance"), args.files, args.size
+        )
+        print(f"{args.files} files, {os.cpu_count()} CPUs")
+        for name, write in (
+            ("ZipFile.write (stored)", write_serial(ZIP_STORED)),
+            ("ZipFile.write (deflated)", write_serial(ZIP_DEFLATED)),
+            (
+                "write_files_to_zip",
+                lambda archive, archive_files: write_files_to_zip(
+                    archive, archive_files, max_workers=args.workers
+                ),
+            ),
+        ):
+            zip_path = os.path.join(work_dir, "instance.zip")
+            start = time.perf_counter()
+            with ZipFile(zip_path, "w") as archive:
+                write(archive, archive_files)
+            elapsed = time.perf_counter() - start
+            print(
+                f"{name}: {elapsed * 1000:.0f} ms,"
+                f" {os.path.getsize(zip_path) / 1024 / 1024:.1f} MiB"
+            )
+            os.remove(zip_path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+import argparse
+import json
+import random
+import sys
+import tempfile
+import timeit
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable
+
+import msgspec
+from loguru import logger
+
+from app.models.metadata.metadata_structure import ExternalRulesFile, SteamDbFile
+from app.utils.steam_db_index import IndexedSteamDatabase
+
+
+def generate_steam_db(path: Path, entries: int) -> None:
+    """write a synthetic Steam DB shaped like the published one"""
+    database = {}
+    for i in range(entries):
+        pfid = str(1_000_000 + i)
+        database[pfid] = {
+            "url": f"https://steamcommunity.com/sharedfiles/filedetails/?id={pfid}",
+            "packageId": f"author{i}.mod{i}",
+            "gameVersions": ["1.4", "1.5"],
+            "steamName": f"Mod {i}",
+            "name": f"Mod {i}",
+            "authors": ["someone"],
+            "dependencies": {
+                str(1_000_000 + random.randrange(entries)): [
+                    "Dependency",
+                    "https://steamcommunity.com/sharedfiles/filedetails/",
+                ]
+            },
+        }
+    path.write_text(json.dumps({"version": 1700000000, "database": database}))
+
+
+def generate_community_rules(path: Path, entries: int) -> None:
+    """write synthetic community rules"""
+    rules = {
+        f"author{i}.mod{i}": {
+            "loadAfter": {
+                f"author{i + 1}.mod{i + 1}": {"name": [f"Mod {i + 1}"], "comment": [""]}
+            }
+        }
+        for i in range(entries)
+    }
+    path.write_text(json.dumps({"timestamp": 1700000000, "rules": rules}))
+
+
+def measure(load: Callable[[], Any], repeat: int) -> tuple[float, float]:
+    """return the best load time (in seconds) and the memory (in MB) held by the result"""
+    seconds = min(timeit.repeat(load, number=1, repeat=repeat))
+    tracemalloc.start()
+    result = load()
+    retained = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del result
+    return seconds, retained / 1e6
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(
+        description="Compare load time and memory of the external metadata DBs"
+    )
+    arg_parser.add_argument("--steam-db", help="path to a steamDB.json")
+    arg_parser.add_argument("--community-rules", help="path to a communityRules.json")
+    arg_parser.add_argument(
+        "--synthetic",
+        type=int,
+        default=100_000,
+        help="number of entries to generate for DBs that are not supplied",
+    )
+    arg_parser.add_argument(
+        "--repeat", type=int, default=5, help="number of timed loads per loader"
+    )
+    args = arg_parser.parse_args()
+
+    logger.remove()
+    logger.add(sys.stderr, level="WARNING")
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        steam_db = Path(args.steam_db or Path(temp_dir) / "steamDB.json")
+        if not args.steam_db:
+            generate_steam_db(steam_db, args.synthetic)
+        community_rules = Path(
+            args.community_rules or Path(temp_dir) / "communityRules.json"
+        )
+        if not args.community_rules:
+            generate_community_rules(community_rules, args.synthetic)
+        index_folder = Path(temp_dir) / "index"
+        # Build the index up front, like the first load after a Steam DB update
+        IndexedSteamDatabase.open_or_build(str(steam_db), index_folder)
+
+        loaders: dict[str, Callable[[], Any]] = {
+            "Steam DB: json.loads": lambda: json.loads(
+                steam_db.read_text(encoding="utf-8")
+            )["database"],
+            "Steam DB: msgspec SteamDbFile": lambda: (
+                msgspec.json.decode(
+                    steam_db.read_bytes(), type=SteamDbFile, strict=False
+                ).database
+            ),
+            "Steam DB: IndexedSteamDatabase": lambda: (
+                IndexedSteamDatabase.open_or_build(str(steam_db), index_folder)
+            ),
+            "Community Rules: json.loads": lambda: json.loads(
+                community_rules.read_text(encoding="utf-8")
+            )["rules"],
+            "Community Rules: msgspec ExternalRulesFile": lambda: (
+                msgspec.json.decode(
+                    community_rules.read_bytes(), type=ExternalRulesFile, strict=False
+                ).rules
+            ),
+        }
+        print("-" * 80)
+        for name, load in loaders.items():
+            seconds, megabytes = measure(load, args.repeat)
+            print(f"{name:<48} {seconds * 1000:>9.1f} ms {megabytes:>9.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+import argparse
+import sys
+import time
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+from loguru import logger
+from PySide6.QtWidgets import QApplication
+
+from app.views.mods_panel import ModListWidget
+
+
+def generate_mods(count: int) -> dict[str, Any]:
+    """generate metadata for mods from every source, some of them with missing dependencies"""
+    mods = {}
+    for i in range(count):
+        mods[f"uuid-{i}"] = {
+            "uuid": f"uuid-{i}",
+            "packageid": f"author{i % 100}.mod{i}",
+            "name": f"Mod {i} " + "with a long name " * (i % 4),
+            "path": f"/mods/{i}",
+            "data_source": ["expansion", "local", "workshop"][i % 3],
+            "dependencies": {f"missing.mod{i}"} if i % 7 == 0 else set(),
+            "supportedversions": {"li": "1.5"},
+        }
+    return mods
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(
+        description="Time creating and scrolling the mod list, with row widgets or painted rows"
+    )
+    arg_parser.add_argument("--mods", type=int, default=3000, help="number of mods")
+    arg_parser.add_argument(
+        "--painted",
+        action=argparse.BooleanOptionalAction,
+        default=True,
+        help="paint rows with a delegate instead of creating a widget for every row",
+    )
+    args = arg_parser.parse_args()
+
+    logger.remove()
+    logger.add(sys.stderr, level="WARNING")
+
+    app = QApplication.instance() or QApplication([])
+    mods = generate_mods(args.mods)
+    metadata_manager = MagicMock()
+    metadata_manager.internal_local_metadata = mods
+    # Plain functions, MagicMock calls would dominate the timings
+    metadata_manager.is_version_mismatch = lambda uuid: False
+    metadata_manager.has_alternative_mod = lambda uuid: None
+    metadata_manager.steamdb_packageid_to_name = {}
+
+    settings_controller = MagicMock()
+    settings_controller.settings.paint_mod_list_rows = args.painted
+    settings_controller.settings.mod_type_filter_toggle = True
+    settings_controller.settings.external_use_this_instead_metadata_source = "None"
+
+    with patch("app.utils.metadata.MetadataManager.instance", lambda: metadata_manager):
+        mod_list = ModListWidget("Active", settings_controller)
+        mod_list.resize(400, 800)
+        mod_list.show()
+
+        start = time.perf_counter()
+        mod_list.recreate_mod_list("Active", list(mods))
+        mod_list.recalculate_internal_errors_warnings()
+        app.processEvents()
+        print(f"create: {(time.perf_counter() - start) * 1000:.0f} ms")
+
+        # Scroll through the list a page at a time, repainting every page
+        scroll_bar = mod_list.verticalScrollBar()
+        start = time.perf_counter()
+        for value in range(0, scroll_bar.maximum() + 1, scroll_bar.pageStep()):
+            scroll_bar.setValue(value)
+            mod_list.viewport().repaint()
+        print(f"scroll: {(time.perf_counter() - start) * 1000:.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
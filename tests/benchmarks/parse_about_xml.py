@@ -0,0 +1,77 @@
+import argparse
+import os
+import sys
+import timeit
+from pathlib import Path
+from typing import Any, Callable
+
+from loguru import logger
+
+from app.utils.xml import about_xml_path_to_json, xml_path_to_json
+
+DEFAULT_CORPUS = str(Path(__file__).parent.parent / "data" / "mod_examples")
+
+
+def find_about_xml_files(mods_path: str) -> list[str]:
+    """find all About.xml files in a mods directory"""
+    about_files = []
+    for root, _, files in os.walk(mods_path):
+        for file in files:
+            if file.lower() == "about.xml":
+                about_files.append(os.path.join(root, file))
+    return about_files
+
+
+def bench(
+    parser: Callable[[str], dict[str, Any]], files: list[str], repeat: int
+) -> float:
+    """return the best time (in seconds) to parse every file once"""
+    return min(
+        timeit.repeat(lambda: [parser(file) for file in files], number=1, repeat=repeat)
+    )
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(
+        description="Compare the About.xml parsers over a mods directory"
+    )
+    arg_parser.add_argument(
+        "mods_path",
+        nargs="?",
+        default=DEFAULT_CORPUS,
+        help="directory to search for About.xml files (default: tests/data/mod_examples)",
+    )
+    arg_parser.add_argument(
+        "--repeat", type=int, default=50, help="number of timed passes per parser"
+    )
+    args = arg_parser.parse_args()
+
+    # Parsers log malformed files, which would dominate the timings
+    logger.remove()
+    logger.add(sys.stderr, level="WARNING")
+
+    files = find_about_xml_files(args.mods_path)
+    if not files:
+        print(f"Error: No About.xml files found in {args.mods_path}")
+        return
+    print(f"Found {len(files)} About.xml files")
+
+    results = {
+        "xml_path_to_json (xmltodict + BeautifulSoup fallback)": bench(
+            xml_path_to_json, files, args.repeat
+        ),
+        "about_xml_path_to_json (recovering lxml parser)": bench(
+            about_xml_path_to_json, files, args.repeat
+        ),
+    }
+    baseline = next(iter(results.values()))
+    print("-" * 80)
+    for name, seconds in results.items():
+        print(
+            f"{name:<56} {seconds * 1000:>9.2f} ms {baseline / seconds:>6.2f}x"
+            f" ({seconds / len(files) * 1e6:.1f} µs/file)"
+        )
+
+
+if __name__ == "__main__":
+    main()
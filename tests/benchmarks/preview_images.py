@@ -0,0 +1,72 @@
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from loguru import logger
+from PySide6.QtGui import QColor, QGuiApplication, QImage, QPainter, QPixmap
+
+from app.utils.preview_image_loader import find_preview_image, load_thumbnail
+
+
+def generate_mods(folder: Path, count: int, size: int) -> list[str]:
+    """generate mod folders with a noisy About/Preview.png each"""
+    mod_paths = []
+    for i in range(count):
+        about_path = folder / f"mod{i}" / "About"
+        about_path.mkdir(parents=True)
+        image = QImage(size, size, QImage.Format.Format_RGB32)
+        image.fill(QColor.fromHsv(i * 37 % 360, 200, 200))
+        painter = QPainter(image)
+        for j in range(0, size, 16):
+            painter.drawLine(0, j, size, size - j)
+        painter.end()
+        image.save(str(about_path / "Preview.png"))
+        mod_paths.append(str(folder / f"mod{i}"))
+    return mod_paths
+
+
+def load_full_size(mod_path: str) -> QPixmap:
+    """the previous loading, reading the full size image on the GUI thread"""
+    image_path = find_preview_image(mod_path)
+    return QPixmap(image_path) if image_path is not None else QPixmap()
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(
+        description="Time loading mod preview images, full size and as cached thumbnails"
+    )
+    arg_parser.add_argument("--mods", type=int, default=20, help="number of mods")
+    arg_parser.add_argument(
+        "--size", type=int, default=3840, help="width and height of the previews"
+    )
+    args = arg_parser.parse_args()
+
+    logger.remove()
+    logger.add(sys.stderr, level="WARNING")
+    app = QGuiApplication.instance() or QGuiApplication(sys.argv)  # noqa: F841
+
+    with tempfile.TemporaryDirectory() as work_dir:
+        mod_paths = generate_mods(Path(work_dir) / "mods", args.mods, args.size)
+        cache_folder = Path(work_dir) / "thumbnails"
+        print(f"{args.mods} mods, {args.size}x{args.size} previews")
+
+        start = time.perf_counter()
+        for mod_path in mod_paths:
+            load_full_size(mod_path)
+        elapsed = time.perf_counter() - start
+        print(f"full size: {elapsed / args.mods * 1000:.0f} ms per preview")
+
+        for name in ("thumbnail, first view", "thumbnail, cached on disk"):
+            start = time.perf_counter()
+            for mod_path in mod_paths:
+                image_path = find_preview_image(mod_path)
+                assert image_path is not None
+                load_thumbnail(image_path, cache_folder)
+            elapsed = time.perf_counter() - start
+            print(f"{name}: {elapsed / args.mods * 1000:.0f} ms per preview")
+
+
+if __name__ == "__main__":
+    main()
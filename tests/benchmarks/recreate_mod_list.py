@@ -0,0 +1,99 @@
+import argparse
+import sys
+import time
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+from loguru import logger
+from PySide6.QtCore import Qt
+from PySide6.QtWidgets import QApplication
+
+from app.utils.custom_list_widget_item import CustomListWidgetItem
+from app.utils.custom_list_widget_item_metadata import CustomListWidgetItemMetadata
+from app.views.mods_panel import ModListWidget
+
+
+def generate_mods(count: int) -> dict[str, Any]:
+    """generate metadata for mods from every source"""
+    return {
+        f"uuid-{i}": {
+            "uuid": f"uuid-{i}",
+            "packageid": f"author{i % 100}.mod{i}",
+            "name": f"Mod {i}",
+            "path": f"/mods/{i}",
+            "data_source": ["expansion", "local", "workshop"][i % 3],
+            "supportedversions": {"li": "1.5"},
+        }
+        for i in range(count)
+    }
+
+
+def recreate_per_row(mod_list: ModListWidget, uuids: list[str]) -> None:
+    """the previous insertion, one item (and one rowsInserted signal) at a time"""
+    mod_list.setUpdatesEnabled(False)
+    mod_list.clear()
+    mod_list.uuids = []
+    for uuid in uuids:
+        list_item = CustomListWidgetItem(mod_list)
+        list_item.setData(
+            Qt.ItemDataRole.UserRole, CustomListWidgetItemMetadata(uuid=uuid)
+        )
+        mod_list.addItem(list_item)
+    mod_list.setUpdatesEnabled(True)
+    mod_list.repaint()
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(
+        description="Time recreating a mod list, per row or in a single model reset"
+    )
+    arg_parser.add_argument("--mods", type=int, default=2000, help="number of mods")
+    arg_parser.add_argument(
+        "--painted",
+        action=argparse.BooleanOptionalAction,
+        default=True,
+        help="paint rows with a delegate instead of creating a widget for every row",
+    )
+    args = arg_parser.parse_args()
+
+    logger.remove()
+    logger.add(sys.stderr, level="WARNING")
+
+    app = QApplication.instance() or QApplication([])
+    mods = generate_mods(args.mods)
+    metadata_manager = MagicMock()
+    metadata_manager.internal_local_metadata = mods
+    # Plain functions, MagicMock calls would dominate the timings
+    metadata_manager.is_version_mismatch = lambda uuid: False
+    metadata_manager.has_alternative_mod = lambda uuid: None
+
+    settings_controller = MagicMock()
+    settings_controller.settings.paint_mod_list_rows = args.painted
+    settings_controller.settings.external_use_this_instead_metadata_source = "None"
+
+    with patch("app.utils.metadata.MetadataManager.instance", lambda: metadata_manager):
+        for name, recreate in (
+            ("per row", recreate_per_row),
+            (
+                "recreate_mod_list",
+                lambda mod_list, uuids: mod_list.recreate_mod_list("Active", uuids),
+            ),
+        ):
+            mod_list = ModListWidget("Active", settings_controller)
+            mod_list.resize(400, 800)
+            mod_list.show()
+            updates: list[str] = []
+            mod_list.list_update_signal.connect(updates.append)
+            start = time.perf_counter()
+            recreate(mod_list, list(mods))
+            # Run the queued rowsInserted slots
+            app.processEvents()
+            elapsed = time.perf_counter() - start
+            assert mod_list.uuids == list(mods)
+            print(f"{name}: {elapsed * 1000:.0f} ms, {len(updates)} list updates")
+            mod_list.deleteLater()
+            app.processEvents()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from loguru import logger
+
+from app.utils.replacement_index import ReplacementIndex
+from app.utils.xml import xml_path_to_json
+
+
+def generate_replacements(folder: Path, count: int) -> None:
+    """generate a Replacements folder, one xml file per replaced mod"""
+    folder.mkdir(parents=True)
+    for i in range(count):
+        (folder / f"{1000000 + i}.xml").write_text(
+            "<ModReplacement>"
+            f"<Author>Author {i}</Author><ModId>author.mod{i}</ModId>"
+            f"<ModName>Mod {i}</ModName><PublishedFileId>{1000000 + i}</PublishedFileId>"
+            f"<ReplacementAuthor>Author {i}</ReplacementAuthor>"
+            f"<ReplacementModId>author.mod{i}.updated</ReplacementModId>"
+            f"<ReplacementName>Mod {i} (Continued)</ReplacementName>"
+            f"<ReplacementSteamId>{2000000 + i}</ReplacementSteamId>"
+            "<ReplacementVersions>1.4,1.5</ReplacementVersions>"
+            "</ModReplacement>",
+            encoding="utf-8",
+        )
+
+
+def probe(folder: Path, pfid: str) -> str | None:
+    """the previous lookup, checking for and parsing the mod's file"""
+    check_path = folder / f"{pfid}.xml"
+    if not check_path.exists():
+        return None
+    return xml_path_to_json(str(check_path))["ModReplacement"]["ReplacementName"]
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(
+        description='Time "Use This Instead" lookups for every installed mod'
+    )
+    arg_parser.add_argument(
+        "--replacements", type=int, default=3000, help="number of replacement files"
+    )
+    arg_parser.add_argument(
+        "--mods", type=int, default=2000, help="number of installed workshop mods"
+    )
+    args = arg_parser.parse_args()
+
+    logger.remove()
+    logger.add(sys.stderr, level="WARNING")
+
+    with tempfile.TemporaryDirectory() as work_dir:
+        folder = Path(work_dir) / "Replacements"
+        generate_replacements(folder, args.replacements)
+        # Some of the installed mods have a replacement
+        pfids = [str(1000000 + i * 2) for i in range(args.mods)]
+        print(
+            f"{args.replacements} replacements, {args.mods} mods, {os.cpu_count()} CPUs"
+        )
+
+        start = time.perf_counter()
+        found = sum(probe(folder, pfid) is not None for pfid in pfids)
+        print(
+            f"probe per mod: {(time.perf_counter() - start) * 1000:.0f} ms, {found} found"
+        )
+
+        index_path = Path(work_dir) / "index.json"
+        for name in ("build index", "load index from disk"):
+            index = ReplacementIndex(index_path)
+            start = time.perf_counter()
+            index.load(folder)
+            print(f"{name}: {(time.perf_counter() - start) * 1000:.0f} ms")
+
+        start = time.perf_counter()
+        found = sum(index.get(folder, pfid) is not None for pfid in pfids)
+        print(
+            f"index lookups: {(time.perf_counter() - start) * 1000:.1f} ms, {found} found"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+import argparse
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+from typing import Callable
+from zipfile import ZIP_DEFLATED, ZipFile
+
+from loguru import logger
+
+from app.utils.zip_extract import extract_zip
+
+
+def generate_archive(zip_path: str, files: int, size: int) -> None:
+    """generate a mod-like archive, mostly small xml files in nested folders, with a few large textures"""
+    with ZipFile(zip_path, "w", ZIP_DEFLATED) as zipobj:
+        for i in range(files):
+            folder = f"Mod{i % 20}/{random.choice(['Defs', 'Patches', 'Languages/English/Keyed'])}/Folder{i % 50}"
+            if i % 200 == 0:
+                # Textures compress poorly
+                data = random.randbytes(size * 64)
+                zipobj.writestr(f"{folder}/Texture{i}.dds", data)
+            else:
+                text = (f"<Defs><ThingDef>{i}</ThingDef></Defs>\n" * size)[:size]
+                zipobj.writestr(f"{folder}/Def{i}.xml", text)
+
+
+def extract_serial(zip_path: str, target_path: str) -> None:
+    """the previous extraction, one member at a time"""
+    with ZipFile(zip_path) as zipobj:
+        for zip_info in zipobj.infolist():
+            dst = os.path.join(target_path, zip_info.filename)
+            os.makedirs(os.path.dirname(dst), exist_ok=True)
+            if zip_info.is_dir():
+                os.makedirs(dst, exist_ok=True)
+            else:
+                with zipobj.open(zip_info) as src, open(dst, "wb") as out_file:
+                    shutil.copyfileobj(src, out_file)
+
+
+def time_extract(
+    extract: Callable[[str, str], object], zip_path: str, work_dir: str, repeat: int
+) -> str:
+    timings = []
+    for i in range(repeat):
+        target_path = os.path.join(work_dir, f"extract{i}")
+        start = time.perf_counter()
+        extract(zip_path, target_path)
+        timings.append(time.perf_counter() - start)
+        shutil.rmtree(target_path)
+    return f"{min(timings) * 1000:.0f} ms"
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(
+        description="Time zip extraction on a synthetic mod archive"
+    )
+    arg_parser.add_argument(
+        "--files", type=int, default=5000, help="number of files in the archive"
+    )
+    arg_parser.add_argument(
+        "--size", type=int, default=16384, help="size of each xml file in bytes"
+    )
+    arg_parser.add_argument(
+        "--workers",
+        type=int,
+        nargs="+",
+        default=[1, 2, 4, 8],
+        help="worker counts to time extract_zip with",
+    )
+    arg_parser.add_argument(
+        "--repeat", type=int, default=3, help="number of timed passes"
+    )
+    args = arg_parser.parse_args()
+
+    logger.remove()
+    logger.add(sys.stderr, level="WARNING")
+
+    random.seed(0)
+    with tempfile.TemporaryDirectory() as work_dir:
+        zip_path = os.path.join(work_dir, "mods.zip")
+        generate_archive(zip_path, args.files, args.size)
+        print(
+            f"{args.files} files, {os.path.getsize(zip_path) / 1024 / 1024:.1f} MiB archive,"
+            f" {os.cpu_count()} CPUs"
+        )
+        print(
+            f"serial: {time_extract(extract_serial, zip_path, work_dir, args.repeat)}"
+        )
+        for workers in args.workers:
+
+            def extract(
+                zip_path: str, target_path: str, workers: int = workers
+            ) -> bool:
+                return extract_zip(zip_path, target_path, max_workers=workers)
+
+            print(
+                f"extract_zip ({workers} workers): {time_extract(extract, zip_path, work_dir, args.repeat)}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+from pathlib import Path
+from unittest.mock import PropertyMock, patch
+
+from app.controllers.instance_controller import InstanceController
+from app.models.instance import Instance
+
+
+def test_instance_archive_round_trip(tmp_path: Path) -> None:
+    instance_folder = tmp_path / "instances" / "Test"
+    (instance_folder / "steamcmd" / "Mods").mkdir(parents=True)
+    (instance_folder / "steamcmd" / "Mods" / "About.xml").write_text("<ModMetaData />")
+    (instance_folder / "steamcmd" / "Preview.png").write_bytes(b"\x89PNG")
+    (instance_folder / "Empty").mkdir()
+    output_path = tmp_path / "backup"
+
+    with patch.object(
+        InstanceController,
+        "instance_folder_path",
+        new_callable=PropertyMock,
+        return_value=instance_folder,
+    ):
+        InstanceController(Instance(name="Test")).compress_to_archive(str(output_path))
+
+    restored_folder = tmp_path / "restored"
+    archive_path = str(output_path) + ".zip"
+    with patch.object(
+        InstanceController,
+        "instance_folder_path",
+        new_callable=PropertyMock,
+        return_value=restored_folder,
+    ):
+        instance_controller = InstanceController(archive_path)
+        instance_controller.extract_from_archive(archive_path)
+
+    assert instance_controller.instance.name == "Test"
+    assert (
+        restored_folder / "steamcmd" / "Mods" / "About.xml"
+    ).read_text() == "<ModMetaData />"
+    assert (restored_folder / "steamcmd" / "Preview.png").read_bytes() == b"\x89PNG"
+    assert (restored_folder / "Empty").is_dir()
+    assert not (restored_folder / "instance.json").exists()
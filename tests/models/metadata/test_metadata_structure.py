@@ -1,9 +1,17 @@
+import json
 from pathlib import Path
 
+import msgspec
 import pytest
 
 import app.models.metadata.metadata_structure as metadata_structure
-from app.models.metadata.metadata_structure import AboutXmlMod, ListedMod, ModType
+from app.models.metadata.metadata_structure import (
+    AboutXmlMod,
+    ExternalRulesFile,
+    ListedMod,
+    ModType,
+    SteamDbFile,
+)
 
 
 def test_case_insensitive() -> None:
@@ -216,3 +224,33 @@ def test_about_xml_mod_overall_rules() -> None:
 def test_listed_mod_c_sharp_mod_default() -> None:
     mod = ListedMod()
     assert not mod.c_sharp_mod
+
+
+def test_steam_db_file_keeps_entries_as_dicts() -> None:
+    path = Path("tests/data/dbs/steamDB.json")
+    steam_db = msgspec.json.decode(path.read_bytes(), type=SteamDbFile, strict=False)
+    data = json.loads(path.read_text(encoding="utf-8"))
+    assert steam_db.version == data["version"]
+    assert steam_db.database == data["database"]
+
+
+def test_steam_db_file_validates_envelope() -> None:
+    assert (
+        msgspec.json.decode(
+            b'{"version": "1700000000"}', type=SteamDbFile, strict=False
+        ).version
+        == 1700000000
+    )
+    with pytest.raises(msgspec.ValidationError):
+        msgspec.json.decode(b'{"database": {}}', type=SteamDbFile, strict=False)
+    with pytest.raises(msgspec.ValidationError):
+        msgspec.json.decode(
+            b'{"version": 1, "database": []}', type=SteamDbFile, strict=False
+        )
+
+
+def test_external_rules_file_keeps_rules_as_dicts() -> None:
+    path = Path("tests/data/dbs/userRules.json")
+    rules = msgspec.json.decode(path.read_bytes(), type=ExternalRulesFile, strict=False)
+    assert rules.rules == json.loads(path.read_text(encoding="utf-8"))["rules"]
+    assert msgspec.json.decode(b'{"rules": null}', type=ExternalRulesFile).rules is None
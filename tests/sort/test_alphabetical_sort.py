@@ -0,0 +1,70 @@
+from typing import Any, Generator
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app.sort.alphabetical_sort import do_alphabetical_heap_sort
+from app.utils.metadata import MetadataManager
+
+
+@pytest.fixture
+def mods() -> Generator[dict[str, Any], None, None]:
+    mods: dict[str, Any] = {}
+    with patch.object(MetadataManager, "instance") as mock_instance:
+        mock = MagicMock()
+        mock.internal_local_metadata = mods
+        mock_instance.return_value = mock
+        yield mods
+
+
+def _add_mods(mods: dict[str, Any], names: dict[str, Any]) -> set[str]:
+    for packageid, name in names.items():
+        mods[f"uuid-{packageid}"] = {"packageid": packageid, "name": name}
+    return set(mods)
+
+
+def _packageids(mods: dict[str, Any], uuids: list[str]) -> list[str]:
+    return [mods[uuid]["packageid"] for uuid in uuids]
+
+
+def test_dependencies_load_first_then_alphabetically(mods: dict[str, Any]) -> None:
+    active = _add_mods(
+        mods, {"a": "Apple", "b": "banana", "c": "Cherry", "d": "Date", "e": None}
+    )
+    graph: dict[str, set[str]] = {
+        "a": {"d"},
+        "b": set(),
+        "c": set(),
+        "d": {"d"},  # Rules on itself are ignored
+        "e": set(),
+    }
+    # Names are compared case insensitively, and invalid names sort as an error message
+    assert _packageids(mods, do_alphabetical_heap_sort(graph, active)) == [
+        "b",
+        "c",
+        "d",
+        "a",
+        "e",
+    ]
+
+
+def test_dependency_loops_are_broken_alphabetically(mods: dict[str, Any]) -> None:
+    active = _add_mods(mods, {"a": "A", "b": "B", "c": "C", "z": "Z"})
+    graph: dict[str, set[str]] = {"a": {"c"}, "b": {"a"}, "c": {"b"}, "z": set()}
+    # Mods outside the loop load first, then the loop starts at its first mod
+    assert _packageids(mods, do_alphabetical_heap_sort(graph, active)) == [
+        "z",
+        "a",
+        "b",
+        "c",
+    ]
+
+
+def test_long_dependency_chain(mods: dict[str, Any]) -> None:
+    count = 5000
+    active = _add_mods(mods, {f"mod{i}": f"Mod {i:05}" for i in range(count)})
+    graph = {f"mod{i}": {f"mod{i + 1}"} for i in range(count - 1)}
+    graph[f"mod{count - 1}"] = set()
+    assert _packageids(mods, do_alphabetical_heap_sort(graph, active)) == [
+        f"mod{i}" for i in reversed(range(count))
+    ]
@@ -0,0 +1,72 @@
+from app.sort.cycles import (
+    describe_cycles,
+    shortest_cycles,
+    strongly_connected_components,
+)
+from app.utils.metadata_rules import (
+    RULE_SOURCE_ABOUT_XML,
+    RULE_SOURCE_COMMUNITY_RULES,
+    RULE_SOURCE_USER_RULES,
+    RuleEdgeIndex,
+)
+
+
+def test_strongly_connected_components() -> None:
+    graph: dict[str, set[str]] = {
+        "a": {"b"},
+        "b": {"c"},
+        "c": {"a", "d"},
+        "d": {"d"},  # Mods depending on themselves are ignored
+        "e": {"f", "a"},
+        "f": {"e"},
+        "g": set(),
+    }
+    assert strongly_connected_components(graph) == [["a", "b", "c"], ["e", "f"]]
+
+
+def test_long_chain_has_no_components() -> None:
+    graph = {f"mod{i}": {f"mod{i + 1}"} for i in range(20000)}
+    assert strongly_connected_components(graph) == []
+    graph["mod20000"] = {"mod0"}
+    assert len(strongly_connected_components(graph)[0]) == 20001
+
+
+def test_shortest_cycles_are_bounded() -> None:
+    # Every mod depends on every other mod: there are too many loops to list them all
+    mods = [f"mod{i:02}" for i in range(30)]
+    graph = {mod: set(mods) - {mod} for mod in mods}
+    component = strongly_connected_components(graph)[0]
+    cycles = shortest_cycles(graph, component, limit=3)
+    assert len(cycles) == 3
+    assert len({tuple(cycle) for cycle in cycles}) == 3
+    for cycle in cycles:
+        assert len(cycle) == 2
+        assert cycle[0] == min(cycle)
+
+
+def test_describe_cycles_rule_sources() -> None:
+    all_mods: dict[str, dict[str, object]] = {
+        "uuid-a": {"packageid": "a", "name": "Mod A"},
+        "uuid-b": {"packageid": "b", "name": "Mod B"},
+    }
+    edges = RuleEdgeIndex()
+    # A loads after B because of its About.xml and the community rules
+    for source in (RULE_SOURCE_ABOUT_XML, RULE_SOURCE_COMMUNITY_RULES):
+        edges.add("uuid-a", "uuid-a", "loadTheseBefore", ("b", True), source, all_mods)
+    # B loads after A because of a user rule on A
+    edges.add(
+        "uuid-a",
+        "uuid-b",
+        "loadTheseBefore",
+        ("a", False),
+        RULE_SOURCE_USER_RULES,
+        all_mods,
+    )
+    graph = {"a": {"b"}, "b": {"a"}}
+    uuid_by_packageid = {"a": "uuid-a", "b": "uuid-b"}
+    assert describe_cycles(graph, uuid_by_packageid, all_mods, edges) == [
+        "2 mods depend on each other: a, b\n"
+        "a -> b -> a\n"
+        "    Mod A (a) loads after b: About.xml, Community Rules\n"
+        "    Mod B (b) loads after a: User Rules"
+    ]
@@ -0,0 +1,112 @@
+import random
+from typing import Any, Generator
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app.controllers.sort_controller import Sorter
+from app.sort.dependency_graph_cache import DependencyGraphCache
+from app.utils.constants import SortMethod
+from app.utils.metadata import MetadataManager
+
+
+def _generate_mods(count: int) -> dict[str, Any]:
+    """Generate mods with acyclic load order rules, like compiled metadata"""
+    rng = random.Random(count)
+    packageids = ["ludeon.rimworld", "brrainz.harmony", "krkr.rocketman"] + [
+        f"author.mod{i}" for i in range(count - 3)
+    ]
+    mods: dict[str, Any] = {
+        f"uuid-{packageid}": {
+            "packageid": packageid,
+            "name": packageid.title(),
+            "loadTheseBefore": set(),
+            "loadTheseAfter": set(),
+            "dependencies": set(),
+        }
+        for packageid in packageids
+    }
+    # Rules only point to mods earlier in the list, so they can not form a cycle
+    for i, packageid in enumerate(packageids[1:], start=1):
+        mod = mods[f"uuid-{packageid}"]
+        for before in rng.sample(packageids[:i], min(i, rng.randrange(4))):
+            mod["loadTheseBefore"].add((before, True))
+            mods[f"uuid-{before}"]["loadTheseAfter"].add((packageid, True))
+        if rng.random() < 0.2:
+            mod["dependencies"].add(rng.choice(packageids[:i]))
+        if rng.random() < 0.03:
+            mod["loadBottom"] = True
+    return mods
+
+
+@pytest.fixture
+def mods() -> Generator[dict[str, Any], None, None]:
+    mods = _generate_mods(200)
+    with patch.object(MetadataManager, "instance") as mock_instance:
+        mock = MagicMock()
+        mock.internal_local_metadata = mods
+        mock.rules_version = 1
+        mock_instance.return_value = mock
+        yield mods
+
+
+def _sorter(
+    active_uuids: set[str],
+    mods: dict[str, Any],
+    graph_cache: DependencyGraphCache | None,
+    use_moddependencies: bool = False,
+) -> Sorter:
+    return Sorter(
+        SortMethod.TOPOLOGICAL,
+        active_package_ids={mods[uuid]["packageid"] for uuid in active_uuids},
+        active_uuids=active_uuids,
+        use_moddependencies_as_loadTheseBefore=use_moddependencies,
+        graph_cache=graph_cache,
+    )
+
+
+@pytest.mark.parametrize("use_moddependencies", [False, True])
+def test_cached_graphs_match_generated_graphs(
+    mods: dict[str, Any], use_moddependencies: bool
+) -> None:
+    rng = random.Random(0)
+    graph_cache = DependencyGraphCache()
+    active = set(rng.sample(sorted(mods), 100))
+    for _ in range(20):
+        # Activate and deactivate a few mods between sorts
+        for uuid in rng.sample(sorted(active), 5):
+            active.discard(uuid)
+        active.update(rng.sample(sorted(mods), 5))
+        cached = _sorter(active, mods, graph_cache, use_moddependencies)
+        generated = _sorter(active, mods, None, use_moddependencies)
+        assert cached.generate_dependency_graphs() == (
+            generated.generate_dependency_graphs()
+        )
+        assert cached.sort() == generated.sort()
+
+
+def test_unchanged_tiers_are_not_sorted_again(mods: dict[str, Any]) -> None:
+    graph_cache = DependencyGraphCache()
+    active = set(mods)
+    sort_method = MagicMock(side_effect=lambda graph, uuids: sorted(graph))
+    sorter = _sorter(active, mods, graph_cache)
+    sorter.sort_method = sort_method
+    first = sorter.sort()
+    assert sort_method.call_count == 3
+    assert sorter.sort() == first
+    assert sort_method.call_count == 3
+
+    # Rules changing invalidates the cache
+    MetadataManager.instance().rules_version += 1
+    assert sorter.sort() == first
+    assert sort_method.call_count == 6
+
+
+def test_duplicate_packageids_are_not_cached(mods: dict[str, Any]) -> None:
+    mods["uuid-copy"] = dict(mods["uuid-author.mod1"])
+    active = {"uuid-author.mod1", "uuid-copy", "uuid-ludeon.rimworld"}
+    graph_cache = DependencyGraphCache()
+    assert not graph_cache.update(active, False)
+    assert _sorter(active, mods, graph_cache).generate_dependency_graphs() == (
+        _sorter(active, mods, None).generate_dependency_graphs()
+    )
@@ -0,0 +1,112 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Generator
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+RECORDED_RESPONSES = Path(__file__).parents[2] / "data" / "steam_webapi"
+
+
+class StubWebAPIServer(ThreadingHTTPServer):
+    """
+    A local Steam WebAPI replaying recorded IPublishedFileService/GetDetails responses.
+
+    The next `failures` requests fail with `failure_status`, to test retries.
+    """
+
+    def __init__(self) -> None:
+        super().__init__(("127.0.0.1", 0), StubWebAPIHandler)
+        self.details: dict[str, Any] = json.loads(
+            (RECORDED_RESPONSES / "IPublishedFileService_GetDetails.json").read_text()
+        )
+        self.lock = threading.Lock()
+        self.requests: list[dict[str, list[str]]] = []
+        self.failures = 0
+        self.failure_status = 503
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host!s}:{port}"
+
+
+class StubWebAPIHandler(BaseHTTPRequestHandler):
+    server: StubWebAPIServer
+
+    def do_GET(self) -> None:
+        url = urlparse(self.path)
+        params = parse_qs(url.query)
+        with self.server.lock:
+            self.server.requests.append(params)
+            fail = self.server.failures > 0
+            if fail:
+                self.server.failures -= 1
+        if fail:
+            self.send_response(self.server.failure_status)
+            self.end_headers()
+            return
+        if url.path == "/IPublishedFileService/GetDetails/v1/":
+            response = self.get_details(params)
+        elif url.path == "/IPublishedFileService/QueryFiles/v1/":
+            response = self.query_files(params)
+        else:
+            self.send_response(404)
+            self.end_headers()
+            return
+        body = json.dumps({"response": response}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def get_details(self, params: dict[str, list[str]]) -> dict[str, Any]:
+        publishedfileids = [
+            params[f"publishedfileids[{i}]"][0]
+            for i in range(len(params))
+            if f"publishedfileids[{i}]" in params
+        ]
+        return {
+            "publishedfiledetails": [
+                self.server.details.get(pfid, {"result": 9, "publishedfileid": pfid})
+                for pfid in publishedfileids
+            ]
+        }
+
+    def query_files(self, params: dict[str, list[str]]) -> dict[str, Any]:
+        # Published mods ranked by last updated date, paged with the cursor as an index
+        details = sorted(
+            (
+                details
+                for details in self.server.details.values()
+                if details["result"] == 1
+            ),
+            # Items without an update time (e.g. unpublished) are ranked first
+            key=lambda details: details.get("time_updated", float("inf")),
+            reverse=True,
+        )
+        start = 0 if params["cursor"][0] == "*" else int(params["cursor"][0])
+        end = start + int(params["numperpage"][0])
+        return {
+            "total": len(details),
+            "publishedfiledetails": details[start:end],
+            "next_cursor": str(end) if end < len(details) else params["cursor"][0],
+        }
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+
+@pytest.fixture
+def webapi_server() -> Generator[StubWebAPIServer, None, None]:
+    server = StubWebAPIServer()
+    thread = threading.Thread(
+        target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True
+    )
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
@@ -0,0 +1,83 @@
+from pathlib import Path
+from time import time
+
+from app.utils.steam.webapi.checkpoint import DynamicQueryCheckpoint
+
+
+def _checkpoint(path: Path, max_age: int = 0) -> DynamicQueryCheckpoint:
+    return DynamicQueryCheckpoint(path, appid=294100, mode="no_local", max_age=max_age)
+
+
+def test_checkpoint_round_trip(tmp_path: Path) -> None:
+    path = DynamicQueryCheckpoint.path_for(str(tmp_path / "steamDB.json"))
+    assert path == tmp_path / "steamDB.json.checkpoint"
+    checkpoint = _checkpoint(path)
+    assert not checkpoint.load()
+    checkpoint.complete_query_files(["1", "2", "3"])
+    checkpoint.database = {"version": 0, "database": {"1": {"steamName": "One"}}}
+    checkpoint.complete_details_step(["4"])
+    checkpoint.step_queried["1"] = time()
+    checkpoint.step_missing_children.append("5")
+    checkpoint.appid_dependencies["1"] = [1149640]
+    checkpoint.save(force=True)
+
+    resumed = _checkpoint(path)
+    assert resumed.load()
+    assert resumed.query_files["publishedfileids"] == ["1", "2", "3"]
+    assert [step["missing_children"] for step in resumed.details_steps] == [["4"]]
+    assert list(resumed.step_queried) == ["1"]
+    assert resumed.step_missing_children == ["5"]
+    assert resumed.appid_dependencies == {"1": [1149640]}
+    assert resumed.database == checkpoint.database
+
+    resumed.remove()
+    assert not path.exists()
+
+
+def test_checkpoint_of_another_build_is_ignored(tmp_path: Path) -> None:
+    path = tmp_path / "steamDB.json.checkpoint"
+    _checkpoint(path).complete_query_files(["1"])
+    other_mode = DynamicQueryCheckpoint(path, appid=294100, mode="all_mods")
+    assert not other_mode.load()
+    assert other_mode.query_files["publishedfileids"] == []
+    path.write_text("{not json")
+    assert not _checkpoint(path).load()
+
+
+def test_stale_progress_is_dropped(tmp_path: Path) -> None:
+    path = tmp_path / "steamDB.json.checkpoint"
+    checkpoint = _checkpoint(path, max_age=3600)
+    checkpoint.complete_query_files(["1", "2", "3"])
+    checkpoint.complete_details_step([])
+    checkpoint.complete_details_step(["4"])
+    checkpoint.details_steps[1]["completed_at"] = time() - 7200
+    checkpoint.step_queried = {"1": time(), "2": time() - 7200}
+    checkpoint.save(force=True)
+
+    resumed = _checkpoint(path, max_age=3600)
+    assert resumed.load()
+    # Steps after a stale step depend on it, so are queried again
+    assert len(resumed.details_steps) == 1
+    assert resumed.step_queried == {}
+
+    checkpoint.details_steps[1]["completed_at"] = time()
+    checkpoint.save(force=True)
+    assert resumed.load()
+    assert len(resumed.details_steps) == 2
+    assert list(resumed.step_queried) == ["1"]
+
+    # Without a max age, progress never goes stale
+    checkpoint.query_files["completed_at"] = 0
+    checkpoint.save(force=True)
+    assert not resumed.load()
+    assert _checkpoint(path).load()
+
+
+def test_saves_are_throttled(tmp_path: Path) -> None:
+    path = tmp_path / "steamDB.json.checkpoint"
+    checkpoint = _checkpoint(path)
+    checkpoint.save()
+    assert not path.exists()
+    checkpoint.save_interval = 0
+    checkpoint.save()
+    assert path.exists()
@@ -0,0 +1,116 @@
+from pathlib import Path
+from time import time
+from typing import Any
+
+from app.utils.steam.webapi.checkpoint import DynamicQueryCheckpoint
+from app.utils.steam.webapi.wrapper import DynamicQuery
+
+
+def _query(database: dict[str, Any], max_workers: int, base_url: str) -> Any:
+    dynamic_query = DynamicQuery(
+        "KEY", 294100, max_workers=max_workers, base_url=base_url
+    )
+    dynamic_query.request_pool.backoff = 0
+    try:
+        return dynamic_query.IPublishedFileService_GetDetails(
+            {"database": {pfid: dict(data) for pfid, data in database.items()}},
+            list(database),
+        )
+    finally:
+        dynamic_query.request_pool.close()
+
+
+def test_get_details(webapi_server: Any) -> None:
+    database: dict[str, Any] = {
+        "818773962": {"name": "HugsLib", "url": "url-hugslib"},
+        "1507748539": {},
+        "2009463077": {"name": "Harmony", "url": "url-harmony"},
+        "1111111111": {},
+    }
+    result, missing_children = _query(database, 4, webapi_server.url)
+    assert result["database"]["818773962"]["steamName"] == "HugsLib"
+    assert result["database"]["818773962"]["dependencies"] == {
+        "2009463077": ["Harmony", "url-harmony"]
+    }
+    assert result["database"]["1111111111"] == {"unpublished": True}
+    assert missing_children == ["2023507013"]
+
+
+def test_concurrent_chunks_merge_in_order(webapi_server: Any) -> None:
+    # Enough mods for several chunks of 213 PublishedFileIds
+    database: dict[str, Any] = {str(pfid): {} for pfid in range(1000)}
+    database.update({"1507748539": {}, "2009463077": {}, "818773962": {}})
+    serial = _query(database, 1, webapi_server.url)
+    webapi_server.failures = 3
+    concurrent = _query(database, 4, webapi_server.url)
+    assert concurrent == serial
+    assert list(concurrent[0]["database"]) == list(serial[0]["database"])
+
+
+def test_resume_from_checkpoint(webapi_server: Any, tmp_path: Path) -> None:
+    publishedfileids = ["818773962", "1507748539", "2009463077", "1111111111"]
+    checkpoint = DynamicQueryCheckpoint(
+        tmp_path / "steamDB.json.checkpoint", appid=294100, mode="all_mods"
+    )
+    dynamic_query = DynamicQuery(
+        "KEY", 294100, base_url=webapi_server.url, checkpoint=checkpoint
+    )
+    database: dict[str, Any] = {
+        "database": {pfid: {"url": f"url-{pfid}"} for pfid in publishedfileids}
+    }
+    checkpoint.database = database
+    # A previous run completed the first step, and queried part of the second
+    checkpoint.complete_details_step(["2023507013"])
+    checkpoint.step_queried = {"818773962": time(), "1507748539": time()}
+    checkpoint.step_missing_children = ["2023507013"]
+    try:
+        _, missing_children = dynamic_query.IPublishedFileService_GetDetails(
+            database, publishedfileids
+        )
+        assert missing_children == ["2023507013"]
+        assert webapi_server.requests == []
+
+        _, missing_children = dynamic_query.IPublishedFileService_GetDetails(
+            database, publishedfileids
+        )
+    finally:
+        dynamic_query.request_pool.close()
+    # Only the PublishedFileIds missing from the checkpoint are queried
+    assert [
+        sorted(key for key in params if key.startswith("publishedfileids"))
+        for params in webapi_server.requests
+    ] == [["publishedfileids[0]", "publishedfileids[1]"]]
+    assert webapi_server.requests[0]["publishedfileids[0]"] == ["2009463077"]
+    assert missing_children == ["2023507013"]
+    assert database["database"]["2009463077"]["steamName"] == "Harmony"
+    assert database["database"]["1111111111"]["unpublished"]
+    # The completed step is checkpointed
+    assert [step["missing_children"] for step in checkpoint.details_steps] == [
+        ["2023507013"],
+        ["2023507013"],
+    ]
+    assert checkpoint.step_queried == {}
+
+
+def test_query_updated_files(webapi_server: Any) -> None:
+    dynamic_query = DynamicQuery("KEY", 294100, base_url=webapi_server.url)
+    try:
+        updated = dynamic_query.IPublishedFileService_QueryUpdatedFiles(1720365219)
+        everything = dynamic_query.IPublishedFileService_QueryUpdatedFiles(0)
+    finally:
+        dynamic_query.request_pool.close()
+    # Mods are ranked by last updated date, and only those updated since are returned
+    assert webapi_server.requests[0]["query_type"] == ["21"]
+    assert updated == ["1507748539", "818773962", "2009463077"]
+    assert everything == ["1507748539", "818773962", "2009463077", "2023507013"]
+
+
+def test_query_updated_files_without_update_time(webapi_server: Any) -> None:
+    webapi_server.details["1"] = {"result": 1, "publishedfileid": "1"}
+    dynamic_query = DynamicQuery("KEY", 294100, base_url=webapi_server.url)
+    try:
+        updated = dynamic_query.IPublishedFileService_QueryUpdatedFiles(1720365219)
+    finally:
+        dynamic_query.request_pool.close()
+    # The item is skipped, without ending the walk before the mods ranked after it
+    assert updated == ["1507748539", "818773962", "2009463077"]
@@ -0,0 +1,94 @@
+from typing import Any
+
+import pytest
+import requests
+
+from app.utils.steam.webapi.request_pool import WebAPIRequestPool
+
+
+def _details_params(pfids: list[str]) -> dict[str, object]:
+    return {"publishedfileids": pfids, "includechildren": True}
+
+
+def test_map_returns_responses_in_order(webapi_server: Any) -> None:
+    chunks = [[str(i), "2009463077"] for i in range(20)]
+    with WebAPIRequestPool(
+        "KEY", max_workers=4, requests_per_second=0, base_url=webapi_server.url
+    ) as pool:
+        responses = list(
+            pool.map(
+                "IPublishedFileService.GetDetails",
+                (_details_params(chunk) for chunk in chunks),
+            )
+        )
+    assert [
+        [
+            details["publishedfileid"]
+            for details in response["response"]["publishedfiledetails"]
+        ]
+        for response in responses
+    ] == chunks
+    assert responses[0]["response"]["publishedfiledetails"][1]["title"] == "Harmony"
+    # The key is sent with every request
+    assert all(params["key"] == ["KEY"] for params in webapi_server.requests)
+
+
+@pytest.mark.parametrize("status", [429, 503])
+def test_transient_errors_are_retried(webapi_server: Any, status: int) -> None:
+    webapi_server.failures = 2
+    webapi_server.failure_status = status
+    with WebAPIRequestPool(
+        "KEY", requests_per_second=0, backoff=0, base_url=webapi_server.url
+    ) as pool:
+        response = pool.request(
+            "IPublishedFileService.GetDetails", _details_params(["818773962"])
+        )
+    assert response["response"]["publishedfiledetails"][0]["title"] == "HugsLib"
+    assert len(webapi_server.requests) == 3
+
+
+def test_failed_requests_are_yielded_as_exceptions(
+    webapi_server: Any,
+) -> None:
+    webapi_server.failures = 2
+    with WebAPIRequestPool(
+        "KEY",
+        max_workers=1,
+        requests_per_second=0,
+        retries=1,
+        backoff=0,
+        base_url=webapi_server.url,
+    ) as pool:
+        responses = list(
+            pool.map(
+                "IPublishedFileService.GetDetails",
+                [_details_params(["818773962"]), _details_params(["2009463077"])],
+            )
+        )
+    assert isinstance(responses[0], requests.HTTPError)
+    assert responses[1]["response"]["publishedfiledetails"][0]["title"] == "Harmony"
+
+
+def test_client_errors_are_not_retried(webapi_server: Any) -> None:
+    with WebAPIRequestPool(
+        "KEY", requests_per_second=0, backoff=0, base_url=webapi_server.url
+    ) as pool:
+        with pytest.raises(requests.HTTPError):
+            pool.request("IPublishedFileService.Missing", {})
+    assert len(webapi_server.requests) == 1
+
+
+def test_requests_are_rate_limited(webapi_server: Any) -> None:
+    with WebAPIRequestPool(
+        "KEY", max_workers=4, requests_per_second=50, base_url=webapi_server.url
+    ) as pool:
+        pool._wait_for_rate_limit()
+        start = pool._next_request
+        list(
+            pool.map(
+                "IPublishedFileService.GetDetails",
+                (_details_params(["2009463077"]) for _ in range(5)),
+            )
+        )
+    # Each request is scheduled 1/50th of a second after the previous one
+    assert pool._next_request == pytest.approx(start + 5 / 50)
@@ -0,0 +1,64 @@
+from typing import Generator
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app.utils.custom_list_widget_item_metadata import CustomListWidgetItemMetadata
+from app.utils.metadata import MetadataManager
+
+
+@pytest.fixture
+def metadata_manager() -> Generator[MagicMock, None, None]:
+    with patch.object(MetadataManager, "instance") as mock_instance:
+        mock = MagicMock()
+        mock.internal_local_metadata = {
+            "uuid-valid": {"packageid": "author.valid"},
+            "uuid-invalid": {"packageid": "author.invalid", "invalid": True},
+        }
+        mock.is_version_mismatch.return_value = True
+        mock.has_alternative_mod.return_value = None
+        mock.rules_version = 1
+        mock_instance.return_value = mock
+        yield mock
+
+
+def test_flags_are_computed_when_read(metadata_manager: MagicMock) -> None:
+    data = CustomListWidgetItemMetadata(uuid="uuid-invalid")
+    # Building the item does not query the mod's metadata
+    metadata_manager.is_version_mismatch.assert_not_called()
+    metadata_manager.has_alternative_mod.assert_not_called()
+
+    assert data["invalid"]
+    assert data.mismatch
+    assert data["alternative"] is None
+    # Computed flags are memoized
+    assert data["mismatch"]
+    assert data.alternative is None
+    metadata_manager.is_version_mismatch.assert_called_once_with("uuid-invalid")
+    metadata_manager.has_alternative_mod.assert_called_once_with("uuid-invalid")
+
+
+def test_flags_are_recomputed_when_metadata_changes(
+    metadata_manager: MagicMock,
+) -> None:
+    data = CustomListWidgetItemMetadata(uuid="uuid-valid")
+    assert not data["invalid"]
+
+    metadata_manager.internal_local_metadata["uuid-valid"]["invalid"] = True
+    assert not data["invalid"]
+    metadata_manager.rules_version += 1
+    assert data["invalid"]
+
+
+def test_provided_flags_are_kept(metadata_manager: MagicMock) -> None:
+    data = CustomListWidgetItemMetadata(
+        uuid="uuid-invalid", invalid=False, alternative="Alternative (1) by Author"
+    )
+    data["mismatch"] = False
+    metadata_manager.rules_version += 1
+
+    assert not data["invalid"]
+    assert not data["mismatch"]
+    assert data["alternative"] == "Alternative (1) by Author"
+    metadata_manager.is_version_mismatch.assert_not_called()
+    metadata_manager.has_alternative_mod.assert_not_called()
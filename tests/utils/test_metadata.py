@@ -0,0 +1,371 @@
+import json
+from pathlib import Path
+from typing import Any, Generator
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app.utils.metadata import (
+    MetadataManager,
+    ModParser,
+    SteamDatabaseBuilder,
+    get_mods_from_list,
+)
+from app.utils.metadata_cache import MetadataParseCache
+
+MODS: dict[str, Any] = {
+    "core": {
+        "packageid": "ludeon.rimworld",
+        "path": "/game/Data/Core",
+        "data_source": "expansion",
+    },
+    "harmony-local": {
+        "packageid": "brrainz.harmony",
+        "path": "/mods/local/Harmony",
+        "data_source": "local",
+    },
+    "harmony-workshop": {
+        "packageid": "brrainz.harmony",
+        "path": "/mods/workshop/2009463077",
+        "data_source": "workshop",
+    },
+    "hugslib-local-10": {
+        "packageid": "unlimitedhugs.hugslib",
+        "path": "/mods/local/HugsLib10",
+        "data_source": "local",
+    },
+    "hugslib-local-9": {
+        "packageid": "unlimitedhugs.hugslib",
+        "path": "/mods/local/HugsLib9",
+        "data_source": "local",
+    },
+    "inactive": {
+        "packageid": "someone.inactive",
+        "path": "/mods/local/Inactive",
+        "data_source": "local",
+    },
+}
+
+
+@pytest.fixture(autouse=True)
+def metadata_manager_mock() -> Generator[MagicMock, None, None]:
+    with patch.object(MetadataManager, "instance") as mock_instance:
+        mock = MagicMock()
+        mock.internal_local_metadata = MODS
+        mock_instance.return_value = mock
+        yield mock
+
+
+def test_get_mods_from_list() -> None:
+    active, inactive, duplicates, missing = get_mods_from_list(
+        ["Ludeon.RimWorld", "brrainz.harmony", "UnlimitedHugs.HugsLib", "x.missing"]
+    )
+    # Local duplicates are preferred, and picked by natural path order
+    assert active == ["core", "harmony-local", "hugslib-local-9"]
+    assert inactive == ["harmony-workshop", "hugslib-local-10", "inactive"]
+    assert duplicates == {
+        "brrainz.harmony": ["harmony-local", "harmony-workshop"],
+        "unlimitedhugs.hugslib": ["hugslib-local-10", "hugslib-local-9"],
+    }
+    assert missing == ["x.missing"]
+
+
+def test_get_mods_from_list_steam_suffix() -> None:
+    active, _, _, missing = get_mods_from_list(
+        ["brrainz.harmony_steam", "brrainz.harmony", "someone.inactive_steam"]
+    )
+    # The _steam suffix prefers the workshop duplicate, and a duplicate is only used once
+    assert active == ["harmony-workshop", "inactive"]
+    assert missing == []
+
+
+def test_steam_database_builder_delta_update(tmp_path: Path) -> None:
+    output_path = tmp_path / "steamDB.json"
+    output_path.write_text(
+        json.dumps(
+            {
+                "version": 1000,
+                "built": 850,
+                "database": {
+                    "1": {"url": "url-1", "steamName": "Unchanged"},
+                    "2": {"url": "url-2", "steamName": "Outdated"},
+                },
+            }
+        )
+    )
+    builder = SteamDatabaseBuilder(
+        apikey="0" * 32,
+        appid=294100,
+        database_expiry=100,
+        mode="no_local",
+        output_database_path=str(output_path),
+        delta=True,
+    )
+
+    def create_steam_db(database: dict[str, Any], publishedfileids: list[str]) -> None:
+        for publishedfileid in publishedfileids:
+            database["database"][publishedfileid]["steamName"] = "Updated"
+        database["version"] = 2000
+        dynamic_query.database.update(database)
+
+    with patch("app.utils.metadata.DynamicQuery") as dynamic_query_class:
+        dynamic_query = dynamic_query_class.return_value
+        dynamic_query.database = {}
+        dynamic_query.started = 1950
+        dynamic_query.pfids_updated_since.return_value = ["3", "2"]
+        dynamic_query.create_steam_db.side_effect = create_steam_db
+        builder.run()
+
+    # Updates are looked for since the database was built, whatever the expiry is now
+    dynamic_query.pfids_updated_since.assert_called_once_with(850)
+    assert dynamic_query.create_steam_db.call_args.args[1] == ["3", "2"]
+    assert json.loads(output_path.read_text()) == {
+        "version": 2000,
+        "built": 1950,
+        "database": {
+            "1": {"url": "url-1", "steamName": "Unchanged"},
+            "2": {"url": "url-2", "steamName": "Updated"},
+            "3": {
+                "url": "https://steamcommunity.com/sharedfiles/filedetails/?id=3",
+                "steamName": "Updated",
+            },
+        },
+    }
+
+
+def test_steam_database_builder_delta_update_without_build_time(
+    tmp_path: Path,
+) -> None:
+    output_path = tmp_path / "steamDB.json"
+    output_path.write_text(json.dumps({"version": 1000, "database": {}}))
+    builder = SteamDatabaseBuilder(
+        apikey="0" * 32,
+        appid=294100,
+        database_expiry=100,
+        mode="no_local",
+        output_database_path=str(output_path),
+        delta=True,
+    )
+
+    with patch("app.utils.metadata.DynamicQuery") as dynamic_query_class:
+        dynamic_query = dynamic_query_class.return_value
+        dynamic_query.publishedfileids = []
+        builder.run()
+
+    # The whole database is built instead
+    dynamic_query.pfids_updated_since.assert_not_called()
+    dynamic_query.pfids_by_appid.assert_called_once()
+
+
+def test_request_mod_details() -> None:
+    metadata_manager = MagicMock()
+    metadata_manager.internal_local_metadata = {
+        "skeleton": {
+            "packageid": "author.skeleton",
+            "path": "/mods/local/Skeleton",
+            "data_source": "local",
+            "metadata_file_path": "/mods/local/Skeleton/About/About.xml",
+            "skeleton": True,
+        },
+        **MODS,
+    }
+    metadata_manager.requested_detail_uuids = set()
+
+    with patch("app.utils.metadata.ModParser") as mod_parser_class:
+        MetadataManager.request_mod_details(metadata_manager, "skeleton")
+        # Requested again while its details are being parsed
+        MetadataManager.request_mod_details(metadata_manager, "skeleton")
+        # Mods with their details are not parsed again
+        MetadataManager.request_mod_details(metadata_manager, "inactive")
+
+    # Parsed in the background, ahead of the rest of the details pass
+    mod_parser_class.assert_called_once_with(
+        data_source="local",
+        mod_directory="/mods/local/Skeleton",
+        metadata_manager=metadata_manager,
+        uuid="skeleton",
+        details_only=True,
+        about_file_path="/mods/local/Skeleton/About/About.xml",
+    )
+    metadata_manager.parser_threadpool.start.assert_called_once_with(
+        mod_parser_class.return_value, 1
+    )
+
+
+def _parser_manager(tmp_path: Path) -> MagicMock:
+    metadata_manager = MagicMock()
+    metadata_manager.external_steam_metadata = None
+    metadata_manager.get_steamdb_stamp.return_value = ""
+    metadata_manager.metadata_cache = MetadataParseCache(tmp_path / "cache.json")
+    metadata_manager.internal_local_metadata = {}
+    return metadata_manager
+
+
+def test_mod_parser_skeleton_and_details(tmp_path: Path) -> None:
+    mod_path = tmp_path / "mods" / "Mod"
+    (mod_path / "About").mkdir(parents=True)
+    (mod_path / "About" / "About.xml").write_text(
+        """<ModMetaData>
+    <name>Mod</name>
+    <packageId>Author.Mod</packageId>
+    <author>Author</author>
+    <description>A long description</description>
+    <supportedVersions><li>1.5</li></supportedVersions>
+    <modDependencies><li><packageId>brrainz.harmony</packageId></li></modDependencies>
+</ModMetaData>""",
+        encoding="utf-8",
+    )
+    (mod_path / "1.5" / "Assemblies").mkdir(parents=True)
+    (mod_path / "1.5" / "Assemblies" / "Mod.dll").write_bytes(b"")
+    metadata_manager = _parser_manager(tmp_path)
+
+    ModParser(
+        data_source="local",
+        mod_directory=str(mod_path),
+        metadata_manager=metadata_manager,
+        uuid="mod",
+        skeleton=True,
+    ).run()
+    skeleton = metadata_manager.internal_local_metadata["mod"]
+    assert skeleton["skeleton"] is True
+    assert skeleton["packageid"] == "author.mod"
+    assert skeleton["moddependencies"] == {"li": {"packageId": "brrainz.harmony"}}
+    # The Assemblies check is cheap enough for the skeleton pass
+    assert skeleton["csharp"] is True
+    assert "description" not in skeleton and "authors" not in skeleton
+    # Cached, but only good enough for another skeleton pass
+    assert metadata_manager.metadata_cache.get(str(mod_path), "") is not None
+
+    # The details pass only parses the tags the skeleton pass skipped
+    ModParser(
+        data_source="local",
+        mod_directory=str(mod_path),
+        metadata_manager=metadata_manager,
+        uuid="mod",
+        details_only=True,
+        about_file_path=skeleton["metadata_file_path"],
+    ).run()
+    metadata_manager.mod_details_parsed_signal.emit.assert_called_once_with(
+        "mod",
+        {
+            "authors": "Author",
+            "description": "A long description",
+            "path": str(mod_path),
+        },
+    )
+    # The cached skeleton is completed with them
+    cached = metadata_manager.metadata_cache.get(str(mod_path), "")
+    assert cached is not None
+    assert "skeleton" not in cached
+    assert cached["description"] == "A long description"
+    assert cached["authors"] == "Author"
+    assert cached["packageid"] == "author.mod"
+
+
+def _details_manager(mod_metadata: dict[str, Any]) -> MagicMock:
+    metadata_manager = MagicMock()
+    metadata_manager.internal_local_metadata = {"mod": mod_metadata}
+    metadata_manager.pending_detail_uuids = {"mod", "other"}
+    metadata_manager.requested_detail_uuids = {"mod"}
+    metadata_manager.rules_version = 0
+    return metadata_manager
+
+
+def _apply_mod_details(metadata_manager: MagicMock, details: dict[str, Any]) -> None:
+    MetadataManager._MetadataManager__apply_mod_details(  # type: ignore[attr-defined]
+        metadata_manager, "mod", details
+    )
+
+
+def test_apply_mod_details() -> None:
+    mod_metadata = {
+        "packageid": "author.mod",
+        "name": "Mod",
+        "path": "/mods/Mod",
+        "publishedfileid": "123",
+        "skeleton": True,
+    }
+    metadata_manager = _details_manager(mod_metadata)
+
+    _apply_mod_details(
+        metadata_manager,
+        {"description": "Details", "publishedfileid": "456", "path": "/mods/Mod"},
+    )
+    # The details fill in what the skeleton is missing, without overriding it
+    assert mod_metadata == {
+        "packageid": "author.mod",
+        "name": "Mod",
+        "path": "/mods/Mod",
+        "publishedfileid": "123",
+        "description": "Details",
+    }
+    assert metadata_manager.pending_detail_uuids == {"other"}
+    assert metadata_manager.requested_detail_uuids == set()
+    metadata_manager.mod_metadata_updated_signal.emit.assert_called_once_with("mod")
+    metadata_manager.compile_metadata.assert_not_called()
+    assert metadata_manager.rules_version == 0
+    # The cache is saved once the last pending details are applied
+    metadata_manager.metadata_cache.save.assert_not_called()
+    metadata_manager.pending_detail_uuids = {"mod"}
+    mod_metadata["skeleton"] = True
+    _apply_mod_details(metadata_manager, {"path": "/mods/Mod"})
+    metadata_manager.metadata_cache.save.assert_called_once()
+
+
+@pytest.mark.parametrize(
+    "details",
+    [
+        {},
+        {"description": "Details", "path": "/mods/Other"},
+    ],
+    ids=["failed", "moved"],
+)
+def test_apply_mod_details_stale(details: dict[str, Any]) -> None:
+    mod_metadata = {"packageid": "author.mod", "path": "/mods/Mod", "skeleton": True}
+    metadata_manager = _details_manager(mod_metadata)
+
+    _apply_mod_details(metadata_manager, details)
+    assert mod_metadata == {
+        "packageid": "author.mod",
+        "path": "/mods/Mod",
+        "skeleton": True,
+    }
+    assert metadata_manager.pending_detail_uuids == {"other"}
+    metadata_manager.mod_metadata_updated_signal.emit.assert_not_called()
+
+
+@pytest.mark.parametrize("packageid", ["scenario.rsc", "author.scenario"])
+def test_apply_mod_details_scenario(packageid: str) -> None:
+    mod_metadata = {
+        "name": "Placeholder",
+        "packageid": "scenario.rsc",
+        "path": "/mods/Scenario",
+        "scenario": True,
+        "skeleton": True,
+    }
+    metadata_manager = _details_manager(mod_metadata)
+    details = {
+        "name": "Scenario",
+        "packageid": packageid,
+        "path": "/mods/Scenario",
+        "scenario": True,
+        "supportedversions": {"li": "1.5"},
+    }
+
+    _apply_mod_details(metadata_manager, details)
+    # The placeholder is replaced entirely, and re-indexed
+    assert mod_metadata == details
+    metadata_manager.unindex_mod.assert_called_once()
+    metadata_manager.index_mod.assert_called_once_with("mod", mod_metadata)
+    if packageid == "scenario.rsc":
+        # Same rules, but the name used when sorting changed
+        metadata_manager.compile_metadata.assert_not_called()
+        metadata_manager.version_mismatch_index.update.assert_called_once_with(
+            ["mod"], metadata_manager.internal_local_metadata
+        )
+        assert metadata_manager.rules_version == 1
+    else:
+        # A new packageid changes the rules towards the scenario
+        metadata_manager.compile_metadata.assert_called_once_with(uuids=["mod"])
+        assert metadata_manager.rules_version == 0
+    metadata_manager.mod_metadata_updated_signal.emit.assert_called_once_with("mod")
@@ -0,0 +1,143 @@
+import os
+from pathlib import Path
+
+import pytest
+
+from app.utils.metadata_cache import (
+    MISSING_PATH_STAMP,
+    MetadataParseCache,
+    path_stamp,
+)
+
+
+@pytest.fixture
+def mod_dir(tmp_path: Path) -> Path:
+    about = tmp_path / "mods" / "test_mod" / "About"
+    about.mkdir(parents=True)
+    (about / "About.xml").write_text(
+        "<ModMetaData><packageId>a.b</packageId></ModMetaData>"
+    )
+    return about.parent
+
+
+@pytest.fixture
+def cache(tmp_path: Path) -> MetadataParseCache:
+    return MetadataParseCache(tmp_path / "metadata_cache.json")
+
+
+def _put(cache: MetadataParseCache, mod_dir: Path, **kwargs: object) -> None:
+    about_xml = str(mod_dir / "About" / "About.xml")
+    cache.put(
+        mod_directory=str(mod_dir),
+        metadata={"packageid": "a.b", "supportedversions": {"li": ["1.4", "1.5"]}},
+        stamp_paths=[about_xml],
+        steamdb_sensitive=bool(kwargs.get("steamdb_sensitive", False)),
+        steamdb_stamp=str(kwargs.get("steamdb_stamp", "")),
+    )
+
+
+def test_path_stamp_missing(tmp_path: Path) -> None:
+    assert path_stamp(str(tmp_path / "does_not_exist")) == MISSING_PATH_STAMP
+
+
+def test_cache_hit(cache: MetadataParseCache, mod_dir: Path) -> None:
+    _put(cache, mod_dir)
+    metadata = cache.get(str(mod_dir), "")
+    assert metadata == {
+        "packageid": "a.b",
+        "supportedversions": {"li": ["1.4", "1.5"]},
+    }
+
+
+def test_cache_returns_independent_copies(
+    cache: MetadataParseCache, mod_dir: Path
+) -> None:
+    _put(cache, mod_dir)
+    first = cache.get(str(mod_dir), "")
+    assert first is not None
+    first["dependencies"] = {"c.d"}
+    assert "dependencies" not in (cache.get(str(mod_dir), "") or {})
+
+
+def test_cache_miss_on_modified_file(cache: MetadataParseCache, mod_dir: Path) -> None:
+    _put(cache, mod_dir)
+    about_xml = mod_dir / "About" / "About.xml"
+    stat = about_xml.stat()
+    about_xml.write_text("<ModMetaData><packageId>a.c</packageId></ModMetaData>")
+    os.utime(about_xml, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert cache.get(str(mod_dir), "") is None
+
+
+def test_cache_miss_on_new_stamped_path(
+    cache: MetadataParseCache, mod_dir: Path
+) -> None:
+    assemblies = mod_dir / "Assemblies"
+    cache.put(
+        mod_directory=str(mod_dir),
+        metadata={"packageid": "a.b"},
+        stamp_paths=[str(assemblies)],
+        steamdb_sensitive=False,
+        steamdb_stamp="",
+    )
+    assemblies.mkdir()
+    assert cache.get(str(mod_dir), "") is None
+
+
+def test_cache_steamdb_sensitivity(cache: MetadataParseCache, mod_dir: Path) -> None:
+    _put(cache, mod_dir, steamdb_sensitive=True, steamdb_stamp="db:1")
+    assert cache.get(str(mod_dir), "db:1") is not None
+    assert cache.get(str(mod_dir), "db:2") is None
+
+    _put(cache, mod_dir, steamdb_sensitive=False, steamdb_stamp="db:1")
+    assert cache.get(str(mod_dir), "db:2") is not None
+
+
+def test_cache_round_trip_and_prune(
+    cache: MetadataParseCache, mod_dir: Path, tmp_path: Path
+) -> None:
+    other_dir = tmp_path / "mods" / "other_mod"
+    other_dir.mkdir()
+    _put(cache, mod_dir)
+    cache.put(
+        mod_directory=str(other_dir),
+        metadata={"invalid": True},
+        stamp_paths=[],
+        steamdb_sensitive=False,
+        steamdb_stamp="",
+    )
+    cache.save(keep=[str(mod_dir)])
+
+    reloaded = MetadataParseCache(cache.path)
+    reloaded.load()
+    assert len(reloaded) == 1
+    assert reloaded.get(str(mod_dir), "") is not None
+    assert reloaded.get(str(other_dir), "") is None
+
+
+def test_cache_load_corrupt_file(cache: MetadataParseCache) -> None:
+    cache.path.write_text("{not json")
+    cache.load()
+    assert len(cache) == 0
+
+
+def test_cache_complete_skeleton(cache: MetadataParseCache, mod_dir: Path) -> None:
+    about_xml = str(mod_dir / "About" / "About.xml")
+    cache.put(
+        mod_directory=str(mod_dir),
+        metadata={"packageid": "a.b", "name": "Mod", "skeleton": True},
+        stamp_paths=[about_xml],
+        steamdb_sensitive=False,
+        steamdb_stamp="",
+    )
+    cache.complete_skeleton(str(mod_dir), {"name": "Other", "description": "Details"})
+    assert cache.get(str(mod_dir), "") == {
+        "packageid": "a.b",
+        "name": "Mod",
+        "description": "Details",
+    }
+
+    # Complete entries, e.g. re-parsed in the meantime, are left alone
+    cache.complete_skeleton(str(mod_dir), {"authors": "Author"})
+    assert "authors" not in (cache.get(str(mod_dir), "") or {})
+    cache.complete_skeleton(str(mod_dir / "missing"), {"authors": "Author"})
+    assert len(cache) == 1
@@ -0,0 +1,221 @@
+import copy
+from typing import Any
+
+import pytest
+
+from app.utils.metadata_rules import (
+    RULE_SOURCE_ABOUT_XML,
+    RULE_SOURCE_COMMUNITY_RULES,
+    RULE_SOURCE_STEAM_DB,
+    RULE_SOURCE_USER_RULES,
+    RuleCompiler,
+    normalize_dependency_ids,
+    normalize_load_rule_ids,
+)
+
+GAME_VERSION = "1.5.4104 rev435"
+
+COMPILED_KEYS = (
+    "dependencies",
+    "incompatibilities",
+    "loadTheseBefore",
+    "loadTheseAfter",
+    "loadBottom",
+)
+
+
+def _mods() -> dict[str, Any]:
+    return {
+        "uuid-core": {"packageid": "ludeon.rimworld"},
+        "uuid-harmony": {
+            "packageid": "brrainz.harmony",
+            "publishedfileid": "2009463077",
+            "loadbefore": {"li": ["Ludeon.RimWorld"]},
+        },
+        "uuid-a": {
+            "packageid": "author.a",
+            "publishedfileid": "111",
+            "moddependencies": {"li": {"packageId": "brrainz.harmony"}},
+            "loadafter": {"li": ["brrainz.harmony", "not.installed"]},
+            "incompatiblewith": {"li": ["author.b", "not.installed"]},
+        },
+        "uuid-b": {
+            "packageid": "author.b",
+            "loadafterbyversion": {"v1.5": {"li": "author.a"}, "v1.4": {"li": "x.y"}},
+        },
+        "uuid-c": {"packageid": "author.c"},
+    }
+
+
+def _packageid_to_uuids(mods: dict[str, Any]) -> dict[str, set[str]]:
+    packageid_to_uuids: dict[str, set[str]] = {}
+    for uuid, mod in mods.items():
+        packageid_to_uuids.setdefault(mod["packageid"], set()).add(uuid)
+    return packageid_to_uuids
+
+
+STEAM_DB = {
+    "2009463077": {"packageid": "brrainz.harmony", "name": "Harmony"},
+    "111": {
+        "packageid": "Author.A",
+        "name": "A",
+        "dependencies": {"2009463077": ["Harmony", "url"], "999": ["Gone", "url"]},
+    },
+}
+COMMUNITY_RULES = {
+    "Author.C": {"loadAfter": {"author.a": {}}, "loadBottom": {"value": True}},
+}
+USER_RULES: dict[str, Any] = {
+    "author.c": {"loadAfter": {"author.a": {}}},
+}
+
+
+def _compiled(mods: dict[str, Any]) -> dict[str, dict[str, Any]]:
+    return {
+        uuid: {key: mod[key] for key in COMPILED_KEYS if mod.get(key)}
+        for uuid, mod in mods.items()
+    }
+
+
+def _compile_all(mods: dict[str, Any]) -> RuleCompiler:
+    compiler = RuleCompiler()
+    compiler.compile(
+        list(mods),
+        mods,
+        _packageid_to_uuids(mods),
+        GAME_VERSION,
+        STEAM_DB,
+        COMMUNITY_RULES,
+        USER_RULES,
+    )
+    return compiler
+
+
+def test_normalize_ids() -> None:
+    assert normalize_dependency_ids([{"packageId": "A.B"}, {"packageId": "C"}]) == [
+        "a.b",
+        "c",
+    ]
+    assert normalize_load_rule_ids(["A.B", {"#text": "C.D"}, None]) == ["a.b", "c.d"]
+
+
+def test_full_compile() -> None:
+    mods = _mods()
+    _compile_all(mods)
+    assert _compiled(mods) == {
+        "uuid-core": {"loadTheseBefore": {("brrainz.harmony", False)}},
+        "uuid-harmony": {
+            "loadTheseAfter": {("ludeon.rimworld", True), ("author.a", False)}
+        },
+        "uuid-a": {
+            "dependencies": {"brrainz.harmony"},
+            "incompatibilities": {"author.b"},
+            "loadTheseBefore": {("brrainz.harmony", True)},
+            "loadTheseAfter": {("author.b", False), ("author.c", False)},
+        },
+        "uuid-b": {"loadTheseBefore": {("author.a", True)}},
+        "uuid-c": {"loadTheseBefore": {("author.a", True)}, "loadBottom": True},
+    }
+
+
+def test_edge_sources() -> None:
+    mods = _mods()
+    compiler = _compile_all(mods)
+    assert compiler.edges.sources_of("uuid-a", "dependencies", "brrainz.harmony") == {
+        RULE_SOURCE_ABOUT_XML,
+        RULE_SOURCE_STEAM_DB,
+    }
+    assert compiler.edges.sources_of(
+        "uuid-a", "loadTheseAfter", ("author.c", False)
+    ) == {RULE_SOURCE_COMMUNITY_RULES, RULE_SOURCE_USER_RULES}
+
+
+@pytest.mark.parametrize(
+    "uuid, change",
+    [
+        ("uuid-a", {"loadafter": {"li": ["author.c"]}}),
+        ("uuid-a", {"packageid": "author.renamed"}),
+        ("uuid-b", {"loadafterbyversion": None}),
+        ("uuid-c", {"loadbefore": {"li": "brrainz.harmony"}}),
+    ],
+)
+def test_incremental_update_matches_full_compile(
+    uuid: str, change: dict[str, Any]
+) -> None:
+    mods = _mods()
+    compiler = _compile_all(mods)
+    packageid_to_uuids = _packageid_to_uuids(mods)
+
+    # Replace the changed mod with freshly parsed metadata, as the parser would
+    updated = copy.deepcopy(_mods())
+    updated[uuid].update(change)
+    mods[uuid] = updated[uuid]
+    for uuids in packageid_to_uuids.values():
+        uuids.discard(uuid)
+    packageid_to_uuids.setdefault(mods[uuid]["packageid"], set()).add(uuid)
+    compiler.compile(
+        [uuid],
+        mods,
+        packageid_to_uuids,
+        GAME_VERSION,
+        STEAM_DB,
+        COMMUNITY_RULES,
+        USER_RULES,
+    )
+
+    expected = updated
+    _compile_all(expected)
+    assert _compiled(mods) == _compiled(expected)
+
+
+def test_incremental_deletion_and_creation() -> None:
+    mods = _mods()
+    compiler = _compile_all(mods)
+    packageid_to_uuids = _packageid_to_uuids(mods)
+
+    deleted = mods.pop("uuid-harmony")
+    packageid_to_uuids["brrainz.harmony"].discard("uuid-harmony")
+    compiler.compile(
+        ["uuid-harmony"],
+        mods,
+        packageid_to_uuids,
+        GAME_VERSION,
+        STEAM_DB,
+        COMMUNITY_RULES,
+        USER_RULES,
+    )
+    assert "loadTheseBefore" not in _compiled(mods)["uuid-core"]
+    assert ("brrainz.harmony", True) not in mods["uuid-a"]["loadTheseBefore"]
+    # Dependencies are kept regardless of whether they are installed
+    assert mods["uuid-a"]["dependencies"] == {"brrainz.harmony"}
+
+    mods["uuid-harmony"] = deleted
+    packageid_to_uuids["brrainz.harmony"].add("uuid-harmony")
+    compiler.compile(
+        ["uuid-harmony"],
+        mods,
+        packageid_to_uuids,
+        GAME_VERSION,
+        STEAM_DB,
+        COMMUNITY_RULES,
+        USER_RULES,
+    )
+    expected = _mods()
+    _compile_all(expected)
+    assert _compiled(mods) == _compiled(expected)
+
+
+def test_incremental_compile_only_touches_dependents() -> None:
+    mods = _mods()
+    compiler = _compile_all(mods)
+    compiled = compiler.compile(
+        ["uuid-b"],
+        mods,
+        _packageid_to_uuids(mods),
+        GAME_VERSION,
+        STEAM_DB,
+        COMMUNITY_RULES,
+        USER_RULES,
+    )
+    # author.a declares author.b incompatible, nothing else references author.b
+    assert compiled == {"uuid-a", "uuid-b"}
@@ -0,0 +1,91 @@
+from typing import Any
+
+import pytest
+
+from app.utils.mod_search_index import ModSearchIndex, search_text
+
+
+def _mods() -> dict[str, Any]:
+    return {
+        "uuid-harmony": {
+            "name": "Harmony",
+            "packageid": "brrainz.harmony",
+            "authors": "Andreas Pardeike",
+            "publishedfileid": "2009463077",
+            "supportedversions": {"li": ["1.4", "1.5"]},
+        },
+        "uuid-hugslib": {
+            "name": "HugsLib",
+            "packageid": "UnlimitedHugs.HugsLib",
+            "authors": ["UnlimitedHugs"],
+            "supportedversions": {"li": "1.5"},
+        },
+        "uuid-local": {"name": "Local Mod", "packageid": "someone.local"},
+    }
+
+
+def test_search_text() -> None:
+    mods = _mods()
+    assert search_text(mods["uuid-hugslib"], "packageid") == "unlimitedhugs.hugslib"
+    assert search_text(mods["uuid-hugslib"], "authors") == "['unlimitedhugs']"
+    assert search_text(mods["uuid-hugslib"], "version") == "1.5"
+    assert search_text(mods["uuid-harmony"], "version") == "1.4\n1.5"
+    assert search_text(mods["uuid-local"], "publishedfileid") is None
+    assert search_text(mods["uuid-local"], "version") is None
+
+
+@pytest.mark.parametrize(
+    "field, pattern, expected",
+    [
+        ("name", "", set()),
+        ("name", "HUGS", {"uuid-harmony", "uuid-local"}),
+        ("packageid", "brrainz", {"uuid-hugslib", "uuid-local"}),
+        # Mods without a value are not filtered out...
+        ("publishedfileid", "2009", set()),
+        ("publishedfileid", "123", {"uuid-harmony"}),
+        # ...except when searching versions
+        ("version", "1.5", {"uuid-local"}),
+        ("version", "1.4", {"uuid-hugslib", "uuid-local"}),
+    ],
+)
+def test_filtered_out(field: str, pattern: str, expected: set[str]) -> None:
+    mods = _mods()
+    index = ModSearchIndex()
+    index.sync(mods, mods)
+    assert index.filtered_out(field, pattern, mods) == expected
+
+
+def test_narrowed_search_matches_full_search() -> None:
+    mods = _mods()
+    index = ModSearchIndex()
+    index.sync(mods, mods)
+    typed = ""
+    for character in "hugslib":
+        typed += character
+        fresh = ModSearchIndex()
+        fresh.sync(mods, mods)
+        assert index.filtered_out("name", typed, mods) == fresh.filtered_out(
+            "name", typed, mods
+        )
+    # Searching a different list of mods does not reuse the previous matches
+    assert index.filtered_out("name", "hugslibs", ["uuid-local"]) == {"uuid-local"}
+    assert index.filtered_out("name", "hugslibs!", mods) == set(mods)
+
+
+def test_index_follows_metadata_changes() -> None:
+    mods = _mods()
+    index = ModSearchIndex()
+    index.sync(mods, mods)
+    assert len(index) == len(mods)
+    assert index.filtered_out("name", "local", mods) == {"uuid-harmony", "uuid-hugslib"}
+
+    # Replaced metadata is re-indexed on the next sync
+    mods["uuid-local"] = {"name": "Renamed", "packageid": "someone.local"}
+    index.sync(mods, mods)
+    assert index.filtered_out("name", "local", mods) == set(mods)
+
+    # Metadata changed in place is re-indexed once discarded
+    mods["uuid-local"]["name"] = "Local again"
+    index.discard("uuid-local")
+    index.sync(mods, mods)
+    assert index.filtered_out("name", "local", mods) == {"uuid-harmony", "uuid-hugslib"}
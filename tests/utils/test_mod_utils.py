@@ -1,9 +1,15 @@
+from threading import Lock, Thread
 from typing import Generator
 from unittest.mock import MagicMock, patch
 
 import pytest
 
-from app.utils.mod_utils import get_mod_name_from_pfid, get_mod_paths_from_uuids
+from app.utils.metadata import MetadataManager
+from app.utils.mod_utils import (
+    get_mod_name_from_pfid,
+    get_mod_path_from_pfid,
+    get_mod_paths_from_uuids,
+)
 
 
 @pytest.fixture
@@ -23,6 +29,16 @@ def metadata_manager_mock() -> Generator[MagicMock, None, None]:
             },
         }
         mock.external_steam_metadata = {"789": {"name": "External Mod"}}
+        # Index the mods and look them up like the MetadataManager does
+        mock.packageid_to_uuids = {}
+        mock.publishedfileid_to_uuids = {}
+        mock.path_to_uuid = {}
+        mock.mod_index_lock = Lock()
+        for uuid, metadata in mock.internal_local_metadata.items():
+            MetadataManager.index_mod(mock, uuid, metadata)
+        mock.get_uuid_from_publishedfileid.side_effect = lambda pfid: (
+            MetadataManager.get_uuid_from_publishedfileid(mock, pfid)
+        )
         mock_instance.return_value = mock
         yield mock
 
@@ -46,6 +62,27 @@ def test_get_mod_name_from_pfid_invalid(metadata_manager_mock: MagicMock) -> Non
     assert get_mod_name_from_pfid(None) == "Unknown Mod"
 
 
+def test_get_mod_path_from_pfid(metadata_manager_mock: MagicMock) -> None:
+    assert get_mod_path_from_pfid("456") == "/path/to/mod2"
+    assert get_mod_path_from_pfid("999") == "Unknown path (999)"
+
+    # Lookups follow mods that are re-indexed or removed
+    mod = metadata_manager_mock.internal_local_metadata["uuid2"]
+    MetadataManager.unindex_mod(metadata_manager_mock, "uuid2", mod)
+    mod["publishedfileid"] = "999"
+    MetadataManager.index_mod(metadata_manager_mock, "uuid2", mod)
+    assert get_mod_path_from_pfid("456") == "Unknown path (456)"
+    assert get_mod_path_from_pfid("999") == "/path/to/mod2"
+    assert metadata_manager_mock.path_to_uuid == {
+        "/path/to/mod1": "uuid1",
+        "/path/to/mod2": "uuid2",
+    }
+
+    MetadataManager.unindex_mod(metadata_manager_mock, "uuid2", mod)
+    assert metadata_manager_mock.publishedfileid_to_uuids == {"123": {"uuid1"}}
+    assert metadata_manager_mock.path_to_uuid == {"/path/to/mod1": "uuid1"}
+
+
 def test_get_mod_paths_from_uuids(metadata_manager_mock: MagicMock) -> None:
     with patch("os.path.isdir") as isdir_mock:
         isdir_mock.side_effect = lambda path: path in ["/path/to/mod1", "/path/to/mod2"]
@@ -62,3 +99,19 @@ def test_get_mod_paths_from_uuids_with_nonexistent_path(
         isdir_mock.return_value = False
         paths = get_mod_paths_from_uuids(["uuid1"])
         assert paths == []
+
+
+def test_index_updates_are_locked(metadata_manager_mock: MagicMock) -> None:
+    # ModParser threads re-index mods while the lookups are in use
+    mod = {"packageid": "author.duplicate", "path": "/mods/duplicate"}
+    with metadata_manager_mock.mod_index_lock:
+        thread = Thread(
+            target=MetadataManager.index_mod,
+            args=(metadata_manager_mock, "uuid3", mod),
+        )
+        thread.start()
+        thread.join(timeout=0.1)
+        assert thread.is_alive()
+        assert "author.duplicate" not in metadata_manager_mock.packageid_to_uuids
+    thread.join()
+    assert metadata_manager_mock.packageid_to_uuids["author.duplicate"] == {"uuid3"}
@@ -0,0 +1,116 @@
+import os
+from pathlib import Path
+
+from PySide6.QtGui import QColor, QImage
+from pytestqt.qtbot import QtBot
+
+from app.utils.preview_image_loader import (
+    THUMBNAIL_SIZE,
+    PreviewImageLoader,
+    find_preview_image,
+    load_thumbnail,
+    prune_thumbnail_cache,
+)
+
+
+def _write_preview(mod_path: Path, width: int, height: int) -> Path:
+    about_path = mod_path / "about"
+    about_path.mkdir(parents=True)
+    image = QImage(width, height, QImage.Format.Format_RGB32)
+    image.fill(QColor("red"))
+    image_path = about_path / "preview.PNG"
+    assert image.save(str(image_path))
+    return image_path
+
+
+def test_find_preview_image(tmp_path: Path) -> None:
+    image_path = _write_preview(tmp_path / "mod", 8, 8)
+    assert find_preview_image(str(tmp_path / "mod")) == str(image_path)
+    assert find_preview_image(str(tmp_path)) is None
+    assert find_preview_image(str(tmp_path / "missing")) is None
+
+
+def test_load_thumbnail(tmp_path: Path) -> None:
+    cache_folder = tmp_path / "thumbnails"
+    small_path = _write_preview(tmp_path / "small", 64, 32)
+    large_path = _write_preview(tmp_path / "large", THUMBNAIL_SIZE * 2, 512)
+
+    # Small images are neither downscaled nor cached
+    small = load_thumbnail(str(small_path), cache_folder)
+    assert (small.width(), small.height()) == (64, 32)
+    assert not cache_folder.exists()
+
+    large = load_thumbnail(str(large_path), cache_folder)
+    assert (large.width(), large.height()) == (THUMBNAIL_SIZE, 256)
+    assert len(os.listdir(cache_folder)) == 1
+
+    # The cached thumbnail is used while the image is unchanged
+    cached = load_thumbnail(str(large_path), cache_folder)
+    assert (cached.width(), cached.height()) == (THUMBNAIL_SIZE, 256)
+    assert len(os.listdir(cache_folder)) == 1
+
+    assert load_thumbnail(str(tmp_path / "missing.png"), cache_folder).isNull()
+
+
+def test_prune_thumbnail_cache(tmp_path: Path) -> None:
+    for i in range(5):
+        (tmp_path / str(i)).write_bytes(b"")
+        os.utime(tmp_path / str(i), ns=(0, i * 1_000_000_000))
+    prune_thumbnail_cache(tmp_path, keep=2)
+    assert sorted(os.listdir(tmp_path)) == ["3", "4"]
+
+
+def test_preview_image_loader(tmp_path: Path, qtbot: QtBot) -> None:
+    _write_preview(tmp_path / "mod", 64, 32)
+    loader = PreviewImageLoader()
+
+    with qtbot.waitSignal(loader.preview_loaded) as blocker:
+        assert loader.request(str(tmp_path / "mod")) is None
+    mod_path, pixmap = blocker.args
+    assert mod_path == str(tmp_path / "mod")
+    assert (pixmap.width(), pixmap.height()) == (64, 32)
+
+    # Loaded previews are kept in memory
+    cached = loader.request(str(tmp_path / "mod"))
+    assert cached is not None and cached.width() == 64
+
+    # Mods without a preview get a null pixmap
+    with qtbot.waitSignal(loader.preview_loaded) as blocker:
+        assert loader.request(str(tmp_path / "missing")) is None
+    assert blocker.args[1].isNull()
+
+
+def test_preview_image_loader_finished_task(tmp_path: Path, qtbot: QtBot) -> None:
+    _write_preview(tmp_path / "first", 8, 8)
+    _write_preview(tmp_path / "second", 8, 8)
+    loader = PreviewImageLoader()
+
+    # Finish loading a preview, without receiving its result yet
+    assert loader.request(str(tmp_path / "first")) is None
+    assert loader._pool.waitForDone(5000)
+    # Requesting another mod tries to cancel the finished task
+    with qtbot.waitSignal(
+        loader.preview_loaded,
+        check_params_cb=lambda mod_path, _: mod_path == str(tmp_path / "second"),
+    ):
+        assert loader.request(str(tmp_path / "second")) is None
+    assert loader.request(str(tmp_path / "first")) is not None
+
+
+def test_preview_image_loader_reloads_changed_previews(
+    tmp_path: Path, qtbot: QtBot
+) -> None:
+    image_path = _write_preview(tmp_path / "mod", 64, 32)
+    loader = PreviewImageLoader()
+    with qtbot.waitSignal(loader.preview_loaded):
+        loader.request(str(tmp_path / "mod"))
+    assert loader.request(str(tmp_path / "mod")) is not None
+
+    # The mod is updated with a new preview
+    image = QImage(16, 16, QImage.Format.Format_RGB32)
+    image.fill(QColor("blue"))
+    assert image.save(str(image_path))
+    os.utime(image_path, ns=(0, os.stat(image_path).st_mtime_ns + 1_000_000_000))
+    with qtbot.waitSignal(loader.preview_loaded) as blocker:
+        assert loader.request(str(tmp_path / "mod")) is None
+    assert blocker.args[1].width() == 16
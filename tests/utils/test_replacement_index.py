@@ -0,0 +1,87 @@
+import os
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.utils.replacement_index import (
+    ReplacementEntry,
+    ReplacementIndex,
+    replacements_stamp,
+)
+
+
+def _write_replacement(folder: Path, pfid: str, name: str, versions: str) -> None:
+    (folder / f"{pfid}.xml").write_text(
+        "<ModReplacement>"
+        f"<ReplacementName>{name}</ReplacementName>"
+        "<ReplacementAuthor>Author</ReplacementAuthor>"
+        f"<ReplacementSteamId>{pfid}0</ReplacementSteamId>"
+        f"<ReplacementVersions>{versions}</ReplacementVersions>"
+        "</ModReplacement>",
+        encoding="utf-8",
+    )
+
+
+def test_replacement_entry_supports() -> None:
+    entry = ReplacementEntry(name="", author="", pfid="", versions="1.4,1.5")
+    assert entry.supports("1.5.4104 rev435")
+    assert not entry.supports("1.3.3389 rev1136")
+    assert not entry.supports("Unknown")
+
+
+def test_replacement_index(tmp_path: Path) -> None:
+    folder = tmp_path / "Replacements"
+    folder.mkdir()
+    _write_replacement(folder, "1", "First", "1.4,1.5")
+    _write_replacement(folder, "2", "Second", "1.5")
+    (folder / "3.xml").write_text("<Invalid />", encoding="utf-8")
+    (folder / "readme.md").write_text("Not a replacement", encoding="utf-8")
+
+    index = ReplacementIndex(tmp_path / "index.json", max_workers=2)
+    replacement = index.get(folder, "1")
+    assert replacement is not None
+    assert (replacement.name, replacement.author, replacement.pfid) == (
+        "First",
+        "Author",
+        "10",
+    )
+    assert index.get(folder, "3") is None
+    assert index.get(folder, "4") is None
+    assert len(index) == 2
+    assert (tmp_path / "index.json").exists()
+
+
+def test_replacements_stamp(tmp_path: Path) -> None:
+    assert replacements_stamp(tmp_path / "missing") == (-1, -1, -1)
+    _write_replacement(tmp_path, "1", "First", "1.5")
+    stamp = replacements_stamp(tmp_path)
+    assert stamp[0] == 1
+
+    # Rewriting a file changes the stamp
+    os.utime(tmp_path / "1.xml", ns=(0, stamp[1] + 1))
+    assert replacements_stamp(tmp_path) != stamp
+
+
+def test_replacement_index_invalidation(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    folder = tmp_path / "Replacements"
+    folder.mkdir()
+    _write_replacement(folder, "1", "First", "1.5")
+    index = ReplacementIndex(tmp_path / "index.json")
+    assert index.get(folder, "2") is None
+
+    # Changes are only picked up once the index is invalidated or reloaded
+    _write_replacement(folder, "2", "Second", "1.5")
+    assert index.get(folder, "2") is None
+    index.invalidate()
+    replacement = index.get(folder, "2")
+    assert replacement is not None and replacement.name == "Second"
+
+    # A new index reuses the on-disk index while the folder is unchanged
+    reloaded = ReplacementIndex(tmp_path / "index.json")
+    monkeypatch.setattr(reloaded, "_build", MagicMock())
+    reloaded.load(folder)
+    assert len(reloaded) == 2
+    reloaded._build.assert_not_called()  # type: ignore[attr-defined]
@@ -0,0 +1,82 @@
+from pathlib import Path
+
+from app.utils.runner_output import RunnerOutputPipeline, open_runner_log, parse_line
+
+
+def test_parse_steamcmd_line() -> None:
+    output = parse_line(
+        "Success. Downloaded item 818773962 to ... (1234 bytes)", "/bin/steamcmd"
+    )
+    assert output.steamcmd_downloaded == ["818773962"]
+    assert not output.overwrite
+
+    output = parse_line(
+        " Update state (0x61) downloading] Downloading update (", "steamcmd"
+    )
+    assert output.overwrite
+
+    output = parse_line("ERROR! Download item 818773962 failed (Failure).", "steamcmd")
+    assert output.progress_state == "warn"
+    assert output.progress_step == 1
+
+    # SteamCMD patterns only apply to SteamCMD
+    output = parse_line("ERROR! Download item 818773962 failed (Failure).", "todds")
+    assert output.progress_state is None
+
+
+def test_parse_progress_line() -> None:
+    output = parse_line("Progress: 40/100 ", "/usr/bin/todds")
+    assert output.progress == (40, 100)
+    assert output.overwrite
+    assert output.text == "Progress: 40/100"
+
+    output = parse_line("IPublishedFileService/GetDetails chunk [2/7]")
+    assert output.progress == (2, 7)
+
+
+def test_runner_output_pipeline(tmp_path: Path) -> None:
+    pipeline = RunnerOutputPipeline(tmp_path)
+    euro = "€".encode()
+    # ANSI escapes are stripped, and characters split across chunks are decoded whole
+    pipeline.feed(b"\x1b[0mfirst\r\n" + euro[:1], "todds")
+    pipeline.feed(euro[1:] + b" second\nProgress: 1/2\n", "todds")
+    pipeline.feed("message")
+    pipeline.wait()
+
+    lines = pipeline.drain()
+    assert [line.text for line in lines] == [
+        "first",
+        "€ second",
+        "Progress: 1/2",
+        "message",
+    ]
+    assert lines[2].progress == (1, 2)
+    assert not pipeline.pending()
+
+    assert pipeline.log is not None
+    log_path = Path(pipeline.log.name)
+    pipeline.close()
+    assert log_path.read_text(encoding="utf-8").splitlines() == [
+        "first",
+        "€ second",
+        "Progress: 1/2",
+        "message",
+    ]
+    # Output after closing is ignored
+    pipeline.feed("ignored")
+    assert not pipeline.pending()
+
+
+def test_open_runner_log_keeps_latest(tmp_path: Path) -> None:
+    for i in range(5):
+        (tmp_path / f"runner_2024010{i}_000000_000000.log").touch()
+
+    log = open_runner_log(tmp_path, keep=3)
+    assert log is not None
+    log.close()
+
+    assert sorted(path.name for path in tmp_path.iterdir()) == [
+        "runner_20240103_000000_000000.log",
+        "runner_20240104_000000_000000.log",
+        Path(log.name).name,
+    ]
@@ -0,0 +1,145 @@
+import json
+import os
+from pathlib import Path
+from typing import Any
+
+import msgspec
+import pytest
+
+from app.utils.metadata_rules import index_steam_db
+from app.utils.steam_db_index import (
+    IndexedSteamDatabase,
+    steam_db_index_path,
+    steam_db_packageid,
+)
+
+DATABASE: dict[str, Any] = {
+    "2009463077": {
+        "url": "https://steamcommunity.com/sharedfiles/filedetails/?id=2009463077",
+        "packageId": "brrainz.harmony",
+        "name": "Harmony",
+        "steamName": "Harmony",
+        "gameVersions": ["1.4", "1.5"],
+    },
+    # Older Steam DBs
+    "111": {
+        "packageid": "Author.A",
+        "name": "A",
+        "dependencies": {"2009463077": ["Harmony", "url"]},
+        "blacklist": {"value": True, "comment": "Broken"},
+    },
+    "222": {"url": "https://steamcommunity.com/sharedfiles/filedetails/?id=222"},
+}
+
+
+@pytest.fixture
+def steam_db_path(tmp_path: Path) -> str:
+    path = tmp_path / "steamDB.json"
+    path.write_text(
+        json.dumps({"version": 1700000000, "database": DATABASE}), encoding="utf-8"
+    )
+    return str(path)
+
+
+@pytest.fixture
+def indexed_db(steam_db_path: str, tmp_path: Path) -> IndexedSteamDatabase:
+    return IndexedSteamDatabase.open_or_build(steam_db_path, tmp_path / "index")
+
+
+def test_indexed_db_behaves_like_database(indexed_db: IndexedSteamDatabase) -> None:
+    assert indexed_db.version == 1700000000
+    assert len(indexed_db) == len(DATABASE)
+    assert indexed_db
+    assert dict(indexed_db) == DATABASE
+    assert dict(indexed_db.items()) == DATABASE
+    assert list(indexed_db.values()) == [DATABASE[key] for key in indexed_db]
+    assert "111" in indexed_db
+    assert "111" in indexed_db.keys()
+    assert "999" not in indexed_db
+    assert indexed_db.get("999") is None
+    assert indexed_db.get("222", {}).get("packageid") is None
+
+
+def test_indexed_db_lookups(indexed_db: IndexedSteamDatabase) -> None:
+    assert dict(indexed_db.packageid_by_pfid) == {
+        "2009463077": "brrainz.harmony",
+        "111": "author.a",
+    }
+    assert indexed_db.name_by_packageid.get("author.a") == "A"
+    # Names can be looked up by the original packageid as well
+    assert indexed_db.name_by_packageid.get("Author.A") == "A"
+    assert len(indexed_db.name_by_packageid) == 2
+    assert dict(indexed_db.pfid_by_packageid) == {
+        "brrainz.harmony": "2009463077",
+        "author.a": "111",
+    }
+    assert indexed_db.pfid_by_packageid.get("Author.A") == "111"
+    assert indexed_db.pfid_by_packageid.get("author.missing") is None
+    # Same as the lookups built from a plain Steam DB
+    steam_id_to_package_id, package_id_to_name = index_steam_db(DATABASE)
+    assert dict(indexed_db.packageid_by_pfid) == steam_id_to_package_id
+    assert dict(indexed_db.name_by_packageid) == package_id_to_name
+
+
+def test_steam_db_packageid() -> None:
+    assert steam_db_packageid({"packageId": "Brrainz.Harmony"}) == "brrainz.harmony"
+    assert steam_db_packageid({"packageid": "Author.A"}) == "author.a"
+    assert steam_db_packageid({"packageId": "", "name": "A"}) is None
+    assert steam_db_packageid({}) is None
+
+
+def test_indexed_db_mutations(indexed_db: IndexedSteamDatabase) -> None:
+    # Mutating a looked up entry sticks, like with a plain dict
+    indexed_db["111"].pop("blacklist", None)
+    assert "blacklist" not in indexed_db["111"]
+    assert "blacklist" not in dict(indexed_db.items())["111"]
+
+    indexed_db.setdefault("333", {})["blacklist"] = {"value": True, "comment": "x"}
+    assert indexed_db["333"]["blacklist"]["comment"] == "x"
+    assert len(indexed_db) == len(DATABASE) + 1
+
+    del indexed_db["222"]
+    assert "222" not in indexed_db
+    assert len(indexed_db) == len(DATABASE)
+    assert set(indexed_db) == {"2009463077", "111", "333"}
+    with pytest.raises(KeyError):
+        del indexed_db["222"]
+
+
+def test_index_is_reused_until_source_changes(
+    steam_db_path: str, tmp_path: Path
+) -> None:
+    index_folder = tmp_path / "index"
+    first = IndexedSteamDatabase.open_or_build(steam_db_path, index_folder)
+    first_mtime = os.path.getmtime(first.path)
+    again = IndexedSteamDatabase.open_or_build(steam_db_path, index_folder)
+    assert again.path == first.path
+    assert os.path.getmtime(again.path) == first_mtime
+    first.close()
+    again.close()
+
+    # A new version of the Steam DB gets a new index, and the stale one is removed
+    with open(steam_db_path, "w", encoding="utf-8") as f:
+        json.dump({"version": 1800000000, "database": {"1": {"name": "B"}}}, f)
+    updated = IndexedSteamDatabase.open_or_build(steam_db_path, index_folder)
+    assert updated.path == steam_db_index_path(steam_db_path, index_folder).resolve()
+    assert updated.version == 1800000000
+    assert dict(updated) == {"1": {"name": "B"}}
+    assert list(index_folder.iterdir()) == [updated.path]
+
+
+def test_unreadable_index_is_rebuilt(steam_db_path: str, tmp_path: Path) -> None:
+    index_folder = tmp_path / "index"
+    index_path = steam_db_index_path(steam_db_path, index_folder)
+    index_folder.mkdir()
+    index_path.write_bytes(b"not a database")
+    assert dict(IndexedSteamDatabase.open_or_build(steam_db_path, index_folder)) == (
+        DATABASE
+    )
+
+
+def test_malformed_steam_db_is_not_indexed(tmp_path: Path) -> None:
+    path = tmp_path / "steamDB.json"
+    path.write_text(json.dumps({"database": DATABASE}), encoding="utf-8")
+    with pytest.raises(msgspec.ValidationError):
+        IndexedSteamDatabase.open_or_build(str(path), tmp_path / "index")
@@ -0,0 +1,76 @@
+from typing import Any
+
+import pytest
+
+from app.utils.version_index import VersionMismatchIndex
+
+GAME_VERSION = "1.5.4104 rev435"
+
+
+def _mods() -> dict[str, Any]:
+    return {
+        "uuid-str": {"packageid": "a.str", "supportedversions": {"li": "1.5"}},
+        "uuid-list": {
+            "packageid": "a.list",
+            "supportedversions": {"li": ["1.4", "1.5"]},
+        },
+        "uuid-old": {"packageid": "a.old", "supportedversions": {"li": ["1.3", "1.4"]}},
+        "uuid-none": {"packageid": "a.none"},
+        "uuid-ignored": {"packageid": "a.ignored", "supportedversions": {"li": "1.0"}},
+        "uuid-invalid": {
+            "packageid": "a.invalid",
+            "supportedversions": {"li": {"#text": "1.5"}},
+        },
+    }
+
+
+@pytest.mark.parametrize(
+    "uuid, expected",
+    [
+        ("uuid-str", False),
+        ("uuid-list", False),
+        ("uuid-old", True),
+        ("uuid-none", True),
+        ("uuid-ignored", False),
+        ("uuid-invalid", True),
+        ("uuid-unknown", True),
+    ],
+)
+def test_is_mismatch(uuid: str, expected: bool) -> None:
+    mods = _mods()
+    index = VersionMismatchIndex()
+    index.rebuild(mods, GAME_VERSION, ["a.ignored"])
+    assert index.is_mismatch(uuid, mods) is expected
+
+
+def test_no_game_version_is_a_mismatch() -> None:
+    mods = _mods()
+    index = VersionMismatchIndex()
+    index.rebuild(mods, "", None)
+    assert all(index.is_mismatch(uuid, mods) for uuid in mods)
+
+
+def test_only_changed_mods_are_reevaluated() -> None:
+    mods = _mods()
+    index = VersionMismatchIndex()
+    index.rebuild(mods, GAME_VERSION, None)
+    assert not index.is_mismatch("uuid-str", mods)
+
+    # Without an update, the indexed value is kept
+    mods["uuid-str"]["supportedversions"]["li"] = "1.4"
+    mods["uuid-old"]["supportedversions"]["li"] = "1.5"
+    index.update(["uuid-old"], mods)
+    assert not index.is_mismatch("uuid-str", mods)
+    assert not index.is_mismatch("uuid-old", mods)
+
+    index.update(["uuid-str"], mods)
+    assert index.is_mismatch("uuid-str", mods)
+
+    # Removed mods are dropped
+    del mods["uuid-str"]
+    index.update(["uuid-str"], mods)
+    assert index.is_mismatch("uuid-str", mods)
+
+    # New mods are evaluated on first use
+    mods["uuid-new"] = {"packageid": "a.new", "supportedversions": {"li": "1.5"}}
+    assert not index.is_mismatch("uuid-new", mods)
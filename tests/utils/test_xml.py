@@ -0,0 +1,124 @@
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from app.utils.xml import (
+    ABOUT_XML_DETAIL_TAGS,
+    ABOUT_XML_SKELETON_TAGS,
+    ABOUT_XML_TAGS,
+    about_xml_path_to_json,
+    xml_path_to_json,
+)
+
+MOD_EXAMPLES = Path(__file__).parent.parent / "data" / "mod_examples"
+
+
+def _about_subset(data: dict[str, Any]) -> dict[str, Any]:
+    return {
+        root: {
+            key: value
+            for key, value in (metadata or {}).items()
+            if key.lower() in ABOUT_XML_TAGS
+        }
+        or None
+        for root, metadata in data.items()
+    }
+
+
+@pytest.mark.parametrize(
+    "about_xml",
+    sorted(MOD_EXAMPLES.rglob("About.xml")),
+    ids=lambda path: str(path.relative_to(MOD_EXAMPLES)),
+)
+def test_about_xml_matches_xml_path_to_json(about_xml: Path) -> None:
+    assert about_xml_path_to_json(str(about_xml)) == _about_subset(
+        xml_path_to_json(str(about_xml))
+    )
+
+
+@pytest.mark.parametrize(
+    "about_xml",
+    sorted(MOD_EXAMPLES.rglob("About.xml")),
+    ids=lambda path: str(path.relative_to(MOD_EXAMPLES)),
+)
+def test_about_xml_skeleton_and_detail_tags(about_xml: Path) -> None:
+    # The skeleton and details passes together parse the same tags as a full parse
+    (root, full), *_ = about_xml_path_to_json(str(about_xml)).items()
+    skeleton = about_xml_path_to_json(str(about_xml), ABOUT_XML_SKELETON_TAGS)[root]
+    details = about_xml_path_to_json(str(about_xml), ABOUT_XML_DETAIL_TAGS)[root]
+    assert {**(skeleton or {}), **(details or {})} == (full or {})
+    assert all(key.lower() in ABOUT_XML_SKELETON_TAGS for key in skeleton or {})
+    assert all(key.lower() in ABOUT_XML_DETAIL_TAGS for key in details or {})
+
+
+def test_about_xml_structure(tmp_path: Path) -> None:
+    about_xml = tmp_path / "About.xml"
+    about_xml.write_text(
+        """<?xml version="1.0" encoding="utf-8"?>
+<ModMetaData>
+    <!-- comment -->
+    <name>Test Mod</name>
+    <packageId>Author.TestMod</packageId>
+    <supportedVersions><li>1.5</li></supportedVersions>
+    <modDependencies>
+        <li><packageId>brrainz.harmony</packageId></li>
+        <li/>
+    </modDependencies>
+    <loadAfter><li IfModActive="a.b">a.b</li></loadAfter>
+    <url></url>
+    <modFileHash>ignored</modFileHash>
+</ModMetaData>""",
+        encoding="utf-8",
+    )
+    assert about_xml_path_to_json(str(about_xml)) == {
+        "ModMetaData": {
+            "name": "Test Mod",
+            "packageId": "Author.TestMod",
+            "supportedVersions": {"li": "1.5"},
+            "modDependencies": {"li": [{"packageId": "brrainz.harmony"}, None]},
+            "loadAfter": {"li": {"@IfModActive": "a.b", "#text": "a.b"}},
+            "url": None,
+        }
+    }
+
+
+@pytest.mark.parametrize(
+    "content, expected",
+    [
+        (
+            "<ModMetaData><name>Tom & Jerry &nbsp;</name><packageId>a.b</packageId></ModMetaData>",
+            {"name": "Tom  Jerry", "packageId": "a.b"},
+        ),
+        (
+            "<ModMetaData><packageId>a.b</packageId><description>a <b>b</i> c</description></ModMetaData>",
+            {"packageId": "a.b", "description": {"b": "b", "#text": "a  c"}},
+        ),
+        (
+            "<ModMetaData><packageId>a.b</packageId></ModMetaData></ModMetaData>junk",
+            {"packageId": "a.b"},
+        ),
+        (
+            "<ModMetaData><packageId>a.b</packageId><supportedVersions><li>1.5</li>",
+            {"packageId": "a.b", "supportedVersions": {"li": "1.5"}},
+        ),
+    ],
+    ids=["entities", "mismatched_tags", "trailing_junk", "unclosed_tags"],
+)
+def test_about_xml_malformed(
+    tmp_path: Path, content: str, expected: dict[str, Any]
+) -> None:
+    about_xml = tmp_path / "About.xml"
+    about_xml.write_text(content, encoding="utf-8")
+    assert about_xml_path_to_json(str(about_xml)) == {"ModMetaData": expected}
+    # Same result as the BeautifulSoup fallback, without a second parse
+    assert about_xml_path_to_json(str(about_xml)) == _about_subset(
+        xml_path_to_json(str(about_xml))
+    )
+
+
+def test_about_xml_missing_or_empty(tmp_path: Path) -> None:
+    assert about_xml_path_to_json(str(tmp_path / "missing.xml")) == {}
+    empty = tmp_path / "About.xml"
+    empty.write_text("", encoding="utf-8")
+    assert about_xml_path_to_json(str(empty)) == {}
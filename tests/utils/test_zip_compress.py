@@ -0,0 +1,111 @@
+import os
+import random
+import zlib
+from pathlib import Path
+from zipfile import ZIP_DEFLATED, ZIP_STORED, ZipFile
+
+import pytest
+
+import app.utils.zip_compress as zip_compress
+from app.utils.zip_compress import write_files_to_zip
+
+
+@pytest.fixture
+def folder(tmp_path: Path) -> Path:
+    random.seed(0)
+    folder = tmp_path / "instance"
+    (folder / "Mods" / "Mod" / "Defs").mkdir(parents=True)
+    (folder / "Mods" / "Mod" / "Textures").mkdir()
+    (folder / "Empty").mkdir()
+    for i in range(50):
+        (folder / "Mods" / "Mod" / "Defs" / f"Def{i}.xml").write_text(
+            f"<Defs>{i}</Defs>" * 100
+        )
+    (folder / "Mods" / "Mod" / "Textures" / "Texture.dds").write_bytes(
+        random.randbytes(4096)
+    )
+    (folder / "Mods" / "Mod" / "Large.xml").write_text("<Defs />" * 10000)
+    (folder / "Mods" / "Mod" / "Random.bin").write_bytes(random.randbytes(4096))
+    return folder
+
+
+def archive_files(folder: Path) -> list[tuple[str, str]]:
+    return [
+        (os.path.join(root, name), os.path.relpath(os.path.join(root, name), folder))
+        for root, dirs, files in os.walk(folder)
+        for name in dirs + files
+    ]
+
+
+def test_write_files_to_zip(
+    folder: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # Stream the large file, and write members while others are being compressed
+    monkeypatch.setattr(zip_compress, "LARGE_FILE_SIZE", 32 * 1024)
+    monkeypatch.setattr(zip_compress, "MAX_BYTES_IN_FLIGHT", 8 * 1024)
+    zip_path = tmp_path / "instance.zip"
+
+    with ZipFile(zip_path, "w") as archive:
+        write_files_to_zip(archive, archive_files(folder), max_workers=4)
+        archive.writestr("instance.json", "{}")
+
+    with ZipFile(zip_path) as archive:
+        assert archive.testzip() is None
+        infos = {info.filename: info for info in archive.infolist()}
+        assert "Empty/" in infos
+        assert infos["Mods/Mod/Defs/Def0.xml"].compress_type == ZIP_DEFLATED
+        assert infos["Mods/Mod/Large.xml"].compress_type == ZIP_DEFLATED
+        assert infos["Mods/Mod/Textures/Texture.dds"].compress_type == ZIP_STORED
+        # Incompressible data is stored
+        assert infos["Mods/Mod/Random.bin"].compress_type == ZIP_STORED
+        for path, arcname in archive_files(folder):
+            if os.path.isfile(path):
+                data = Path(path).read_bytes()
+                info = infos[arcname.replace(os.sep, "/")]
+                assert (info.CRC, info.file_size) == (zlib.crc32(data), len(data))
+                assert archive.read(info) == data
+        assert archive.read("instance.json") == b"{}"
+
+
+def test_write_files_to_zip_append(folder: Path, tmp_path: Path) -> None:
+    (folder / "Mods" / "Mod" / "Languages" / "Русский").mkdir(parents=True)
+    (folder / "Mods" / "Mod" / "Languages" / "Русский" / "Ключи.xml").write_text(
+        "<LanguageData>Привет</LanguageData>" * 100, encoding="utf-8"
+    )
+    (folder / "Mods" / "Mod" / "日本語.xml").write_text("<Defs />" * 100)
+    zip_path = tmp_path / "instance.zip"
+    with ZipFile(zip_path, "w") as archive:
+        archive.writestr("instance.json", "{}")
+
+    # Members are appended after the existing ones
+    with ZipFile(zip_path, "a") as archive:
+        write_files_to_zip(archive, archive_files(folder), max_workers=4)
+
+    with ZipFile(zip_path) as archive:
+        assert archive.testzip() is None
+        assert archive.read("instance.json") == b"{}"
+        info = archive.getinfo("Mods/Mod/Languages/Русский/Ключи.xml")
+        assert info.compress_type == ZIP_DEFLATED
+        for path, arcname in archive_files(folder):
+            if os.path.isfile(path):
+                assert (
+                    archive.read(arcname.replace(os.sep, "/"))
+                    == Path(path).read_bytes()
+                )
+
+
+def test_write_files_to_zip_untested_python(
+    folder: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # A Python version whose ZipFile may have changed
+    monkeypatch.setattr(zip_compress, "PRECOMPRESS_PYTHON_VERSIONS", frozenset())
+    monkeypatch.setattr(zip_compress, "_write_deflated", None)
+    zip_path = tmp_path / "instance.zip"
+
+    with ZipFile(zip_path, "w") as archive:
+        write_files_to_zip(archive, archive_files(folder), max_workers=4)
+
+    with ZipFile(zip_path) as archive:
+        assert archive.testzip() is None
+        assert archive.getinfo("Mods/Mod/Defs/Def0.xml").compress_type == ZIP_DEFLATED
+        assert archive.read("Mods/Mod/Defs/Def0.xml") == b"<Defs>0</Defs>" * 100
@@ -0,0 +1,84 @@
+from pathlib import Path
+from zipfile import ZIP_DEFLATED, ZipFile
+
+import pytest
+
+import app.utils.zip_extract as zip_extract
+from app.utils.zip_extract import extract_zip
+
+
+@pytest.fixture
+def archive(tmp_path: Path) -> Path:
+    zip_path = tmp_path / "mod.zip"
+    with ZipFile(zip_path, "w", ZIP_DEFLATED) as zipobj:
+        zipobj.writestr("Mod/", "")
+        zipobj.writestr("Mod/About/About.xml", "<ModMetaData />")
+        zipobj.writestr("Mod/Empty/", "")
+        for i in range(300):
+            zipobj.writestr(f"Mod/Defs/Def{i}.xml", f"<Defs>{i}</Defs>" * (i + 1))
+    return zip_path
+
+
+def test_extract_zip(archive: Path, tmp_path: Path) -> None:
+    target = tmp_path / "mods"
+    progress: list[int] = []
+
+    assert extract_zip(
+        str(archive), str(target), max_workers=4, progress_callback=progress.append
+    )
+
+    assert (target / "Mod" / "About" / "About.xml").read_text() == "<ModMetaData />"
+    assert (target / "Mod" / "Empty").is_dir()
+    for i in (0, 150, 299):
+        assert (
+            target / "Mod" / "Defs" / f"Def{i}.xml"
+        ).read_text() == f"<Defs>{i}</Defs>" * (i + 1)
+    assert progress == sorted(set(progress))
+    assert progress[-1] == 100
+
+
+def test_extract_zip_skip_existing(archive: Path, tmp_path: Path) -> None:
+    target = tmp_path / "mods"
+    about = target / "Mod" / "About" / "About.xml"
+    about.parent.mkdir(parents=True)
+    about.write_text("existing")
+
+    assert extract_zip(str(archive), str(target), overwrite=False)
+    assert about.read_text() == "existing"
+    assert (target / "Mod" / "Defs" / "Def0.xml").exists()
+
+    assert extract_zip(str(archive), str(target), overwrite=True)
+    assert about.read_text() == "<ModMetaData />"
+
+
+def test_extract_zip_skips_members_outside_target(tmp_path: Path) -> None:
+    zip_path = tmp_path / "evil.zip"
+    with ZipFile(zip_path, "w") as zipobj:
+        zipobj.writestr("../evil.txt", "evil")
+        zipobj.writestr("Mod/About/About.xml", "<ModMetaData />")
+    target = tmp_path / "mods"
+
+    assert extract_zip(str(zip_path), str(target))
+    assert not (tmp_path / "evil.txt").exists()
+    assert (target / "Mod" / "About" / "About.xml").exists()
+
+
+def test_extract_zip_abort_mid_member(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    zip_path = tmp_path / "large.zip"
+    with ZipFile(zip_path, "w", ZIP_DEFLATED) as zipobj:
+        zipobj.writestr("Mod/Textures/Large.dds", b"\0" * 64 * 1024)
+    monkeypatch.setattr(zip_extract, "COPY_BLOCK_SIZE", 1024)
+    target = tmp_path / "mods"
+    polls = 0
+
+    def should_abort() -> bool:
+        nonlocal polls
+        polls += 1
+        # Abort after a few blocks of the member are written
+        return polls > 4
+
+    assert not extract_zip(str(zip_path), str(target), should_abort=should_abort)
+    assert (target / "Mod" / "Textures").is_dir()
+    assert not (target / "Mod" / "Textures" / "Large.dds").exists()
@@ -0,0 +1,297 @@
+from typing import Any, Generator
+from unittest.mock import MagicMock, patch
+
+import pytest
+from PySide6.QtCore import QEvent, QModelIndex, QPoint, QRect, Qt
+from PySide6.QtGui import QHelpEvent
+from PySide6.QtTest import QTest
+from PySide6.QtWidgets import QApplication, QListWidget, QToolTip
+from pytestqt.qtbot import QtBot
+
+from app.utils.custom_list_widget_item_metadata import CustomListWidgetItemMetadata
+from app.utils.metadata import MetadataManager
+from app.views.mods_panel import ModListItemDelegate, ModListWidget, mod_tool_tip_text
+
+
+@pytest.fixture
+def mods() -> Generator[dict[str, Any], None, None]:
+    mods: dict[str, Any] = {}
+    with patch.object(MetadataManager, "instance") as mock_instance:
+        mock = MagicMock()
+        mock.internal_local_metadata = mods
+        mock.is_version_mismatch = lambda uuid: False
+        mock.has_alternative_mod = lambda uuid: None
+        mock.steamdb_packageid_to_name = {}
+        mock_instance.return_value = mock
+        yield mods
+
+
+def _add_mods(mods: dict[str, Any], count: int) -> list[str]:
+    for i in range(count):
+        mods[f"uuid-{i}"] = {
+            "uuid": f"uuid-{i}",
+            "packageid": f"author.mod{i}",
+            "name": f"Mod {i}",
+            "path": f"/mods/{i}",
+            "data_source": "local",
+            "supportedversions": {"li": "1.5"},
+        }
+    return list(mods)
+
+
+def _mod_list(qtbot: QtBot, list_type: str, painted: bool = True) -> ModListWidget:
+    settings_controller = MagicMock()
+    settings_controller.settings.paint_mod_list_rows = painted
+    settings_controller.settings.mod_type_filter_toggle = True
+    settings_controller.settings.external_use_this_instead_metadata_source = "None"
+    mod_list = ModListWidget(list_type, settings_controller)
+    qtbot.addWidget(mod_list)
+    mod_list.resize(400, 600)
+    return mod_list
+
+
+@pytest.mark.parametrize("painted", [True, False])
+def test_recreate_mod_list(mods: dict[str, Any], qtbot: QtBot, painted: bool) -> None:
+    uuids = _add_mods(mods, 50)
+    mod_list = _mod_list(qtbot, "Active", painted)
+    updates: list[str] = []
+    mod_list.list_update_signal.connect(updates.append)
+
+    mod_list.recreate_mod_list("Active", uuids[::-1])
+    # Process the queued row slots, none of them may update the list again
+    qtbot.wait(10)
+
+    assert mod_list.uuids == uuids[::-1]
+    assert [
+        mod_list.item(row).data(Qt.ItemDataRole.UserRole)["uuid"]
+        for row in range(mod_list.count())
+    ] == uuids[::-1]
+    assert updates == ["50"]
+
+    # Recreating the list replaces its mods
+    updates.clear()
+    mod_list.recreate_mod_list("Active", uuids[:10])
+    qtbot.wait(10)
+    assert mod_list.uuids == uuids[:10]
+    assert mod_list.count() == 10
+    assert updates == ["10"]
+
+    updates.clear()
+    mod_list.recreate_mod_list("Active", [])
+    qtbot.wait(10)
+    assert mod_list.uuids == []
+    assert mod_list.count() == 0
+    assert updates == ["0"]
+
+
+def test_recreate_mod_list_moves_mods_from_other_list(
+    mods: dict[str, Any], qtbot: QtBot
+) -> None:
+    uuids = _add_mods(mods, 10)
+    active = _mod_list(qtbot, "Active")
+    inactive = _mod_list(qtbot, "Inactive")
+    # Connected like MainContent connects the mod lists
+    active.items_added_signal.connect(inactive.handle_other_list_rows_added)
+    inactive.items_added_signal.connect(active.handle_other_list_rows_added)
+    inactive.recreate_mod_list("Inactive", uuids)
+
+    with qtbot.waitSignal(active.items_added_signal) as blocker:
+        active.recreate_mod_list("Active", uuids[2:5])
+    assert blocker.args == [uuids[2:5]]
+    assert active.uuids == uuids[2:5]
+    assert inactive.uuids == uuids[:2] + uuids[5:]
+
+
+def _show_with_warnings(
+    mods: dict[str, Any], qtbot: QtBot
+) -> tuple[ModListWidget, CustomListWidgetItemMetadata]:
+    uuids = _add_mods(mods, 3)
+    mod_list = _mod_list(qtbot, "Active")
+    mod_list.recreate_mod_list("Active", uuids)
+    mod_list.show()
+    qtbot.waitExposed(mod_list)
+    item = mod_list.item(1)
+    data = item.data(Qt.ItemDataRole.UserRole)
+    data["warnings"] = "Missing dependency"
+    data["errors"] = "Incompatible mod"
+    item.setData(Qt.ItemDataRole.UserRole, data)
+    return mod_list, data
+
+
+def _delegate(mod_list: ModListWidget) -> ModListItemDelegate:
+    delegate = mod_list.itemDelegate()
+    assert isinstance(delegate, ModListItemDelegate)
+    return delegate
+
+
+def test_delegate_layout(mods: dict[str, Any], qtbot: QtBot) -> None:
+    mod_list, data = _show_with_warnings(mods, qtbot)
+    delegate = _delegate(mod_list)
+    size = ModListItemDelegate.ICON_SIZE
+    rect = QRect(10, 40, 400, 24)
+
+    icon_rects, name_rect, name, trailing = delegate._layout(
+        rect, mod_list.fontMetrics(), data
+    )
+    # The local mod and XML icons, the name, then the warning and error icons
+    assert [tool_tip for _, _, tool_tip in icon_rects] == [
+        "Installed locally",
+        "Contains custom content (textures / XML)",
+        "Missing dependency",
+        "Incompatible mod",
+    ]
+    assert trailing == 2
+    assert name == "Mod 1"
+    assert [icon_rect.left() for icon_rect, _, _ in icon_rects] == [
+        10,
+        10 + size,
+        name_rect.right() + 1,
+        name_rect.right() + 1 + size,
+    ]
+    assert name_rect.left() == 10 + 2 * size
+    assert name_rect.width() == mod_list.fontMetrics().horizontalAdvance("Mod 1")
+    for icon_rect, _, _ in icon_rects:
+        assert icon_rect.size().toTuple() == (size, size)
+        assert icon_rect.center().y() == rect.center().y()
+
+    # Long names are elided to leave room for every icon
+    mods["uuid-1"]["name"] = "A very long mod name " * 10
+    icon_rects, name_rect, name, _ = delegate._layout(
+        rect, mod_list.fontMetrics(), data
+    )
+    assert name.endswith("…")
+    assert name_rect.width() <= rect.width() - 4 * size
+    assert rect.contains(icon_rects[-1][0])
+
+
+def test_delegate_toggles_warning(mods: dict[str, Any], qtbot: QtBot) -> None:
+    mod_list, data = _show_with_warnings(mods, qtbot)
+    item_rect = mod_list.visualItemRect(mod_list.item(1))
+    icon_rects, name_rect, _, _ = _delegate(mod_list)._layout(
+        item_rect, mod_list.fontMetrics(), data
+    )
+
+    # Clicking the name does not toggle the warnings
+    QTest.mouseClick(
+        mod_list.viewport(), Qt.MouseButton.LeftButton, pos=name_rect.center()
+    )
+    assert mod_list.ignore_warning_list == []
+
+    for icon_rect, _, _ in icon_rects[-2:]:
+        with qtbot.waitSignal(mod_list.recalculate_warnings_signal):
+            QTest.mouseClick(
+                mod_list.viewport(), Qt.MouseButton.LeftButton, pos=icon_rect.center()
+            )
+        toggled = mod_list.item(1).data(Qt.ItemDataRole.UserRole)["warning_toggled"]
+        assert mod_list.ignore_warning_list == (["author.mod1"] if toggled else [])
+    # Clicking the warning, then the error icon toggled the warnings on and off
+    assert not toggled
+
+
+def test_delegate_tooltips(
+    mods: dict[str, Any], qtbot: QtBot, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    mod_list, data = _show_with_warnings(mods, qtbot)
+    item_rect = mod_list.visualItemRect(mod_list.item(1))
+    icon_rects, name_rect, _, _ = _delegate(mod_list)._layout(
+        item_rect, mod_list.fontMetrics(), data
+    )
+    tool_tips: list[str] = []
+    monkeypatch.setattr(
+        QToolTip, "showText", lambda pos, text, *args: tool_tips.append(text)
+    )
+
+    def hover(pos: QPoint) -> None:
+        event = QHelpEvent(
+            QEvent.Type.ToolTip, pos, mod_list.viewport().mapToGlobal(pos)
+        )
+        QApplication.sendEvent(mod_list.viewport(), event)
+
+    for icon_rect, _, _ in icon_rects:
+        hover(icon_rect.center())
+    hover(name_rect.center())
+    assert tool_tips == [tool_tip for _, _, tool_tip in icon_rects] + [
+        mod_tool_tip_text("uuid-1")
+    ]
+
+
+def _add_related_mods(mods: dict[str, Any]) -> list[str]:
+    uuids = _add_mods(mods, 8)
+    mods["uuid-1"]["incompatibilities"] = {"author.mod7"}
+    mods["uuid-3"]["loadTheseBefore"] = [("author.mod2", True)]
+    mods["uuid-5"]["dependencies"] = {"author.mod6", "missing.mod"}
+    mods["uuid-5"]["loadTheseBefore"] = [("author.mod6", True)]
+    mods["uuid-6"]["loadTheseAfter"] = [("author.mod0", True), ("author.mod7", False)]
+    return uuids
+
+
+def _item_errors_warnings(mod_list: ModListWidget) -> list[tuple[Any, ...]]:
+    return [
+        tuple(
+            mod_list.item(row).data(Qt.ItemDataRole.UserRole)[key]
+            for key in ("uuid", "errors", "warnings", "errors_warnings", "mismatch")
+        )
+        for row in range(mod_list.count())
+    ]
+
+
+@pytest.mark.parametrize(
+    "first, count, destination, recalculated_rows",
+    [
+        # Loads mod 6 before mod 5, which loads after it, and before mod 0
+        (6, 1, 0, range(0, 7)),
+        # Loads mod 5 after its dependency
+        (5, 1, 7, range(5, 7)),
+        # Moves the incompatible mod 1, and mod 2 after mod 3, which loads after it
+        (1, 2, 8, range(1, 8)),
+        (3, 1, 2, range(2, 4)),
+    ],
+)
+def test_recalculate_errors_warnings_after_drop(
+    mods: dict[str, Any],
+    qtbot: QtBot,
+    monkeypatch: pytest.MonkeyPatch,
+    first: int,
+    count: int,
+    destination: int,
+    recalculated_rows: range,
+) -> None:
+    mod_list = _mod_list(qtbot, "Active")
+    mod_list.recreate_mod_list("Active", _add_related_mods(mods))
+    before = mod_list.recalculate_internal_errors_warnings()
+
+    # Drop the selected rows, moved within the list like QListWidget moves them
+    def move_rows(self: QListWidget, event: Any) -> None:
+        self.model().moveRows(QModelIndex(), first, count, QModelIndex(), destination)
+
+    monkeypatch.setattr(QListWidget, "dropEvent", move_rows)
+    for row in range(first, first + count):
+        mod_list.item(row).setSelected(True)
+    event = MagicMock()
+    event.source.return_value = mod_list
+    event.dropAction.return_value = Qt.DropAction.MoveAction
+    mod_list.dropEvent(event)
+    assert mod_list.uuids == [
+        mod_list.item(row).data(Qt.ItemDataRole.UserRole)["uuid"]
+        for row in range(mod_list.count())
+    ]
+
+    calculate = mod_list._calculate_mod_errors_warnings
+    rows: list[int] = []
+
+    def calculate_spy(row: int, *args: Any) -> Any:
+        rows.append(row)
+        return calculate(row, *args)
+
+    monkeypatch.setattr(mod_list, "_calculate_mod_errors_warnings", calculate_spy)
+    incremental = mod_list.recalculate_internal_errors_warnings()
+    assert rows == list(recalculated_rows)
+    incremental_items = _item_errors_warnings(mod_list)
+
+    # A full pass over the rearranged list has the same results
+    rows.clear()
+    full = mod_list.recalculate_internal_errors_warnings()
+    assert rows == list(range(mod_list.count()))
+    assert incremental == full
+    assert incremental_items == _item_errors_warnings(mod_list)
+    assert full != before